@@ -1,4 +1,9 @@
+import argparse
 import csv
+import hashlib
+import io
+import sys
+from concurrent.futures import ProcessPoolExecutor
 
 VMT_TYPES = (
     'combination long-haul truck',
@@ -27,13 +32,33 @@ MOT_TYPES = (
     'worked at home',
 )
 
-def clean_row(row, lower):
-    """Clean up entries in a row."""
-    return tuple(field.strip().lower() if lower else field.strip() for field in row)
+SOURCES = (
+    'ev.csv',
+    'community_ghg.csv',
+    'community.csv',
+    'vmt.csv',
+    'ghg.csv',
+)
+
+def fingerprints():
+    """Hash each source file, so an incremental load can tell which ones changed."""
+    result = {}
+    for filename in SOURCES:
+        with open(filename, 'rb') as file:
+            result[filename] = hashlib.sha256(file.read()).hexdigest()
+    return result
+
+def data_version():
+    """Fingerprint the source files, so the web app can tell when data changes."""
+    digest = hashlib.sha256()
+    for filename in SOURCES:
+        with open(filename, 'rb') as file:
+            digest.update(file.read())
+    return digest.hexdigest()[:16]
 
 def parse_int(i):
     """Parse an integer with commas."""
-    if i == '#n/a':
+    if i.lower() == '#n/a':
         return 0
     return int(i.replace(',', ''))
 
@@ -41,26 +66,85 @@ def parse_float(i):
     """Parse a float with commas."""
     return float(i.replace(',', ''))
 
-def import_csv(filename, lower=True):
-    """Iterate over the rows."""
-    keys = None
-    with open(filename) as file:
-        for row in csv.reader(file):
-            row = clean_row(row, lower)
-            if keys is None:
-                keys = row
-            else:
-                yield {keys[i]: row[i] for i in range(len(keys))}
+def read_csv(filename, columns):
+    """Iterate over the given columns of each row, stripped of whitespace."""
+    with open(filename, newline='') as file:
+        reader = csv.reader(file)
+        header = [field.strip().lower() for field in next(reader)]
+        indices = [header.index(column) for column in columns]
+        for row in reader:
+            yield tuple(row[i].strip() for i in indices)
+
+# each of these parses one file into tuples starting with name, county and year,
+# with names keeping their capitalization
+
+def parse_ev(filename):
+    return [
+        (name, county, int(year), parse_int(personal), parse_int(evs))
+        for name, county, year, personal, evs
+        in read_csv(filename, ('municipality', 'county', 'year', 'total personal vehicles', '# of evs'))
+    ]
+
+def parse_community_ghg(filename):
+    return [
+        (name, county, int(year), parse_int(co2))
+        for name, county, year, co2
+        in read_csv(filename, ('municipality', 'county', 'year', 'total mtco2e'))
+    ]
+
+def parse_community(filename):
+    return [
+        (name, county, int(year), parse_int(population), tuple(parse_float(p.replace('%', '')) for p in percentages))
+        for name, county, year, population, *percentages
+        in read_csv(filename, ('municipality', 'county', 'year', 'population') + MOT_TYPES)
+    ]
+
+def parse_vehicles(filename, parse):
+    # NOTE: there are a few cases where the data is not provided.
+    # for each of these cases, we have no data for any type for the given
+    # year, so we must not allow comparing data for these cases.
+    return [
+        (name, county, int(year), tuple(None if value.lower() == 'nda' else parse(value) for value in values))
+        for name, county, year, *values
+        in read_csv(filename, ('municipality name', 'county', 'year') + VMT_TYPES)
+    ]
+
+def parse_vmt(filename):
+    return parse_vehicles(filename, parse_int)
+
+def parse_ghg(filename):
+    return parse_vehicles(filename, parse_float)
+
+PARSERS = (
+    ('ev.csv', parse_ev),
+    ('community_ghg.csv', parse_community_ghg),
+    ('community.csv', parse_community),
+    ('vmt.csv', parse_vmt),
+    ('ghg.csv', parse_ghg),
+)
 
 municipalities = {}
+# municipalities in the files being loaded, which may be fewer than those numbered
+seen = set()
+next_mno = 0
 
 def get_mno(name, county):
     """Get the municipality number for a given name and county."""
+    global next_mno
     key = (name, county)
     if key not in municipalities:
-        municipalities[key] = len(municipalities)
+        municipalities[key] = next_mno
+        next_mno += 1
+    seen.add(key)
     return municipalities[key]
 
+def seed_municipalities(rows):
+    """Keep the numbers municipalities were given by the last load."""
+    global next_mno
+    for mno, name, county in rows:
+        municipalities[name, county] = mno
+    next_mno = max(municipalities.values(), default=-1) + 1
+
 def clean_up_municipality_name(name):
     # capitalize town type, and remove duplicate town type if present
     parts = name.split(' ')
@@ -70,79 +154,214 @@ def clean_up_municipality_name(name):
             parts.pop()
     return ' '.join(parts)
 
-with open('initialize_db.sql', 'wt') as file:
-    print('DROP TABLE means_of_transportation;', file=file)
-    print('DROP TABLE on_road_vehicle;', file=file)
-    print('DROP TABLE population;', file=file)
-    print('DROP TABLE municipality;', file=file)
-
-    print('CREATE TYPE on_road_vehicle_type AS ENUM(', file=file)
-    print(','.join("'" + t + "'" for t in VMT_TYPES), file=file)
-    print(');', file=file)
-
-    print('CREATE TYPE means_of_transportation_type AS ENUM(', file=file)
-    print(','.join("'" + t + "'" for t in MOT_TYPES), file=file)
-    print(');', file=file)
-
-    print('CREATE TABLE municipality (', file=file)
-    print('MNo SMALLINT,', file=file)
-    print('Name VARCHAR(30),', file=file)
-    print('County VARCHAR(10),', file=file)
-    print('PRIMARY KEY (MNo)', file=file)
-    print(');', file=file)
-
-    print('CREATE TABLE population (', file=file)
-    print('MNo SMALLINT,', file=file)
-    print('Year SMALLINT,', file=file)
-    print('Pop INT,', file=file)
-    print('CO2 INT,', file=file)
-    print('EVs SMALLINT,', file=file)
-    print('PersonalVehicles INT,', file=file)
-    print('PRIMARY KEY (MNo, Year),', file=file)
-    print('FOREIGN KEY (MNo) REFERENCES municipality (MNo)', file=file)
-    print(');', file=file)
-
-    print('CREATE TABLE on_road_vehicle (', file=file)
-    print('MNo SMALLINT,', file=file)
-    print('Year SMALLINT,', file=file)
-    print('Type on_road_vehicle_type,', file=file)
-    print('CO2 DECIMAL(8,2),', file=file)
-    print('Miles INT,', file=file)
-    print('PRIMARY KEY (MNo, Year, Type)', file=file)
-    print(');', file=file)
-
-    print('CREATE TABLE means_of_transportation (', file=file)
-    print('MNo SMALLINT,', file=file)
-    print('Year SMALLINT,', file=file)
-    print('Type means_of_transportation_type,', file=file)
-    print('Percentage DECIMAL(7,3),', file=file)
-    print('PRIMARY KEY (MNo, Year, Type),', file=file)
-    print('FOREIGN KEY (MNo, Year) REFERENCES population (MNo, Year)', file=file)
-    print(');', file=file)
+# tables in the order they must be loaded, with the columns rows are given in
+TABLES = (
+    ('municipality', ('MNo', 'Name', 'County')),
+    ('population', ('MNo', 'Year', 'EVs', 'CO2', 'Pop', 'PersonalVehicles')),
+    ('means_of_transportation', ('MNo', 'Year', 'Type', 'Percentage')),
+    ('on_road_vehicle', ('MNo', 'Year', 'Type', 'CO2', 'Miles')),
+    ('data_version', ('Version',)),
+    ('ingest_source', ('Source', 'Fingerprint')),
+    ('ingest_municipality', ('MNo', 'NameKey', 'CountyKey')),
+    ('ingest_row', ('TableName', 'MNo', 'Year', 'Hash')),
+)
 
-    ev_data = {}
-    for entry in import_csv('ev.csv'):
-        mno = get_mno(entry['municipality'], entry['county'])
-        year = int(entry['year'])
-        personal = parse_int(entry['total personal vehicles'])
-        count = parse_int(entry['# of evs'])
-        ev_data[mno, year] = (personal, count)
+# tables compared between loads, a group of rows at a time
+COMPARED = ('municipality', 'population', 'means_of_transportation', 'on_road_vehicle')
 
-    co2_data = {}
-    for entry in import_csv('community_ghg.csv'):
-        mno = get_mno(entry['municipality'], entry['county'])
-        year = int(entry['year'])
-        co2_data[mno, year] = parse_int(entry['total mtco2e'])
+TYPES = (
+    ('on_road_vehicle_type', VMT_TYPES),
+    ('means_of_transportation_type', MOT_TYPES),
+)
+
+# indexes answering the web app's queries for a year of a table on their own,
+# created after the data is loaded
+INDEXES = (
+    'CREATE INDEX IF NOT EXISTS population_year ON population (Year, MNo) INCLUDE (Pop, CO2, EVs, PersonalVehicles);',
+    'CREATE INDEX IF NOT EXISTS means_of_transportation_year ON means_of_transportation (Year, Type, MNo) INCLUDE (Percentage);',
+    'CREATE INDEX IF NOT EXISTS on_road_vehicle_year ON on_road_vehicle (Year, Type, MNo) INCLUDE (CO2, Miles);',
+)
+
+# materialized views summarizing the data, refreshed after every load
+AGGREGATES = (
+    # every metric of every municipality in long form, ranked within each year
+    ('ranking', '''WITH metric_value (Metric, Year, MNo, Value) AS (
+    SELECT 'population'::text, Year, MNo, Pop::float8 FROM population
+    UNION ALL SELECT 'co2', Year, MNo, CO2 FROM population
+    UNION ALL SELECT 'co2_per_capita', Year, MNo, CO2::float8 / NULLIF(Pop, 0) FROM population
+    UNION ALL SELECT 'evs', Year, MNo, EVs FROM population
+    UNION ALL SELECT 'ev_share', Year, MNo, 100.0 * EVs / NULLIF(PersonalVehicles, 0) FROM population
+    UNION ALL SELECT 'vehicle_co2', Year, MNo, SUM(CO2) FROM on_road_vehicle GROUP BY Year, MNo
+    UNION ALL SELECT 'vehicle_miles', Year, MNo, SUM(Miles) FROM on_road_vehicle GROUP BY Year, MNo
+    UNION ALL SELECT 'vehicle_co2:' || Type, Year, MNo, CO2 FROM on_road_vehicle
+    UNION ALL SELECT 'transportation:' || Type, Year, MNo, Percentage FROM means_of_transportation
+)
+SELECT v.Metric, v.Year, v.MNo, v.Value,
+    v.Value - LAG(v.Value) OVER (PARTITION BY v.Metric, v.MNo ORDER BY v.Year) AS Delta,
+    RANK() OVER (PARTITION BY v.Metric, v.Year ORDER BY v.Value DESC) AS Rank,
+    PERCENT_RANK() OVER (PARTITION BY v.Metric, v.Year ORDER BY v.Value) AS Percentile,
+    p.Pop
+FROM metric_value v
+JOIN municipality m ON m.MNo = v.MNo
+LEFT JOIN population p ON p.MNo = v.MNo AND p.Year = v.Year
+WHERE v.Value IS NOT NULL''', (
+        'CREATE UNIQUE INDEX ranking_key ON ranking (Metric, Year, MNo);',
+    )),
+    # sums by county, and statewide where County is NULL
+    ('totals', '''WITH people AS (
+    SELECT m.County, p.Year, SUM(p.Pop) AS Pop, SUM(p.CO2) AS CO2, SUM(p.EVs) AS EVs, SUM(p.PersonalVehicles) AS PersonalVehicles
+    FROM population p JOIN municipality m ON m.MNo = p.MNo
+    GROUP BY GROUPING SETS ((m.County, p.Year), (p.Year))
+), vehicles AS (
+    SELECT m.County, v.Year, SUM(v.CO2) AS CO2, SUM(v.Miles) AS Miles
+    FROM on_road_vehicle v JOIN municipality m ON m.MNo = v.MNo
+    GROUP BY GROUPING SETS ((m.County, v.Year), (v.Year))
+), total (County, Year, Metric, Value) AS (
+    SELECT County, Year, Metric, Value FROM people, LATERAL (VALUES
+        ('population', Pop::float8),
+        ('co2', CO2::float8),
+        ('co2_per_capita', CO2::float8 / NULLIF(Pop, 0)),
+        ('evs', EVs::float8),
+        ('ev_share', 100.0 * EVs / NULLIF(PersonalVehicles, 0))
+    ) AS metric (Metric, Value)
+    UNION ALL
+    SELECT County, Year, Metric, Value FROM vehicles, LATERAL (VALUES
+        ('vehicle_co2', CO2::float8),
+        ('vehicle_miles', Miles::float8)
+    ) AS metric (Metric, Value)
+)
+SELECT Metric, Year, County, Value,
+    Value - LAG(Value) OVER (PARTITION BY Metric, County ORDER BY Year) AS Delta
+FROM total''', (
+        'CREATE INDEX totals_key ON totals (Metric, Year);',
+    )),
+)
+
+def schema():
+    """Statements creating the types and tables, unqualified so they go in the first schema on the search path."""
+    statements = []
+    for name, values in TYPES:
+        statements.append(f'CREATE TYPE {name} AS ENUM(\n' + ','.join("'" + t + "'" for t in values) + '\n);')
+    statements.append('''CREATE TABLE municipality (
+MNo SMALLINT,
+Name VARCHAR(30),
+County VARCHAR(10),
+PRIMARY KEY (MNo)
+);''')
+    statements.append('''CREATE TABLE population (
+MNo SMALLINT,
+Year SMALLINT,
+Pop INT,
+CO2 INT,
+EVs SMALLINT,
+PersonalVehicles INT,
+PRIMARY KEY (MNo, Year),
+FOREIGN KEY (MNo) REFERENCES municipality (MNo)
+);''')
+    statements.append('''CREATE TABLE on_road_vehicle (
+MNo SMALLINT,
+Year SMALLINT,
+Type on_road_vehicle_type,
+CO2 DECIMAL(8,2),
+Miles INT,
+PRIMARY KEY (MNo, Year, Type)
+);''')
+    statements.append('''CREATE TABLE means_of_transportation (
+MNo SMALLINT,
+Year SMALLINT,
+Type means_of_transportation_type,
+Percentage DECIMAL(7,3),
+PRIMARY KEY (MNo, Year, Type),
+FOREIGN KEY (MNo, Year) REFERENCES population (MNo, Year)
+);''')
+    statements.append('''CREATE TABLE data_version (
+Version CHAR(16),
+Loaded TIMESTAMP WITH TIME ZONE DEFAULT now()
+);''')
+    # what was loaded, for incremental loads to compare against
+    statements.append('''CREATE TABLE ingest_source (
+Source VARCHAR(30),
+Fingerprint CHAR(64),
+PRIMARY KEY (Source)
+);''')
+    statements.append('''CREATE TABLE ingest_municipality (
+MNo SMALLINT,
+NameKey VARCHAR(40),
+CountyKey VARCHAR(10),
+PRIMARY KEY (MNo)
+);''')
+    statements.append('''CREATE TABLE ingest_row (
+TableName VARCHAR(30),
+MNo SMALLINT,
+Year SMALLINT,
+Hash CHAR(16),
+PRIMARY KEY (TableName, MNo, Year)
+);''')
+    for aggregate in AGGREGATES:
+        statements.extend(aggregate_schema(*aggregate))
+    return statements
+
+def aggregate_schema(name, query, indexes):
+    return [f'CREATE MATERIALIZED VIEW {name} AS\n{query}\nWITH NO DATA;'] + list(indexes)
+
+def refresh_aggregates(cur):
+    """Refresh the aggregates, creating any that a database was loaded without."""
+    for name, query, indexes in AGGREGATES:
+        cur.execute('SELECT to_regclass(%s);', (name,))
+        if cur.fetchone()[0] is None:
+            for statement in aggregate_schema(name, query, indexes):
+                cur.execute(statement)
+        cur.execute(f'REFRESH MATERIALIZED VIEW {name};')
+
+def join_vehicles(vmt, ghg):
+    """
+    Pair up the rows of vmt.csv and ghg.csv for the same municipality, county and year.
+
+    The files needn't be in the same order. Rows of either file without a
+    partner in the other are reported and left out.
+    """
+    index = {}
+    for name, county, year, co2_values in ghg:
+        index[name.lower(), county.lower(), year] = co2_values
+    for name, county, year, miles_values in vmt:
+        key = (name.lower(), county.lower(), year)
+        co2_values = index.pop(key, None)
+        if co2_values is None:
+            print(f'vmt.csv: no match in ghg.csv for {key}', file=sys.stderr)
+            continue
+        yield key + (miles_values, co2_values)
+    for key in index:
+        print(f'ghg.csv: no match in vmt.csv for {key}', file=sys.stderr)
+
+def parse_all():
+    """Parse every source file, each in its own process, keyed by file name."""
+    with ProcessPoolExecutor(max_workers=len(PARSERS)) as pool:
+        futures = {filename: pool.submit(parse, filename) for filename, parse in PARSERS}
+        return {filename: future.result() for filename, future in futures.items()}
 
-    # get names of municipalities and counties, properly capitalized
+def load_rows():
+    """
+    Read every source file, returning the rows of each table keyed by table name.
+
+    The files are parsed in parallel, then municipalities are numbered here in
+    a fixed order so the numbers don't depend on which file finished first.
+    The rows of each table are generated as they are consumed, which must be
+    in the order of TABLES, since the row hashes are worked out along the way.
+    """
+    parsed = parse_all()
+    ev = parsed['ev.csv']
+    community_ghg = parsed['community_ghg.csv']
+    community = parsed['community.csv']
+
+    ev_data = {}
     names = {}
     counties = {}
-    for entry in import_csv('ev.csv', lower=False):
-        name = entry['Municipality']
+    for name, county, year, personal, evs in ev:
         name_key = name.lower()
-        name = clean_up_municipality_name(name)
-        county = entry['County']
         county_key = county.lower()
+        ev_data[get_mno(name_key, county_key), year] = (personal, evs)
+        # get names of municipalities and counties, properly capitalized
+        name = clean_up_municipality_name(name)
         # ensure consistent capitalization
         assert name_key not in names or names[name_key] == name
         assert county_key not in counties or counties[county_key] == county
@@ -150,42 +369,265 @@ with open('initialize_db.sql', 'wt') as file:
         names[name_key] = name
         counties[county_key] = county
 
-    print('INSERT INTO municipality (MNo, Name, County) VALUES', file=file)
-    municipality_values = []
-    for (name, county) in municipalities:
-        municipality_values.append(f"({municipalities[name, county]}, '{names[name]}', '{counties[county]}')")
-    print(',\n'.join(municipality_values) + ';', file=file)
-
-    mot_data = []
-    population_values = []
-    for entry in import_csv('community.csv'):
-        mno = get_mno(entry['municipality'], entry['county'])
-        year = int(entry['year'])
-        population = parse_int(entry['population'])
-        personal, evs = ev_data[mno, year]
-        co2 = co2_data[mno, year]
-        population_values.append(f'({mno}, {year}, {evs}, {co2}, {population}, {personal})')
-        for mot_type in MOT_TYPES:
-            percentage = parse_float(entry[mot_type].replace('%', ''))
-            mot_data.append(f"({mno}, {year}, '{mot_type}', {percentage})")
-    print('INSERT INTO population (MNo, Year, EVs, CO2, Pop, PersonalVehicles) VALUES', file=file)
-    print(',\n'.join(population_values) + ';', file=file)
-    print(';INSERT INTO means_of_transportation (MNo, Year, Type, Percentage) VALUES', file=file)
-    print(',\n'.join(mot_data) + ';', file=file)
-
-    vehicle_values = []
-    for (vmt_entry, ghg_entry) in zip(import_csv('vmt.csv'), import_csv('ghg.csv')):
-        mno = get_mno(vmt_entry['municipality name'], vmt_entry['county'])
-        year = int(vmt_entry['year'])
-        for vmt_type in VMT_TYPES:
-            miles = vmt_entry[vmt_type]
-            # NOTE: there are a few cases where the data is not provided.
-            # for each of these cases, we have no data for any type for the given
-            # year, so we must not allow comparing data for these cases.
-            if miles == 'nda':
-                continue
-            miles = parse_int(miles)
-            co2 = parse_float(ghg_entry[vmt_type])
-            vehicle_values.append(f"({mno}, {year}, '{vmt_type}', {co2}, {miles})")
-    print('INSERT INTO on_road_vehicle (MNo, Year, Type, CO2, Miles) VALUES', file=file)
-    print(',\n'.join(vehicle_values) + ';', file=file)
+    co2_data = {}
+    for name, county, year, co2 in community_ghg:
+        co2_data[get_mno(name.lower(), county.lower()), year] = co2
+
+    def municipality_values():
+        # like before, only those numbered so far, which have names
+        for (name, county) in sorted(seen, key=municipalities.get):
+            yield (municipalities[name, county], names[name], counties[county])
+
+    def population_values():
+        for name, county, year, population, _ in community:
+            mno = get_mno(name.lower(), county.lower())
+            personal, evs = ev_data[mno, year]
+            yield (mno, year, evs, co2_data[mno, year], population, personal)
+
+    def mot_values():
+        for name, county, year, _, percentages in community:
+            mno = get_mno(name.lower(), county.lower())
+            for mot_type, percentage in zip(MOT_TYPES, percentages):
+                yield (mno, year, mot_type, percentage)
+
+    def vehicle_values():
+        for name, county, year, miles_values, co2_values in join_vehicles(parsed['vmt.csv'], parsed['ghg.csv']):
+            mno = get_mno(name, county)
+            for vmt_type, miles, co2 in zip(VMT_TYPES, miles_values, co2_values):
+                if miles is not None:
+                    yield (mno, year, vmt_type, co2, miles)
+
+    hashes = {}
+
+    def known_municipalities():
+        for key in sorted(seen, key=municipalities.get):
+            yield (municipalities[key],) + key
+
+    def row_hashes():
+        # only complete once the tables above have been consumed
+        for (table, mno, year), digest in hashes.items():
+            yield (table, mno, year, digest.hexdigest()[:16])
+
+    return {
+        'municipality': hashed('municipality', municipality_values(), hashes),
+        'population': hashed('population', population_values(), hashes),
+        'means_of_transportation': hashed('means_of_transportation', mot_values(), hashes),
+        'on_road_vehicle': hashed('on_road_vehicle', vehicle_values(), hashes),
+        'data_version': [(data_version(),)],
+        'ingest_source': sorted(fingerprints().items()),
+        'ingest_municipality': known_municipalities(),
+        'ingest_row': row_hashes(),
+    }
+
+def hashed(table, rows, hashes):
+    """Pass rows through, hashing each (mno, year) group of them, with municipalities in year 0."""
+    for row in rows:
+        key = (table, row[0], 0) if table == 'municipality' else (table, row[0], row[1])
+        if key not in hashes:
+            hashes[key] = hashlib.sha256()
+        hashes[key].update(repr(row).encode())
+        yield row
+
+def sql_literal(value):
+    """Format a value for an SQL script, escaping quotes in strings."""
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    return str(value)
+
+def write_script(filename, tables):
+    """Write an SQL script that drops and recreates every table, for psql."""
+    with open(filename, 'wt') as file:
+        for name, _, _ in AGGREGATES:
+            print(f'DROP MATERIALIZED VIEW IF EXISTS {name};', file=file)
+        for table, _ in reversed(TABLES):
+            print(f'DROP TABLE {table};', file=file)
+        for statement in schema():
+            print(statement, file=file)
+        for table, columns in TABLES:
+            print(f'INSERT INTO {table} ({", ".join(columns)}) VALUES', file=file)
+            separator = ''
+            for row in tables[table]:
+                file.write(separator + '(' + ', '.join(sql_literal(value) for value in row) + ')')
+                separator = ',\n'
+            print(';', file=file)
+        for statement in INDEXES:
+            print(statement, file=file)
+        for name, _, _ in AGGREGATES:
+            print(f'REFRESH MATERIALIZED VIEW {name};', file=file)
+        # so the indexes can be read without visiting the tables
+        print('VACUUM ANALYZE;', file=file)
+
+class CsvReader:
+    """A file to read rows from as CSV, formatting them only as they are read."""
+
+    def __init__(self, rows):
+        self.rows = iter(rows)
+        self.buffer = io.StringIO()
+        self.writer = csv.writer(self.buffer)
+
+    def read(self, size=-1):
+        while size < 0 or self.buffer.tell() < size:
+            row = next(self.rows, None)
+            if row is None:
+                break
+            self.writer.writerow(row)
+        data = self.buffer.getvalue()
+        if size >= 0:
+            data, rest = data[:size], data[size:]
+        else:
+            rest = ''
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        self.buffer.write(rest)
+        return data
+
+def copy_rows(cur, table, columns, rows):
+    """Stream rows into a table with COPY, as CSV so quoting is handled for us."""
+    cur.copy_expert(f'COPY {table} ({", ".join(columns)}) FROM STDIN WITH (FORMAT csv)', CsvReader(rows))
+
+def copy_into_database(dsn, tables):
+    """
+    Load every table into a running database without taking it offline.
+
+    The tables are built and filled in a staging schema, then swapped into
+    public in the same transaction, so readers see either the old data or
+    the new data and never an empty or partly loaded table.
+    """
+    import psycopg2
+    conn = psycopg2.connect(dsn)
+    try:
+        with conn, conn.cursor() as cur:
+            cur.execute('DROP SCHEMA IF EXISTS staging CASCADE;')
+            cur.execute('CREATE SCHEMA staging;')
+            cur.execute('SET LOCAL search_path TO staging;')
+            for statement in schema():
+                cur.execute(statement)
+            for table, columns in TABLES:
+                copy_rows(cur, table, columns, tables[table])
+            for statement in INDEXES:
+                cur.execute(statement)
+            refresh_aggregates(cur)
+            # move the old tables out of the way, then the new ones into place
+            cur.execute('CREATE SCHEMA retired;')
+            for table, _ in TABLES:
+                cur.execute(f'ALTER TABLE IF EXISTS public.{table} SET SCHEMA retired;')
+                cur.execute(f'ALTER TABLE staging.{table} SET SCHEMA public;')
+            for name, _, _ in AGGREGATES:
+                cur.execute(f'ALTER MATERIALIZED VIEW IF EXISTS public.{name} SET SCHEMA retired;')
+                cur.execute(f'ALTER MATERIALIZED VIEW staging.{name} SET SCHEMA public;')
+            for name, _ in TYPES:
+                cur.execute(f"SELECT 1 FROM pg_type t JOIN pg_namespace n ON n.oid = t.typnamespace WHERE n.nspname = 'public' AND t.typname = '{name}';")
+                if cur.fetchone():
+                    cur.execute(f'ALTER TYPE public.{name} SET SCHEMA retired;')
+                cur.execute(f'ALTER TYPE staging.{name} SET SCHEMA public;')
+            cur.execute('DROP SCHEMA retired CASCADE;')
+            cur.execute('DROP SCHEMA staging;')
+        vacuum(conn)
+    finally:
+        conn.close()
+
+def vacuum(conn):
+    """Update the visibility map and statistics after a load, so the indexes can be read without the tables."""
+    conn.autocommit = True
+    with conn.cursor() as cur:
+        for table, _ in TABLES:
+            cur.execute(f'VACUUM ANALYZE {table};')
+        for name, _, _ in AGGREGATES:
+            cur.execute(f'VACUUM ANALYZE {name};')
+
+def upsert_rows(cur, table, columns, key, rows):
+    """Insert rows, replacing any with the same key."""
+    cur.execute(f'CREATE TEMPORARY TABLE incoming_{table} (LIKE {table}) ON COMMIT DROP;')
+    copy_rows(cur, f'incoming_{table}', columns, rows)
+    updates = ', '.join(f'{column} = EXCLUDED.{column}' for column in columns if column not in key)
+    cur.execute(f'INSERT INTO {table} ({", ".join(columns)}) SELECT {", ".join(columns)} FROM incoming_{table} '
+                f'ON CONFLICT ({", ".join(key)}) DO UPDATE SET {updates};')
+
+def delete_groups(cur, table, keys):
+    """Delete the rows of the given (mno, year) groups."""
+    keys = sorted(keys)
+    if table == 'municipality':
+        cur.execute('DELETE FROM municipality WHERE MNo = ANY(%s::smallint[]);', ([mno for mno, _ in keys],))
+    else:
+        cur.execute(f'DELETE FROM {table} t USING UNNEST(%s::smallint[], %s::smallint[]) AS stale (mno, year) '
+                    'WHERE t.MNo = stale.mno AND t.Year = stale.year;', ([mno for mno, _ in keys], [year for _, year in keys]))
+
+def load_incrementally(dsn):
+    """
+    Load only what changed in the source files since the last load.
+
+    Every load records a fingerprint of each source file, the name and county
+    each municipality number was given to, and a hash of each municipality's
+    rows for each year. If no file changed there is nothing to do. Otherwise
+    municipalities keep their numbers, and only the groups of rows whose hash
+    changed are replaced or deleted, in one transaction along with a new data
+    version. Returns False if the database has no record of a load to compare
+    against. Changes to the types still need a full load.
+    """
+    import psycopg2
+    conn = psycopg2.connect(dsn)
+    try:
+        with conn, conn.cursor() as cur:
+            cur.execute("SELECT to_regclass('ingest_source');")
+            if cur.fetchone()[0] is None:
+                return False
+            # one load at a time
+            cur.execute('LOCK TABLE ingest_source IN EXCLUSIVE MODE;')
+            cur.execute('SELECT Source, Fingerprint FROM ingest_source;')
+            if dict(cur.fetchall()) == fingerprints():
+                print('source files are unchanged')
+                return True
+            cur.execute('SELECT MNo, NameKey, CountyKey FROM ingest_municipality;')
+            seed_municipalities(cur.fetchall())
+            rows = load_rows()
+            tables = {table: list(rows[table]) for table, _ in TABLES}
+            cur.execute('SELECT TableName, MNo, Year, Hash FROM ingest_row;')
+            loaded = {(table, mno, year): digest for table, mno, year, digest in cur.fetchall()}
+            current = {(table, mno, year): digest for table, mno, year, digest in tables['ingest_row']}
+            # changed or removed, and changed or added
+            stale = {key for key, digest in loaded.items() if current.get(key) != digest}
+            fresh = {key for key, digest in current.items() if loaded.get(key) != digest}
+            changes = {table: (
+                {key[1:] for key in stale if key[0] == table},
+                {key[1:] for key in fresh if key[0] == table},
+            ) for table in COMPARED}
+            columns = dict(TABLES)
+            # children before parents when deleting, parents before children when adding
+            for table in ('on_road_vehicle', 'means_of_transportation'):
+                delete_groups(cur, table, changes[table][0])
+            for table in ('population', 'municipality'):
+                delete_groups(cur, table, changes[table][0] - changes[table][1])
+            upsert_rows(cur, 'municipality', columns['municipality'], ('MNo',),
+                        [row for row in tables['municipality'] if (row[0], 0) in changes['municipality'][1]])
+            upsert_rows(cur, 'population', columns['population'], ('MNo', 'Year'),
+                        [row for row in tables['population'] if row[:2] in changes['population'][1]])
+            for table in ('means_of_transportation', 'on_road_vehicle'):
+                copy_rows(cur, table, columns[table], [row for row in tables[table] if row[:2] in changes[table][1]])
+            for table in ('data_version', 'ingest_source', 'ingest_municipality', 'ingest_row'):
+                cur.execute(f'DELETE FROM {table};')
+                copy_rows(cur, table, columns[table], tables[table])
+            for statement in INDEXES:
+                cur.execute(statement)
+            refresh_aggregates(cur)
+            for table in COMPARED:
+                removed, added = changes[table]
+                print(f'{table}: {len(added)} groups of rows added or changed, {len(removed - added)} removed')
+        vacuum(conn)
+        return True
+    finally:
+        conn.close()
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Load the Sustainable Jersey data.')
+    parser.add_argument('--copy', action='store_true', help='load straight into a running database instead of writing initialize_db.sql')
+    parser.add_argument('--incremental', action='store_true', help='load only what changed into a running database, or everything if it was never loaded this way')
+    parser.add_argument('--dsn', default='dbname=njdata', help='database to load into with --copy or --incremental (default: %(default)s)')
+    args = parser.parse_args()
+    if args.incremental:
+        if not load_incrementally(args.dsn):
+            print('nothing to compare against, loading everything')
+            copy_into_database(args.dsn, load_rows())
+    elif args.copy:
+        copy_into_database(args.dsn, load_rows())
+    else:
+        write_script('initialize_db.sql', load_rows())
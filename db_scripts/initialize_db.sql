@@ -1,5 +1,11 @@
-DROP TABLE means_of_transportation;
+DROP MATERIALIZED VIEW IF EXISTS ranking;
+DROP MATERIALIZED VIEW IF EXISTS totals;
+DROP TABLE ingest_row;
+DROP TABLE ingest_municipality;
+DROP TABLE ingest_source;
+DROP TABLE data_version;
 DROP TABLE on_road_vehicle;
+DROP TABLE means_of_transportation;
 DROP TABLE population;
 DROP TABLE municipality;
 CREATE TYPE on_road_vehicle_type AS ENUM(
@@ -40,6 +46,79 @@ Percentage DECIMAL(7,3),
 PRIMARY KEY (MNo, Year, Type),
 FOREIGN KEY (MNo, Year) REFERENCES population (MNo, Year)
 );
+CREATE TABLE data_version (
+Version CHAR(16),
+Loaded TIMESTAMP WITH TIME ZONE DEFAULT now()
+);
+CREATE TABLE ingest_source (
+Source VARCHAR(30),
+Fingerprint CHAR(64),
+PRIMARY KEY (Source)
+);
+CREATE TABLE ingest_municipality (
+MNo SMALLINT,
+NameKey VARCHAR(40),
+CountyKey VARCHAR(10),
+PRIMARY KEY (MNo)
+);
+CREATE TABLE ingest_row (
+TableName VARCHAR(30),
+MNo SMALLINT,
+Year SMALLINT,
+Hash CHAR(16),
+PRIMARY KEY (TableName, MNo, Year)
+);
+CREATE MATERIALIZED VIEW ranking AS
+WITH metric_value (Metric, Year, MNo, Value) AS (
+    SELECT 'population'::text, Year, MNo, Pop::float8 FROM population
+    UNION ALL SELECT 'co2', Year, MNo, CO2 FROM population
+    UNION ALL SELECT 'co2_per_capita', Year, MNo, CO2::float8 / NULLIF(Pop, 0) FROM population
+    UNION ALL SELECT 'evs', Year, MNo, EVs FROM population
+    UNION ALL SELECT 'ev_share', Year, MNo, 100.0 * EVs / NULLIF(PersonalVehicles, 0) FROM population
+    UNION ALL SELECT 'vehicle_co2', Year, MNo, SUM(CO2) FROM on_road_vehicle GROUP BY Year, MNo
+    UNION ALL SELECT 'vehicle_miles', Year, MNo, SUM(Miles) FROM on_road_vehicle GROUP BY Year, MNo
+    UNION ALL SELECT 'vehicle_co2:' || Type, Year, MNo, CO2 FROM on_road_vehicle
+    UNION ALL SELECT 'transportation:' || Type, Year, MNo, Percentage FROM means_of_transportation
+)
+SELECT v.Metric, v.Year, v.MNo, v.Value,
+    v.Value - LAG(v.Value) OVER (PARTITION BY v.Metric, v.MNo ORDER BY v.Year) AS Delta,
+    RANK() OVER (PARTITION BY v.Metric, v.Year ORDER BY v.Value DESC) AS Rank,
+    PERCENT_RANK() OVER (PARTITION BY v.Metric, v.Year ORDER BY v.Value) AS Percentile,
+    p.Pop
+FROM metric_value v
+JOIN municipality m ON m.MNo = v.MNo
+LEFT JOIN population p ON p.MNo = v.MNo AND p.Year = v.Year
+WHERE v.Value IS NOT NULL
+WITH NO DATA;
+CREATE UNIQUE INDEX ranking_key ON ranking (Metric, Year, MNo);
+CREATE MATERIALIZED VIEW totals AS
+WITH people AS (
+    SELECT m.County, p.Year, SUM(p.Pop) AS Pop, SUM(p.CO2) AS CO2, SUM(p.EVs) AS EVs, SUM(p.PersonalVehicles) AS PersonalVehicles
+    FROM population p JOIN municipality m ON m.MNo = p.MNo
+    GROUP BY GROUPING SETS ((m.County, p.Year), (p.Year))
+), vehicles AS (
+    SELECT m.County, v.Year, SUM(v.CO2) AS CO2, SUM(v.Miles) AS Miles
+    FROM on_road_vehicle v JOIN municipality m ON m.MNo = v.MNo
+    GROUP BY GROUPING SETS ((m.County, v.Year), (v.Year))
+), total (County, Year, Metric, Value) AS (
+    SELECT County, Year, Metric, Value FROM people, LATERAL (VALUES
+        ('population', Pop::float8),
+        ('co2', CO2::float8),
+        ('co2_per_capita', CO2::float8 / NULLIF(Pop, 0)),
+        ('evs', EVs::float8),
+        ('ev_share', 100.0 * EVs / NULLIF(PersonalVehicles, 0))
+    ) AS metric (Metric, Value)
+    UNION ALL
+    SELECT County, Year, Metric, Value FROM vehicles, LATERAL (VALUES
+        ('vehicle_co2', CO2::float8),
+        ('vehicle_miles', Miles::float8)
+    ) AS metric (Metric, Value)
+)
+SELECT Metric, Year, County, Value,
+    Value - LAG(Value) OVER (PARTITION BY Metric, County ORDER BY Year) AS Delta
+FROM total
+WITH NO DATA;
+CREATE INDEX totals_key ON totals (Metric, Year);
 INSERT INTO municipality (MNo, Name, County) VALUES
 (0, 'Aberdeen Township', 'Monmouth'),
 (1, 'Absecon City', 'Atlantic'),
@@ -1737,7 +1816,7 @@ INSERT INTO population (MNo, Year, EVs, CO2, Pop, PersonalVehicles) VALUES
 (563, 2020, 6, 41149, 546, 384),
 (564, 2015, 9, 154264, 17045, 11639),
 (564, 2020, 119, 157069, 16959, 11582);
-;INSERT INTO means_of_transportation (MNo, Year, Type, Percentage) VALUES
+INSERT INTO means_of_transportation (MNo, Year, Type, Percentage) VALUES
 (0, 2015, 'car, truck, or van', 83.9154013015184),
 (0, 2015, 'public transport', 11.0737527114967),
 (0, 2015, 'taxicab', 0.726681127982646),
@@ -25417,3 +25496,4539 @@ INSERT INTO on_road_vehicle (MNo, Year, Type, CO2, Miles) VALUES
 (564, 2019, 'single unit long-haul truck', 1210.38, 1185237),
 (564, 2019, 'single unit short-haul truck', 3056.55, 2901759),
 (564, 2019, 'transit bus', 486.0, 410806);
+INSERT INTO data_version (Version) VALUES
+('49d5cd74a111799d');
+INSERT INTO ingest_source (Source, Fingerprint) VALUES
+('community.csv', 'ada176d408bc34793e2b4b3b0bc528c0e9c06a22f5b359d0a3e504decb424029'),
+('community_ghg.csv', 'ecbf523ba05fc2a732785a7c8894e890e6e24b02bca9a5ca16dac49c1b733f49'),
+('ev.csv', 'a4a06606b2d28274d8b1bdf19bffadf45ae0910b770a98d1e5ed485868d2ae5e'),
+('ghg.csv', '6b7e6102f98705636d3df917630154325a7fd5e490a931fce7e9300e2647e5bc'),
+('vmt.csv', '8c6e5089016bd73cf852ead44c6c758651e36be749c4823d0c0fb4b4a638feb2');
+INSERT INTO ingest_municipality (MNo, NameKey, CountyKey) VALUES
+(0, 'aberdeen township', 'monmouth'),
+(1, 'absecon city', 'atlantic'),
+(2, 'alexandria township', 'hunterdon'),
+(3, 'allamuchy township', 'warren'),
+(4, 'allendale borough', 'bergen'),
+(5, 'allenhurst borough', 'monmouth'),
+(6, 'allentown borough', 'monmouth'),
+(7, 'alloway township', 'salem'),
+(8, 'alpha borough', 'warren'),
+(9, 'alpine borough', 'bergen'),
+(10, 'andover borough', 'sussex'),
+(11, 'andover township', 'sussex'),
+(12, 'asbury park city', 'monmouth'),
+(13, 'atlantic city city', 'atlantic'),
+(14, 'atlantic highlands borough', 'monmouth'),
+(15, 'audubon borough', 'camden'),
+(16, 'audubon park borough', 'camden'),
+(17, 'avalon borough', 'cape may'),
+(18, 'avon-by-the-sea borough', 'monmouth'),
+(19, 'barnegat light borough', 'ocean'),
+(20, 'barnegat township', 'ocean'),
+(21, 'barrington borough', 'camden'),
+(22, 'bass river township', 'burlington'),
+(23, 'bay head borough', 'ocean'),
+(24, 'bayonne city', 'hudson'),
+(25, 'beach haven borough', 'ocean'),
+(26, 'beachwood borough', 'ocean'),
+(27, 'bedminster township', 'somerset'),
+(28, 'belleville township', 'essex'),
+(29, 'bellmawr borough', 'camden'),
+(30, 'belmar borough', 'monmouth'),
+(31, 'belvidere town', 'warren'),
+(32, 'bergenfield borough', 'bergen'),
+(33, 'berkeley heights township', 'union'),
+(34, 'berkeley township', 'ocean'),
+(35, 'berlin borough', 'camden'),
+(36, 'berlin township', 'camden'),
+(37, 'bernards township', 'somerset'),
+(38, 'bernardsville borough', 'somerset'),
+(39, 'bethlehem township', 'hunterdon'),
+(40, 'beverly city', 'burlington'),
+(41, 'blairstown township', 'warren'),
+(42, 'bloomfield township', 'essex'),
+(43, 'bloomingdale borough', 'passaic'),
+(44, 'bloomsbury borough', 'hunterdon'),
+(45, 'bogota borough', 'bergen'),
+(46, 'boonton town', 'morris'),
+(47, 'boonton township', 'morris'),
+(48, 'bordentown city', 'burlington'),
+(49, 'bordentown township', 'burlington'),
+(50, 'bound brook borough', 'somerset'),
+(51, 'bradley beach borough', 'monmouth'),
+(52, 'branchburg township', 'somerset'),
+(53, 'branchville borough', 'sussex'),
+(54, 'brick township', 'ocean'),
+(55, 'bridgeton city', 'cumberland'),
+(56, 'bridgewater township', 'somerset'),
+(57, 'brielle borough', 'monmouth'),
+(58, 'brigantine city', 'atlantic'),
+(59, 'brooklawn borough', 'camden'),
+(60, 'buena borough', 'atlantic'),
+(61, 'buena vista township', 'atlantic'),
+(62, 'burlington city', 'burlington'),
+(63, 'burlington township', 'burlington'),
+(64, 'butler borough', 'morris'),
+(65, 'byram township', 'sussex'),
+(66, 'caldwell borough', 'essex'),
+(67, 'califon borough', 'hunterdon'),
+(68, 'camden city', 'camden'),
+(69, 'cape may city', 'cape may'),
+(70, 'cape may point borough', 'cape may'),
+(71, 'carlstadt borough', 'bergen'),
+(72, 'carneys point township', 'salem'),
+(73, 'carteret borough', 'middlesex'),
+(74, 'cedar grove township', 'essex'),
+(75, 'chatham borough', 'morris'),
+(76, 'chatham township', 'morris'),
+(77, 'cherry hill township', 'camden'),
+(78, 'chesilhurst borough', 'camden'),
+(79, 'chester borough', 'morris'),
+(80, 'chester township', 'morris'),
+(81, 'chesterfield township', 'burlington'),
+(82, 'cinnaminson township', 'burlington'),
+(83, 'city of orange township', 'essex'),
+(84, 'clark township', 'union'),
+(85, 'clayton borough', 'gloucester'),
+(86, 'clementon borough', 'camden'),
+(87, 'cliffside park borough', 'bergen'),
+(88, 'clifton city', 'passaic'),
+(89, 'clinton town', 'hunterdon'),
+(90, 'clinton township', 'hunterdon'),
+(91, 'closter borough', 'bergen'),
+(92, 'collingswood borough', 'camden'),
+(93, 'colts neck township', 'monmouth'),
+(94, 'commercial township', 'cumberland'),
+(95, 'corbin city city', 'atlantic'),
+(96, 'cranbury township', 'middlesex'),
+(97, 'cranford township', 'union'),
+(98, 'cresskill borough', 'bergen'),
+(99, 'deal borough', 'monmouth'),
+(100, 'deerfield township', 'cumberland'),
+(101, 'delanco township', 'burlington'),
+(102, 'delaware township', 'hunterdon'),
+(103, 'delran township', 'burlington'),
+(104, 'demarest borough', 'bergen'),
+(105, 'dennis township', 'cape may'),
+(106, 'denville township', 'morris'),
+(107, 'deptford township', 'gloucester'),
+(108, 'dover town', 'morris'),
+(109, 'downe township', 'cumberland'),
+(110, 'dumont borough', 'bergen'),
+(111, 'dunellen borough', 'middlesex'),
+(112, 'eagleswood township', 'ocean'),
+(113, 'east amwell township', 'hunterdon'),
+(114, 'east brunswick township', 'middlesex'),
+(115, 'east greenwich township', 'gloucester'),
+(116, 'east hanover township', 'morris'),
+(117, 'east newark borough', 'hudson'),
+(118, 'east orange city', 'essex'),
+(119, 'east rutherford borough', 'bergen'),
+(120, 'east windsor township', 'mercer'),
+(121, 'eastampton township', 'burlington'),
+(122, 'eatontown borough', 'monmouth'),
+(123, 'edgewater borough', 'bergen'),
+(124, 'edgewater park township', 'burlington'),
+(125, 'edison township', 'middlesex'),
+(126, 'egg harbor city city', 'atlantic'),
+(127, 'egg harbor township', 'atlantic'),
+(128, 'elizabeth city', 'union'),
+(129, 'elk township', 'gloucester'),
+(130, 'elmer borough', 'salem'),
+(131, 'elmwood park borough', 'bergen'),
+(132, 'elsinboro township', 'salem'),
+(133, 'emerson borough', 'bergen'),
+(134, 'englewood city', 'bergen'),
+(135, 'englewood cliffs borough', 'bergen'),
+(136, 'englishtown borough', 'monmouth'),
+(137, 'essex fells borough', 'essex'),
+(138, 'estell manor city', 'atlantic'),
+(139, 'evesham township', 'burlington'),
+(140, 'ewing township', 'mercer'),
+(141, 'fair haven borough', 'monmouth'),
+(142, 'fair lawn borough', 'bergen'),
+(143, 'fairfield township', 'cumberland'),
+(144, 'fairfield township', 'essex'),
+(145, 'fairview borough', 'bergen'),
+(146, 'fanwood borough', 'union'),
+(147, 'far hills borough', 'somerset'),
+(148, 'farmingdale borough', 'monmouth'),
+(149, 'fieldsboro borough', 'burlington'),
+(150, 'flemington borough', 'hunterdon'),
+(151, 'florence township', 'burlington'),
+(152, 'florham park borough', 'morris'),
+(153, 'folsom borough', 'atlantic'),
+(154, 'fort lee borough', 'bergen'),
+(155, 'frankford township', 'sussex'),
+(156, 'franklin borough', 'sussex'),
+(157, 'franklin lakes borough', 'bergen'),
+(158, 'franklin township', 'gloucester'),
+(159, 'franklin township', 'hunterdon'),
+(160, 'franklin township', 'somerset'),
+(161, 'franklin township', 'warren'),
+(162, 'fredon township', 'sussex'),
+(163, 'freehold borough', 'monmouth'),
+(164, 'freehold township', 'monmouth'),
+(165, 'frelinghuysen township', 'warren'),
+(166, 'frenchtown borough', 'hunterdon'),
+(167, 'galloway township', 'atlantic'),
+(168, 'garfield city', 'bergen'),
+(169, 'garwood borough', 'union'),
+(170, 'gibbsboro borough', 'camden'),
+(171, 'glassboro borough', 'gloucester'),
+(172, 'glen gardner borough', 'hunterdon'),
+(173, 'glen ridge borough', 'essex'),
+(174, 'glen rock borough', 'bergen'),
+(175, 'gloucester city city', 'camden'),
+(176, 'gloucester township', 'camden'),
+(177, 'green brook township', 'somerset'),
+(178, 'green township', 'sussex'),
+(179, 'greenwich township', 'cumberland'),
+(180, 'greenwich township', 'gloucester'),
+(181, 'greenwich township', 'warren'),
+(182, 'guttenberg town', 'hudson'),
+(183, 'hackensack city', 'bergen'),
+(184, 'hackettstown town', 'warren'),
+(185, 'haddon heights borough', 'camden'),
+(186, 'haddon township', 'camden'),
+(187, 'haddonfield borough', 'camden'),
+(188, 'hainesport township', 'burlington'),
+(189, 'haledon borough', 'passaic'),
+(190, 'hamburg borough', 'sussex'),
+(191, 'hamilton township', 'atlantic'),
+(192, 'hamilton township', 'mercer'),
+(193, 'hammonton town', 'atlantic'),
+(194, 'hampton borough', 'hunterdon'),
+(195, 'hampton township', 'sussex'),
+(196, 'hanover township', 'morris'),
+(197, 'harding township', 'morris'),
+(198, 'hardwick township', 'warren'),
+(199, 'hardyston township', 'sussex'),
+(200, 'harmony township', 'warren'),
+(201, 'harrington park borough', 'bergen'),
+(202, 'harrison town', 'hudson'),
+(203, 'harrison township', 'gloucester'),
+(204, 'harvey cedars borough', 'ocean'),
+(205, 'hasbrouck heights borough', 'bergen'),
+(206, 'haworth borough', 'bergen'),
+(207, 'hawthorne borough', 'passaic'),
+(208, 'hazlet township', 'monmouth'),
+(209, 'helmetta borough', 'middlesex'),
+(210, 'high bridge borough', 'hunterdon'),
+(211, 'highland park borough', 'middlesex'),
+(212, 'highlands borough', 'monmouth'),
+(213, 'hightstown borough', 'mercer'),
+(214, 'hillsborough township', 'somerset'),
+(215, 'hillsdale borough', 'bergen'),
+(216, 'hillside township', 'union'),
+(217, 'hi-nella borough', 'camden'),
+(218, 'hoboken city', 'hudson'),
+(219, 'ho-ho-kus borough', 'bergen'),
+(220, 'holland township', 'hunterdon'),
+(221, 'holmdel township', 'monmouth'),
+(222, 'hopatcong borough', 'sussex'),
+(223, 'hope township', 'warren'),
+(224, 'hopewell borough', 'mercer'),
+(225, 'hopewell township', 'cumberland'),
+(226, 'hopewell township', 'mercer'),
+(227, 'howell township', 'monmouth'),
+(228, 'independence township', 'warren'),
+(229, 'interlaken borough', 'monmouth'),
+(230, 'irvington township', 'essex'),
+(231, 'island heights borough', 'ocean'),
+(232, 'jackson township', 'ocean'),
+(233, 'jamesburg borough', 'middlesex'),
+(234, 'jefferson township', 'morris'),
+(235, 'jersey city city', 'hudson'),
+(236, 'keansburg borough', 'monmouth'),
+(237, 'kearny town', 'hudson'),
+(238, 'kenilworth borough', 'union'),
+(239, 'keyport borough', 'monmouth'),
+(240, 'kingwood township', 'hunterdon'),
+(241, 'kinnelon borough', 'morris'),
+(242, 'knowlton township', 'warren'),
+(243, 'lacey township', 'ocean'),
+(244, 'lafayette township', 'sussex'),
+(245, 'lake como borough', 'monmouth'),
+(246, 'lakehurst borough', 'ocean'),
+(247, 'lakewood township', 'ocean'),
+(248, 'lambertville city', 'hunterdon'),
+(249, 'laurel springs borough', 'camden'),
+(250, 'lavallette borough', 'ocean'),
+(251, 'lawnside borough', 'camden'),
+(252, 'lawrence township', 'cumberland'),
+(253, 'lawrence township', 'mercer'),
+(254, 'lebanon borough', 'hunterdon'),
+(255, 'lebanon township', 'hunterdon'),
+(256, 'leonia borough', 'bergen'),
+(257, 'liberty township', 'warren'),
+(258, 'lincoln park borough', 'morris'),
+(259, 'linden city', 'union'),
+(260, 'lindenwold borough', 'camden'),
+(261, 'linwood city', 'atlantic'),
+(262, 'little egg harbor township', 'ocean'),
+(263, 'little falls township', 'passaic'),
+(264, 'little ferry borough', 'bergen'),
+(265, 'little silver borough', 'monmouth'),
+(266, 'livingston township', 'essex'),
+(267, 'loch arbour village', 'monmouth'),
+(268, 'lodi borough', 'bergen'),
+(269, 'logan township', 'gloucester'),
+(270, 'long beach township', 'ocean'),
+(271, 'long branch city', 'monmouth'),
+(272, 'long hill township', 'morris'),
+(273, 'longport borough', 'atlantic'),
+(274, 'lopatcong township', 'warren'),
+(275, 'lower alloways creek township', 'salem'),
+(276, 'lower township', 'cape may'),
+(277, 'lumberton township', 'burlington'),
+(278, 'lyndhurst township', 'bergen'),
+(279, 'madison borough', 'morris'),
+(280, 'magnolia borough', 'camden'),
+(281, 'mahwah township', 'bergen'),
+(282, 'manalapan township', 'monmouth'),
+(283, 'manasquan borough', 'monmouth'),
+(284, 'manchester township', 'ocean'),
+(285, 'mannington township', 'salem'),
+(286, 'mansfield township', 'burlington'),
+(287, 'mansfield township', 'warren'),
+(288, 'mantoloking borough', 'ocean'),
+(289, 'mantua township', 'gloucester'),
+(290, 'manville borough', 'somerset'),
+(291, 'maple shade township', 'burlington'),
+(292, 'maplewood township', 'essex'),
+(293, 'margate city city', 'atlantic'),
+(294, 'marlboro township', 'monmouth'),
+(295, 'matawan borough', 'monmouth'),
+(296, 'maurice river township', 'cumberland'),
+(297, 'maywood borough', 'bergen'),
+(298, 'medford lakes borough', 'burlington'),
+(299, 'medford township', 'burlington'),
+(300, 'mendham borough', 'morris'),
+(301, 'mendham township', 'morris'),
+(302, 'merchantville borough', 'camden'),
+(303, 'metuchen borough', 'middlesex'),
+(304, 'middle township', 'cape may'),
+(305, 'middlesex borough', 'middlesex'),
+(306, 'middletown township', 'monmouth'),
+(307, 'midland park borough', 'bergen'),
+(308, 'milford borough', 'hunterdon'),
+(309, 'millburn township', 'essex'),
+(310, 'millstone borough', 'somerset'),
+(311, 'millstone township', 'monmouth'),
+(312, 'milltown borough', 'middlesex'),
+(313, 'millville city', 'cumberland'),
+(314, 'mine hill township', 'morris'),
+(315, 'monmouth beach borough', 'monmouth'),
+(316, 'monroe township', 'gloucester'),
+(317, 'monroe township', 'middlesex'),
+(318, 'montague township', 'sussex'),
+(319, 'montclair township', 'essex'),
+(320, 'montgomery township', 'somerset'),
+(321, 'montvale borough', 'bergen'),
+(322, 'montville township', 'morris'),
+(323, 'moonachie borough', 'bergen'),
+(324, 'moorestown township', 'burlington'),
+(325, 'morris plains borough', 'morris'),
+(326, 'morris township', 'morris'),
+(327, 'morristown town', 'morris'),
+(328, 'mount arlington borough', 'morris'),
+(329, 'mount ephraim borough', 'camden'),
+(330, 'mount holly township', 'burlington'),
+(331, 'mount laurel township', 'burlington'),
+(332, 'mount olive township', 'morris'),
+(333, 'mountain lakes borough', 'morris'),
+(334, 'mountainside borough', 'union'),
+(335, 'mullica township', 'atlantic'),
+(336, 'national park borough', 'gloucester'),
+(337, 'neptune city borough', 'monmouth'),
+(338, 'neptune township', 'monmouth'),
+(339, 'netcong borough', 'morris'),
+(340, 'new brunswick city', 'middlesex'),
+(341, 'new hanover township', 'burlington'),
+(342, 'new milford borough', 'bergen'),
+(343, 'new providence borough', 'union'),
+(344, 'newark city', 'essex'),
+(345, 'newfield borough', 'gloucester'),
+(346, 'newton town', 'sussex'),
+(347, 'north arlington borough', 'bergen'),
+(348, 'north bergen township', 'hudson'),
+(349, 'north brunswick township', 'middlesex'),
+(350, 'north caldwell borough', 'essex'),
+(351, 'north haledon borough', 'passaic'),
+(352, 'north hanover township', 'burlington'),
+(353, 'north plainfield borough', 'somerset'),
+(354, 'north wildwood city', 'cape may'),
+(355, 'northfield city', 'atlantic'),
+(356, 'northvale borough', 'bergen'),
+(357, 'norwood borough', 'bergen'),
+(358, 'nutley township', 'essex'),
+(359, 'oakland borough', 'bergen'),
+(360, 'oaklyn borough', 'camden'),
+(361, 'ocean city city', 'cape may'),
+(362, 'ocean gate borough', 'ocean'),
+(363, 'ocean township', 'monmouth'),
+(364, 'ocean township', 'ocean'),
+(365, 'oceanport borough', 'monmouth'),
+(366, 'ogdensburg borough', 'sussex'),
+(367, 'old bridge township', 'middlesex'),
+(368, 'old tappan borough', 'bergen'),
+(369, 'oldmans township', 'salem'),
+(370, 'oradell borough', 'bergen'),
+(371, 'oxford township', 'warren'),
+(372, 'palisades park borough', 'bergen'),
+(373, 'palmyra borough', 'burlington'),
+(374, 'paramus borough', 'bergen'),
+(375, 'park ridge borough', 'bergen'),
+(376, 'parsippany-troy hills township', 'morris'),
+(377, 'passaic city', 'passaic'),
+(378, 'paterson city', 'passaic'),
+(379, 'paulsboro borough', 'gloucester'),
+(380, 'peapack and gladstone borough', 'somerset'),
+(381, 'pemberton borough', 'burlington'),
+(382, 'pemberton township', 'burlington'),
+(383, 'pennington borough', 'mercer'),
+(384, 'penns grove borough', 'salem'),
+(385, 'pennsauken township', 'camden'),
+(386, 'pennsville township', 'salem'),
+(387, 'pequannock township', 'morris'),
+(388, 'perth amboy city', 'middlesex'),
+(389, 'phillipsburg town', 'warren'),
+(390, 'pilesgrove township', 'salem'),
+(391, 'pine beach borough', 'ocean'),
+(392, 'pine hill borough', 'camden'),
+(393, 'pine valley borough', 'camden'),
+(394, 'piscataway township', 'middlesex'),
+(395, 'pitman borough', 'gloucester'),
+(396, 'pittsgrove township', 'salem'),
+(397, 'plainfield city', 'union'),
+(398, 'plainsboro township', 'middlesex'),
+(399, 'pleasantville city', 'atlantic'),
+(400, 'plumsted township', 'ocean'),
+(401, 'pohatcong township', 'warren'),
+(402, 'point pleasant beach borough', 'ocean'),
+(403, 'point pleasant borough', 'ocean'),
+(404, 'pompton lakes borough', 'passaic'),
+(405, 'port republic city', 'atlantic'),
+(406, 'princeton', 'mercer'),
+(407, 'prospect park borough', 'passaic'),
+(408, 'quinton township', 'salem'),
+(409, 'rahway city', 'union'),
+(410, 'ramsey borough', 'bergen'),
+(411, 'randolph township', 'morris'),
+(412, 'raritan borough', 'somerset'),
+(413, 'raritan township', 'hunterdon'),
+(414, 'readington township', 'hunterdon'),
+(415, 'red bank borough', 'monmouth'),
+(416, 'ridgefield borough', 'bergen'),
+(417, 'ridgefield park village', 'bergen'),
+(418, 'ridgewood village', 'bergen'),
+(419, 'ringwood borough', 'passaic'),
+(420, 'river edge borough', 'bergen'),
+(421, 'river vale township', 'bergen'),
+(422, 'riverdale borough', 'morris'),
+(423, 'riverside township', 'burlington'),
+(424, 'riverton borough', 'burlington'),
+(425, 'robbinsville township', 'mercer'),
+(426, 'rochelle park township', 'bergen'),
+(427, 'rockaway borough', 'morris'),
+(428, 'rockaway township', 'morris'),
+(429, 'rockleigh borough', 'bergen'),
+(430, 'rocky hill borough', 'somerset'),
+(431, 'roosevelt borough', 'monmouth'),
+(432, 'roseland borough', 'essex'),
+(433, 'roselle borough', 'union'),
+(434, 'roselle park borough', 'union'),
+(435, 'roxbury township', 'morris'),
+(436, 'rumson borough', 'monmouth'),
+(437, 'runnemede borough', 'camden'),
+(438, 'rutherford borough', 'bergen'),
+(439, 'saddle brook township', 'bergen'),
+(440, 'saddle river borough', 'bergen'),
+(441, 'salem city', 'salem'),
+(442, 'sandyston township', 'sussex'),
+(443, 'sayreville borough', 'middlesex'),
+(444, 'scotch plains township', 'union'),
+(445, 'sea bright borough', 'monmouth'),
+(446, 'sea girt borough', 'monmouth'),
+(447, 'sea isle city city', 'cape may'),
+(448, 'seaside heights borough', 'ocean'),
+(449, 'seaside park borough', 'ocean'),
+(450, 'secaucus town', 'hudson'),
+(451, 'shamong township', 'burlington'),
+(452, 'shiloh borough', 'cumberland'),
+(453, 'ship bottom borough', 'ocean'),
+(454, 'shrewsbury borough', 'monmouth'),
+(455, 'shrewsbury township', 'monmouth'),
+(456, 'somerdale borough', 'camden'),
+(457, 'somers point city', 'atlantic'),
+(458, 'somerville borough', 'somerset'),
+(459, 'south amboy city', 'middlesex'),
+(460, 'south bound brook borough', 'somerset'),
+(461, 'south brunswick township', 'middlesex'),
+(462, 'south hackensack township', 'bergen'),
+(463, 'south harrison township', 'gloucester'),
+(464, 'south orange village township', 'essex'),
+(465, 'south plainfield borough', 'middlesex'),
+(466, 'south river borough', 'middlesex'),
+(467, 'south toms river borough', 'ocean'),
+(468, 'southampton township', 'burlington'),
+(469, 'sparta township', 'sussex'),
+(470, 'spotswood borough', 'middlesex'),
+(471, 'spring lake borough', 'monmouth'),
+(472, 'spring lake heights borough', 'monmouth'),
+(473, 'springfield township', 'burlington'),
+(474, 'springfield township', 'union'),
+(475, 'stafford township', 'ocean'),
+(476, 'stanhope borough', 'sussex'),
+(477, 'stillwater township', 'sussex'),
+(478, 'stockton borough', 'hunterdon'),
+(479, 'stone harbor borough', 'cape may'),
+(480, 'stow creek township', 'cumberland'),
+(481, 'stratford borough', 'camden'),
+(482, 'summit city', 'union'),
+(483, 'surf city borough', 'ocean'),
+(484, 'sussex borough', 'sussex'),
+(485, 'swedesboro borough', 'gloucester'),
+(486, 'tabernacle township', 'burlington'),
+(487, 'tavistock borough', 'camden'),
+(488, 'teaneck township', 'bergen'),
+(489, 'tenafly borough', 'bergen'),
+(490, 'teterboro borough', 'bergen'),
+(491, 'tewksbury township', 'hunterdon'),
+(492, 'tinton falls borough', 'monmouth'),
+(493, 'toms river township', 'ocean'),
+(494, 'totowa borough', 'passaic'),
+(495, 'trenton city', 'mercer'),
+(496, 'tuckerton borough', 'ocean'),
+(497, 'union beach borough', 'monmouth'),
+(498, 'union city city', 'hudson'),
+(499, 'union township', 'hunterdon'),
+(500, 'union township', 'union'),
+(501, 'upper deerfield township', 'cumberland'),
+(502, 'upper freehold township', 'monmouth'),
+(503, 'upper pittsgrove township', 'salem'),
+(504, 'upper saddle river borough', 'bergen'),
+(505, 'upper township', 'cape may'),
+(506, 'ventnor city city', 'atlantic'),
+(507, 'vernon township', 'sussex'),
+(508, 'verona township', 'essex'),
+(509, 'victory gardens borough', 'morris'),
+(510, 'vineland city', 'cumberland'),
+(511, 'voorhees township', 'camden'),
+(512, 'waldwick borough', 'bergen'),
+(513, 'wall township', 'monmouth'),
+(514, 'wallington borough', 'bergen'),
+(515, 'walpack township', 'sussex'),
+(516, 'wanaque borough', 'passaic'),
+(517, 'wantage township', 'sussex'),
+(518, 'warren township', 'somerset'),
+(519, 'washington borough', 'warren'),
+(520, 'washington township', 'bergen'),
+(521, 'washington township', 'burlington'),
+(522, 'washington township', 'gloucester'),
+(523, 'washington township', 'morris'),
+(524, 'washington township', 'warren'),
+(525, 'watchung borough', 'somerset'),
+(526, 'waterford township', 'camden'),
+(527, 'wayne township', 'passaic'),
+(528, 'weehawken township', 'hudson'),
+(529, 'wenonah borough', 'gloucester'),
+(530, 'west amwell township', 'hunterdon'),
+(531, 'west caldwell township', 'essex'),
+(532, 'west cape may borough', 'cape may'),
+(533, 'west deptford township', 'gloucester'),
+(534, 'west long branch borough', 'monmouth'),
+(535, 'west milford township', 'passaic'),
+(536, 'west new york town', 'hudson'),
+(537, 'west orange township', 'essex'),
+(538, 'west wildwood borough', 'cape may'),
+(539, 'west windsor township', 'mercer'),
+(540, 'westampton township', 'burlington'),
+(541, 'westfield town', 'union'),
+(542, 'westville borough', 'gloucester'),
+(543, 'westwood borough', 'bergen'),
+(544, 'weymouth township', 'atlantic'),
+(545, 'wharton borough', 'morris'),
+(546, 'white township', 'warren'),
+(547, 'wildwood city', 'cape may'),
+(548, 'wildwood crest borough', 'cape may'),
+(549, 'willingboro township', 'burlington'),
+(550, 'winfield township', 'union'),
+(551, 'winslow township', 'camden'),
+(552, 'woodbine borough', 'cape may'),
+(553, 'woodbridge township', 'middlesex'),
+(554, 'woodbury city', 'gloucester'),
+(555, 'woodbury heights borough', 'gloucester'),
+(556, 'woodcliff lake borough', 'bergen'),
+(557, 'woodland park borough', 'passaic'),
+(558, 'woodland township', 'burlington'),
+(559, 'woodlynne borough', 'camden'),
+(560, 'wood-ridge borough', 'bergen'),
+(561, 'woodstown borough', 'salem'),
+(562, 'woolwich township', 'gloucester'),
+(563, 'wrightstown borough', 'burlington'),
+(564, 'wyckoff township', 'bergen'),
+(565, 'green brook township', 'sussex'),
+(566, 'green township', 'somerset'),
+(567, 'raritan borough', 'hunterdon'),
+(568, 'raritan township', 'somerset');
+INSERT INTO ingest_row (TableName, MNo, Year, Hash) VALUES
+('municipality', 0, 0, '19c0b6e899e56be4'),
+('municipality', 1, 0, 'd0b9846a383e6f1d'),
+('municipality', 2, 0, 'edf6bec90e1c6e2b'),
+('municipality', 3, 0, 'c7655189fdd4b0e6'),
+('municipality', 4, 0, 'e1057aacb036822a'),
+('municipality', 5, 0, '07eb0a7893024326'),
+('municipality', 6, 0, 'b4e9c238d0f88737'),
+('municipality', 7, 0, 'b15f2aa32c68fe55'),
+('municipality', 8, 0, '8d74bb8ad0eb8b9b'),
+('municipality', 9, 0, 'b8549901abae4b56'),
+('municipality', 10, 0, '46987e21cdcc357d'),
+('municipality', 11, 0, '3e70cf5b4a846d7f'),
+('municipality', 12, 0, '2cd15b19398a19bf'),
+('municipality', 13, 0, 'a4071d3c5b3680c5'),
+('municipality', 14, 0, '20700bcc52417364'),
+('municipality', 15, 0, '84e37451fbe36ef9'),
+('municipality', 16, 0, '1d38646b81db21b3'),
+('municipality', 17, 0, 'fe1d395b615df8ca'),
+('municipality', 18, 0, 'd7edc75d60ca3344'),
+('municipality', 19, 0, 'd79ca5767afd2a9d'),
+('municipality', 20, 0, '5d84d6db1c691f4a'),
+('municipality', 21, 0, '6812b0d844017367'),
+('municipality', 22, 0, '59aa2add715152e7'),
+('municipality', 23, 0, '27c44357c90648d7'),
+('municipality', 24, 0, '286e3dcf8c8b6b91'),
+('municipality', 25, 0, 'd7045cefaea6b9f3'),
+('municipality', 26, 0, '3c07d26b6b79f84b'),
+('municipality', 27, 0, 'cd649837ebe787be'),
+('municipality', 28, 0, 'f25979e4e0861f35'),
+('municipality', 29, 0, 'b363f4dc68557746'),
+('municipality', 30, 0, '346a8f6f80f932e7'),
+('municipality', 31, 0, '00d17e3ff1ae98b4'),
+('municipality', 32, 0, '88c6ba01f95bac98'),
+('municipality', 33, 0, 'f7dc63a0f3756258'),
+('municipality', 34, 0, '7bddb02cdf9f2fd3'),
+('municipality', 35, 0, '2acc1a4a62301cc6'),
+('municipality', 36, 0, 'daf9887a2ba651c9'),
+('municipality', 37, 0, 'a8c709416d89e0fc'),
+('municipality', 38, 0, '1e32b4cdacddba4e'),
+('municipality', 39, 0, 'a17bbbf9267249c5'),
+('municipality', 40, 0, 'c3a04ed966bbbe7e'),
+('municipality', 41, 0, '2c06e87347950a85'),
+('municipality', 42, 0, '48a9b636eaa144f2'),
+('municipality', 43, 0, '3977fb3927ed3ec2'),
+('municipality', 44, 0, '746645a4dc701d1b'),
+('municipality', 45, 0, '55978b7f11fb89e3'),
+('municipality', 46, 0, '20643a4c84a19a8c'),
+('municipality', 47, 0, 'ab728464095c8afb'),
+('municipality', 48, 0, '0e29833e4ec8aca5'),
+('municipality', 49, 0, '70d9fc6d9356b458'),
+('municipality', 50, 0, '0c2a41c4dcd67d82'),
+('municipality', 51, 0, 'c5b1dddab021afdd'),
+('municipality', 52, 0, '8e2b98087757ac33'),
+('municipality', 53, 0, '5faedfe90252a6a1'),
+('municipality', 54, 0, 'efe1156005b2f14d'),
+('municipality', 55, 0, 'c72ee94b22af774d'),
+('municipality', 56, 0, '7899788681b293fc'),
+('municipality', 57, 0, '013bfa23211aa531'),
+('municipality', 58, 0, 'b9261b59aee2c83e'),
+('municipality', 59, 0, '63b0acb5597b00c7'),
+('municipality', 60, 0, '641b47aeee691b2b'),
+('municipality', 61, 0, 'f334ee1e226cd9dc'),
+('municipality', 62, 0, '94403b92da3b4ffb'),
+('municipality', 63, 0, '4d8045ec3f5d8adb'),
+('municipality', 64, 0, 'd86af94e03a77d68'),
+('municipality', 65, 0, '6043dd5ac4f05a2e'),
+('municipality', 66, 0, 'bbf5c9af1854193e'),
+('municipality', 67, 0, '30afe7a3fae15458'),
+('municipality', 68, 0, 'b84dded8bd43e2d4'),
+('municipality', 69, 0, '5041a18f0adeea20'),
+('municipality', 70, 0, 'e379a5708c42d4b0'),
+('municipality', 71, 0, 'c002ee2671743378'),
+('municipality', 72, 0, 'cee4063496274712'),
+('municipality', 73, 0, 'f7e03e9a110372c4'),
+('municipality', 74, 0, '4c78b6f927959185'),
+('municipality', 75, 0, 'b6ff669f4e1b547b'),
+('municipality', 76, 0, '7d09615032d09027'),
+('municipality', 77, 0, '1f4e2b74761ec61e'),
+('municipality', 78, 0, '7d5e6977163cb896'),
+('municipality', 79, 0, '2a44f886e5dfb1e4'),
+('municipality', 80, 0, '97e9f66cd6cc4245'),
+('municipality', 81, 0, 'f23319bbeed444cf'),
+('municipality', 82, 0, '2b82e350c9259233'),
+('municipality', 83, 0, '355206d0ac3ebdda'),
+('municipality', 84, 0, 'a6cc916f023c7f5b'),
+('municipality', 85, 0, '2de685fd9a5052ce'),
+('municipality', 86, 0, 'e0d10fbf4bc9170b'),
+('municipality', 87, 0, '98fe9307a96bc78e'),
+('municipality', 88, 0, 'a0977def8f757c4b'),
+('municipality', 89, 0, '0f11e32984a4c832'),
+('municipality', 90, 0, 'e0c48fb35cf0fc78'),
+('municipality', 91, 0, '72bbcbcfca4da92b'),
+('municipality', 92, 0, 'c0d4e841099907e3'),
+('municipality', 93, 0, '3107a4974a07d2f6'),
+('municipality', 94, 0, '042aa5e4cc534292'),
+('municipality', 95, 0, 'ddbec2fbf7184085'),
+('municipality', 96, 0, 'a2453c70de74ff06'),
+('municipality', 97, 0, 'd6f43c816763d8f9'),
+('municipality', 98, 0, 'ff4b303c0d9b4fab'),
+('municipality', 99, 0, '28e6e37dac17750e'),
+('municipality', 100, 0, 'a64746747a4d3309'),
+('municipality', 101, 0, '571d7b63fd8fe424'),
+('municipality', 102, 0, 'ecf8d0095d1e9fdc'),
+('municipality', 103, 0, '13e80d4a8d90af0c'),
+('municipality', 104, 0, 'ced099b027fc5e03'),
+('municipality', 105, 0, 'e2e0d00c70958c68'),
+('municipality', 106, 0, 'b0313a4357851c94'),
+('municipality', 107, 0, 'da20ccaefe8b45a8'),
+('municipality', 108, 0, '1063de37e7136be0'),
+('municipality', 109, 0, 'e69ee0d954f2da02'),
+('municipality', 110, 0, '7814c6215e297ccb'),
+('municipality', 111, 0, 'c52cbd0f59be66cf'),
+('municipality', 112, 0, '334ca6c91fb85ba4'),
+('municipality', 113, 0, '401e1ff4fa1a766c'),
+('municipality', 114, 0, '6e714b7f7434eff6'),
+('municipality', 115, 0, '6e9764ab7d026ab8'),
+('municipality', 116, 0, '7f130eaf32a1d1d3'),
+('municipality', 117, 0, 'ed23dc0dfacc6605'),
+('municipality', 118, 0, '81eb0abd37bf7af3'),
+('municipality', 119, 0, '68f316dd1a93fdbb'),
+('municipality', 120, 0, '0a55a6415b3f3ae8'),
+('municipality', 121, 0, '96ac5ef780824f2f'),
+('municipality', 122, 0, '64d96811b0d28f72'),
+('municipality', 123, 0, '27541aac8610aa5c'),
+('municipality', 124, 0, '61551d9e62fa8fac'),
+('municipality', 125, 0, '02531d4c7c13353c'),
+('municipality', 126, 0, '7de3fec69d05d723'),
+('municipality', 127, 0, '055457f17f0c39ab'),
+('municipality', 128, 0, '99845956d524f2b9'),
+('municipality', 129, 0, '7f041c06ca28442b'),
+('municipality', 130, 0, '1b2b36ffeeaf8c3e'),
+('municipality', 131, 0, 'ab0bfd807899e2f6'),
+('municipality', 132, 0, '02cec24123dad251'),
+('municipality', 133, 0, 'cfd397a830cd38e9'),
+('municipality', 134, 0, 'd80f4004d8885599'),
+('municipality', 135, 0, 'b72a4331da3cf90a'),
+('municipality', 136, 0, 'ac903a65e562ced2'),
+('municipality', 137, 0, 'c06f38210ca4f702'),
+('municipality', 138, 0, '43d83c9de83c8c39'),
+('municipality', 139, 0, '24524e384a1f4dbf'),
+('municipality', 140, 0, '4d974bc015d4d57a'),
+('municipality', 141, 0, '41ae1419276ee2dc'),
+('municipality', 142, 0, '857bba62e2d30300'),
+('municipality', 143, 0, '43367f0007d5e9b8'),
+('municipality', 144, 0, 'f2d2de16fa4a0fef'),
+('municipality', 145, 0, 'a2b1686e2bbad89d'),
+('municipality', 146, 0, '249eec4621607cec'),
+('municipality', 147, 0, '32a788a34c3165a1'),
+('municipality', 148, 0, '317da393fa608a5a'),
+('municipality', 149, 0, 'ad88759e4ffa63a7'),
+('municipality', 150, 0, 'dd5862441d9ad25c'),
+('municipality', 151, 0, '962ae2b973142fb2'),
+('municipality', 152, 0, 'fa77d307dde98471'),
+('municipality', 153, 0, 'd86acab82482915e'),
+('municipality', 154, 0, 'faff804f31e9fed6'),
+('municipality', 155, 0, '31535f4cc3630be3'),
+('municipality', 156, 0, '01404fc29a2ce352'),
+('municipality', 157, 0, '5c6ae1b95260e6c4'),
+('municipality', 158, 0, 'af084254b241b79f'),
+('municipality', 159, 0, 'b5e6c5f61c39fa29'),
+('municipality', 160, 0, 'ef46ef443fa95ffc'),
+('municipality', 161, 0, '9010448a5e065c05'),
+('municipality', 162, 0, '5a49963240111810'),
+('municipality', 163, 0, '8506089724182862'),
+('municipality', 164, 0, '30700430485ae836'),
+('municipality', 165, 0, '65c626b65e3dad63'),
+('municipality', 166, 0, '04937d5ea0886ca1'),
+('municipality', 167, 0, '9f57b77093a464e9'),
+('municipality', 168, 0, '08b6b342eae35989'),
+('municipality', 169, 0, '1939af7274c52b8f'),
+('municipality', 170, 0, '62a00767c4a2de11'),
+('municipality', 171, 0, '5806d76008bae13d'),
+('municipality', 172, 0, '5d24a76d53ddfec5'),
+('municipality', 173, 0, '90556979acf7bd00'),
+('municipality', 174, 0, 'b6c2093556f88a29'),
+('municipality', 175, 0, '0edabb2ea96355b7'),
+('municipality', 176, 0, '3256ae4b8f76a347'),
+('municipality', 177, 0, 'febaa660f153f53e'),
+('municipality', 178, 0, '8832dc9cf43f19c8'),
+('municipality', 179, 0, 'b9beae5c8971f0f7'),
+('municipality', 180, 0, '7a86fc13720ed780'),
+('municipality', 181, 0, '5fbea9202ec79599'),
+('municipality', 182, 0, 'ad83cd1024717fd2'),
+('municipality', 183, 0, '6e6503d3e7269941'),
+('municipality', 184, 0, 'a645394b2f79a085'),
+('municipality', 185, 0, '0ac135edde373d83'),
+('municipality', 186, 0, '3dcdc989609afcf1'),
+('municipality', 187, 0, '84e3afb31a6ca226'),
+('municipality', 188, 0, '9f4271b0c0d51504'),
+('municipality', 189, 0, 'c37afc83cbde0af7'),
+('municipality', 190, 0, 'f510b32f803556c3'),
+('municipality', 191, 0, '8f0d09fbb8c2a6f8'),
+('municipality', 192, 0, '913b40d84ecff470'),
+('municipality', 193, 0, '74486f8282e5e542'),
+('municipality', 194, 0, '8821b17e79a2ef13'),
+('municipality', 195, 0, '5906e23870802271'),
+('municipality', 196, 0, '9b67569f5b2708ce'),
+('municipality', 197, 0, 'e8ef1128bf7afef7'),
+('municipality', 198, 0, '7985428c31b4940b'),
+('municipality', 199, 0, '3ea153275663d75f'),
+('municipality', 200, 0, '735f1d0ffad9f2a6'),
+('municipality', 201, 0, 'eac5ab640ae47112'),
+('municipality', 202, 0, 'e1aacc258ccd1351'),
+('municipality', 203, 0, 'dd7b1f838a563157'),
+('municipality', 204, 0, '24e98cf7f7e7af22'),
+('municipality', 205, 0, '4e5ff4acc69699ff'),
+('municipality', 206, 0, '82bce4ea80f0c2d5'),
+('municipality', 207, 0, 'cf01e6e05ee41609'),
+('municipality', 208, 0, '469cc9fc922a329c'),
+('municipality', 209, 0, 'cfa8f41dd2b07552'),
+('municipality', 210, 0, '6d894241dc8a6597'),
+('municipality', 211, 0, 'be6b7dc11ee6358a'),
+('municipality', 212, 0, '3d7b002841bfb805'),
+('municipality', 213, 0, 'b362e66f2d6704e8'),
+('municipality', 214, 0, 'c2b40f8334870edb'),
+('municipality', 215, 0, '78090e7eed41fea5'),
+('municipality', 216, 0, 'ca657a2318e66ed5'),
+('municipality', 217, 0, '983649ddfa606102'),
+('municipality', 218, 0, 'c110bb4a1829d7c0'),
+('municipality', 219, 0, 'b0c4d743d88ebe4e'),
+('municipality', 220, 0, '8b1b63ce436336d4'),
+('municipality', 221, 0, 'f71ca2ce90884c8b'),
+('municipality', 222, 0, '6bf2b914d47e6074'),
+('municipality', 223, 0, '639c4f373d8787e8'),
+('municipality', 224, 0, '9ded84415fab9683'),
+('municipality', 225, 0, '36585abafecf2945'),
+('municipality', 226, 0, '55481069f91fc3cc'),
+('municipality', 227, 0, 'b41f13b1652383d7'),
+('municipality', 228, 0, 'ed2b0884b88bd7c8'),
+('municipality', 229, 0, 'f276475a88d11fdf'),
+('municipality', 230, 0, '22d98288ef333627'),
+('municipality', 231, 0, 'd863cb24c40ca513'),
+('municipality', 232, 0, 'f093be487e7b2e8b'),
+('municipality', 233, 0, 'afc8767f5356fde5'),
+('municipality', 234, 0, '2584be113376cd9d'),
+('municipality', 235, 0, 'b53a1f767e256ac5'),
+('municipality', 236, 0, '9522d3b7e044ba43'),
+('municipality', 237, 0, 'e8f52f135197e864'),
+('municipality', 238, 0, 'fdf763406bb1b085'),
+('municipality', 239, 0, '231c3cb150303508'),
+('municipality', 240, 0, 'e083ded9138df42e'),
+('municipality', 241, 0, '9a02be20960b2727'),
+('municipality', 242, 0, '228f9fecf0c5ee84'),
+('municipality', 243, 0, 'ccdedcb4a88a9d8f'),
+('municipality', 244, 0, '09af0855c18a61ca'),
+('municipality', 245, 0, '2aa36bc471016b8d'),
+('municipality', 246, 0, '733d54fc301ec3f5'),
+('municipality', 247, 0, '1c7ae3bba0eeb4f9'),
+('municipality', 248, 0, 'eb661b406411acef'),
+('municipality', 249, 0, '7124b29da337b250'),
+('municipality', 250, 0, '2659c45040b14eb4'),
+('municipality', 251, 0, '4fb2d4d1432b881d'),
+('municipality', 252, 0, '89ae7fcf2e2dda2f'),
+('municipality', 253, 0, 'b8f70ae5f460ef07'),
+('municipality', 254, 0, '16131b6caa27a4c6'),
+('municipality', 255, 0, 'ec90b9df48ec4e54'),
+('municipality', 256, 0, '9893fe152eab420c'),
+('municipality', 257, 0, '1e1e167d02dc0e4c'),
+('municipality', 258, 0, 'f1bdc1dc61f1546f'),
+('municipality', 259, 0, 'a2dd399e316fa419'),
+('municipality', 260, 0, 'f9d628298d9f3530'),
+('municipality', 261, 0, '7a5c85eeb57dfe0c'),
+('municipality', 262, 0, 'a9c80c2cb6167cd2'),
+('municipality', 263, 0, '4931f882e88b35bc'),
+('municipality', 264, 0, '3c7dfc96064bb7f2'),
+('municipality', 265, 0, '1fb05826b23e4371'),
+('municipality', 266, 0, 'bff0b71508510f9c'),
+('municipality', 267, 0, '8ccf41c1574bc41d'),
+('municipality', 268, 0, 'e979295db0ebb839'),
+('municipality', 269, 0, '8daf6fdf912d5793'),
+('municipality', 270, 0, 'a1e1255930bd3735'),
+('municipality', 271, 0, '0f7b00c6333a4eda'),
+('municipality', 272, 0, 'facaba6760bfbdaa'),
+('municipality', 273, 0, '199b3aefc9bb5371'),
+('municipality', 274, 0, '06f3baec65f151b8'),
+('municipality', 275, 0, 'd741025bff4a1fd6'),
+('municipality', 276, 0, '77805313ba420f32'),
+('municipality', 277, 0, '20413f8b46b83818'),
+('municipality', 278, 0, 'be76bd3bc37ea633'),
+('municipality', 279, 0, '66f5a0a25e8b14f8'),
+('municipality', 280, 0, '7caef1614d4e017c'),
+('municipality', 281, 0, '4f1e89fd96c673a5'),
+('municipality', 282, 0, '760987fdfd65743d'),
+('municipality', 283, 0, '621beb00af7db297'),
+('municipality', 284, 0, '1ec91667849d5f69'),
+('municipality', 285, 0, '824d32c19528d89c'),
+('municipality', 286, 0, 'd2c68ba02d53ab5a'),
+('municipality', 287, 0, '47867ee971893648'),
+('municipality', 288, 0, 'cb2a31ec2e44812f'),
+('municipality', 289, 0, '09535a23a9ec5e28'),
+('municipality', 290, 0, '58f9fcc5fc057f89'),
+('municipality', 291, 0, '62395643a1b01d02'),
+('municipality', 292, 0, '5454acabc1195a1c'),
+('municipality', 293, 0, 'df9b23ef29a3b540'),
+('municipality', 294, 0, '6b9a78db3f3b8162'),
+('municipality', 295, 0, '3b9a12d5eecd3bc8'),
+('municipality', 296, 0, '66947a944aa3bb23'),
+('municipality', 297, 0, '53d57fcb4e1877ba'),
+('municipality', 298, 0, '8e18553e88485cb7'),
+('municipality', 299, 0, 'ca5fc1afeea5145a'),
+('municipality', 300, 0, '51c35ed03f68b00e'),
+('municipality', 301, 0, '0caebf29da4457ab'),
+('municipality', 302, 0, '761f1e7f71456487'),
+('municipality', 303, 0, '04d13885357be876'),
+('municipality', 304, 0, 'c71145c1e2347253'),
+('municipality', 305, 0, '7d6eb47eb1c4478e'),
+('municipality', 306, 0, 'e41b0591dd8fc444'),
+('municipality', 307, 0, '649add035caf2447'),
+('municipality', 308, 0, '28e360a9148d9069'),
+('municipality', 309, 0, '5b850a64713f2994'),
+('municipality', 310, 0, '32b9f7db55f8088a'),
+('municipality', 311, 0, '5c812cff240606ad'),
+('municipality', 312, 0, 'de3c0b05d53c4d34'),
+('municipality', 313, 0, '2194b76b30b4df31'),
+('municipality', 314, 0, '28dafe1f8f08259a'),
+('municipality', 315, 0, '0a9caddfedd01fe1'),
+('municipality', 316, 0, '86162ea647a48b77'),
+('municipality', 317, 0, '177f705040dbec35'),
+('municipality', 318, 0, '7e1323f99186fd66'),
+('municipality', 319, 0, 'a11ef9e57324f43d'),
+('municipality', 320, 0, 'f0783a1359f3b1a9'),
+('municipality', 321, 0, '395f940940b0c9da'),
+('municipality', 322, 0, 'b593c34ad86e01aa'),
+('municipality', 323, 0, '5272e8db8fc9d594'),
+('municipality', 324, 0, 'defeba8fd1c18452'),
+('municipality', 325, 0, 'e77ba3acfe9ae2f4'),
+('municipality', 326, 0, '28388c863fa2bd54'),
+('municipality', 327, 0, '0339934ac98b38e9'),
+('municipality', 328, 0, '57826e96244809ae'),
+('municipality', 329, 0, '9e5c104e5aec04c9'),
+('municipality', 330, 0, '24df023924d341ad'),
+('municipality', 331, 0, '33358d1fd88a4920'),
+('municipality', 332, 0, 'ad312b3c037b90f1'),
+('municipality', 333, 0, '6e51f32c572f87f4'),
+('municipality', 334, 0, '2e83a63c25bbd1f1'),
+('municipality', 335, 0, '7c28c3b562f18bd1'),
+('municipality', 336, 0, '38dec2f674c6bbd3'),
+('municipality', 337, 0, 'fb6343e48c5bb02a'),
+('municipality', 338, 0, '2fea4e2ade4a665f'),
+('municipality', 339, 0, '768af017d717e3b2'),
+('municipality', 340, 0, '35fdf43c31d16f0b'),
+('municipality', 341, 0, 'ef6dd4a170c6295e'),
+('municipality', 342, 0, 'a9a4693df945c663'),
+('municipality', 343, 0, '648d4bddb6862a51'),
+('municipality', 344, 0, '3af850ec3bf86b83'),
+('municipality', 345, 0, '4bb725d798df7ff3'),
+('municipality', 346, 0, '97df24d8b6049d6e'),
+('municipality', 347, 0, '30e21a4272689524'),
+('municipality', 348, 0, '50cb1e55649e5862'),
+('municipality', 349, 0, '456eefaff42de004'),
+('municipality', 350, 0, 'e9b5e42699fb2d76'),
+('municipality', 351, 0, 'c99033d8b3db08d2'),
+('municipality', 352, 0, 'b5d31c2ab8fafbb3'),
+('municipality', 353, 0, '11928e7c0e1db5e8'),
+('municipality', 354, 0, '26e00e6b99a76af4'),
+('municipality', 355, 0, 'f0311d647a113d8b'),
+('municipality', 356, 0, 'b7e92af81dc42a49'),
+('municipality', 357, 0, '85d5e44157c6a0c6'),
+('municipality', 358, 0, '4062daa4c5c4661b'),
+('municipality', 359, 0, 'dd3a081e1e8815fc'),
+('municipality', 360, 0, '2e0939b2b4f9bf4d'),
+('municipality', 361, 0, 'd177a67070acde3a'),
+('municipality', 362, 0, '6b5015ce066f3c06'),
+('municipality', 363, 0, '2fc27f205c8e6c70'),
+('municipality', 364, 0, 'ab15425864e1f7c4'),
+('municipality', 365, 0, '414425584ab4ce86'),
+('municipality', 366, 0, '4767cb1d567c02bd'),
+('municipality', 367, 0, '58f8cc2ce1241e82'),
+('municipality', 368, 0, 'c34df95ac43d617b'),
+('municipality', 369, 0, 'ab235940beb4a583'),
+('municipality', 370, 0, 'bcf495d886cb0086'),
+('municipality', 371, 0, '269bd4dd71292e77'),
+('municipality', 372, 0, '0e6b0e9975a2a511'),
+('municipality', 373, 0, '8e5e26fef17f6ca7'),
+('municipality', 374, 0, '21acfff451eb9faa'),
+('municipality', 375, 0, 'a62b493bd3cbb2e0'),
+('municipality', 376, 0, '2a446a2bfeb7da4b'),
+('municipality', 377, 0, 'c2955feee8dc3092'),
+('municipality', 378, 0, '5b276de5fbae9967'),
+('municipality', 379, 0, 'e81d5c827dec442c'),
+('municipality', 380, 0, '90111f3bea8053e6'),
+('municipality', 381, 0, '6648f2944b43ad96'),
+('municipality', 382, 0, '3822141d9822ea9d'),
+('municipality', 383, 0, '66f6eebc26090063'),
+('municipality', 384, 0, '66ccc375b957f311'),
+('municipality', 385, 0, 'b2bc9c47a6c2586c'),
+('municipality', 386, 0, 'c05c5ae0cc369dab'),
+('municipality', 387, 0, 'c94a69731413c4e7'),
+('municipality', 388, 0, '11610031918cc65d'),
+('municipality', 389, 0, '5e8a9dc48b081ed9'),
+('municipality', 390, 0, '8adfc21b56995f35'),
+('municipality', 391, 0, 'dfd7548df0f6f9ba'),
+('municipality', 392, 0, '5ed8b5a0bb5f6deb'),
+('municipality', 393, 0, 'e07ba31a2b46af79'),
+('municipality', 394, 0, '4ae89915f01090c5'),
+('municipality', 395, 0, 'f9fa49aef7da3ea1'),
+('municipality', 396, 0, '300b90308ff515b7'),
+('municipality', 397, 0, '11dadd825edfa236'),
+('municipality', 398, 0, '85e2c64f28323a3b'),
+('municipality', 399, 0, '96bb98d08617748c'),
+('municipality', 400, 0, '898a26cfce8d0bd5'),
+('municipality', 401, 0, '7ca6ab888bb94407'),
+('municipality', 402, 0, '798b198708784ccd'),
+('municipality', 403, 0, 'fcbcfa0bea0f1c65'),
+('municipality', 404, 0, 'd2b2e148b7e400ae'),
+('municipality', 405, 0, 'b4a1803b98bebf9c'),
+('municipality', 406, 0, 'f3760a385bc4cd55'),
+('municipality', 407, 0, '96b3e6d41c912f39'),
+('municipality', 408, 0, '010fd655301dcb6d'),
+('municipality', 409, 0, '52b9f84f677fcc1a'),
+('municipality', 410, 0, '0faefed405530d3e'),
+('municipality', 411, 0, '638e3d0bf4e2e657'),
+('municipality', 412, 0, '7c996ad425d55e89'),
+('municipality', 413, 0, '379230aa4ff08b68'),
+('municipality', 414, 0, 'a830b53bdcaf5069'),
+('municipality', 415, 0, '58647f009ca6cff5'),
+('municipality', 416, 0, '3f358d7b7cb2396e'),
+('municipality', 417, 0, '189f593ee199450d'),
+('municipality', 418, 0, 'dcfba0afa979cec8'),
+('municipality', 419, 0, 'c9b22cf05aa4d371'),
+('municipality', 420, 0, '3ede082a5ca75181'),
+('municipality', 421, 0, 'badef476464578fe'),
+('municipality', 422, 0, 'facf5f9b46ee3bc6'),
+('municipality', 423, 0, 'a8ad2d1f55bebe2b'),
+('municipality', 424, 0, 'e2df68381d35448d'),
+('municipality', 425, 0, '350a2cfa133ca07c'),
+('municipality', 426, 0, '80a68dd54ad5c942'),
+('municipality', 427, 0, '72c6253711ed76e4'),
+('municipality', 428, 0, '5490b7037c52bb22'),
+('municipality', 429, 0, '55cb353cfcff7e5a'),
+('municipality', 430, 0, '30fba3cfa812d4a8'),
+('municipality', 431, 0, '6f6e3c7cc917e98c'),
+('municipality', 432, 0, '3e5d65d9653da936'),
+('municipality', 433, 0, 'b7586ce051bcb246'),
+('municipality', 434, 0, '06a5287416e8a25d'),
+('municipality', 435, 0, '678083b20dc76632'),
+('municipality', 436, 0, '3968b81080ebf69d'),
+('municipality', 437, 0, '7eb41d0ff452bd4e'),
+('municipality', 438, 0, 'cff7e644cd669623'),
+('municipality', 439, 0, 'cd128d31a411d15b'),
+('municipality', 440, 0, 'f5af1e638266e6d7'),
+('municipality', 441, 0, 'c15625f75273b997'),
+('municipality', 442, 0, 'b0fc9d77d9f5041e'),
+('municipality', 443, 0, '7677a806d4a2f416'),
+('municipality', 444, 0, 'a8213bc045a77a7a'),
+('municipality', 445, 0, '98c5a1f1e82e1f13'),
+('municipality', 446, 0, 'aeca2c52467a5bda'),
+('municipality', 447, 0, '2c299b93fd8097ad'),
+('municipality', 448, 0, '529da057c84be2fc'),
+('municipality', 449, 0, '198e4fb8946d5371'),
+('municipality', 450, 0, '345de48ea811d599'),
+('municipality', 451, 0, '11acdc5f0149d34f'),
+('municipality', 452, 0, '60842617e73a96ac'),
+('municipality', 453, 0, '11398997f8f273b3'),
+('municipality', 454, 0, '049eacb22a422a8a'),
+('municipality', 455, 0, '644fcd2b56bb6cd3'),
+('municipality', 456, 0, 'dbf5f9d3d54fd964'),
+('municipality', 457, 0, '89f8ff9a884a1c3f'),
+('municipality', 458, 0, 'ea3a05866b3f965a'),
+('municipality', 459, 0, '5cd32ec80c93b099'),
+('municipality', 460, 0, 'ee7e0734eda0e247'),
+('municipality', 461, 0, '9be3756c41f593b3'),
+('municipality', 462, 0, '7a5d88a3dc443a48'),
+('municipality', 463, 0, 'b17c71fd7f311d81'),
+('municipality', 464, 0, '4488c213ec02a115'),
+('municipality', 465, 0, '9c4ede52dfb2c718'),
+('municipality', 466, 0, '4282f8f9a337b63d'),
+('municipality', 467, 0, 'ebf14c9bd7c9ef6e'),
+('municipality', 468, 0, '8f2ca0800e27731d'),
+('municipality', 469, 0, '04feb68b303e307f'),
+('municipality', 470, 0, '06d964ed4e97dc13'),
+('municipality', 471, 0, '061e8f63d43b680e'),
+('municipality', 472, 0, '680b0ec239a0c5cb'),
+('municipality', 473, 0, 'd873cbcc87f3d94b'),
+('municipality', 474, 0, '686fa7ab3a9ffc84'),
+('municipality', 475, 0, 'dc3910eb1b132e55'),
+('municipality', 476, 0, '28e3664ae722ad07'),
+('municipality', 477, 0, '0bc9958ab2b822c0'),
+('municipality', 478, 0, '11aec55be4b9ccf0'),
+('municipality', 479, 0, '91f62603690d82b9'),
+('municipality', 480, 0, '82320b8badbc96a5'),
+('municipality', 481, 0, 'ed03e8d999190cf2'),
+('municipality', 482, 0, '5236a0c714cd76b0'),
+('municipality', 483, 0, '5307744959be79e5'),
+('municipality', 484, 0, '29077a6cd1a19f10'),
+('municipality', 485, 0, '159789c0b7407572'),
+('municipality', 486, 0, 'c1ef05dd95fec20b'),
+('municipality', 487, 0, '6032ed43d310d443'),
+('municipality', 488, 0, '8825026e376878c6'),
+('municipality', 489, 0, '34917201e0a388cd'),
+('municipality', 490, 0, '7d0f3993ffee63e3'),
+('municipality', 491, 0, '7ad08b1ca726f7eb'),
+('municipality', 492, 0, '728d98670362d86f'),
+('municipality', 493, 0, 'a7f6b0aaee028bcb'),
+('municipality', 494, 0, '35926805f86bb477'),
+('municipality', 495, 0, 'bbf48db7d21c245a'),
+('municipality', 496, 0, '8cc125882e28d7af'),
+('municipality', 497, 0, '87ba9ee9959bd206'),
+('municipality', 498, 0, 'fb7b153a0007d9e8'),
+('municipality', 499, 0, '202d7b200abef274'),
+('municipality', 500, 0, 'af8a5e7d2c8044e1'),
+('municipality', 501, 0, '515b56b2c981656d'),
+('municipality', 502, 0, 'f4b9b268763763e6'),
+('municipality', 503, 0, 'e2435992fcaf686e'),
+('municipality', 504, 0, 'f5753b7782f19f8a'),
+('municipality', 505, 0, '9d9913b22517b0f7'),
+('municipality', 506, 0, '374bb81ffbcf258a'),
+('municipality', 507, 0, '3017f616160002b1'),
+('municipality', 508, 0, 'ec2587d33bcdde8e'),
+('municipality', 509, 0, '2df523f581b6619e'),
+('municipality', 510, 0, 'b60590e8c7b76c52'),
+('municipality', 511, 0, '44484373bdef0769'),
+('municipality', 512, 0, '0d28db76f8cc7083'),
+('municipality', 513, 0, '1d04e8bd53a36c52'),
+('municipality', 514, 0, '53523875636cc5ef'),
+('municipality', 515, 0, '54319414b99443dc'),
+('municipality', 516, 0, '85cc4d75f569eeca'),
+('municipality', 517, 0, '164470541eaf0d29'),
+('municipality', 518, 0, 'd293d61f3760f914'),
+('municipality', 519, 0, '448f26121362dabe'),
+('municipality', 520, 0, '100859c313e0042f'),
+('municipality', 521, 0, 'bd44f1dfc31a4d60'),
+('municipality', 522, 0, '7e4866738eac3dc2'),
+('municipality', 523, 0, 'a2ae215278412888'),
+('municipality', 524, 0, 'c93a7eadc52aa9ba'),
+('municipality', 525, 0, 'e71119b89122fc44'),
+('municipality', 526, 0, 'f3e5e69eff50eb87'),
+('municipality', 527, 0, 'aafdf6421e3075db'),
+('municipality', 528, 0, '7399fbbe5062cf3d'),
+('municipality', 529, 0, 'f8b54e34f94be9bf'),
+('municipality', 530, 0, '21a861c1e215e28c'),
+('municipality', 531, 0, 'a2df8629ecc3830d'),
+('municipality', 532, 0, '7d67bfdf2067b4c6'),
+('municipality', 533, 0, 'b478030aa512b4f0'),
+('municipality', 534, 0, '61f17cb647249358'),
+('municipality', 535, 0, '0b50d9b7006ec5b8'),
+('municipality', 536, 0, 'fa712c9cc8f5babb'),
+('municipality', 537, 0, 'eb4225aa1158b2b9'),
+('municipality', 538, 0, '6339fa41d308ac5d'),
+('municipality', 539, 0, '678c02737adc52a5'),
+('municipality', 540, 0, '34957a22fd5dc38f'),
+('municipality', 541, 0, '02931fff3f9f8b39'),
+('municipality', 542, 0, 'd76ac8d0e5a069e2'),
+('municipality', 543, 0, 'f8fc0f8dff83e5f4'),
+('municipality', 544, 0, 'b4a338f8ef697fcd'),
+('municipality', 545, 0, 'eeab8fb5d71070db'),
+('municipality', 546, 0, '88c63558b44a9874'),
+('municipality', 547, 0, 'bc0d4723610305a5'),
+('municipality', 548, 0, 'e08f987529a3156c'),
+('municipality', 549, 0, '14ea46a8cc2739ad'),
+('municipality', 550, 0, 'fc900c11dbf844d7'),
+('municipality', 551, 0, '29556266d124c6a6'),
+('municipality', 552, 0, '1e12d34af8209858'),
+('municipality', 553, 0, 'edf135da8806168d'),
+('municipality', 554, 0, '17bd89274049d72c'),
+('municipality', 555, 0, 'fc78d5267efde3bb'),
+('municipality', 556, 0, 'de4ca935158d4210'),
+('municipality', 557, 0, 'f35f52c2b69880f3'),
+('municipality', 558, 0, '603e08f18e504cac'),
+('municipality', 559, 0, '796c09f15fb92a1e'),
+('municipality', 560, 0, '651fa8ebde45debd'),
+('municipality', 561, 0, 'cfc18473493d95f2'),
+('municipality', 562, 0, '995988eaa2a2fdd0'),
+('municipality', 563, 0, 'baad195861d6c833'),
+('municipality', 564, 0, '666e75fdfe35d821'),
+('population', 0, 2015, 'e2d525087697e418'),
+('population', 0, 2020, '7d652af13dce2316'),
+('population', 1, 2015, '6a272d04701c2384'),
+('population', 1, 2020, 'af4f443492de954f'),
+('population', 2, 2015, '9c437dec418741fa'),
+('population', 2, 2020, '1fe60cc9bd17eb91'),
+('population', 3, 2015, 'e042e5dc8ba57d9d'),
+('population', 3, 2020, 'a676999f9293315d'),
+('population', 4, 2015, '191e1e604bf91b35'),
+('population', 4, 2020, 'bcea7444b5acae6a'),
+('population', 5, 2015, '684322c6021785b3'),
+('population', 5, 2020, '701f3c7f36a32876'),
+('population', 6, 2015, '0c40049aadd664c5'),
+('population', 6, 2020, 'ee675699b578b9d3'),
+('population', 7, 2015, '91a5fc43749e6169'),
+('population', 7, 2020, '0f17b0208765b23a'),
+('population', 8, 2015, '02938464ce976c40'),
+('population', 8, 2020, 'fecf86d26cad9655'),
+('population', 9, 2015, '13e7c3b733c68ce7'),
+('population', 9, 2020, 'd2da72a13f496faa'),
+('population', 10, 2015, 'f4ba75fe81c3303f'),
+('population', 10, 2020, '25bbc826ed50f3fa'),
+('population', 11, 2015, 'c100f3c0036e5120'),
+('population', 11, 2020, 'fdb24abc9320b6fe'),
+('population', 12, 2015, '300df4da49079e1e'),
+('population', 12, 2020, '369766101d8452d7'),
+('population', 13, 2015, 'b8216e0a2406fa28'),
+('population', 13, 2020, '223602b19c959a11'),
+('population', 14, 2015, '77eb48fd4bc7946f'),
+('population', 14, 2020, 'bf08d2523f48e2f5'),
+('population', 15, 2015, '953577ba895f65f1'),
+('population', 15, 2020, '5fc85e5f50e7f0c2'),
+('population', 16, 2015, '4bd1c9c9dd323eed'),
+('population', 16, 2020, 'a027a65ad5d35e4b'),
+('population', 17, 2015, 'b58f2752ae410578'),
+('population', 17, 2020, '4555f725938fefdd'),
+('population', 18, 2015, '50567c6312c4b8ce'),
+('population', 18, 2020, '5c3788e36a0afc74'),
+('population', 19, 2015, '77272573cf6050a6'),
+('population', 19, 2020, 'd04cd82e08f33269'),
+('population', 20, 2015, '1dc9ae2812a07b47'),
+('population', 20, 2020, '95fa39f2e8b8b22f'),
+('population', 21, 2015, '49d7ef82f51dc0e5'),
+('population', 21, 2020, 'cadcd17e62141ae9'),
+('population', 22, 2015, 'a1db10b467cc8ecd'),
+('population', 22, 2020, '9f04b6aec247f926'),
+('population', 23, 2015, '8315474b22161e51'),
+('population', 23, 2020, 'f71a2eaba8f053c3'),
+('population', 24, 2015, '14f894afb2c2d901'),
+('population', 24, 2020, '7c85436b8fc0533f'),
+('population', 25, 2015, '443154fa9bef6e69'),
+('population', 25, 2020, '1e675ef57cf8b0f2'),
+('population', 26, 2015, 'f18047e9e78e4408'),
+('population', 26, 2020, '6f0ef24e6b9f172b'),
+('population', 27, 2015, 'fe979ac3131247ab'),
+('population', 27, 2020, 'd76eb61ac821f71e'),
+('population', 28, 2015, '57a7e94b7eee584f'),
+('population', 28, 2020, '6bf0abb57958a23c'),
+('population', 29, 2015, '0418a9247fb02f41'),
+('population', 29, 2020, 'fe7d0769f9046592'),
+('population', 30, 2015, '17a3837a776d6c81'),
+('population', 30, 2020, '72fc35abe02fb87e'),
+('population', 31, 2015, '38dbd08765db31d3'),
+('population', 31, 2020, '63b45163eb934d70'),
+('population', 32, 2015, '47709a750fa3fc63'),
+('population', 32, 2020, '36c5c515705228c0'),
+('population', 33, 2015, '60ac472e2f6f998d'),
+('population', 33, 2020, 'a0a21e981d40325e'),
+('population', 34, 2015, 'dd39dd86218270f5'),
+('population', 34, 2020, '2120c37ee875aa38'),
+('population', 35, 2015, '8229683448b5da7d'),
+('population', 35, 2020, 'c15f3107f39dcf69'),
+('population', 36, 2015, '964798da077270cd'),
+('population', 36, 2020, 'bbf8a557774e2cca'),
+('population', 37, 2015, '3a8141244e90ecd0'),
+('population', 37, 2020, 'b0742b1deb5206dd'),
+('population', 38, 2015, 'dafbcb1c663edbe3'),
+('population', 38, 2020, 'c0baf062b6ebd652'),
+('population', 39, 2015, '494d863881e66ef2'),
+('population', 39, 2020, '102f762dbe8d6440'),
+('population', 40, 2015, '984998382d7fc241'),
+('population', 40, 2020, 'bdc35bd91cb9f722'),
+('population', 41, 2015, '33a97845150a962b'),
+('population', 41, 2020, 'c6c31a181b0b1b1f'),
+('population', 42, 2015, '30d7ac27f95bfcd6'),
+('population', 42, 2020, 'fb3e943ef3d919e0'),
+('population', 43, 2015, 'e41742a38bb69ad7'),
+('population', 43, 2020, '62524e6cbaf978f5'),
+('population', 44, 2015, 'f64d7d5f34e0e252'),
+('population', 44, 2020, '50e2323b556a86ae'),
+('population', 45, 2015, 'c6ec6bcef117f3cd'),
+('population', 45, 2020, '2305959071be5ccd'),
+('population', 46, 2015, 'e8c98a9ef36fa09e'),
+('population', 46, 2020, 'c889ab805a683028'),
+('population', 47, 2015, '555afdc3ded0b140'),
+('population', 47, 2020, 'b9044e7b6ef74724'),
+('population', 48, 2015, '150b74eb1fb98a60'),
+('population', 48, 2020, '727f836020fa8ee5'),
+('population', 49, 2015, 'ab98347248f5e081'),
+('population', 49, 2020, 'a882c7bb3f52b677'),
+('population', 50, 2015, '7f49d425423ad84a'),
+('population', 50, 2020, '248e4c898c534486'),
+('population', 51, 2015, '9b8e8a40f2ce0704'),
+('population', 51, 2020, 'c9c694ef64232999'),
+('population', 52, 2015, '4fe7ef56febc1395'),
+('population', 52, 2020, '17dff221b24497a4'),
+('population', 53, 2015, '9516490d41192c35'),
+('population', 53, 2020, 'd26d30b45d5b696e'),
+('population', 54, 2015, 'e9f65e041088f5cd'),
+('population', 54, 2020, '08e68cf638f20e3f'),
+('population', 55, 2015, '1f8e4187a3857d09'),
+('population', 55, 2020, '1e3a3307ec66a343'),
+('population', 56, 2015, 'd5820b3d9632dcee'),
+('population', 56, 2020, '0e05684de67c3938'),
+('population', 57, 2015, 'b2c512441dddcb9c'),
+('population', 57, 2020, 'f48409204dd21270'),
+('population', 58, 2015, 'b7c8ac3510b03b4a'),
+('population', 58, 2020, '547c8e22100e5ec6'),
+('population', 59, 2015, '7b6a0178bf593eae'),
+('population', 59, 2020, 'c55df833e9363245'),
+('population', 60, 2015, 'b5ca221986d4cb4c'),
+('population', 60, 2020, 'e778396b35320c8d'),
+('population', 61, 2015, 'df52885d1516fb15'),
+('population', 61, 2020, '25d189cca1163a20'),
+('population', 62, 2015, 'c169d3d9b7ff8d94'),
+('population', 62, 2020, '11c3487c0c6f38fb'),
+('population', 63, 2015, '2069dc20592ec162'),
+('population', 63, 2020, '5003173ff815752d'),
+('population', 64, 2015, '8183be8319e63cbb'),
+('population', 64, 2020, 'e01ae89ea4ef5fe8'),
+('population', 65, 2015, '12df2db2f53d50d8'),
+('population', 65, 2020, '1b594755998c6515'),
+('population', 66, 2015, 'e5392b048475af62'),
+('population', 66, 2020, 'f12db2f56d14f456'),
+('population', 67, 2015, '881342dfff6d9395'),
+('population', 67, 2020, '8a6642a87b9317e5'),
+('population', 68, 2015, 'a6c84d65ba4157af'),
+('population', 68, 2020, '6169ac3116886228'),
+('population', 69, 2015, 'c8ae7c4bb3350094'),
+('population', 69, 2020, '10c8c25193eec6c8'),
+('population', 70, 2015, '71d474db1241b275'),
+('population', 70, 2020, '668f3e6256f72aa5'),
+('population', 71, 2015, '398aa7cc2f79c8d8'),
+('population', 71, 2020, 'b5b6166bd8e5e7e2'),
+('population', 72, 2015, '5064bbd92a459c9b'),
+('population', 72, 2020, '9ded58b56d7db753'),
+('population', 73, 2015, 'a082942c8a0fa30d'),
+('population', 73, 2020, '99d4b3fc6b92aa20'),
+('population', 74, 2015, '0178b8afd708cf30'),
+('population', 74, 2020, '5599ccb98afab51e'),
+('population', 75, 2015, 'a40c926b54fc6711'),
+('population', 75, 2020, '08fcf100c7316c90'),
+('population', 76, 2015, '1527ffb1f08b8555'),
+('population', 76, 2020, '32ed6008394fcdf8'),
+('population', 77, 2015, '671d6a4c0d8468e8'),
+('population', 77, 2020, 'aac69cb0d12f1c2a'),
+('population', 78, 2015, 'ec66050699593e3a'),
+('population', 78, 2020, '4b93f96cec5d984f'),
+('population', 79, 2015, 'e03f88d8cb306a64'),
+('population', 79, 2020, '6ae4da67d89cf270'),
+('population', 80, 2015, '84af74d5770f8b6f'),
+('population', 80, 2020, '8782182935906b2d'),
+('population', 81, 2015, 'a9b78dbeabd336c7'),
+('population', 81, 2020, '3e5760969f9f0806'),
+('population', 82, 2015, 'a6d2aff398624f13'),
+('population', 82, 2020, '4f04ab1434620965'),
+('population', 83, 2015, '1f633067600ed0c6'),
+('population', 83, 2020, 'f6ba2c8b07a4653b'),
+('population', 84, 2015, 'a2443f215e43d335'),
+('population', 84, 2020, '9a25d6f2b98af920'),
+('population', 85, 2015, '30fc8f236ce6ccd6'),
+('population', 85, 2020, '19e4da38d56473b6'),
+('population', 86, 2015, '4900e9ae0fc74074'),
+('population', 86, 2020, '6ee00a9453f6b342'),
+('population', 87, 2015, '9e6e17a527b10fe0'),
+('population', 87, 2020, 'd5f4a179336eb121'),
+('population', 88, 2015, 'fb1b876d5d8b853b'),
+('population', 88, 2020, '1ab2e682e6879db8'),
+('population', 89, 2015, '4496652bb3ef822e'),
+('population', 89, 2020, '6b8eec7365ba942f'),
+('population', 90, 2015, '4365fb079a5b0b2f'),
+('population', 90, 2020, '1896d70b6589277c'),
+('population', 91, 2015, '2d61200ecb65c602'),
+('population', 91, 2020, 'b121dc81e4f35dd2'),
+('population', 92, 2015, '6ea824f1086adf94'),
+('population', 92, 2020, '0c1bb58cb4926666'),
+('population', 93, 2015, 'd65a1192c331a8aa'),
+('population', 93, 2020, '2944107f20289886'),
+('population', 94, 2015, '901ee5ddce9e9d9f'),
+('population', 94, 2020, '54980623b770ac36'),
+('population', 95, 2015, '21daa2c4167e6b0a'),
+('population', 95, 2020, 'ec7a1a02c00b55cd'),
+('population', 96, 2015, 'ebc42c3153dd1a8b'),
+('population', 96, 2020, '5e026f6714a7f405'),
+('population', 97, 2015, 'ab6f78bae3b3eac7'),
+('population', 97, 2020, 'a5236c9a64813ce3'),
+('population', 98, 2015, 'd257411fe3f308d7'),
+('population', 98, 2020, 'bcc1218a30acbb84'),
+('population', 99, 2015, 'ee95240669fe26af'),
+('population', 99, 2020, 'eb557ee62f0668bb'),
+('population', 100, 2015, '82088cc574a9efbd'),
+('population', 100, 2020, 'c1ff17b7621a9add'),
+('population', 101, 2015, 'ce04bd544c9409f8'),
+('population', 101, 2020, 'f2265c350bec168a'),
+('population', 102, 2015, '200dbd501fca6e51'),
+('population', 102, 2020, '7310ba2f30c3d25a'),
+('population', 103, 2015, 'd4f8549533cc8f84'),
+('population', 103, 2020, 'f215f26c8f5be5bc'),
+('population', 104, 2015, '19e35234a9563ab2'),
+('population', 104, 2020, 'b0479c6597e0e697'),
+('population', 105, 2015, 'b5708c58c2befa9f'),
+('population', 105, 2020, 'aa167440e7f7b3e4'),
+('population', 106, 2015, 'b068949caee96953'),
+('population', 106, 2020, 'ef6edf82ad594b95'),
+('population', 107, 2015, '9e2539de22337a51'),
+('population', 107, 2020, 'beb859a03264d803'),
+('population', 108, 2015, '8e7468141f211c64'),
+('population', 108, 2020, 'f0a4b5e58faed492'),
+('population', 109, 2015, '5b8cddbd8e5d91ba'),
+('population', 109, 2020, '958c9f1749d81e7a'),
+('population', 110, 2015, '910b4913ae6b7494'),
+('population', 110, 2020, '194e98d4db78022c'),
+('population', 111, 2015, 'bca7d57a492ce9b5'),
+('population', 111, 2020, '83949ccbda6cac50'),
+('population', 112, 2015, '8d9ce6e28133180b'),
+('population', 112, 2020, '156c8fdf34fa9460'),
+('population', 113, 2015, '11ac962596fa9165'),
+('population', 113, 2020, 'f34e59cb515290d0'),
+('population', 114, 2015, 'b4d5c88da868d733'),
+('population', 114, 2020, '03ada35a0f86d7cf'),
+('population', 115, 2015, '2020d80cf23b4c9f'),
+('population', 115, 2020, '2ba6d91fcfcd3087'),
+('population', 116, 2015, 'e3a70d52e64297f1'),
+('population', 116, 2020, 'b21194651f7eda44'),
+('population', 117, 2015, '786819a400913b0e'),
+('population', 117, 2020, '7cfa815b5adaee73'),
+('population', 118, 2015, '16f872049f499867'),
+('population', 118, 2020, '131af42945b6c2c4'),
+('population', 119, 2015, '49b5e696d03acabb'),
+('population', 119, 2020, '08209ddf8688a21c'),
+('population', 120, 2015, '344ad830d7cb7745'),
+('population', 120, 2020, '29df3604bd90f728'),
+('population', 121, 2015, 'df4acdfbed352cb7'),
+('population', 121, 2020, 'fe30a684e14ab75f'),
+('population', 122, 2015, '029b0a69fc0b6048'),
+('population', 122, 2020, '2f56d89085199d58'),
+('population', 123, 2015, '833f41c43451595e'),
+('population', 123, 2020, '418c182ea3fbc2e1'),
+('population', 124, 2015, 'a1050fd61694580c'),
+('population', 124, 2020, 'bf4ece416cd108e6'),
+('population', 125, 2015, '0bac934e4909af65'),
+('population', 125, 2020, '3e4b33521fef72ac'),
+('population', 126, 2015, '94896bf690f4fdc4'),
+('population', 126, 2020, 'ce89497f4d5844ad'),
+('population', 127, 2015, 'f2a821b56cf0bb9a'),
+('population', 127, 2020, 'c0c30c73a181e3eb'),
+('population', 128, 2015, 'e76bec3fb27c3aa6'),
+('population', 128, 2020, '5ca140147bf812cb'),
+('population', 129, 2015, 'a7abaa9a7f3ae97f'),
+('population', 129, 2020, '6b065acf0f4c4bdd'),
+('population', 130, 2015, 'cff404b0577f2e1a'),
+('population', 130, 2020, 'c3a746941c6d6c48'),
+('population', 131, 2015, '0f1ce215147fad66'),
+('population', 131, 2020, '0e8c93a8fbe356b5'),
+('population', 132, 2015, 'c5ec0c89406196d2'),
+('population', 132, 2020, '3fcccb297018bae3'),
+('population', 133, 2015, 'c11a6117ce9afc50'),
+('population', 133, 2020, 'aad35bfca8a84585'),
+('population', 134, 2015, '20c3cc8502659c7c'),
+('population', 134, 2020, '5623cdc91858ecb5'),
+('population', 135, 2015, 'b7837c1bf2ad6bfb'),
+('population', 135, 2020, '97631dfbbdfebe5d'),
+('population', 136, 2015, '48712a8bc230e1f6'),
+('population', 136, 2020, 'a3b29ecca899fb90'),
+('population', 137, 2015, 'f8752ab5e01e0d9a'),
+('population', 137, 2020, 'fcd01928007f6503'),
+('population', 138, 2015, 'a613709246c707c9'),
+('population', 138, 2020, '79cbfd3b3489232f'),
+('population', 139, 2015, 'c74dd73f3cd1a25c'),
+('population', 139, 2020, 'bac8e5558c4283b8'),
+('population', 140, 2015, 'cb6ed8eee53ffad7'),
+('population', 140, 2020, 'e2dcd7e8e7dafcca'),
+('population', 141, 2015, 'f509adf377a649cf'),
+('population', 141, 2020, '265da01b6607a54f'),
+('population', 142, 2015, '93be04b425010de5'),
+('population', 142, 2020, 'ae5cd8e9650445ae'),
+('population', 143, 2015, '51cd7c0e9e94b078'),
+('population', 143, 2020, '2334470f0052fccf'),
+('population', 144, 2015, '5a3f501265b3faf3'),
+('population', 144, 2020, '7c1b3ec4af09cbbb'),
+('population', 145, 2015, 'ecc0f3f43d0c5326'),
+('population', 145, 2020, '130de46ee54848ac'),
+('population', 146, 2015, '47f9a06c3ebb2846'),
+('population', 146, 2020, '06fad8a46254f1c9'),
+('population', 147, 2015, 'a6e68542a8d6cecf'),
+('population', 147, 2020, 'd22e9f77cd60133d'),
+('population', 148, 2015, 'a89f44e4aaa99068'),
+('population', 148, 2020, '31a707d050ab7edd'),
+('population', 149, 2015, 'cadca405716f1e38'),
+('population', 149, 2020, 'a860189af99061e5'),
+('population', 150, 2015, '68b2c2c55ed6c4d0'),
+('population', 150, 2020, 'bac14adc34ef4d42'),
+('population', 151, 2015, '9e8774f16c865c27'),
+('population', 151, 2020, '610161ae97fe75fd'),
+('population', 152, 2015, '57c54fce5c980fe0'),
+('population', 152, 2020, 'd00df5ff90ed4183'),
+('population', 153, 2015, '9c4d929dedef1f27'),
+('population', 153, 2020, '9637891b330550a8'),
+('population', 154, 2015, '765bd60f714c6452'),
+('population', 154, 2020, 'd367510240158377'),
+('population', 155, 2015, '858a7cda0940bc6c'),
+('population', 155, 2020, '5bb01c4f6d55bfaf'),
+('population', 156, 2015, '120060762af4fff6'),
+('population', 156, 2020, 'db0da1c7f710d807'),
+('population', 157, 2015, '1e5abf888d0bbfc3'),
+('population', 157, 2020, '6c3f7a27f79dfb8a'),
+('population', 158, 2015, 'c54c140109a2aee6'),
+('population', 158, 2020, '749a8bd86f73d788'),
+('population', 159, 2015, 'f0fadacd6ea5f8cc'),
+('population', 159, 2020, 'b8b77f19fe5b3403'),
+('population', 160, 2015, '9e4f9c761e7e870d'),
+('population', 160, 2020, '096e4406e139bf08'),
+('population', 161, 2015, 'ca117bf78473433c'),
+('population', 161, 2020, '7fb729f8bfc811e5'),
+('population', 162, 2015, 'bb2fd6d460cae667'),
+('population', 162, 2020, '04e711ff3b6ab0b0'),
+('population', 163, 2015, '7259d6836bdb9934'),
+('population', 163, 2020, '1959469d62b3a3b2'),
+('population', 164, 2015, '784e82e9792999e6'),
+('population', 164, 2020, 'a9fee63cd6cbc65f'),
+('population', 165, 2015, 'a78c0e242b7be8fa'),
+('population', 165, 2020, 'd9b2553aa0e631aa'),
+('population', 166, 2015, '71d665f2a8ae13b3'),
+('population', 166, 2020, 'fe6ee3c3d016958d'),
+('population', 167, 2015, 'b28fda45b1ccf273'),
+('population', 167, 2020, '34d7a2b34a957cb2'),
+('population', 168, 2015, '9f8de9c0f69090a4'),
+('population', 168, 2020, '1545b701080b7442'),
+('population', 169, 2015, 'f1d32c53ec41ca25'),
+('population', 169, 2020, '6bc721918e601e7f'),
+('population', 170, 2015, 'ba1023b4d184af01'),
+('population', 170, 2020, '324d05b772062ac3'),
+('population', 171, 2015, '05043f3898dd9f23'),
+('population', 171, 2020, 'bafb2e4eaed36050'),
+('population', 172, 2015, '1671c0ec183cdfd0'),
+('population', 172, 2020, '389a1dc1aa8758f8'),
+('population', 173, 2015, 'ebf9273d9a12436a'),
+('population', 173, 2020, '7b74ac2044b18848'),
+('population', 174, 2015, 'd21af26e7f75c520'),
+('population', 174, 2020, '48e88b99ed656a7c'),
+('population', 175, 2015, '362fc3c0bb027e49'),
+('population', 175, 2020, 'dc7d7170d5876ba9'),
+('population', 176, 2015, 'c15f3a3a15af9d9d'),
+('population', 176, 2020, '29fd3974aba03fc3'),
+('population', 177, 2015, 'ea7c7fad864e358f'),
+('population', 177, 2020, '39e0f228a2a41734'),
+('population', 178, 2015, '71dd39265417cbae'),
+('population', 178, 2020, '898b7d62d07c635e'),
+('population', 179, 2015, 'ca3d67811bfd84d6'),
+('population', 179, 2020, 'c840989053a93751'),
+('population', 180, 2015, '8fe50cb1b16c85bb'),
+('population', 180, 2020, '535bc95a8a80e2fe'),
+('population', 181, 2015, '05df72ccc65b6c9f'),
+('population', 181, 2020, 'ddcede1c669cb439'),
+('population', 182, 2015, '5c4c9711e5ec111f'),
+('population', 182, 2020, '4f2184b139e714a5'),
+('population', 183, 2015, '4d9cb5b51819b19b'),
+('population', 183, 2020, 'f41db8928432746a'),
+('population', 184, 2015, 'ada1a5b13059e5fb'),
+('population', 184, 2020, 'b4f6e5f2d9045a9a'),
+('population', 185, 2015, 'bebef75f84153b02'),
+('population', 185, 2020, '458eff68826ae797'),
+('population', 186, 2015, '535490887a25bceb'),
+('population', 186, 2020, '3174c6c7cd1794df'),
+('population', 187, 2015, 'a21df35e10ad035b'),
+('population', 187, 2020, 'c6a41e9a31cd162d'),
+('population', 188, 2015, '0bf3f47ff2c32291'),
+('population', 188, 2020, 'afbbff415d292c39'),
+('population', 189, 2015, '84425b1c446356e0'),
+('population', 189, 2020, '5732f7fde7bed868'),
+('population', 190, 2015, 'd16ac4901f4945bf'),
+('population', 190, 2020, '8a05f4cd94b5a61b'),
+('population', 191, 2015, '6612d64c258d11b4'),
+('population', 191, 2020, 'af01c923a0e902ef'),
+('population', 192, 2015, '422e206f757adef4'),
+('population', 192, 2020, 'c399b1dc46698382'),
+('population', 193, 2015, 'f91b8f7afd373ffe'),
+('population', 193, 2020, 'd0d0136d280984bb'),
+('population', 194, 2015, '2dd34794d983be35'),
+('population', 194, 2020, 'e7e2bc7e3b0cb70d'),
+('population', 195, 2015, 'c18249f1f0ae2f75'),
+('population', 195, 2020, '9457884c067ca64f'),
+('population', 196, 2015, '39968fdad2a31147'),
+('population', 196, 2020, '7187aaa7fb7ce228'),
+('population', 197, 2015, '6a66319a490b21ab'),
+('population', 197, 2020, 'cf5e7bdc38a92864'),
+('population', 198, 2015, '2d6bc84215e23a75'),
+('population', 198, 2020, 'bed035f83c3722b5'),
+('population', 199, 2015, 'fb1ced04a26b2961'),
+('population', 199, 2020, 'baf023e99c17d02b'),
+('population', 200, 2015, 'd71b928a69b2a31c'),
+('population', 200, 2020, 'd689f262fe307da4'),
+('population', 201, 2015, 'cf9de0f05aeb4c1f'),
+('population', 201, 2020, '2fe8e7f498f59bfa'),
+('population', 202, 2015, '4c4ee0631c6b072c'),
+('population', 202, 2020, '8e8398472b30a1e7'),
+('population', 203, 2015, '77a7b13d8c7687e3'),
+('population', 203, 2020, '5a435dc394b2cbef'),
+('population', 204, 2015, 'd062119dc9661b18'),
+('population', 204, 2020, '82a92391dcfe9ef4'),
+('population', 205, 2015, 'f0d6a715485e0235'),
+('population', 205, 2020, 'aa80cc37373cfea6'),
+('population', 206, 2015, '22bc0420642224bc'),
+('population', 206, 2020, 'db4887fbb2c6269f'),
+('population', 207, 2015, '5fdf747904cd0483'),
+('population', 207, 2020, 'c0caf761314975a4'),
+('population', 208, 2015, '5a9e253f4aed5c7b'),
+('population', 208, 2020, 'a56dc403133bb1f5'),
+('population', 209, 2015, 'c537d9e7bac91f67'),
+('population', 209, 2020, '6445bf27bb0b816f'),
+('population', 210, 2015, '0d9ceb451f344562'),
+('population', 210, 2020, 'b3394c00ab806479'),
+('population', 211, 2015, '9fafe9e02713db2c'),
+('population', 211, 2020, 'be378c110e42895f'),
+('population', 212, 2015, 'ed6e73100e253b4f'),
+('population', 212, 2020, '13dfb84fd5ecbc98'),
+('population', 213, 2015, '7ca2cd09990ddc81'),
+('population', 213, 2020, 'ec95151c738ea708'),
+('population', 214, 2015, '2e6e6a1e72c184d4'),
+('population', 214, 2020, '517ffa44c8615ed0'),
+('population', 215, 2015, '042793e613449659'),
+('population', 215, 2020, '04cfad3b7f6b61e1'),
+('population', 216, 2015, '82c5325c8ecefcd3'),
+('population', 216, 2020, '3ead9bb0e06e50e7'),
+('population', 217, 2015, '6df353739d9789d5'),
+('population', 217, 2020, '65a59d08fddd35cf'),
+('population', 218, 2015, '6bbf6d1d404e05d8'),
+('population', 218, 2020, '1cdea70de127a389'),
+('population', 219, 2015, '0a1f18246124ebad'),
+('population', 219, 2020, 'ecb0bafd69fa44a5'),
+('population', 220, 2015, 'c696b11544a15267'),
+('population', 220, 2020, 'e8c86b88ebaec6d6'),
+('population', 221, 2015, '376c1386d7597dd0'),
+('population', 221, 2020, '9fbaba654fa76918'),
+('population', 222, 2015, 'd38fb82a6f4590b4'),
+('population', 222, 2020, 'b6f6abe063dc4bab'),
+('population', 223, 2015, '05c7883af3511217'),
+('population', 223, 2020, '169f685f557bb4ec'),
+('population', 224, 2015, '54cbab0507bcddaf'),
+('population', 224, 2020, '4a55feff78763233'),
+('population', 225, 2015, '85d54815bc0dbb75'),
+('population', 225, 2020, '4fbbbe740d933e52'),
+('population', 226, 2015, 'f7f7ea6ac1124904'),
+('population', 226, 2020, 'd1093a33fae52683'),
+('population', 227, 2015, '11afb5592cad8393'),
+('population', 227, 2020, '451aeefdc757c6d4'),
+('population', 228, 2015, 'eb281aaecadef986'),
+('population', 228, 2020, '234f8755f41c8278'),
+('population', 229, 2015, '19c2c277e07554a9'),
+('population', 229, 2020, '1c2c2cac8360f232'),
+('population', 230, 2015, 'b37820ba3a598fb4'),
+('population', 230, 2020, 'cd4a070a97abed64'),
+('population', 231, 2015, '76c956feafd87a81'),
+('population', 231, 2020, '93f1e9a85240b100'),
+('population', 232, 2015, '8a6dc50d58f37f0f'),
+('population', 232, 2020, '55c529dafc16612b'),
+('population', 233, 2015, 'c8788e0b4b44fade'),
+('population', 233, 2020, '414fa2d1a7e859d9'),
+('population', 234, 2015, '3102387ab9d47190'),
+('population', 234, 2020, '15eea14a3c2ee1e5'),
+('population', 235, 2015, 'ac287de9df960586'),
+('population', 235, 2020, 'e727f94d66865439'),
+('population', 236, 2015, '093d6efaf7f1219f'),
+('population', 236, 2020, 'db4f9a8d7692c299'),
+('population', 237, 2015, '0273cb3499a8c7da'),
+('population', 237, 2020, '3e69c9589397cf05'),
+('population', 238, 2015, '508aa2316b2b63a4'),
+('population', 238, 2020, '40732db9d2484c96'),
+('population', 239, 2015, '4c2d63501ba0f694'),
+('population', 239, 2020, 'ac013d1a33a83c74'),
+('population', 240, 2015, '118967f2d1dc53d9'),
+('population', 240, 2020, '8a9e603dc0857d7d'),
+('population', 241, 2015, '3f1903c5f21f6bdb'),
+('population', 241, 2020, '95cfd968b1966069'),
+('population', 242, 2015, 'e4653c038cfcce06'),
+('population', 242, 2020, 'b0a824e0c88b1ef9'),
+('population', 243, 2015, '6e89efd3a38dc97e'),
+('population', 243, 2020, '0dfc30153a0e2734'),
+('population', 244, 2015, '767a6446a863d600'),
+('population', 244, 2020, 'd138d54103a95f77'),
+('population', 245, 2015, '5365641384c2f24a'),
+('population', 245, 2020, 'c787e16bbceda305'),
+('population', 246, 2015, 'd4cdd4050b0af429'),
+('population', 246, 2020, 'c763af37d72e632a'),
+('population', 247, 2015, 'e11ea7cc22dc8dfb'),
+('population', 247, 2020, '94b4410773469b25'),
+('population', 248, 2015, '2b36881298fd6903'),
+('population', 248, 2020, 'b757a2766513abe6'),
+('population', 249, 2015, '4285b8b022a3fba8'),
+('population', 249, 2020, 'aecc611addea88b3'),
+('population', 250, 2015, '3c42e63148e31eee'),
+('population', 250, 2020, '5312aba02fb6b004'),
+('population', 251, 2015, 'a741241691aa99ae'),
+('population', 251, 2020, '58cc0818b52b9f40'),
+('population', 252, 2015, '969e3c2dcc7f1e6a'),
+('population', 252, 2020, '2cbf42b77b693b09'),
+('population', 253, 2015, 'ba796a4ebe98fcfc'),
+('population', 253, 2020, '981fc345b9906019'),
+('population', 254, 2015, 'ce2714ddc5b4a888'),
+('population', 254, 2020, '4237a45f71fdb97d'),
+('population', 255, 2015, '2642903fddf4182f'),
+('population', 255, 2020, '45ccaeff58f0e6f8'),
+('population', 256, 2015, 'd0b9c3b1d9bb92b6'),
+('population', 256, 2020, 'e8137102024285b5'),
+('population', 257, 2015, '9b86b848be09f3c2'),
+('population', 257, 2020, '260303228c474c2b'),
+('population', 258, 2015, 'd23ce890700f348c'),
+('population', 258, 2020, '958f90667222ca43'),
+('population', 259, 2015, '22ef029f2fd8cf3d'),
+('population', 259, 2020, '8ec3648170e1ab63'),
+('population', 260, 2015, '0f7ded3d018a665f'),
+('population', 260, 2020, '96ccac5a9194581b'),
+('population', 261, 2015, '6236d225ea358f83'),
+('population', 261, 2020, 'cf790fb53beaeb0f'),
+('population', 262, 2015, 'a40d734a9985068d'),
+('population', 262, 2020, 'cd2bbf3dae021efd'),
+('population', 263, 2015, '1f5e5cab96a27275'),
+('population', 263, 2020, '9942a8eaf582aa0a'),
+('population', 264, 2015, 'b4453088ea2c89e2'),
+('population', 264, 2020, 'e8400637c2875bce'),
+('population', 265, 2015, '568c6427592aaf89'),
+('population', 265, 2020, 'b5ec0da083204fc6'),
+('population', 266, 2015, 'e05190a358f47f04'),
+('population', 266, 2020, '1479a9d838df6cb7'),
+('population', 267, 2015, '8a793139088f5250'),
+('population', 267, 2020, '08b3adb505a77a68'),
+('population', 268, 2015, 'd8b5317fcc02331f'),
+('population', 268, 2020, 'c3865f3f0b7dff44'),
+('population', 269, 2015, '19a776ddfb41697d'),
+('population', 269, 2020, '9258d31362ce8520'),
+('population', 270, 2015, '9d30733db86cbd52'),
+('population', 270, 2020, '2a1dd17701db724d'),
+('population', 271, 2015, '35bcbae05a506a73'),
+('population', 271, 2020, '5f75f5773d74b360'),
+('population', 272, 2015, '7eef6d51fc0443c5'),
+('population', 272, 2020, 'd1971c523eb7fae0'),
+('population', 273, 2015, '16d173fa5cb6063f'),
+('population', 273, 2020, 'a0153f036196232a'),
+('population', 274, 2015, '6c28a95aef52c46f'),
+('population', 274, 2020, '22225d79d31e468e'),
+('population', 275, 2015, '2018e00527713700'),
+('population', 275, 2020, 'f72c99832b151c85'),
+('population', 276, 2015, '0b78f2f1414ca0ea'),
+('population', 276, 2020, '8d78868d0d98dae0'),
+('population', 277, 2015, '100e8495b4221d14'),
+('population', 277, 2020, 'da76aed9210787b3'),
+('population', 278, 2015, 'e2710982b83cf49d'),
+('population', 278, 2020, 'cb79e891ce02fcaa'),
+('population', 279, 2015, '4ac7f2ed5e769c30'),
+('population', 279, 2020, '672215e73f2d49d3'),
+('population', 280, 2015, '6792bc2bc6b4ef82'),
+('population', 280, 2020, 'ade056c60c5c3d2e'),
+('population', 281, 2015, '092a83bc6f20db39'),
+('population', 281, 2020, '1e51f4844ba177ae'),
+('population', 282, 2015, '10d70c280a68530d'),
+('population', 282, 2020, '9fc887b4761ae1d7'),
+('population', 283, 2015, 'e99625e9d03ddb72'),
+('population', 283, 2020, 'c2f80d9a6cb0d5e6'),
+('population', 284, 2015, '0968345b6abda5d0'),
+('population', 284, 2020, '48a9349d5304876f'),
+('population', 285, 2015, 'e1f6c0b6b7202c6f'),
+('population', 285, 2020, 'adefd2ffed234f70'),
+('population', 286, 2015, '5a1c72d562508a63'),
+('population', 286, 2020, 'aee957cd23f9d0ca'),
+('population', 287, 2015, 'e84991383b138aaf'),
+('population', 287, 2020, 'f045fdda54d8ebd9'),
+('population', 288, 2015, '57a9f8c5357b37f4'),
+('population', 288, 2020, '4a9b4a9559f2ca99'),
+('population', 289, 2015, '6f3d4ae99b7694c1'),
+('population', 289, 2020, '7b12f8ec8e028b38'),
+('population', 290, 2015, '742fadabbf89d065'),
+('population', 290, 2020, '0434698e73394634'),
+('population', 291, 2015, 'ef21715399d43dfa'),
+('population', 291, 2020, '1593002c9da9fc26'),
+('population', 292, 2015, 'dbb3c7d1e352b3cf'),
+('population', 292, 2020, 'b84c3151d8058d8a'),
+('population', 293, 2015, '9c49609e9e23b1ed'),
+('population', 293, 2020, '141253521857d89b'),
+('population', 294, 2015, '59b3dfd576e7f161'),
+('population', 294, 2020, '0699854198656c63'),
+('population', 295, 2015, 'c48d05fd3a1bf1f6'),
+('population', 295, 2020, 'c1c32a6eb26c32de'),
+('population', 296, 2015, '7d34bed435c52d28'),
+('population', 296, 2020, '2963643dc65aa8c6'),
+('population', 297, 2015, 'c1cf67128c8cbd2a'),
+('population', 297, 2020, 'b2205db37e2ca3b8'),
+('population', 298, 2015, '57ec0bb2d20eccd5'),
+('population', 298, 2020, 'e389f43bd2d72d24'),
+('population', 299, 2015, '3893b04cf0bb6319'),
+('population', 299, 2020, 'aa435ce7abac39be'),
+('population', 300, 2015, 'db9eb8169d093243'),
+('population', 300, 2020, '6285928f62f4c240'),
+('population', 301, 2015, '547fa938704158b4'),
+('population', 301, 2020, '9f7369a06d5a7a21'),
+('population', 302, 2015, '87388f88b789be5b'),
+('population', 302, 2020, '98997df916c476bf'),
+('population', 303, 2015, '5049b9f8e634bf71'),
+('population', 303, 2020, 'e5594b97894f3273'),
+('population', 304, 2015, '28ba2fa7b76eccf7'),
+('population', 304, 2020, 'f99f2ed96f699577'),
+('population', 305, 2015, '0e18d0ee064bbd2d'),
+('population', 305, 2020, '49af5f3a47799d5e'),
+('population', 306, 2015, '24a1673077a9c38f'),
+('population', 306, 2020, '20cbcbb3b071008e'),
+('population', 307, 2015, '46118a2926d54374'),
+('population', 307, 2020, 'ec589362167e4d99'),
+('population', 308, 2015, 'e0f65bc6fecbc0fc'),
+('population', 308, 2020, 'c1de079041a1d846'),
+('population', 309, 2015, '6a75d765cd2bfd84'),
+('population', 309, 2020, 'df9be33e31f4c0aa'),
+('population', 310, 2015, '5cade646911f9dcb'),
+('population', 310, 2020, '39d022ff9c8ab57d'),
+('population', 311, 2015, '0a6c3f9e45546b67'),
+('population', 311, 2020, '12f5a39571a9ac74'),
+('population', 312, 2015, '222fbb866354d3e8'),
+('population', 312, 2020, 'd6e6d40e17f7fd78'),
+('population', 313, 2015, '561a0fb295b1047f'),
+('population', 313, 2020, '15bf74e0d487cca5'),
+('population', 314, 2015, 'e63926b42a888f3b'),
+('population', 314, 2020, '1fddb83e572d7e98'),
+('population', 315, 2015, 'f79a53c91cb66210'),
+('population', 315, 2020, 'a0755042902cced9'),
+('population', 316, 2015, 'd460619c81767709'),
+('population', 316, 2020, 'c278c619f4ca7234'),
+('population', 317, 2015, '70ff1d77cc52c4f6'),
+('population', 317, 2020, '5ce2cf27372e54e1'),
+('population', 318, 2015, '48683cda5f6aecf4'),
+('population', 318, 2020, '74dde477a2ee3eef'),
+('population', 319, 2015, 'ee4d430775da3397'),
+('population', 319, 2020, '580a2914ea527992'),
+('population', 320, 2015, '511fd6e621dbe92c'),
+('population', 320, 2020, '1287b217399af25e'),
+('population', 321, 2015, '790bb7fc9e00de17'),
+('population', 321, 2020, '39ad5e5e59d1b82e'),
+('population', 322, 2015, 'e10de8d4cfbc8523'),
+('population', 322, 2020, '0511fe3bdc83484f'),
+('population', 323, 2015, 'a0e276bef2d4cd34'),
+('population', 323, 2020, 'ba08dc1ff068e392'),
+('population', 324, 2015, 'e88abba75d307c13'),
+('population', 324, 2020, '19493502c27685d1'),
+('population', 325, 2015, '1f1166a407f1c79d'),
+('population', 325, 2020, 'c1602f32a7764778'),
+('population', 326, 2015, 'c4d717b6587979b1'),
+('population', 326, 2020, '4b341dd136e239aa'),
+('population', 327, 2015, 'f13ecfb4b39f9307'),
+('population', 327, 2020, '4811fea2f641b308'),
+('population', 328, 2015, '805d201a9779ffd9'),
+('population', 328, 2020, '997dffaaefdb14c3'),
+('population', 329, 2015, '98e2d35afa0710ec'),
+('population', 329, 2020, '5dae3f43a8a5b9cc'),
+('population', 330, 2015, '6fa33934dd889f21'),
+('population', 330, 2020, '9772e78241d5b425'),
+('population', 331, 2015, 'eadec58683a40846'),
+('population', 331, 2020, 'cbccc157c783c20f'),
+('population', 332, 2015, 'a74be5cee43a49b8'),
+('population', 332, 2020, 'e512d7e46b54d98d'),
+('population', 333, 2015, 'fd44feb591eb2809'),
+('population', 333, 2020, '51792c716bca401c'),
+('population', 334, 2015, 'd3a03ecdca5e84fc'),
+('population', 334, 2020, '50fb05b95c508238'),
+('population', 335, 2015, '78bc8c4737dd65ad'),
+('population', 335, 2020, '7f866e49b6fd6952'),
+('population', 336, 2015, '364190d7f08bdb1a'),
+('population', 336, 2020, '0f1f8dcb511565a5'),
+('population', 337, 2015, '126bb97caa4aea51'),
+('population', 337, 2020, '1cd82c83f41a58f6'),
+('population', 338, 2015, '3de8facee1a4f303'),
+('population', 338, 2020, '67006f1b84c5ff42'),
+('population', 339, 2015, 'eefbaa89812d06ac'),
+('population', 339, 2020, '4de5a6e7fb597cd8'),
+('population', 340, 2015, '53bf349e8012aecf'),
+('population', 340, 2020, '5127ccd896e87667'),
+('population', 341, 2015, '6c9156644cd19732'),
+('population', 341, 2020, '6f067ecda03c6a61'),
+('population', 342, 2015, '37ca8701e95eb401'),
+('population', 342, 2020, '386d11098a79916a'),
+('population', 343, 2015, 'caab01456c4663e5'),
+('population', 343, 2020, 'eea1c96d1c45c1c8'),
+('population', 344, 2015, '0e4d030e2eb63eb2'),
+('population', 344, 2020, '6f4e0bfa0c3c8f7c'),
+('population', 345, 2015, '46030fe0bce463bb'),
+('population', 345, 2020, 'e274b6cd1079cdac'),
+('population', 346, 2015, 'bd7fe9a494f425a3'),
+('population', 346, 2020, 'bee8fa6e8207b54b'),
+('population', 347, 2015, 'c5e97a90174ad096'),
+('population', 347, 2020, 'f9909c06519cfc1b'),
+('population', 348, 2015, 'a8c159d7ee96ae27'),
+('population', 348, 2020, 'd0b3b216cb1dbc8e'),
+('population', 349, 2015, '66cc0215a2c13f83'),
+('population', 349, 2020, '2b6e0701e7e4e068'),
+('population', 350, 2015, 'ffef6ec4f202f38f'),
+('population', 350, 2020, '6e50f3952c5d38a2'),
+('population', 351, 2015, 'c726f12777464bd1'),
+('population', 351, 2020, 'b0d9ef2c2873d1b2'),
+('population', 352, 2015, '93dd42508cdbb21b'),
+('population', 352, 2020, 'da33a8226ae0037f'),
+('population', 353, 2015, '31ddf61c494f5480'),
+('population', 353, 2020, '2000f6826c84e126'),
+('population', 354, 2015, 'b94f0bf8671694ad'),
+('population', 354, 2020, '71f8b4c2c86d449e'),
+('population', 355, 2015, '568577097a88e499'),
+('population', 355, 2020, 'dc25f645131a32c2'),
+('population', 356, 2015, '5c103b3280dd6481'),
+('population', 356, 2020, '6c74f796721ee95e'),
+('population', 357, 2015, '4b5d32d60264b170'),
+('population', 357, 2020, '8ac31df8541bdbe7'),
+('population', 358, 2015, 'a70261bdf2b879ce'),
+('population', 358, 2020, 'c3c1a6b5e971c01b'),
+('population', 359, 2015, '56b90d21cb18fe39'),
+('population', 359, 2020, '823dbab533500822'),
+('population', 360, 2015, '565fc30d202469c0'),
+('population', 360, 2020, 'e7396dd8354ba33a'),
+('population', 361, 2015, '11f76774a31caea8'),
+('population', 361, 2020, '966223766e4c4ec9'),
+('population', 362, 2015, '66d2cf1352580e9e'),
+('population', 362, 2020, '97f64013e3af2460'),
+('population', 363, 2015, 'fdf88b461b1c076d'),
+('population', 363, 2020, 'f70ee74d85c81f5e'),
+('population', 364, 2015, 'b42a78fd7af698d4'),
+('population', 364, 2020, 'd39a180037e7163f'),
+('population', 365, 2015, 'f7ac35676b0d6088'),
+('population', 365, 2020, '6012ee91811c7df1'),
+('population', 366, 2015, '24f8a65dd6f3cd1a'),
+('population', 366, 2020, '42afa274e1d238b7'),
+('population', 367, 2015, '293a28ba7801550a'),
+('population', 367, 2020, 'e742a7b54ac611d0'),
+('population', 368, 2015, '1a2ad6c19745a542'),
+('population', 368, 2020, 'e5dfff804cd21b0e'),
+('population', 369, 2015, '50fad7542ea183e3'),
+('population', 369, 2020, '71d4124742d43a06'),
+('population', 370, 2015, '7e586b8087da69d6'),
+('population', 370, 2020, '6a75472379f96540'),
+('population', 371, 2015, '06d27498557dd55b'),
+('population', 371, 2020, '1da82163705e438d'),
+('population', 372, 2015, '36a76777d3f1b54c'),
+('population', 372, 2020, '6f20720e12e145e7'),
+('population', 373, 2015, 'c3099de80b1dfec5'),
+('population', 373, 2020, 'c81e0db88aad06fe'),
+('population', 374, 2015, 'e5978e30373899fe'),
+('population', 374, 2020, '07feea99614b0175'),
+('population', 375, 2015, '5d16b6d5f3c229b3'),
+('population', 375, 2020, 'f073c1ecdf47823a'),
+('population', 376, 2015, '7bd90874fb9c224e'),
+('population', 376, 2020, '9f073199e748a1bf'),
+('population', 377, 2015, '151358da5d815cc8'),
+('population', 377, 2020, 'e23c5e0f3e1cc223'),
+('population', 378, 2015, '055c4a86111865ca'),
+('population', 378, 2020, '2b3a56628bd9976f'),
+('population', 379, 2015, '91d565899606fd33'),
+('population', 379, 2020, '69874af9db9ca607'),
+('population', 380, 2015, '724fb311244b8119'),
+('population', 380, 2020, 'c8dde6b567e44d1b'),
+('population', 381, 2015, '6a9509546a3c8452'),
+('population', 381, 2020, 'b6eb6af14ca21afb'),
+('population', 382, 2015, '4b95233d5cda11e9'),
+('population', 382, 2020, '6884b8d933b861ee'),
+('population', 383, 2015, '67b1daac7f2866d8'),
+('population', 383, 2020, '1aa8efd7dcf3c40b'),
+('population', 384, 2015, '292bee57cdc6b630'),
+('population', 384, 2020, '193838e695457fe0'),
+('population', 385, 2015, '7b47880f77f10165'),
+('population', 385, 2020, 'acb79de7f2edd337'),
+('population', 386, 2015, 'e92467b5f033bdbf'),
+('population', 386, 2020, '43d2ba64c533b900'),
+('population', 387, 2015, '8e589ad465bd0790'),
+('population', 387, 2020, '5f82ea86c121b6fd'),
+('population', 388, 2015, '51c9b5ea907102e2'),
+('population', 388, 2020, '167e118a33f2a87c'),
+('population', 389, 2015, '1b485817ee3a1584'),
+('population', 389, 2020, 'dbdd90adc662c9c5'),
+('population', 390, 2015, 'cd1f9929a066d7ad'),
+('population', 390, 2020, '4c0dd45fa016e98f'),
+('population', 391, 2015, '2b65dfd2d6a8e785'),
+('population', 391, 2020, '849750406a862dbe'),
+('population', 392, 2015, '0eb99b34d8c9f6eb'),
+('population', 392, 2020, '7e793bf603026e25'),
+('population', 393, 2015, 'd4af336a95689180'),
+('population', 393, 2020, '2ac17446f9051611'),
+('population', 394, 2015, 'b1eee9370ecd7588'),
+('population', 394, 2020, '5e4787bec1e39164'),
+('population', 395, 2015, '280b1066a35fe424'),
+('population', 395, 2020, '823b8d2ec6fcfc2e'),
+('population', 396, 2015, '81037617b46a6455'),
+('population', 396, 2020, '373f58c79b5be866'),
+('population', 397, 2015, 'd5f50c00e8bfd077'),
+('population', 397, 2020, 'd77a9f6391f3537a'),
+('population', 398, 2015, 'c1f12b60583a8e91'),
+('population', 398, 2020, '3e6a16a219341a6e'),
+('population', 399, 2015, 'c2740964e39d6723'),
+('population', 399, 2020, '6cac185e8d38645c'),
+('population', 400, 2015, '867bdb97086b5db2'),
+('population', 400, 2020, '3d3b62692274d921'),
+('population', 401, 2015, '8e2d00dc383ab944'),
+('population', 401, 2020, '90b4dbbf1af1d9aa'),
+('population', 402, 2015, '8937b3748ae9d3aa'),
+('population', 402, 2020, '561424a3bdf46721'),
+('population', 403, 2015, '1bb7834db41a9875'),
+('population', 403, 2020, '7b46376d46723c93'),
+('population', 404, 2015, '505a02ad3ddcbe98'),
+('population', 404, 2020, '14dde89f0cbcd0ee'),
+('population', 405, 2015, '805bf46a59c27d36'),
+('population', 405, 2020, '67a3103530d777a2'),
+('population', 406, 2015, '66ccd3785dca18de'),
+('population', 406, 2020, '1b5974c53574b4bc'),
+('population', 407, 2015, 'ad853dde79415808'),
+('population', 407, 2020, '7b064ad23d1ea4ec'),
+('population', 408, 2015, '06678801be43f9dc'),
+('population', 408, 2020, '38c7c98e4ba960e2'),
+('population', 409, 2015, 'fae198641d655ce7'),
+('population', 409, 2020, '4ff12eaecebde1a0'),
+('population', 410, 2015, 'de68c52e8c16f73f'),
+('population', 410, 2020, '48ab76dfdb71f523'),
+('population', 411, 2015, '7baccd63e58e610d'),
+('population', 411, 2020, 'f4709f1c45d033f0'),
+('population', 412, 2015, '0232a37a593ceaa9'),
+('population', 412, 2020, 'd5adb5bc2e39f518'),
+('population', 413, 2015, '61bbb237e5b1d2a6'),
+('population', 413, 2020, '2e87f64a1cca4bb9'),
+('population', 414, 2015, '20ef1d353157b39a'),
+('population', 414, 2020, '62951c8d67b6cdd9'),
+('population', 415, 2015, 'f7a2a48a66b62e48'),
+('population', 415, 2020, 'a336d4cfe01699f0'),
+('population', 416, 2015, 'bf665145f19c43ad'),
+('population', 416, 2020, '3f36219f6197f229'),
+('population', 417, 2015, 'ce4eb34f4b2f3032'),
+('population', 417, 2020, '6f9793a8b8b957cd'),
+('population', 418, 2015, '70c84fb5f6be605a'),
+('population', 418, 2020, '4c9a6f5ee28db2c7'),
+('population', 419, 2015, '6f506526cdd481b3'),
+('population', 419, 2020, '2125fdaae7feb66f'),
+('population', 420, 2015, 'd4e16ed172a8e061'),
+('population', 420, 2020, '8b4a870d4acf7800'),
+('population', 421, 2015, '2adda410af6e9399'),
+('population', 421, 2020, '06364f63bbd51ab3'),
+('population', 422, 2015, '5595199be0f7841b'),
+('population', 422, 2020, '7afff2fc284bdaba'),
+('population', 423, 2015, 'e8a8a7ee4ad0bf3c'),
+('population', 423, 2020, 'be77ddabfd4b5925'),
+('population', 424, 2015, 'aeff62b6395c31b5'),
+('population', 424, 2020, '6a406fb0441ebc33'),
+('population', 425, 2015, '8354d8bd756599ba'),
+('population', 425, 2020, 'adb2131cff2594c3'),
+('population', 426, 2015, '6c7785cc516adc36'),
+('population', 426, 2020, '4c3d2d090e4d66bc'),
+('population', 427, 2015, 'ba0a02ad38fd7536'),
+('population', 427, 2020, '93d5f7db495bed28'),
+('population', 428, 2015, '76f267c1d615765f'),
+('population', 428, 2020, '1fe3ce376c8082ca'),
+('population', 429, 2015, '048ccda571cbd00a'),
+('population', 429, 2020, 'ea05b16d88c61caf'),
+('population', 430, 2015, '1b1f08d36b8ea862'),
+('population', 430, 2020, '1bec7acfb9afdfee'),
+('population', 431, 2015, '760224ffaf28cd64'),
+('population', 431, 2020, '8ace7baff91dc672'),
+('population', 432, 2015, '46fdc831f6204ec8'),
+('population', 432, 2020, '0f80396c6d0415b7'),
+('population', 433, 2015, 'a0a253bfc3fb4785'),
+('population', 433, 2020, 'eeebd32f5bc5e72a'),
+('population', 434, 2015, 'f0ee46e31c33fc92'),
+('population', 434, 2020, '0b1915a987582f51'),
+('population', 435, 2015, 'ad141b21eeb82252'),
+('population', 435, 2020, 'c66a5439495c1ba5'),
+('population', 436, 2015, '8a5987f46cb5d225'),
+('population', 436, 2020, '35b6952f7ad38420'),
+('population', 437, 2015, '23fc2f5f23a51df6'),
+('population', 437, 2020, '96e9b284cc2ce3e9'),
+('population', 438, 2015, 'f2b66d1d0b8a202d'),
+('population', 438, 2020, '492a9398f12f5953'),
+('population', 439, 2015, '638d4f519dbdf2dc'),
+('population', 439, 2020, 'eb165115fd901315'),
+('population', 440, 2015, '86e744374344c1d5'),
+('population', 440, 2020, 'e96fd89a951dfb81'),
+('population', 441, 2015, 'ea474849c2f48f4b'),
+('population', 441, 2020, '3834e34f6e48cb5d'),
+('population', 442, 2015, '3d7d3507343b9f81'),
+('population', 442, 2020, 'b08de7bedb9f6110'),
+('population', 443, 2015, '6d369558e1d40477'),
+('population', 443, 2020, '8f18b3ff4e3e8394'),
+('population', 444, 2015, '14b04aeb125e7a0b'),
+('population', 444, 2020, '9f8317a02abdeaf6'),
+('population', 445, 2015, '32dbef86297cd4a4'),
+('population', 445, 2020, '4211aa74fe79b506'),
+('population', 446, 2015, '0c50f56aea47d9d3'),
+('population', 446, 2020, '48a0f0ced401960c'),
+('population', 447, 2015, '614e14d7d1de58cd'),
+('population', 447, 2020, '72627e8f68b72686'),
+('population', 448, 2015, 'a8f2c8e6eaacbaca'),
+('population', 448, 2020, '55e6997cc96a3aee'),
+('population', 449, 2015, '3f14b8cd999fafd0'),
+('population', 449, 2020, 'a97c2ba3e9be886b'),
+('population', 450, 2015, '7352743bfe5987f2'),
+('population', 450, 2020, 'd54c06574d389b25'),
+('population', 451, 2015, '8e89ddac6742058a'),
+('population', 451, 2020, 'd9a23cf18c4b257e'),
+('population', 452, 2015, 'e7f4ceedc35dddad'),
+('population', 452, 2020, 'd90f1d831aef4727'),
+('population', 453, 2015, '5d9ecd9d4790d77b'),
+('population', 453, 2020, '5efdefc80676d35b'),
+('population', 454, 2015, 'd7cc9642d525a495'),
+('population', 454, 2020, '9c933375cc8cabb9'),
+('population', 455, 2015, '3321c0af328a3fb1'),
+('population', 455, 2020, '6745539d8cca985c'),
+('population', 456, 2015, '6c17c34abfd41240'),
+('population', 456, 2020, 'aee3c92cf1de792f'),
+('population', 457, 2015, '52668884caafb294'),
+('population', 457, 2020, '3869088413a8f2a5'),
+('population', 458, 2015, '46dbebed8c2f3f94'),
+('population', 458, 2020, '2ba17de59939b4e7'),
+('population', 459, 2015, '1e8c76eae62399a9'),
+('population', 459, 2020, '79880b1a5b100284'),
+('population', 460, 2015, '3f5a4ed2b8a8511f'),
+('population', 460, 2020, 'fa81555a79c92efe'),
+('population', 461, 2015, '8e94895a5e099ff7'),
+('population', 461, 2020, '54c6e63cb8f08e6b'),
+('population', 462, 2015, '90db0cdfb19c4785'),
+('population', 462, 2020, 'fc456d6dd625f602'),
+('population', 463, 2015, 'e724ce3a73fc15d6'),
+('population', 463, 2020, '73660da91d0f591b'),
+('population', 464, 2015, 'cee2d58ab6da4150'),
+('population', 464, 2020, '67217b47190c9074'),
+('population', 465, 2015, '65730aa0190ccd16'),
+('population', 465, 2020, '1d1a6ad4be4bca6b'),
+('population', 466, 2015, '8fd59621034b55da'),
+('population', 466, 2020, '3ee8710e14acae37'),
+('population', 467, 2015, 'fb06da6995f4a782'),
+('population', 467, 2020, 'df98fe321fd732b0'),
+('population', 468, 2015, '6f3a45a761f172b7'),
+('population', 468, 2020, 'b3cfbf31204b1d12'),
+('population', 469, 2015, '99067ccd009b91ab'),
+('population', 469, 2020, '40d73f8ea3328282'),
+('population', 470, 2015, 'fe7c545e673adf91'),
+('population', 470, 2020, '41f3502ccbf6077b'),
+('population', 471, 2015, 'af41c32597e925f8'),
+('population', 471, 2020, '34bcd7f1f66fcf8d'),
+('population', 472, 2015, '29fc6f487e9f68c2'),
+('population', 472, 2020, '8a25e49fe800364a'),
+('population', 473, 2015, '72ec3c46de287745'),
+('population', 473, 2020, '9ffb06e4f33ff120'),
+('population', 474, 2015, 'caa66e041c73d7f7'),
+('population', 474, 2020, 'fb3902be39e193fe'),
+('population', 475, 2015, '515507a80c2871e2'),
+('population', 475, 2020, 'fb3c301acaed5423'),
+('population', 476, 2015, '4286eeacd34bc6e7'),
+('population', 476, 2020, '78dda67c4ef78f44'),
+('population', 477, 2015, 'acc923a0df74a514'),
+('population', 477, 2020, 'd74841c5baafc7bf'),
+('population', 478, 2015, '98e1ec358365f344'),
+('population', 478, 2020, '47ded28a5326fe0c'),
+('population', 479, 2015, '971772094957b446'),
+('population', 479, 2020, '15ced1727ccf1577'),
+('population', 480, 2015, '5882f5bd5f63ca1b'),
+('population', 480, 2020, '0e096bf4c156bcac'),
+('population', 481, 2015, '67c178104cebe0ce'),
+('population', 481, 2020, '768daab69cfc6b5e'),
+('population', 482, 2015, '8303f4310ef1d1d4'),
+('population', 482, 2020, '68712fe3eadf30c6'),
+('population', 483, 2015, '88faedabbfa3542d'),
+('population', 483, 2020, '64814a9d27d3f7c7'),
+('population', 484, 2015, '74c185a0ddbef91d'),
+('population', 484, 2020, '53851632a65f42ba'),
+('population', 485, 2015, '796a6efa1ea0e529'),
+('population', 485, 2020, '51ef304eee5b27fa'),
+('population', 486, 2015, '11d9ab6f6b6cc815'),
+('population', 486, 2020, '254cf8c9e1bcef99'),
+('population', 487, 2015, 'e0f11b4028f483f5'),
+('population', 487, 2020, '866833ca6aaeba03'),
+('population', 488, 2015, '4def2b80a187a283'),
+('population', 488, 2020, '9b30eddcb4588dcb'),
+('population', 489, 2015, '62a3d9a77f57d784'),
+('population', 489, 2020, 'c3302bba16683d14'),
+('population', 490, 2015, 'd8b135bb88b40766'),
+('population', 490, 2020, '9ed9ab3c4b8d9c51'),
+('population', 491, 2015, '7ba641e9c4f1d582'),
+('population', 491, 2020, '228e1db250770ef5'),
+('population', 492, 2015, '219030aa182bbcef'),
+('population', 492, 2020, '15ae01672d3ec347'),
+('population', 493, 2015, 'f1fcae7e4ecec568'),
+('population', 493, 2020, 'a7a456ec00d1a19f'),
+('population', 494, 2015, '124eb34f8ff86304'),
+('population', 494, 2020, '92445b78925f903c'),
+('population', 495, 2015, 'f525d21e20a188c8'),
+('population', 495, 2020, '03509eeca53070de'),
+('population', 496, 2015, 'fce407aa605f499b'),
+('population', 496, 2020, 'e911938505abcda2'),
+('population', 497, 2015, 'ec8a872b2fe692a6'),
+('population', 497, 2020, 'b05fc08336758f40'),
+('population', 498, 2015, 'e5af664622a2ea3a'),
+('population', 498, 2020, 'a8e76aeb04d9fa66'),
+('population', 499, 2015, 'f33b01f26a73271f'),
+('population', 499, 2020, 'af82e96f856746c5'),
+('population', 500, 2015, 'c75ff95c59024965'),
+('population', 500, 2020, '24e17055450ed513'),
+('population', 501, 2015, '992da514ef6178b2'),
+('population', 501, 2020, '905d06d3e4b1373a'),
+('population', 502, 2015, '28516587b9940165'),
+('population', 502, 2020, '26661db4363fcdaf'),
+('population', 503, 2015, '6922ce7f19665f06'),
+('population', 503, 2020, '8cc8d8212b64e9ac'),
+('population', 504, 2015, '099fdd71ed6a2aae'),
+('population', 504, 2020, '84ebba4c6aca9e04'),
+('population', 505, 2015, '061df31559c6da0a'),
+('population', 505, 2020, 'a0f4681bbab02687'),
+('population', 506, 2015, '8069269711d29344'),
+('population', 506, 2020, '8adb3a5b2dcf1e12'),
+('population', 507, 2015, '02046492cd3596c2'),
+('population', 507, 2020, 'c974a19f2fe07b80'),
+('population', 508, 2015, 'c7bfd00bcb4fb092'),
+('population', 508, 2020, '8fc05b91a3c0bc95'),
+('population', 509, 2015, '1c6211d9b9c7daa9'),
+('population', 509, 2020, 'f7005aa6e9818148'),
+('population', 510, 2015, 'd4a30194aa6b018c'),
+('population', 510, 2020, '16c4805252c69851'),
+('population', 511, 2015, 'd9e41d02c564594b'),
+('population', 511, 2020, '7aaaffe00d51b188'),
+('population', 512, 2015, '9ec12f34c8e57bb9'),
+('population', 512, 2020, 'd11135a5b4b253dd'),
+('population', 513, 2015, 'b7417fcef684c8dc'),
+('population', 513, 2020, '646ec222c7204d8a'),
+('population', 514, 2015, '2732c82b262cbc6b'),
+('population', 514, 2020, 'c3b5764cacea6424'),
+('population', 515, 2015, '3c43718e593df646'),
+('population', 515, 2020, 'f3cea516325718b1'),
+('population', 516, 2015, '957da2688576cd25'),
+('population', 516, 2020, '10ced238a01b0b4b'),
+('population', 517, 2015, '2274d5f851098fc5'),
+('population', 517, 2020, 'bbbcb766e585024d'),
+('population', 518, 2015, 'e1df1498da633744'),
+('population', 518, 2020, '943e2aafbd22d508'),
+('population', 519, 2015, 'd78707ff071d85fb'),
+('population', 519, 2020, '5a1a7d91cbf1de09'),
+('population', 520, 2015, 'ab70be1e0e27b053'),
+('population', 520, 2020, '53aba2dd9fd28e13'),
+('population', 521, 2015, '8316ed06e6bc4b1e'),
+('population', 521, 2020, 'e38cbb1ae0ca790c'),
+('population', 522, 2015, '147095ca2215c14b'),
+('population', 522, 2020, 'f9f7bccf9cb063bb'),
+('population', 523, 2015, '8b20a5163f5638d8'),
+('population', 523, 2020, '2b09c89f14ebe55a'),
+('population', 524, 2015, 'fcef4c2b4f8a742e'),
+('population', 524, 2020, '64d3c7f2c0e0de80'),
+('population', 525, 2015, '510f041f4fd4a72e'),
+('population', 525, 2020, 'bb745851d0f2a85b'),
+('population', 526, 2015, '29db1a3923bc516b'),
+('population', 526, 2020, 'bb8f2ebb5c5d5e18'),
+('population', 527, 2015, '5939a7a78b440243'),
+('population', 527, 2020, '1d0d85feb8603db4'),
+('population', 528, 2015, '5ef20bc09d19e2c8'),
+('population', 528, 2020, '3f0bfc54dc5c6a74'),
+('population', 529, 2015, 'dad7d58df1b1b04e'),
+('population', 529, 2020, '3858073fc2987de2'),
+('population', 530, 2015, '1d672a7f71daf301'),
+('population', 530, 2020, 'ec444c8af9cdc331'),
+('population', 531, 2015, '3daca4d4c33fed73'),
+('population', 531, 2020, '83033c9bd511bc4c'),
+('population', 532, 2015, '5801c8d473ac75a3'),
+('population', 532, 2020, '9ffcbdfc53b4cc6c'),
+('population', 533, 2015, '25be113f1d72e44c'),
+('population', 533, 2020, 'd8a76cc32a71672a'),
+('population', 534, 2015, 'dfd995244463f38c'),
+('population', 534, 2020, '28928043d81b9232'),
+('population', 535, 2015, '1a0f15f8b0eb0f69'),
+('population', 535, 2020, '1db099d512db5341'),
+('population', 536, 2015, 'c59283c6977fae38'),
+('population', 536, 2020, 'cc2009b83c1b4d76'),
+('population', 537, 2015, '8fd3e58e2c543547'),
+('population', 537, 2020, '3c13c1c452e6864e'),
+('population', 538, 2015, '2c96fc5c5929ae79'),
+('population', 538, 2020, 'f2be29416e99ae22'),
+('population', 539, 2015, '156bedab34abbcbf'),
+('population', 539, 2020, 'cbe0d45f9a1c5e34'),
+('population', 540, 2015, '7a36be221c309dde'),
+('population', 540, 2020, 'befc26266eaba56d'),
+('population', 541, 2015, 'eb8b110daf002ade'),
+('population', 541, 2020, '90a3617cbe3eb90a'),
+('population', 542, 2015, 'cbd556eed77fc101'),
+('population', 542, 2020, '481aa101f2d3bd6f'),
+('population', 543, 2015, 'd6a3bff4163f516d'),
+('population', 543, 2020, '7c1a38a009ae91bd'),
+('population', 544, 2015, '98afb4c2b035d21e'),
+('population', 544, 2020, 'e2967b6457d08ad0'),
+('population', 545, 2015, '8eb34bfdd9808645'),
+('population', 545, 2020, '3e6716d7a4fabd9b'),
+('population', 546, 2015, 'b8569c0ef9de58c7'),
+('population', 546, 2020, '82065f6d332c07d1'),
+('population', 547, 2015, '79455d05ce788890'),
+('population', 547, 2020, '0fed96514e1925ad'),
+('population', 548, 2015, 'fe871ed486fe50d1'),
+('population', 548, 2020, '3f99d6bc8d0b2b42'),
+('population', 549, 2015, 'b315d91d613d01d2'),
+('population', 549, 2020, 'beb54c697d491dfd'),
+('population', 550, 2015, 'bcd95e2a0e89c6a8'),
+('population', 550, 2020, '6bd270eaa0e9fe01'),
+('population', 551, 2015, '60ac2b72316833da'),
+('population', 551, 2020, '9fa4d7e417c25f3b'),
+('population', 552, 2015, '3b1fc757cd961a24'),
+('population', 552, 2020, 'ba10bdb49478832f'),
+('population', 553, 2015, 'de6ba269751dffee'),
+('population', 553, 2020, '7d6b6193e2ad94f8'),
+('population', 554, 2015, '61ff19146a458509'),
+('population', 554, 2020, '9a790cbdf8ce6d3d'),
+('population', 555, 2015, '2a0a47b4866e806f'),
+('population', 555, 2020, 'd170f41cb8202bdb'),
+('population', 556, 2015, '2f4daee2578ff8d5'),
+('population', 556, 2020, '278739f2a27dcdd9'),
+('population', 557, 2015, 'e484077af24e82ef'),
+('population', 557, 2020, '818b683cd0a2b425'),
+('population', 558, 2015, 'a7086884a1bc80c2'),
+('population', 558, 2020, '825ec6b634a2c872'),
+('population', 559, 2015, 'e9febaf00fea840b'),
+('population', 559, 2020, '1c5f626c1d8a2e49'),
+('population', 560, 2015, '8368c7333a639084'),
+('population', 560, 2020, '49dc53a53a149a10'),
+('population', 561, 2015, '0d7c024bd729908b'),
+('population', 561, 2020, '3a764727e4c140b3'),
+('population', 562, 2015, 'bfef590552fd29eb'),
+('population', 562, 2020, 'b23b5ae6be407469'),
+('population', 563, 2015, '2a42131c33d56642'),
+('population', 563, 2020, '698deab8b29c2ac2'),
+('population', 564, 2015, '6fdfa1a624bc5b12'),
+('population', 564, 2020, 'db4ca0f171d3e58c'),
+('means_of_transportation', 0, 2015, '7f95dbc6d99bd6a2'),
+('means_of_transportation', 0, 2020, '370ab25fab4da437'),
+('means_of_transportation', 1, 2015, '8de4cc5cc53ed733'),
+('means_of_transportation', 1, 2020, '3e8bf5a2c56ad228'),
+('means_of_transportation', 2, 2015, '0e867b5410be886e'),
+('means_of_transportation', 2, 2020, 'b497b90a0d6b0713'),
+('means_of_transportation', 3, 2015, '5cd312670a38e63e'),
+('means_of_transportation', 3, 2020, '5b0a24f2c3b558c8'),
+('means_of_transportation', 4, 2015, 'b2a49cf97e2b2792'),
+('means_of_transportation', 4, 2020, 'b22b400770994c10'),
+('means_of_transportation', 5, 2015, 'f98374fabd2e3f8f'),
+('means_of_transportation', 5, 2020, '40019bf2b5b4d446'),
+('means_of_transportation', 6, 2015, '5342929eb8815d6e'),
+('means_of_transportation', 6, 2020, '8448805445305d0e'),
+('means_of_transportation', 7, 2015, 'eaaa4a9f65d1f1f1'),
+('means_of_transportation', 7, 2020, 'fb5429c619aff399'),
+('means_of_transportation', 8, 2015, '0fb9f8ab42593d83'),
+('means_of_transportation', 8, 2020, '2bfac53ccf07b41c'),
+('means_of_transportation', 9, 2015, '73ee8a7dec3907ec'),
+('means_of_transportation', 9, 2020, '7225cfa371321aaf'),
+('means_of_transportation', 10, 2015, 'd9417a384d1fdd35'),
+('means_of_transportation', 10, 2020, '03c83d0329ce3e93'),
+('means_of_transportation', 11, 2015, 'e5ad79693a737ce6'),
+('means_of_transportation', 11, 2020, '20b2f9562cf0bea2'),
+('means_of_transportation', 12, 2015, '8450e8b1c24a2f7a'),
+('means_of_transportation', 12, 2020, '7623f999945806ef'),
+('means_of_transportation', 13, 2015, '0c7daf6fe9cac184'),
+('means_of_transportation', 13, 2020, '7c8d7354f4eb0795'),
+('means_of_transportation', 14, 2015, '82ec2e8a4ca8fc9e'),
+('means_of_transportation', 14, 2020, 'b7c62f22880f4a47'),
+('means_of_transportation', 15, 2015, '11403cac3457ceda'),
+('means_of_transportation', 15, 2020, '5ab7fceccf420cc7'),
+('means_of_transportation', 16, 2015, '93ec6d1b39c066e8'),
+('means_of_transportation', 16, 2020, '8c6d61c3949930ac'),
+('means_of_transportation', 17, 2015, '45caed89bd9236cb'),
+('means_of_transportation', 17, 2020, '6c6ded2b83a67453'),
+('means_of_transportation', 18, 2015, '2c1dd14eae196ada'),
+('means_of_transportation', 18, 2020, 'd51e40517f4fd987'),
+('means_of_transportation', 19, 2015, 'dec4af799e8fe18a'),
+('means_of_transportation', 19, 2020, '86a531ffff561b77'),
+('means_of_transportation', 20, 2015, '128862695934f130'),
+('means_of_transportation', 20, 2020, 'a3887721630571bc'),
+('means_of_transportation', 21, 2015, '4783fb8125843989'),
+('means_of_transportation', 21, 2020, '531b9cd19a83d92c'),
+('means_of_transportation', 22, 2015, 'dbb8577557f7e804'),
+('means_of_transportation', 22, 2020, '7d58934a94808f84'),
+('means_of_transportation', 23, 2015, '4023355c409a625e'),
+('means_of_transportation', 23, 2020, '8387f2479052be65'),
+('means_of_transportation', 24, 2015, '3948496acded7a3c'),
+('means_of_transportation', 24, 2020, 'fa3674f039086549'),
+('means_of_transportation', 25, 2015, '744b603eec28496c'),
+('means_of_transportation', 25, 2020, 'b3aaa20d55516e36'),
+('means_of_transportation', 26, 2015, 'a136f8aa455c0ff4'),
+('means_of_transportation', 26, 2020, 'c035415f3bf68dd9'),
+('means_of_transportation', 27, 2015, 'cea8b6e5378b6553'),
+('means_of_transportation', 27, 2020, '886bc4241187448a'),
+('means_of_transportation', 28, 2015, '24d7dafbe3025866'),
+('means_of_transportation', 28, 2020, '7e5140b2263cc324'),
+('means_of_transportation', 29, 2015, '1d2c6dd395cafd1b'),
+('means_of_transportation', 29, 2020, '8ed0d63803ee5594'),
+('means_of_transportation', 30, 2015, 'f0a35f1d36da3166'),
+('means_of_transportation', 30, 2020, '616c57d91933e391'),
+('means_of_transportation', 31, 2015, '65e41c73c1872bb4'),
+('means_of_transportation', 31, 2020, 'c8333366031278be'),
+('means_of_transportation', 32, 2015, '2f20f78dd3255854'),
+('means_of_transportation', 32, 2020, '7559d577f32f8d9a'),
+('means_of_transportation', 33, 2015, 'ad3af2bff6226b9d'),
+('means_of_transportation', 33, 2020, '455fa5144fe23bca'),
+('means_of_transportation', 34, 2015, '1da1dffabed3621c'),
+('means_of_transportation', 34, 2020, '2dd9b364a2771bec'),
+('means_of_transportation', 35, 2015, 'de6aa8f96b520f6b'),
+('means_of_transportation', 35, 2020, '7309ba82cc080cff'),
+('means_of_transportation', 36, 2015, '74985fce70cae032'),
+('means_of_transportation', 36, 2020, '637788d9987ff44d'),
+('means_of_transportation', 37, 2015, 'f25d46299b41f60f'),
+('means_of_transportation', 37, 2020, 'cea6c33dd947a25f'),
+('means_of_transportation', 38, 2015, 'c5352e7c69fea562'),
+('means_of_transportation', 38, 2020, '79f50fbfba9165ad'),
+('means_of_transportation', 39, 2015, '2e435778f0dfe1db'),
+('means_of_transportation', 39, 2020, 'f5c8468eadbed22a'),
+('means_of_transportation', 40, 2015, '07939c05f25cd6b8'),
+('means_of_transportation', 40, 2020, '9291afaa2e9db491'),
+('means_of_transportation', 41, 2015, '77a6bbd704533fb5'),
+('means_of_transportation', 41, 2020, 'c66c8f9598bd7da4'),
+('means_of_transportation', 42, 2015, '577e5ee1e55080b1'),
+('means_of_transportation', 42, 2020, '5f39c57185500421'),
+('means_of_transportation', 43, 2015, '2f587be03bafc883'),
+('means_of_transportation', 43, 2020, 'e53d193fbaacebda'),
+('means_of_transportation', 44, 2015, 'ef000544740bb072'),
+('means_of_transportation', 44, 2020, 'b5bc1fda4d983a64'),
+('means_of_transportation', 45, 2015, '3d3385b8f4f67db7'),
+('means_of_transportation', 45, 2020, 'fdbff3a5ad3195ca'),
+('means_of_transportation', 46, 2015, '67a7a08be6a9b546'),
+('means_of_transportation', 46, 2020, '35a5176d4d4f9600'),
+('means_of_transportation', 47, 2015, '674190abcc20f6b2'),
+('means_of_transportation', 47, 2020, '020e8c970e407c63'),
+('means_of_transportation', 48, 2015, 'c8ea66407948efa4'),
+('means_of_transportation', 48, 2020, '9a229ed0e725b0a5'),
+('means_of_transportation', 49, 2015, 'bad1550e8f6b3454'),
+('means_of_transportation', 49, 2020, 'af4322880fd88886'),
+('means_of_transportation', 50, 2015, '990d4c133c235480'),
+('means_of_transportation', 50, 2020, '94a39bdc7bc0a58c'),
+('means_of_transportation', 51, 2015, '218e4b9eb527936a'),
+('means_of_transportation', 51, 2020, '997c483141107410'),
+('means_of_transportation', 52, 2015, '992d72727050a5e2'),
+('means_of_transportation', 52, 2020, '16a391266cc91912'),
+('means_of_transportation', 53, 2015, 'e1148eb11dc2377a'),
+('means_of_transportation', 53, 2020, 'ec4c7ba0b1716136'),
+('means_of_transportation', 54, 2015, '8dda17d6fc35b322'),
+('means_of_transportation', 54, 2020, 'e5cc464749853d61'),
+('means_of_transportation', 55, 2015, '991b9e8f8acb8141'),
+('means_of_transportation', 55, 2020, 'cd6d58fc4d495f66'),
+('means_of_transportation', 56, 2015, 'a07bd7162acedfb8'),
+('means_of_transportation', 56, 2020, '3453b991374f323a'),
+('means_of_transportation', 57, 2015, '0cf6b4728d5d9fdb'),
+('means_of_transportation', 57, 2020, '7ee58a7d1ee5969c'),
+('means_of_transportation', 58, 2015, '5c9f93cb1175c8b5'),
+('means_of_transportation', 58, 2020, '78bd58431bc0a3f0'),
+('means_of_transportation', 59, 2015, '8474d33ddef1dc8d'),
+('means_of_transportation', 59, 2020, '8c45ff35a3fa1f2d'),
+('means_of_transportation', 60, 2015, '88caf627e542558c'),
+('means_of_transportation', 60, 2020, '29470baad6865758'),
+('means_of_transportation', 61, 2015, 'e79afbfaff65ce80'),
+('means_of_transportation', 61, 2020, 'b17fb5a3275b1004'),
+('means_of_transportation', 62, 2015, 'a517e872ede3c833'),
+('means_of_transportation', 62, 2020, 'f4498f87148ee3c2'),
+('means_of_transportation', 63, 2015, '6f50ec5b3d98daf8'),
+('means_of_transportation', 63, 2020, 'e828ba7ef707a10f'),
+('means_of_transportation', 64, 2015, '89dfea033c9e6295'),
+('means_of_transportation', 64, 2020, 'c4dc6a944d98449a'),
+('means_of_transportation', 65, 2015, 'aa98f0331cfc6462'),
+('means_of_transportation', 65, 2020, '8577479643c6c4d3'),
+('means_of_transportation', 66, 2015, '6816be367f977565'),
+('means_of_transportation', 66, 2020, '55107210342479e0'),
+('means_of_transportation', 67, 2015, 'a79e374e4b5f6cfd'),
+('means_of_transportation', 67, 2020, 'bb795d2d67a1fdc2'),
+('means_of_transportation', 68, 2015, 'ea3724a8127bcc68'),
+('means_of_transportation', 68, 2020, '1cb1110769e1b080'),
+('means_of_transportation', 69, 2015, 'a57b1e07cfd46759'),
+('means_of_transportation', 69, 2020, '7f845dee7cb2033b'),
+('means_of_transportation', 70, 2015, '561368d3a5b8a929'),
+('means_of_transportation', 70, 2020, '2a582676a7c3d473'),
+('means_of_transportation', 71, 2015, '5f58267472bf65a2'),
+('means_of_transportation', 71, 2020, 'ff1b0b7a298838da'),
+('means_of_transportation', 72, 2015, '3af2d99edf4c2308'),
+('means_of_transportation', 72, 2020, 'f60c546831c0a9bc'),
+('means_of_transportation', 73, 2015, '482bc36b6c633cb7'),
+('means_of_transportation', 73, 2020, '6bbc0e3b8b29161c'),
+('means_of_transportation', 74, 2015, 'fcd6dffd350db48a'),
+('means_of_transportation', 74, 2020, '63ed1b564c697a24'),
+('means_of_transportation', 75, 2015, 'ec3e1a7218527cdd'),
+('means_of_transportation', 75, 2020, 'dd375937fa5ab783'),
+('means_of_transportation', 76, 2015, '194af54dd59e371a'),
+('means_of_transportation', 76, 2020, '33152b9801e20cad'),
+('means_of_transportation', 77, 2015, 'd6f1c5f03f761ba9'),
+('means_of_transportation', 77, 2020, 'd5542e2c23f582ae'),
+('means_of_transportation', 78, 2015, 'fe1b84a6aec13246'),
+('means_of_transportation', 78, 2020, 'f34bef543c76479c'),
+('means_of_transportation', 79, 2015, 'a0fe0f9201ab8e8f'),
+('means_of_transportation', 79, 2020, '6eb9634119ef7962'),
+('means_of_transportation', 80, 2015, '9033bbd1590983dd'),
+('means_of_transportation', 80, 2020, 'dc101eefa0e3459a'),
+('means_of_transportation', 81, 2015, 'fd5613ecf978f4c4'),
+('means_of_transportation', 81, 2020, 'e20187d6103f9a4c'),
+('means_of_transportation', 82, 2015, 'e0dd96fd64c27efc'),
+('means_of_transportation', 82, 2020, '677b4259139eb9db'),
+('means_of_transportation', 83, 2015, 'c1f07b107070baaa'),
+('means_of_transportation', 83, 2020, '77a336470fc2b1f9'),
+('means_of_transportation', 84, 2015, 'fa8586b12d4bc237'),
+('means_of_transportation', 84, 2020, '4258dec8cdabf717'),
+('means_of_transportation', 85, 2015, '898d9c77cead698a'),
+('means_of_transportation', 85, 2020, '9424ee9bfb2d4b4f'),
+('means_of_transportation', 86, 2015, 'c98175cc83d4d10f'),
+('means_of_transportation', 86, 2020, 'da278b6a87ed05f3'),
+('means_of_transportation', 87, 2015, 'fa29b35c901b3a26'),
+('means_of_transportation', 87, 2020, '0250e89bbcf4b924'),
+('means_of_transportation', 88, 2015, 'd209864312ee32ad'),
+('means_of_transportation', 88, 2020, '7c574ca7ae27fd88'),
+('means_of_transportation', 89, 2015, 'b1bfc2bb3f562bc4'),
+('means_of_transportation', 89, 2020, '4fc7cd771490e39a'),
+('means_of_transportation', 90, 2015, 'd18fdc3ed47ffa2c'),
+('means_of_transportation', 90, 2020, 'f18219e68a04dd7c'),
+('means_of_transportation', 91, 2015, 'e3d6f6272056cb30'),
+('means_of_transportation', 91, 2020, '1367efebeca72df5'),
+('means_of_transportation', 92, 2015, '59f59637f05a823e'),
+('means_of_transportation', 92, 2020, '0f81f054c00ed6c9'),
+('means_of_transportation', 93, 2015, 'cac676d7cd77612e'),
+('means_of_transportation', 93, 2020, '9646ce6f46687cd6'),
+('means_of_transportation', 94, 2015, '7077ac0bcf283882'),
+('means_of_transportation', 94, 2020, 'b82931d65df9e948'),
+('means_of_transportation', 95, 2015, 'c96ebce82384c4eb'),
+('means_of_transportation', 95, 2020, 'b7d94b8146b525d8'),
+('means_of_transportation', 96, 2015, '5d429a6bcf4fa362'),
+('means_of_transportation', 96, 2020, '19a675227f8075a7'),
+('means_of_transportation', 97, 2015, '6bbcaa96206dede3'),
+('means_of_transportation', 97, 2020, 'c1acc0868b102e7d'),
+('means_of_transportation', 98, 2015, '265d3f8a09a5b24e'),
+('means_of_transportation', 98, 2020, '5707290cb9a310fd'),
+('means_of_transportation', 99, 2015, '4385b76025b922c8'),
+('means_of_transportation', 99, 2020, '8d37110a607b4b10'),
+('means_of_transportation', 100, 2015, 'f2eb37088712863a'),
+('means_of_transportation', 100, 2020, '04ebcb752ad92304'),
+('means_of_transportation', 101, 2015, 'cd67c57344f2c92f'),
+('means_of_transportation', 101, 2020, '274492ee479540e3'),
+('means_of_transportation', 102, 2015, '34707a5f06fb13fe'),
+('means_of_transportation', 102, 2020, 'f5b46930f2acbbcc'),
+('means_of_transportation', 103, 2015, '0ded1465966f30e9'),
+('means_of_transportation', 103, 2020, '6139ff0d51e1f96a'),
+('means_of_transportation', 104, 2015, '6fb9b89a5f63653a'),
+('means_of_transportation', 104, 2020, '9fb5b7459cc5daed'),
+('means_of_transportation', 105, 2015, 'f3348ab564703da6'),
+('means_of_transportation', 105, 2020, '79a6bb7014eb5612'),
+('means_of_transportation', 106, 2015, 'ddb575d143043727'),
+('means_of_transportation', 106, 2020, '333817db8c789853'),
+('means_of_transportation', 107, 2015, '5c0fb097802d653c'),
+('means_of_transportation', 107, 2020, '31676e8e02e2a43a'),
+('means_of_transportation', 108, 2015, 'f78fe14a00193656'),
+('means_of_transportation', 108, 2020, '7910927ed0d0eb96'),
+('means_of_transportation', 109, 2015, '6cfcbef59a350d42'),
+('means_of_transportation', 109, 2020, 'fdd59acfc5d19244'),
+('means_of_transportation', 110, 2015, '1a6fdd3963bd55b2'),
+('means_of_transportation', 110, 2020, '2f8eb9ceedf0d5df'),
+('means_of_transportation', 111, 2015, 'a7d77c667368a0da'),
+('means_of_transportation', 111, 2020, '91b5578134c2978c'),
+('means_of_transportation', 112, 2015, 'faed144f5e1c4278'),
+('means_of_transportation', 112, 2020, '145c9eef6ec2f804'),
+('means_of_transportation', 113, 2015, 'f6d845b63e92abff'),
+('means_of_transportation', 113, 2020, 'fa3d02f1d4318454'),
+('means_of_transportation', 114, 2015, '88b38332f4494395'),
+('means_of_transportation', 114, 2020, 'd04233bf3df45bd6'),
+('means_of_transportation', 115, 2015, '19745e71e56690e6'),
+('means_of_transportation', 115, 2020, '986664153d8458b0'),
+('means_of_transportation', 116, 2015, '894d15c633fbaae0'),
+('means_of_transportation', 116, 2020, '4ef12b53218735fe'),
+('means_of_transportation', 117, 2015, 'ac6d595ade1c83fa'),
+('means_of_transportation', 117, 2020, 'a8b336023745c16a'),
+('means_of_transportation', 118, 2015, 'c6c3541f64ef7849'),
+('means_of_transportation', 118, 2020, '2fa56408d28b316b'),
+('means_of_transportation', 119, 2015, '4b902b409a861836'),
+('means_of_transportation', 119, 2020, '89924e8842834ae8'),
+('means_of_transportation', 120, 2015, '7cd76a50f348cde0'),
+('means_of_transportation', 120, 2020, 'b9a267d2ebf5a5a1'),
+('means_of_transportation', 121, 2015, 'f02f3f5b71b98348'),
+('means_of_transportation', 121, 2020, '96e24d9dcd3095db'),
+('means_of_transportation', 122, 2015, '71a093cd86af900a'),
+('means_of_transportation', 122, 2020, '68ba1b42350fbf5a'),
+('means_of_transportation', 123, 2015, '098cc957e14b4561'),
+('means_of_transportation', 123, 2020, '02b81015fe02315a'),
+('means_of_transportation', 124, 2015, 'c6d016fdfbbe1cbf'),
+('means_of_transportation', 124, 2020, '3a0db29b28fa19db'),
+('means_of_transportation', 125, 2015, '9a287a43a0f01272'),
+('means_of_transportation', 125, 2020, '64e96b8a78e77f0e'),
+('means_of_transportation', 126, 2015, '11573547e0800447'),
+('means_of_transportation', 126, 2020, '83e7fc9a4da1dfc8'),
+('means_of_transportation', 127, 2015, '40ccc52d721a9ef5'),
+('means_of_transportation', 127, 2020, '2bcfdc22b984b580'),
+('means_of_transportation', 128, 2015, 'b3e1c76e383f29c0'),
+('means_of_transportation', 128, 2020, '2f08726597a0fa3b'),
+('means_of_transportation', 129, 2015, '92e4f3bb98741e27'),
+('means_of_transportation', 129, 2020, '6e25310e694b74c2'),
+('means_of_transportation', 130, 2015, '180617542dec91b7'),
+('means_of_transportation', 130, 2020, 'a8b4080fb658df3a'),
+('means_of_transportation', 131, 2015, '53a79e091c5edc0b'),
+('means_of_transportation', 131, 2020, 'd95b79e91707d2eb'),
+('means_of_transportation', 132, 2015, '54294c71c86e19aa'),
+('means_of_transportation', 132, 2020, '580be4ea8412a92a'),
+('means_of_transportation', 133, 2015, '49d22b7357163a45'),
+('means_of_transportation', 133, 2020, '8c776095de645602'),
+('means_of_transportation', 134, 2015, 'a25c739dba688e6c'),
+('means_of_transportation', 134, 2020, '837ce5a173c1f9cb'),
+('means_of_transportation', 135, 2015, '8a2c677207141c87'),
+('means_of_transportation', 135, 2020, '1efc502a76542d99'),
+('means_of_transportation', 136, 2015, '3ba9cb89c83b62c1'),
+('means_of_transportation', 136, 2020, 'cc6ca126d2889e30'),
+('means_of_transportation', 137, 2015, 'df0a202b4330419d'),
+('means_of_transportation', 137, 2020, 'bc7dc44febb4827a'),
+('means_of_transportation', 138, 2015, 'd0b95747696f065d'),
+('means_of_transportation', 138, 2020, '46ffae71309925a6'),
+('means_of_transportation', 139, 2015, '2453c28a4100f588'),
+('means_of_transportation', 139, 2020, '466e3f96d1b5cb7b'),
+('means_of_transportation', 140, 2015, '29577ca0ac483a02'),
+('means_of_transportation', 140, 2020, 'c43c3f3f1e6d2d99'),
+('means_of_transportation', 141, 2015, 'e3bbbeb3dbf7407f'),
+('means_of_transportation', 141, 2020, 'cd1b716e33c51d9c'),
+('means_of_transportation', 142, 2015, 'd6901ed11391c95e'),
+('means_of_transportation', 142, 2020, 'e33efef279f10410'),
+('means_of_transportation', 143, 2015, '770ed38f4c5b2354'),
+('means_of_transportation', 143, 2020, '644bb4b878cbebd1'),
+('means_of_transportation', 144, 2015, '7ed4d06a95672c08'),
+('means_of_transportation', 144, 2020, '8171a2ede1a917ad'),
+('means_of_transportation', 145, 2015, '39a419a65c44af33'),
+('means_of_transportation', 145, 2020, '907a4ce69bab7178'),
+('means_of_transportation', 146, 2015, 'ef7e823540d8334a'),
+('means_of_transportation', 146, 2020, '33671322d0f1bd87'),
+('means_of_transportation', 147, 2015, '34450f16611eff62'),
+('means_of_transportation', 147, 2020, '4e1a222c7169a5f7'),
+('means_of_transportation', 148, 2015, 'b2a181029692da91'),
+('means_of_transportation', 148, 2020, '94abbb2d359ffdfc'),
+('means_of_transportation', 149, 2015, '4cd57948e39a0d8f'),
+('means_of_transportation', 149, 2020, '0af6e06bf680a0e6'),
+('means_of_transportation', 150, 2015, 'e12941520d194aa9'),
+('means_of_transportation', 150, 2020, '69cedb7f29e84867'),
+('means_of_transportation', 151, 2015, 'a14e13e7e5a17715'),
+('means_of_transportation', 151, 2020, '8dbdc890d1cd4e05'),
+('means_of_transportation', 152, 2015, '4caedbe272c04b00'),
+('means_of_transportation', 152, 2020, 'd1f1bee41f791f17'),
+('means_of_transportation', 153, 2015, 'f08816db021de7af'),
+('means_of_transportation', 153, 2020, '1b56dfce7a9c1901'),
+('means_of_transportation', 154, 2015, 'ed1170fc623bcc83'),
+('means_of_transportation', 154, 2020, '9818d7d36d9e0844'),
+('means_of_transportation', 155, 2015, '5795bfc686e217de'),
+('means_of_transportation', 155, 2020, 'bff4aaf2ffbd6e1a'),
+('means_of_transportation', 156, 2015, '70c83049544d8155'),
+('means_of_transportation', 156, 2020, '7d5a1d0e5ff7c589'),
+('means_of_transportation', 157, 2015, '0336734ebf408dfa'),
+('means_of_transportation', 157, 2020, 'c8d9bf641f5c04df'),
+('means_of_transportation', 158, 2015, '28746d2fb9858bf8'),
+('means_of_transportation', 158, 2020, 'ece06908c1e0d016'),
+('means_of_transportation', 159, 2015, '5faac92060891a5f'),
+('means_of_transportation', 159, 2020, '4e28979bbdbfd64a'),
+('means_of_transportation', 160, 2015, '62f8bc53840ac581'),
+('means_of_transportation', 160, 2020, 'dcb0ef0aad1c804b'),
+('means_of_transportation', 161, 2015, '025629b0c4c7a2c1'),
+('means_of_transportation', 161, 2020, '0a3f7584386b5e25'),
+('means_of_transportation', 162, 2015, '5421d5e4b7b38818'),
+('means_of_transportation', 162, 2020, '3196b20f569faf29'),
+('means_of_transportation', 163, 2015, '9773a158ef307957'),
+('means_of_transportation', 163, 2020, 'eb657490508a5f40'),
+('means_of_transportation', 164, 2015, 'f61255434b753da5'),
+('means_of_transportation', 164, 2020, '6848241bd21f7bd4'),
+('means_of_transportation', 165, 2015, 'aceb0a4f3e81138a'),
+('means_of_transportation', 165, 2020, '8ee92b1f1203fc12'),
+('means_of_transportation', 166, 2015, 'bc0dde3041f9005a'),
+('means_of_transportation', 166, 2020, '8eeab2402b31ba8f'),
+('means_of_transportation', 167, 2015, '231f9b5fc738976a'),
+('means_of_transportation', 167, 2020, '1611a17dbd12ce62'),
+('means_of_transportation', 168, 2015, 'c8d33b9bf31ba5d2'),
+('means_of_transportation', 168, 2020, '0c3b0fc4ced26fe0'),
+('means_of_transportation', 169, 2015, '8f65c654a2355ebd'),
+('means_of_transportation', 169, 2020, 'f27c3baa60216e6d'),
+('means_of_transportation', 170, 2015, 'c201b2805c01ac27'),
+('means_of_transportation', 170, 2020, 'd6f6211a18af8b89'),
+('means_of_transportation', 171, 2015, 'e38e80753fb05a95'),
+('means_of_transportation', 171, 2020, 'a85db6503df21b4a'),
+('means_of_transportation', 172, 2015, '65bbf5eefe66a6e8'),
+('means_of_transportation', 172, 2020, '475250d654d1a925'),
+('means_of_transportation', 173, 2015, '8f6a236dc107c10d'),
+('means_of_transportation', 173, 2020, 'e81e7daefef69d5c'),
+('means_of_transportation', 174, 2015, 'b52f90987e1602f9'),
+('means_of_transportation', 174, 2020, '15e84398f70be489'),
+('means_of_transportation', 175, 2015, 'c7a8344d9d078097'),
+('means_of_transportation', 175, 2020, '3161a716b9865342'),
+('means_of_transportation', 176, 2015, '3f5e12872110c97a'),
+('means_of_transportation', 176, 2020, '82a1dc3f7277b6ec'),
+('means_of_transportation', 177, 2015, 'ac02ab01e7e5d98b'),
+('means_of_transportation', 177, 2020, '0575d88ace45c837'),
+('means_of_transportation', 178, 2015, 'f0ce3d1271fafdc2'),
+('means_of_transportation', 178, 2020, 'f1c7074089269094'),
+('means_of_transportation', 179, 2015, '57e31fa2d395ac4b'),
+('means_of_transportation', 179, 2020, 'ecf38a8bf42ce095'),
+('means_of_transportation', 180, 2015, '853274a537880819'),
+('means_of_transportation', 180, 2020, '8ca46640772028d0'),
+('means_of_transportation', 181, 2015, 'e7b78f9fed8d8d71'),
+('means_of_transportation', 181, 2020, 'ffb3bbce8b03e9b6'),
+('means_of_transportation', 182, 2015, 'b2da7f5e4df850ae'),
+('means_of_transportation', 182, 2020, '6482424ffb4adc99'),
+('means_of_transportation', 183, 2015, 'dbd76187c6ca10fa'),
+('means_of_transportation', 183, 2020, '6dc9f01a4be3aed7'),
+('means_of_transportation', 184, 2015, 'e9db9af4d37f72fa'),
+('means_of_transportation', 184, 2020, 'df9006169d2facec'),
+('means_of_transportation', 185, 2015, '1663d5896696044b'),
+('means_of_transportation', 185, 2020, 'e4da859aea9f7c1c'),
+('means_of_transportation', 186, 2015, '6a7863fbeabaf75e'),
+('means_of_transportation', 186, 2020, '8dcd1f3ceb1e49b6'),
+('means_of_transportation', 187, 2015, '2ef81bcf24c04bc4'),
+('means_of_transportation', 187, 2020, '7c6f3bc970140fca'),
+('means_of_transportation', 188, 2015, 'dbb7b58093167beb'),
+('means_of_transportation', 188, 2020, 'b1f8034c54720b84'),
+('means_of_transportation', 189, 2015, '2cca14bb785b5763'),
+('means_of_transportation', 189, 2020, '44bf65229eac6c2f'),
+('means_of_transportation', 190, 2015, '8adee718683eba8f'),
+('means_of_transportation', 190, 2020, '686a4383f4a5ce68'),
+('means_of_transportation', 191, 2015, '6992dad024f67dd1'),
+('means_of_transportation', 191, 2020, '8398299e97a6cd79'),
+('means_of_transportation', 192, 2015, '238ae2f3747ae337'),
+('means_of_transportation', 192, 2020, '37472c5c1a17d8fd'),
+('means_of_transportation', 193, 2015, '20d11c6ae72e4bee'),
+('means_of_transportation', 193, 2020, '7c077630a79dc358'),
+('means_of_transportation', 194, 2015, '2aae7d39c05fd455'),
+('means_of_transportation', 194, 2020, '0628d7a036ea813f'),
+('means_of_transportation', 195, 2015, 'abd960d19f3cc831'),
+('means_of_transportation', 195, 2020, 'b8ffe3a42b7f5b01'),
+('means_of_transportation', 196, 2015, 'f6536598556d0333'),
+('means_of_transportation', 196, 2020, '6a448b956a570541'),
+('means_of_transportation', 197, 2015, '2c88e22fdd2580d8'),
+('means_of_transportation', 197, 2020, '0101bc1d7c80f21d'),
+('means_of_transportation', 198, 2015, '1bb896313deb0465'),
+('means_of_transportation', 198, 2020, 'b15e99aebbbd0a4d'),
+('means_of_transportation', 199, 2015, 'be88a12fbed4b416'),
+('means_of_transportation', 199, 2020, 'acff690ccf2eb1d0'),
+('means_of_transportation', 200, 2015, 'dc0f542ebf9cd7d8'),
+('means_of_transportation', 200, 2020, 'ef174b9a2d9fd0be'),
+('means_of_transportation', 201, 2015, 'e164a4b7cd8c690c'),
+('means_of_transportation', 201, 2020, '8793bc3e92960080'),
+('means_of_transportation', 202, 2015, '9288a16b0843d5c5'),
+('means_of_transportation', 202, 2020, '12a6d79fc5ece76e'),
+('means_of_transportation', 203, 2015, 'ab833853d67253a6'),
+('means_of_transportation', 203, 2020, '1f6049288aafc923'),
+('means_of_transportation', 204, 2015, '02962aab94d12aff'),
+('means_of_transportation', 204, 2020, 'f1a63f6459aab2ec'),
+('means_of_transportation', 205, 2015, '7d0f41e771a1bd10'),
+('means_of_transportation', 205, 2020, '404ec4a677485f25'),
+('means_of_transportation', 206, 2015, '127fb70a4c07361b'),
+('means_of_transportation', 206, 2020, '446544d19af2c727'),
+('means_of_transportation', 207, 2015, '4fc1ea70d44df34a'),
+('means_of_transportation', 207, 2020, 'eab67e0b1ca9fc0d'),
+('means_of_transportation', 208, 2015, '14a30aa4ffbed890'),
+('means_of_transportation', 208, 2020, '58abf1a13aa6fad7'),
+('means_of_transportation', 209, 2015, '012eec0864b4cc1a'),
+('means_of_transportation', 209, 2020, '58b4dcd6b773e054'),
+('means_of_transportation', 210, 2015, '42b5961a5923942f'),
+('means_of_transportation', 210, 2020, '3301566ff42fb5af'),
+('means_of_transportation', 211, 2015, 'f4631ae81720204d'),
+('means_of_transportation', 211, 2020, 'fcd961cd2c4562b9'),
+('means_of_transportation', 212, 2015, 'f6c203da4e45392b'),
+('means_of_transportation', 212, 2020, '74b429c1cddafd83'),
+('means_of_transportation', 213, 2015, 'edb20a3fb730b040'),
+('means_of_transportation', 213, 2020, 'e14b466ea7c6afe2'),
+('means_of_transportation', 214, 2015, '7d242000d0ce1434'),
+('means_of_transportation', 214, 2020, '0d4974af2fed53ed'),
+('means_of_transportation', 215, 2015, 'e7068753232b0cf7'),
+('means_of_transportation', 215, 2020, '8a3ead74c1efea2a'),
+('means_of_transportation', 216, 2015, 'd11d0a4ac62f62de'),
+('means_of_transportation', 216, 2020, '2e5b5e0e8c64746c'),
+('means_of_transportation', 217, 2015, '727ffba951563415'),
+('means_of_transportation', 217, 2020, '11d533fa6884398c'),
+('means_of_transportation', 218, 2015, 'ce343257877037cf'),
+('means_of_transportation', 218, 2020, '6f1db0ced3abac1c'),
+('means_of_transportation', 219, 2015, '0d8b5b69a01db135'),
+('means_of_transportation', 219, 2020, 'fbf50c47cc72acc5'),
+('means_of_transportation', 220, 2015, '3b400d8f60f1d832'),
+('means_of_transportation', 220, 2020, 'e624ee68d402045b'),
+('means_of_transportation', 221, 2015, '532fcb850275ae6d'),
+('means_of_transportation', 221, 2020, 'f811e2864db8c5df'),
+('means_of_transportation', 222, 2015, 'ace776ab947e478c'),
+('means_of_transportation', 222, 2020, 'f162db41a212c466'),
+('means_of_transportation', 223, 2015, 'c264fc78ffa8c520'),
+('means_of_transportation', 223, 2020, '69cce62ec5a6c4c9'),
+('means_of_transportation', 224, 2015, 'aea2ce225b018fd9'),
+('means_of_transportation', 224, 2020, 'f97d33fc8e7224ae'),
+('means_of_transportation', 225, 2015, '4e76bfa6e2d6fd98'),
+('means_of_transportation', 225, 2020, '85f7f922cfb79ead'),
+('means_of_transportation', 226, 2015, '6cfc611e829ab6fa'),
+('means_of_transportation', 226, 2020, 'c9f176e4a8b47cae'),
+('means_of_transportation', 227, 2015, '547098d8e5e4f9dc'),
+('means_of_transportation', 227, 2020, 'b96c1cabb112a2ff'),
+('means_of_transportation', 228, 2015, 'bcce07cf38ef7fb7'),
+('means_of_transportation', 228, 2020, '71a66c80fd882b82'),
+('means_of_transportation', 229, 2015, '1ec567c824f44da9'),
+('means_of_transportation', 229, 2020, '7ef5a5f8de0b5eb2'),
+('means_of_transportation', 230, 2015, '4ddcc313d465cfc0'),
+('means_of_transportation', 230, 2020, '7562c98a642cd2f1'),
+('means_of_transportation', 231, 2015, '42e66dd847ea3722'),
+('means_of_transportation', 231, 2020, 'ae2a58f80908c14d'),
+('means_of_transportation', 232, 2015, '2c4bb6f02365875e'),
+('means_of_transportation', 232, 2020, '95ef90e436e176f1'),
+('means_of_transportation', 233, 2015, '14f37cf91cfb69ef'),
+('means_of_transportation', 233, 2020, '5066df270d644c27'),
+('means_of_transportation', 234, 2015, 'db6ef6170e48936a'),
+('means_of_transportation', 234, 2020, '3af942786cf84e9d'),
+('means_of_transportation', 235, 2015, '97ea5b8336daa439'),
+('means_of_transportation', 235, 2020, '67f592e799070229'),
+('means_of_transportation', 236, 2015, 'bcade1de503964a8'),
+('means_of_transportation', 236, 2020, 'cdecece2585c481a'),
+('means_of_transportation', 237, 2015, 'df85e6f91c4297eb'),
+('means_of_transportation', 237, 2020, 'd90c2cae2122c5fe'),
+('means_of_transportation', 238, 2015, '7eac0c84d7bc56ae'),
+('means_of_transportation', 238, 2020, '2c5e6dce2ebdac5c'),
+('means_of_transportation', 239, 2015, '54f8a37c0216065b'),
+('means_of_transportation', 239, 2020, '402ab1d714ac268c'),
+('means_of_transportation', 240, 2015, '3e35e29221a3bc0e'),
+('means_of_transportation', 240, 2020, 'fa7db6f40df78a2f'),
+('means_of_transportation', 241, 2015, '85d864ddaa0a12ea'),
+('means_of_transportation', 241, 2020, '2123bb0c2158eb6b'),
+('means_of_transportation', 242, 2015, '276e434906b6709d'),
+('means_of_transportation', 242, 2020, '349848762fc1f491'),
+('means_of_transportation', 243, 2015, '7969a6f8e1ee5a24'),
+('means_of_transportation', 243, 2020, '8aed079967d82a12'),
+('means_of_transportation', 244, 2015, '0797b9333c7341ef'),
+('means_of_transportation', 244, 2020, '3262cb9a4df63dc7'),
+('means_of_transportation', 245, 2015, '7544f4996dcedd8c'),
+('means_of_transportation', 245, 2020, '80c2d8dd3e5ab2cb'),
+('means_of_transportation', 246, 2015, '783a7a3a1d1d6d80'),
+('means_of_transportation', 246, 2020, '48e3bd07d2450084'),
+('means_of_transportation', 247, 2015, '1cd7f1b6963c16ca'),
+('means_of_transportation', 247, 2020, '184da6b22bc6877f'),
+('means_of_transportation', 248, 2015, '324bd6db4a41dea0'),
+('means_of_transportation', 248, 2020, '091107971750cf8c'),
+('means_of_transportation', 249, 2015, '77896b7bd2c377a4'),
+('means_of_transportation', 249, 2020, 'c9c0934ddabda62e'),
+('means_of_transportation', 250, 2015, 'f1f32caa0356aac5'),
+('means_of_transportation', 250, 2020, '38bdde8fcf41a002'),
+('means_of_transportation', 251, 2015, '314eb6613622e183'),
+('means_of_transportation', 251, 2020, '708e6b03cdff2d99'),
+('means_of_transportation', 252, 2015, 'c9a5c10ba4a7cc81'),
+('means_of_transportation', 252, 2020, 'beae758cb6ff319d'),
+('means_of_transportation', 253, 2015, '79927b9775263753'),
+('means_of_transportation', 253, 2020, '58078ef4f32dfda6'),
+('means_of_transportation', 254, 2015, '5a781b574b0ebc51'),
+('means_of_transportation', 254, 2020, 'd2459d0e8103665d'),
+('means_of_transportation', 255, 2015, '8a85d608b2718602'),
+('means_of_transportation', 255, 2020, '3b5ab58cd30df1a9'),
+('means_of_transportation', 256, 2015, '434e1e1a0787facf'),
+('means_of_transportation', 256, 2020, 'a2ef4ab3aa3b460a'),
+('means_of_transportation', 257, 2015, 'bb36715f24f933fd'),
+('means_of_transportation', 257, 2020, '165547dd30c33eeb'),
+('means_of_transportation', 258, 2015, '644b0ec7ae33686c'),
+('means_of_transportation', 258, 2020, '04c11e3bfce7c11f'),
+('means_of_transportation', 259, 2015, 'd30f590051bb3e4e'),
+('means_of_transportation', 259, 2020, 'e9966059423d2e1a'),
+('means_of_transportation', 260, 2015, '278ffa3c9f1fc5ca'),
+('means_of_transportation', 260, 2020, '5648e9ba9d5e4d65'),
+('means_of_transportation', 261, 2015, '7509ba58dad729f1'),
+('means_of_transportation', 261, 2020, 'bf8ad9b99e0b8d83'),
+('means_of_transportation', 262, 2015, 'bed8abbc4c92fc09'),
+('means_of_transportation', 262, 2020, 'd58c76b5541f0f83'),
+('means_of_transportation', 263, 2015, '0b52a165547c0eab'),
+('means_of_transportation', 263, 2020, '8567d55a8dcfa81e'),
+('means_of_transportation', 264, 2015, 'a8984ec9b9b5a075'),
+('means_of_transportation', 264, 2020, 'bef3fc7fd5f48a7c'),
+('means_of_transportation', 265, 2015, '922dc5172b405769'),
+('means_of_transportation', 265, 2020, '99650f5ef5cd6f44'),
+('means_of_transportation', 266, 2015, '44b9acb9873fdc93'),
+('means_of_transportation', 266, 2020, '70a91fd10610249e'),
+('means_of_transportation', 267, 2015, 'e566df36d66281d0'),
+('means_of_transportation', 267, 2020, '14da54599285fbea'),
+('means_of_transportation', 268, 2015, 'b204c96335cbaa2f'),
+('means_of_transportation', 268, 2020, 'acb782a26aef1630'),
+('means_of_transportation', 269, 2015, 'fce267587697f0d7'),
+('means_of_transportation', 269, 2020, '585c8ae76a5614cb'),
+('means_of_transportation', 270, 2015, '2926e3a0ebcdcb16'),
+('means_of_transportation', 270, 2020, '65e8876b423c2b96'),
+('means_of_transportation', 271, 2015, '5bdc96980faeedf4'),
+('means_of_transportation', 271, 2020, 'a8802ce2e0a7a1e5'),
+('means_of_transportation', 272, 2015, 'a834b07010e32eb0'),
+('means_of_transportation', 272, 2020, '774862e302be8611'),
+('means_of_transportation', 273, 2015, '87f6fca45cc54ecd'),
+('means_of_transportation', 273, 2020, '8ccc2abe5b94983e'),
+('means_of_transportation', 274, 2015, 'dc125d7dc1009dfa'),
+('means_of_transportation', 274, 2020, 'cadc421a8e818602'),
+('means_of_transportation', 275, 2015, 'b05952b385b00282'),
+('means_of_transportation', 275, 2020, 'b9ef02048eb6941e'),
+('means_of_transportation', 276, 2015, '8b68f8e6e7f762cb'),
+('means_of_transportation', 276, 2020, '55553b415a45df31'),
+('means_of_transportation', 277, 2015, 'b19d4bfd119b8d3e'),
+('means_of_transportation', 277, 2020, 'a57981da04e8babb'),
+('means_of_transportation', 278, 2015, '78ada34974ab2c05'),
+('means_of_transportation', 278, 2020, '746a980412937781'),
+('means_of_transportation', 279, 2015, 'ac3b100be73d52bb'),
+('means_of_transportation', 279, 2020, '94b2083ea5700de1'),
+('means_of_transportation', 280, 2015, 'e42194d2110f966e'),
+('means_of_transportation', 280, 2020, 'e65011e1b740ab94'),
+('means_of_transportation', 281, 2015, 'a4b0d41aecc71530'),
+('means_of_transportation', 281, 2020, '3f8da9a9b3b71f46'),
+('means_of_transportation', 282, 2015, '6f1dffc17b0c67d2'),
+('means_of_transportation', 282, 2020, '60e96e47892e7551'),
+('means_of_transportation', 283, 2015, '884be0273b70f34a'),
+('means_of_transportation', 283, 2020, 'e581e4f4bc593a4c'),
+('means_of_transportation', 284, 2015, '8e8afde88a7d39e0'),
+('means_of_transportation', 284, 2020, 'a87fb8e515c56ab4'),
+('means_of_transportation', 285, 2015, 'a2565dbb359c04b2'),
+('means_of_transportation', 285, 2020, '5389fa6cea25b44a'),
+('means_of_transportation', 286, 2015, '529e3ef9976e4fd4'),
+('means_of_transportation', 286, 2020, 'c3b06a87d8145a71'),
+('means_of_transportation', 287, 2015, '2c192f630213b522'),
+('means_of_transportation', 287, 2020, '5aad93ca5da5111c'),
+('means_of_transportation', 288, 2015, '8df78146aea29ee1'),
+('means_of_transportation', 288, 2020, 'ab92b7d8030608d1'),
+('means_of_transportation', 289, 2015, '101ea0ee58c2d613'),
+('means_of_transportation', 289, 2020, 'f77c66f0e664670f'),
+('means_of_transportation', 290, 2015, 'c56658d46ed0eaf9'),
+('means_of_transportation', 290, 2020, '4edae434d9299b94'),
+('means_of_transportation', 291, 2015, '6287ec314e8d41a4'),
+('means_of_transportation', 291, 2020, 'cf94f6c24be857ef'),
+('means_of_transportation', 292, 2015, 'a3ffa2208ef4b859'),
+('means_of_transportation', 292, 2020, '9eb2a2da1f657cd6'),
+('means_of_transportation', 293, 2015, '27406055c452b8ff'),
+('means_of_transportation', 293, 2020, '5adb328533b83e24'),
+('means_of_transportation', 294, 2015, '6354c9de21440c08'),
+('means_of_transportation', 294, 2020, 'c04609d1bb44e77c'),
+('means_of_transportation', 295, 2015, '3ba6c9c0148497e6'),
+('means_of_transportation', 295, 2020, 'c9cfb11ed1b1d5ec'),
+('means_of_transportation', 296, 2015, 'f4a9adbfc46fd335'),
+('means_of_transportation', 296, 2020, 'a8d60cde154208ea'),
+('means_of_transportation', 297, 2015, 'b5c8b26d34ac88ae'),
+('means_of_transportation', 297, 2020, '0133972ffaf984ad'),
+('means_of_transportation', 298, 2015, '6320d399d0bca8e4'),
+('means_of_transportation', 298, 2020, 'a2bf6faea9d98878'),
+('means_of_transportation', 299, 2015, 'd551d4b646341b91'),
+('means_of_transportation', 299, 2020, 'eb28746fbe38756f'),
+('means_of_transportation', 300, 2015, 'ddad1619e5c90c5c'),
+('means_of_transportation', 300, 2020, '98471f30da5021f8'),
+('means_of_transportation', 301, 2015, '07e6075fdd45d323'),
+('means_of_transportation', 301, 2020, 'fe29fc9ce0846cc2'),
+('means_of_transportation', 302, 2015, 'e036c60d7156cfb5'),
+('means_of_transportation', 302, 2020, '1d9dcf83c2f34752'),
+('means_of_transportation', 303, 2015, '5ca4f50c2ae508e5'),
+('means_of_transportation', 303, 2020, '95e611e7fa83014d'),
+('means_of_transportation', 304, 2015, 'e60ce4adcdab617c'),
+('means_of_transportation', 304, 2020, '2fa551d1cef7e0f0'),
+('means_of_transportation', 305, 2015, 'a15b983818f59c9f'),
+('means_of_transportation', 305, 2020, 'd4a670522c592732'),
+('means_of_transportation', 306, 2015, '4f92aa48900808d8'),
+('means_of_transportation', 306, 2020, 'b1677802b73f7306'),
+('means_of_transportation', 307, 2015, '538f25179c3ce4bd'),
+('means_of_transportation', 307, 2020, '39ee2cdb9cf07bfd'),
+('means_of_transportation', 308, 2015, '2e0180b7b170a915'),
+('means_of_transportation', 308, 2020, '573fb74cee1cdf22'),
+('means_of_transportation', 309, 2015, '39578b17eba75e5c'),
+('means_of_transportation', 309, 2020, '852edc7dc44effda'),
+('means_of_transportation', 310, 2015, '589c3c2d330eb88d'),
+('means_of_transportation', 310, 2020, '6385fc0dd4b63d88'),
+('means_of_transportation', 311, 2015, 'd2721d61cb3eb8a0'),
+('means_of_transportation', 311, 2020, '3393db406ab382bb'),
+('means_of_transportation', 312, 2015, 'b7f418f63e659fe2'),
+('means_of_transportation', 312, 2020, '7bd368ba0969bfb7'),
+('means_of_transportation', 313, 2015, '9fc25f999e74005f'),
+('means_of_transportation', 313, 2020, 'c0d4469f7c55b3fd'),
+('means_of_transportation', 314, 2015, '2e4e55bcf74eb9c9'),
+('means_of_transportation', 314, 2020, 'd555e91a17856301'),
+('means_of_transportation', 315, 2015, '6f77e73e21bb5708'),
+('means_of_transportation', 315, 2020, 'edfc706a2ff0527f'),
+('means_of_transportation', 316, 2015, '8eaec80b3507a591'),
+('means_of_transportation', 316, 2020, 'd006332988fb2fdb'),
+('means_of_transportation', 317, 2015, '1a908b66a26b1bbf'),
+('means_of_transportation', 317, 2020, 'cd4b244aed313c6e'),
+('means_of_transportation', 318, 2015, 'caf50fe9a491605a'),
+('means_of_transportation', 318, 2020, 'ee33f90fd4b07901'),
+('means_of_transportation', 319, 2015, '4818b410ab600a5f'),
+('means_of_transportation', 319, 2020, 'ca2b62d1e8d29f03'),
+('means_of_transportation', 320, 2015, 'ea817f09d28368b2'),
+('means_of_transportation', 320, 2020, 'e5f71379804bce8c'),
+('means_of_transportation', 321, 2015, 'b36bc9536be27604'),
+('means_of_transportation', 321, 2020, '76853de434820e00'),
+('means_of_transportation', 322, 2015, '731e556ec46a6f5a'),
+('means_of_transportation', 322, 2020, '52b3016fc0e985b8'),
+('means_of_transportation', 323, 2015, 'bf2d0fc7b5fa8847'),
+('means_of_transportation', 323, 2020, '7ea89180a918d6db'),
+('means_of_transportation', 324, 2015, '56809a08411f23a8'),
+('means_of_transportation', 324, 2020, '0abbaf2cd299d916'),
+('means_of_transportation', 325, 2015, '0d1bd7050bba69c8'),
+('means_of_transportation', 325, 2020, '210d1f0b1800954f'),
+('means_of_transportation', 326, 2015, 'a00b1c7f76d52986'),
+('means_of_transportation', 326, 2020, 'dc268d65db812b96'),
+('means_of_transportation', 327, 2015, '243bf3661bd2ced0'),
+('means_of_transportation', 327, 2020, 'a3f4d85153463c61'),
+('means_of_transportation', 328, 2015, '44f96d31bf296e63'),
+('means_of_transportation', 328, 2020, '60f4cf4eec1a894f'),
+('means_of_transportation', 329, 2015, '8ad55bb7ad045b1a'),
+('means_of_transportation', 329, 2020, '6eb4dddf9066a217'),
+('means_of_transportation', 330, 2015, 'de364595648e8af9'),
+('means_of_transportation', 330, 2020, '2a7ab246b6fa2903'),
+('means_of_transportation', 331, 2015, '216ac11e3be713a1'),
+('means_of_transportation', 331, 2020, '7c4d5bb800c1ae2b'),
+('means_of_transportation', 332, 2015, '248041053b519b2a'),
+('means_of_transportation', 332, 2020, '43ff489b61cd42af'),
+('means_of_transportation', 333, 2015, 'f7e6d89215c63a9e'),
+('means_of_transportation', 333, 2020, '6fd7b0cb2825d8f9'),
+('means_of_transportation', 334, 2015, 'a0b180a5aa35e95b'),
+('means_of_transportation', 334, 2020, 'd1897508800c86f7'),
+('means_of_transportation', 335, 2015, '1508791f5a5ab675'),
+('means_of_transportation', 335, 2020, 'eaf221a24aea955b'),
+('means_of_transportation', 336, 2015, 'b3588e1e39f0b2dd'),
+('means_of_transportation', 336, 2020, '914b119b5e9053f3'),
+('means_of_transportation', 337, 2015, 'b07527ad2e09934e'),
+('means_of_transportation', 337, 2020, '2e6ea32507ef302f'),
+('means_of_transportation', 338, 2015, 'cd4d6c9f754ad986'),
+('means_of_transportation', 338, 2020, '2b0b354e9b3af0dd'),
+('means_of_transportation', 339, 2015, 'eba73aa1e1a8f0a7'),
+('means_of_transportation', 339, 2020, 'adcf32a486a3f38f'),
+('means_of_transportation', 340, 2015, '40ce4096583da907'),
+('means_of_transportation', 340, 2020, '07f445efd60bd810'),
+('means_of_transportation', 341, 2015, '5cf36eeda5bfb763'),
+('means_of_transportation', 341, 2020, '2164100914e88932'),
+('means_of_transportation', 342, 2015, '4e3f353fe8402a85'),
+('means_of_transportation', 342, 2020, '36d3e8f2859b23b4'),
+('means_of_transportation', 343, 2015, 'd8669268318ab777'),
+('means_of_transportation', 343, 2020, '135a63cb07d2cb80'),
+('means_of_transportation', 344, 2015, '5e0bab18dcf8b970'),
+('means_of_transportation', 344, 2020, 'e63e0a395c7b5060'),
+('means_of_transportation', 345, 2015, '22333788c8f48760'),
+('means_of_transportation', 345, 2020, '38f21b0634a4de60'),
+('means_of_transportation', 346, 2015, '590306c603e6ac99'),
+('means_of_transportation', 346, 2020, 'a272f77d9718cb95'),
+('means_of_transportation', 347, 2015, '4a9f91b19794aafe'),
+('means_of_transportation', 347, 2020, 'e826416f2ea3caac'),
+('means_of_transportation', 348, 2015, 'b01dae03317ed96a'),
+('means_of_transportation', 348, 2020, '5c47ee463dfd6499'),
+('means_of_transportation', 349, 2015, 'b31f20e3ab3e0fb7'),
+('means_of_transportation', 349, 2020, 'ee640306942bee6a'),
+('means_of_transportation', 350, 2015, '880c7f976f53fa5e'),
+('means_of_transportation', 350, 2020, 'b15c27ba7f8ff60f'),
+('means_of_transportation', 351, 2015, '79926ed428246107'),
+('means_of_transportation', 351, 2020, '33da84331f1c58a0'),
+('means_of_transportation', 352, 2015, 'd774632844f60f0f'),
+('means_of_transportation', 352, 2020, 'aab6dcfd5aa553d0'),
+('means_of_transportation', 353, 2015, 'f40de0b7a3582e07'),
+('means_of_transportation', 353, 2020, 'e2f3be0cf369a804'),
+('means_of_transportation', 354, 2015, '4db2df1f0b9d8574'),
+('means_of_transportation', 354, 2020, 'f4b86f7a32a61026'),
+('means_of_transportation', 355, 2015, '2db82308b1efe64e'),
+('means_of_transportation', 355, 2020, '05f69e8df1c90d0f'),
+('means_of_transportation', 356, 2015, 'a506ca1e165e8683'),
+('means_of_transportation', 356, 2020, '052df805ca6add55'),
+('means_of_transportation', 357, 2015, 'fbdc437c23743429'),
+('means_of_transportation', 357, 2020, '5c4db1b12a84a6e9'),
+('means_of_transportation', 358, 2015, 'e7708599f1e7a71c'),
+('means_of_transportation', 358, 2020, '5bd8d6209a45e203'),
+('means_of_transportation', 359, 2015, '49934e5ace1cc5c2'),
+('means_of_transportation', 359, 2020, 'e2ff902ac5eec0a0'),
+('means_of_transportation', 360, 2015, '4f48a2553672c174'),
+('means_of_transportation', 360, 2020, '9b8584291ab9ff72'),
+('means_of_transportation', 361, 2015, 'b13899069ece4f1d'),
+('means_of_transportation', 361, 2020, '6be6b23d20964c87'),
+('means_of_transportation', 362, 2015, '1932ae8cadb1a78c'),
+('means_of_transportation', 362, 2020, '6de2406c18e24f74'),
+('means_of_transportation', 363, 2015, 'b89b38fb4d12bb48'),
+('means_of_transportation', 363, 2020, '772c5000d54a047e'),
+('means_of_transportation', 364, 2015, '93b5773d2079c198'),
+('means_of_transportation', 364, 2020, 'cd700f17889a1cac'),
+('means_of_transportation', 365, 2015, '25f531d00cfbb0a5'),
+('means_of_transportation', 365, 2020, 'a624f9d416280461'),
+('means_of_transportation', 366, 2015, '3334638ab4141129'),
+('means_of_transportation', 366, 2020, '3648367e108774f9'),
+('means_of_transportation', 367, 2015, '2b98dfedd4911919'),
+('means_of_transportation', 367, 2020, 'bc3b1de92175802e'),
+('means_of_transportation', 368, 2015, 'b35d4a0f69b58548'),
+('means_of_transportation', 368, 2020, '57097e2af9076c6a'),
+('means_of_transportation', 369, 2015, '34aec3f1bbebfcee'),
+('means_of_transportation', 369, 2020, '036e2d2a8c9a64a0'),
+('means_of_transportation', 370, 2015, '5ecaf8d4086e6825'),
+('means_of_transportation', 370, 2020, '4ba074d45fb587b9'),
+('means_of_transportation', 371, 2015, '33248078e24b003d'),
+('means_of_transportation', 371, 2020, '2e0bdc9f5b7833df'),
+('means_of_transportation', 372, 2015, '1d4e760ca9282bfc'),
+('means_of_transportation', 372, 2020, 'cae98493725c7d53'),
+('means_of_transportation', 373, 2015, '3789490ba1ceb3a4'),
+('means_of_transportation', 373, 2020, 'fb19fcb6cc77b4b2'),
+('means_of_transportation', 374, 2015, 'ae62e3ad9f4a747e'),
+('means_of_transportation', 374, 2020, 'ac32c18d7c15b46c'),
+('means_of_transportation', 375, 2015, '5cd03888e989f69e'),
+('means_of_transportation', 375, 2020, 'dec56afdebca6287'),
+('means_of_transportation', 376, 2015, '026a76465d0fb1fe'),
+('means_of_transportation', 376, 2020, '4ee4f80d446aa1a3'),
+('means_of_transportation', 377, 2015, '63e17d3d7bbe1ac7'),
+('means_of_transportation', 377, 2020, '289d567209af4058'),
+('means_of_transportation', 378, 2015, '8728018af8ac2272'),
+('means_of_transportation', 378, 2020, '1bbd0c28a21fe928'),
+('means_of_transportation', 379, 2015, 'b54b10f44b5e8d58'),
+('means_of_transportation', 379, 2020, 'cdfaec530f51657a'),
+('means_of_transportation', 380, 2015, 'b04a790501284905'),
+('means_of_transportation', 380, 2020, 'eb7696d6239483c3'),
+('means_of_transportation', 381, 2015, '477d43f92eb8047e'),
+('means_of_transportation', 381, 2020, 'f51cc55a3abf0187'),
+('means_of_transportation', 382, 2015, '60052a9639f654eb'),
+('means_of_transportation', 382, 2020, 'c09aac152f0776a4'),
+('means_of_transportation', 383, 2015, 'b552079b59efe28c'),
+('means_of_transportation', 383, 2020, '6a4103a716805660'),
+('means_of_transportation', 384, 2015, 'e9936faa0cddc18d'),
+('means_of_transportation', 384, 2020, 'ae163df6e6f797dd'),
+('means_of_transportation', 385, 2015, '0832d7f43b930f86'),
+('means_of_transportation', 385, 2020, '0c37568842b8961a'),
+('means_of_transportation', 386, 2015, 'f15d8e1003370841'),
+('means_of_transportation', 386, 2020, 'c8adfc097347ae70'),
+('means_of_transportation', 387, 2015, 'd85808b91ea7fab1'),
+('means_of_transportation', 387, 2020, '822a558209bdf804'),
+('means_of_transportation', 388, 2015, 'd5aa0ce5c5b9c224'),
+('means_of_transportation', 388, 2020, 'e16d883e1277c56b'),
+('means_of_transportation', 389, 2015, '971c18e074980831'),
+('means_of_transportation', 389, 2020, '79555df5c781239b'),
+('means_of_transportation', 390, 2015, 'b605bb822290c895'),
+('means_of_transportation', 390, 2020, '18d88a501acc1e45'),
+('means_of_transportation', 391, 2015, 'ce3297b6c426fa6c'),
+('means_of_transportation', 391, 2020, '9955db86efeb562f'),
+('means_of_transportation', 392, 2015, '044f67abb3caebd1'),
+('means_of_transportation', 392, 2020, '02715f42199a9dea'),
+('means_of_transportation', 393, 2015, '41a885cc2d7caa89'),
+('means_of_transportation', 393, 2020, '7b0778c6a7658146'),
+('means_of_transportation', 394, 2015, '1c1190289ba99873'),
+('means_of_transportation', 394, 2020, '2e1bd0ba4a4f1c24'),
+('means_of_transportation', 395, 2015, '29a55d8bf9fcbdf8'),
+('means_of_transportation', 395, 2020, '7cfdc7717d9f636e'),
+('means_of_transportation', 396, 2015, '13dc2ed0b025d0d6'),
+('means_of_transportation', 396, 2020, '2088641aeb5c3a4a'),
+('means_of_transportation', 397, 2015, 'f4bf17125bb7f8d8'),
+('means_of_transportation', 397, 2020, '328a489e3edae3d1'),
+('means_of_transportation', 398, 2015, 'b9ae6122b1715819'),
+('means_of_transportation', 398, 2020, 'd11f959907edcf42'),
+('means_of_transportation', 399, 2015, 'b3d3d3527ce241e9'),
+('means_of_transportation', 399, 2020, '61d1dfe2f61c961e'),
+('means_of_transportation', 400, 2015, 'b183bd31113eae94'),
+('means_of_transportation', 400, 2020, 'd3408321edfb9aa8'),
+('means_of_transportation', 401, 2015, '2dbf6d5d39e9da04'),
+('means_of_transportation', 401, 2020, '00dacaa7c662d45a'),
+('means_of_transportation', 402, 2015, 'baa004943912a02d'),
+('means_of_transportation', 402, 2020, '7106866956590698'),
+('means_of_transportation', 403, 2015, '55569007c430f2eb'),
+('means_of_transportation', 403, 2020, '018800badedd43a0'),
+('means_of_transportation', 404, 2015, '84d31e6083df71ea'),
+('means_of_transportation', 404, 2020, 'a93e6ae17afcd0ed'),
+('means_of_transportation', 405, 2015, '975f00105017e90a'),
+('means_of_transportation', 405, 2020, '07b9b9bd54918817'),
+('means_of_transportation', 406, 2015, '046c4fb03f9de708'),
+('means_of_transportation', 406, 2020, 'f1a2784baba723f2'),
+('means_of_transportation', 407, 2015, 'f2158894a33d0d04'),
+('means_of_transportation', 407, 2020, '4e4df47c2208613d'),
+('means_of_transportation', 408, 2015, '67d92d1796c51b4f'),
+('means_of_transportation', 408, 2020, '60ae1e2602854a22'),
+('means_of_transportation', 409, 2015, '26f3c2c4f5722475'),
+('means_of_transportation', 409, 2020, '739531bc298c8643'),
+('means_of_transportation', 410, 2015, 'f94319951667882f'),
+('means_of_transportation', 410, 2020, '1fc2c4db3a9fbf77'),
+('means_of_transportation', 411, 2015, 'e6b72e4a3a5275e6'),
+('means_of_transportation', 411, 2020, '71a2fc71ac41d11d'),
+('means_of_transportation', 412, 2015, 'dbca113ce393f97f'),
+('means_of_transportation', 412, 2020, '754b049a5b77a59d'),
+('means_of_transportation', 413, 2015, 'd97309ad2b4acdcf'),
+('means_of_transportation', 413, 2020, '7f267ad91ff4b8c4'),
+('means_of_transportation', 414, 2015, 'd86a3d67202ce971'),
+('means_of_transportation', 414, 2020, 'bfd9692342c22e23'),
+('means_of_transportation', 415, 2015, '74b0b5b4a5823306'),
+('means_of_transportation', 415, 2020, '3370a7d93c10af32'),
+('means_of_transportation', 416, 2015, '0602c17a8549c789'),
+('means_of_transportation', 416, 2020, '3e14b7539e15b90b'),
+('means_of_transportation', 417, 2015, '9b88b8f96bfabfaa'),
+('means_of_transportation', 417, 2020, 'ff01f42765785a8d'),
+('means_of_transportation', 418, 2015, 'c50ecc7a7291daaa'),
+('means_of_transportation', 418, 2020, '144e21ac350b749a'),
+('means_of_transportation', 419, 2015, '34bcd591b250db9c'),
+('means_of_transportation', 419, 2020, '0ef62ec17befbb4d'),
+('means_of_transportation', 420, 2015, '0e36f9b31a1e74a9'),
+('means_of_transportation', 420, 2020, '1dc9940f59f60be0'),
+('means_of_transportation', 421, 2015, '8b98a0ab2da85cc5'),
+('means_of_transportation', 421, 2020, '73e8cf54e17435a2'),
+('means_of_transportation', 422, 2015, '42aa98fe8b61b2d3'),
+('means_of_transportation', 422, 2020, '859636b500b62174'),
+('means_of_transportation', 423, 2015, 'ec3b469a5562a9e8'),
+('means_of_transportation', 423, 2020, 'a257a5b5424e281d'),
+('means_of_transportation', 424, 2015, '7827f10837148aa8'),
+('means_of_transportation', 424, 2020, 'fce3572188afcebe'),
+('means_of_transportation', 425, 2015, '296099b93cdd367b'),
+('means_of_transportation', 425, 2020, '1d4b7fada358dd7c'),
+('means_of_transportation', 426, 2015, 'a907210dc24de336'),
+('means_of_transportation', 426, 2020, 'e9fed404fd34858a'),
+('means_of_transportation', 427, 2015, 'b0edd38a0b79c95b'),
+('means_of_transportation', 427, 2020, '96c8db3b6a01aa6f'),
+('means_of_transportation', 428, 2015, '41067df6ad3fe480'),
+('means_of_transportation', 428, 2020, 'ac94317de2a1a773'),
+('means_of_transportation', 429, 2015, 'cdbbe05431b4735a'),
+('means_of_transportation', 429, 2020, '42ac49e1fbfbe395'),
+('means_of_transportation', 430, 2015, 'eaf9db424de2b1ab'),
+('means_of_transportation', 430, 2020, 'ea5df7b79ddd6c09'),
+('means_of_transportation', 431, 2015, 'f84c717bebee8468'),
+('means_of_transportation', 431, 2020, '80b6e59bf85098d8'),
+('means_of_transportation', 432, 2015, 'cbe96f12419d161e'),
+('means_of_transportation', 432, 2020, '6102296238dec241'),
+('means_of_transportation', 433, 2015, '6b47c8b6c3272bdf'),
+('means_of_transportation', 433, 2020, 'bf4fe13291cd9852'),
+('means_of_transportation', 434, 2015, '78f2a68aa447a0fb'),
+('means_of_transportation', 434, 2020, 'b8fb0cccb01a69d0'),
+('means_of_transportation', 435, 2015, '73a0f201a5db24b5'),
+('means_of_transportation', 435, 2020, '0eb8f9429496fb9d'),
+('means_of_transportation', 436, 2015, 'c5ccc927d0d25df7'),
+('means_of_transportation', 436, 2020, 'dc7f69f03ae11406'),
+('means_of_transportation', 437, 2015, 'afd0b1e6771b7994'),
+('means_of_transportation', 437, 2020, 'a60a479454011db0'),
+('means_of_transportation', 438, 2015, 'e82cbe8d4edc3902'),
+('means_of_transportation', 438, 2020, 'a126d7c88c160006'),
+('means_of_transportation', 439, 2015, 'c9510f0350b0ea47'),
+('means_of_transportation', 439, 2020, 'd5a54f6ec852417d'),
+('means_of_transportation', 440, 2015, '57d981805ab874b4'),
+('means_of_transportation', 440, 2020, 'd654609f3f42a474'),
+('means_of_transportation', 441, 2015, 'c4cedfbda7e3608d'),
+('means_of_transportation', 441, 2020, '5cd515087f6fb6dd'),
+('means_of_transportation', 442, 2015, 'b8c34333edbf84dc'),
+('means_of_transportation', 442, 2020, '852963a171cdf5e2'),
+('means_of_transportation', 443, 2015, 'd323e0713e8963e6'),
+('means_of_transportation', 443, 2020, 'da992e5cf7f4fd84'),
+('means_of_transportation', 444, 2015, 'eed91bbdd3d6ea59'),
+('means_of_transportation', 444, 2020, 'dc5658030a1367a8'),
+('means_of_transportation', 445, 2015, 'c19e69ca7e2b0cc8'),
+('means_of_transportation', 445, 2020, '6bbf9958fe641d8a'),
+('means_of_transportation', 446, 2015, '3f2e8268df0eb479'),
+('means_of_transportation', 446, 2020, '17fce494746cae2c'),
+('means_of_transportation', 447, 2015, 'e0b60397d963b87d'),
+('means_of_transportation', 447, 2020, 'a3ca5c6677b235eb'),
+('means_of_transportation', 448, 2015, 'dfc5eb0253b085b0'),
+('means_of_transportation', 448, 2020, 'ede05304c5246001'),
+('means_of_transportation', 449, 2015, 'eb6d40adec2788dc'),
+('means_of_transportation', 449, 2020, '6138b183638abf62'),
+('means_of_transportation', 450, 2015, '8404518fc9b140bb'),
+('means_of_transportation', 450, 2020, '795c2fe247e5c744'),
+('means_of_transportation', 451, 2015, '4e85d82146007bb1'),
+('means_of_transportation', 451, 2020, '7fcb70279604390d'),
+('means_of_transportation', 452, 2015, 'dd11072d9108c817'),
+('means_of_transportation', 452, 2020, 'bedde7db75e0f5c4'),
+('means_of_transportation', 453, 2015, 'cd07448ceeb7fab8'),
+('means_of_transportation', 453, 2020, '1d4d662c411065a4'),
+('means_of_transportation', 454, 2015, '033fecb07c2f3f74'),
+('means_of_transportation', 454, 2020, '37891633a69e1ee9'),
+('means_of_transportation', 455, 2015, '9613fa023a69c286'),
+('means_of_transportation', 455, 2020, '223552b804cd3a57'),
+('means_of_transportation', 456, 2015, 'aaf106db7305cee2'),
+('means_of_transportation', 456, 2020, 'dcbad3e36a4ac04e'),
+('means_of_transportation', 457, 2015, '3e566d153254d4f8'),
+('means_of_transportation', 457, 2020, '95247dc9f7633acc'),
+('means_of_transportation', 458, 2015, '641741ea7820a757'),
+('means_of_transportation', 458, 2020, 'aba65032893ac048'),
+('means_of_transportation', 459, 2015, '64e3e9384dd4a3f9'),
+('means_of_transportation', 459, 2020, '9ad084d5e9dfe59f'),
+('means_of_transportation', 460, 2015, '4aa0568631881ab0'),
+('means_of_transportation', 460, 2020, '8eaad01891df7959'),
+('means_of_transportation', 461, 2015, '18b9181fa8a6efab'),
+('means_of_transportation', 461, 2020, '6628bb51a39c8113'),
+('means_of_transportation', 462, 2015, '2b7c863a55943dfb'),
+('means_of_transportation', 462, 2020, '0f424edca768914e'),
+('means_of_transportation', 463, 2015, '712a51e09f3eaf52'),
+('means_of_transportation', 463, 2020, '5d640da84729abdb'),
+('means_of_transportation', 464, 2015, '9fa9b9401a408f01'),
+('means_of_transportation', 464, 2020, '36798deaae22e2aa'),
+('means_of_transportation', 465, 2015, '9d80cdbd3a96a689'),
+('means_of_transportation', 465, 2020, '7d82e635f4f773bb'),
+('means_of_transportation', 466, 2015, '8af0e76b2f84be1a'),
+('means_of_transportation', 466, 2020, 'c1d3aed743ca8aa0'),
+('means_of_transportation', 467, 2015, 'df756f5de2e24028'),
+('means_of_transportation', 467, 2020, 'e73f193aae36c44c'),
+('means_of_transportation', 468, 2015, '506266a8ccb6738f'),
+('means_of_transportation', 468, 2020, 'd43cdb72cfef2a72'),
+('means_of_transportation', 469, 2015, 'cbe27c9abef920f0'),
+('means_of_transportation', 469, 2020, '59b8fb87cf8f16cb'),
+('means_of_transportation', 470, 2015, '7468ea8df6299462'),
+('means_of_transportation', 470, 2020, '944ebf631050bbb6'),
+('means_of_transportation', 471, 2015, '74c64c108bc18f15'),
+('means_of_transportation', 471, 2020, 'e68a260ae94c64ec'),
+('means_of_transportation', 472, 2015, 'bcab72df16b5e396'),
+('means_of_transportation', 472, 2020, 'dae2699bc3e5acff'),
+('means_of_transportation', 473, 2015, '254db37e0a6d328e'),
+('means_of_transportation', 473, 2020, 'd881a2cd3142afe7'),
+('means_of_transportation', 474, 2015, 'dc017b1e8256a7eb'),
+('means_of_transportation', 474, 2020, '680a030f7af05f8d'),
+('means_of_transportation', 475, 2015, 'dc1c625926b47090'),
+('means_of_transportation', 475, 2020, 'c39519f334dcab33'),
+('means_of_transportation', 476, 2015, 'fc4f9791ee104e83'),
+('means_of_transportation', 476, 2020, '271e3c2f6beb4da4'),
+('means_of_transportation', 477, 2015, '357988e407dee0bf'),
+('means_of_transportation', 477, 2020, '539f9c45f3dff2a4'),
+('means_of_transportation', 478, 2015, 'f9b290a88411d919'),
+('means_of_transportation', 478, 2020, '7a5c4e143acda905'),
+('means_of_transportation', 479, 2015, '3a4d8fb792987477'),
+('means_of_transportation', 479, 2020, '0cff8015837eb798'),
+('means_of_transportation', 480, 2015, '3cce4e6ec850ff04'),
+('means_of_transportation', 480, 2020, '7521035ec9452e8f'),
+('means_of_transportation', 481, 2015, 'd3ac5ab8109f744d'),
+('means_of_transportation', 481, 2020, 'aba9640d7428675a'),
+('means_of_transportation', 482, 2015, '0e0071b346c527a3'),
+('means_of_transportation', 482, 2020, '1627f07efdfd5b46'),
+('means_of_transportation', 483, 2015, 'e49a7d73c435f0ea'),
+('means_of_transportation', 483, 2020, '195f8d3c12e573bc'),
+('means_of_transportation', 484, 2015, 'c191a32228354648'),
+('means_of_transportation', 484, 2020, 'c43d75e947d44b7c'),
+('means_of_transportation', 485, 2015, '388fa012108f838b'),
+('means_of_transportation', 485, 2020, '02ea02ec5a21c159'),
+('means_of_transportation', 486, 2015, '4eb92b0339fec9d3'),
+('means_of_transportation', 486, 2020, '1c1472eddc486db3'),
+('means_of_transportation', 487, 2015, '868d969a856ecf94'),
+('means_of_transportation', 487, 2020, 'd26a56bdda23c35a'),
+('means_of_transportation', 488, 2015, '20c60edace445e7d'),
+('means_of_transportation', 488, 2020, '69cc0cfa17d60ab8'),
+('means_of_transportation', 489, 2015, '49a6ed5bc2bf04b1'),
+('means_of_transportation', 489, 2020, '8df923ff67c88fbf'),
+('means_of_transportation', 490, 2015, 'ee650c9035bf99cb'),
+('means_of_transportation', 490, 2020, '2e52303fe4e16997'),
+('means_of_transportation', 491, 2015, '8d30409794f3e4a6'),
+('means_of_transportation', 491, 2020, 'b565e97c0d28a971'),
+('means_of_transportation', 492, 2015, 'c7d3c23465057ddd'),
+('means_of_transportation', 492, 2020, '9a22d07c5a71041c'),
+('means_of_transportation', 493, 2015, '85cea097a8438cec'),
+('means_of_transportation', 493, 2020, 'aed2f67760e887b3'),
+('means_of_transportation', 494, 2015, '62c3ba0ab7a810ba'),
+('means_of_transportation', 494, 2020, 'add4d7045f69eb2e'),
+('means_of_transportation', 495, 2015, 'e0836e2a118b4634'),
+('means_of_transportation', 495, 2020, '1decd4200565f521'),
+('means_of_transportation', 496, 2015, '269b176a85981240'),
+('means_of_transportation', 496, 2020, '84733f666d367761'),
+('means_of_transportation', 497, 2015, '6d4075afd15b2832'),
+('means_of_transportation', 497, 2020, '71ebda6ce99be47d'),
+('means_of_transportation', 498, 2015, 'f5ce946d2cce6284'),
+('means_of_transportation', 498, 2020, '79c9394867a903d0'),
+('means_of_transportation', 499, 2015, '09741cce40cd9158'),
+('means_of_transportation', 499, 2020, '86f7d59f3557b74d'),
+('means_of_transportation', 500, 2015, 'ff8bbeafdefc98ec'),
+('means_of_transportation', 500, 2020, '35536a7c9d095ba6'),
+('means_of_transportation', 501, 2015, 'a4383361a7af0175'),
+('means_of_transportation', 501, 2020, 'f6edd78c44fc07ec'),
+('means_of_transportation', 502, 2015, '6d50fd649bd54701'),
+('means_of_transportation', 502, 2020, '288533860e8226a1'),
+('means_of_transportation', 503, 2015, '372d911c4cbb781d'),
+('means_of_transportation', 503, 2020, '19495b8d9ef99f86'),
+('means_of_transportation', 504, 2015, '2ff17248d4cf5122'),
+('means_of_transportation', 504, 2020, '1770d969b58a11b7'),
+('means_of_transportation', 505, 2015, 'ffbcaa967677d40e'),
+('means_of_transportation', 505, 2020, '778e56426ccdb9e5'),
+('means_of_transportation', 506, 2015, 'dcecf6ff12086af2'),
+('means_of_transportation', 506, 2020, 'b2a1297972154a26'),
+('means_of_transportation', 507, 2015, 'cdcf0044becd2b76'),
+('means_of_transportation', 507, 2020, '0bf4cde33a1b8305'),
+('means_of_transportation', 508, 2015, '94ea94ee435fbbde'),
+('means_of_transportation', 508, 2020, 'c3b4b56f77c75f4a'),
+('means_of_transportation', 509, 2015, '9356a5b89667a5d2'),
+('means_of_transportation', 509, 2020, '7788f8863041bd0e'),
+('means_of_transportation', 510, 2015, 'bbe878269b7d22fb'),
+('means_of_transportation', 510, 2020, '4ee0d9245b33676f'),
+('means_of_transportation', 511, 2015, '4c176b722e1ebb3f'),
+('means_of_transportation', 511, 2020, '8010f35559111333'),
+('means_of_transportation', 512, 2015, 'feb30163078a6d20'),
+('means_of_transportation', 512, 2020, '84d6f9151231c5b6'),
+('means_of_transportation', 513, 2015, 'd6dc9aefadb0ea48'),
+('means_of_transportation', 513, 2020, '1ad67aec0f477258'),
+('means_of_transportation', 514, 2015, '2d8066d9261cd847'),
+('means_of_transportation', 514, 2020, 'd9eb0efe878d1ff6'),
+('means_of_transportation', 515, 2015, 'e8fff4148c4118db'),
+('means_of_transportation', 515, 2020, 'a5e8d02a8f642460'),
+('means_of_transportation', 516, 2015, 'fc83c5f870a21834'),
+('means_of_transportation', 516, 2020, '93034fed3d34cf98'),
+('means_of_transportation', 517, 2015, '841a506d191a229e'),
+('means_of_transportation', 517, 2020, 'f27c0b78b0a8b3dc'),
+('means_of_transportation', 518, 2015, 'da3cbcc16422b26f'),
+('means_of_transportation', 518, 2020, '869e86939a36e920'),
+('means_of_transportation', 519, 2015, '3320d7f65276a5a9'),
+('means_of_transportation', 519, 2020, '1f3238c432471ac0'),
+('means_of_transportation', 520, 2015, '82a2ef35b65e906e'),
+('means_of_transportation', 520, 2020, '027ba50bb515a4db'),
+('means_of_transportation', 521, 2015, '68f2e19ab70f0cab'),
+('means_of_transportation', 521, 2020, 'e22ed9f409dbfb0f'),
+('means_of_transportation', 522, 2015, '6b0c713e74471721'),
+('means_of_transportation', 522, 2020, '8862d94971fa8ada'),
+('means_of_transportation', 523, 2015, 'c99f3f3f7433ff2f'),
+('means_of_transportation', 523, 2020, 'f03b3b8886b59a68'),
+('means_of_transportation', 524, 2015, '51c3576a08f4601a'),
+('means_of_transportation', 524, 2020, '445bf62b98b345de'),
+('means_of_transportation', 525, 2015, 'c7ef3adde7e163ec'),
+('means_of_transportation', 525, 2020, '81f45f722dabfd0a'),
+('means_of_transportation', 526, 2015, '7dfc3420c6791ff7'),
+('means_of_transportation', 526, 2020, '18243c290a2738f4'),
+('means_of_transportation', 527, 2015, '23b36eacf759957b'),
+('means_of_transportation', 527, 2020, '90affb7cbae679d9'),
+('means_of_transportation', 528, 2015, '5b51d3782c883579'),
+('means_of_transportation', 528, 2020, '3f49445decfadb15'),
+('means_of_transportation', 529, 2015, '356123c9743137d7'),
+('means_of_transportation', 529, 2020, '869bf8a05358c5d2'),
+('means_of_transportation', 530, 2015, '498deb7b708b050e'),
+('means_of_transportation', 530, 2020, '833106b7da35fe5c'),
+('means_of_transportation', 531, 2015, '979eeb6ac71fedb9'),
+('means_of_transportation', 531, 2020, '13bf472866583fe7'),
+('means_of_transportation', 532, 2015, '741a028dbeb88a78'),
+('means_of_transportation', 532, 2020, 'b5aa2f9f24739a82'),
+('means_of_transportation', 533, 2015, '3c7c5a2a38d62a32'),
+('means_of_transportation', 533, 2020, '5693bf4f280cfeaf'),
+('means_of_transportation', 534, 2015, '29eaf2fb7e9b6c83'),
+('means_of_transportation', 534, 2020, '3153b4bf3ec7f845'),
+('means_of_transportation', 535, 2015, '4be805881a30c147'),
+('means_of_transportation', 535, 2020, '2f06c5bcd980dcf6'),
+('means_of_transportation', 536, 2015, 'b2c09555c6af489c'),
+('means_of_transportation', 536, 2020, '5eca5021259eeb79'),
+('means_of_transportation', 537, 2015, 'b7f102853f22cb12'),
+('means_of_transportation', 537, 2020, 'f94444545b4f9bbc'),
+('means_of_transportation', 538, 2015, 'e22f5ffe5f84a82b'),
+('means_of_transportation', 538, 2020, '9c9f8b55960e6801'),
+('means_of_transportation', 539, 2015, '2672e69baa1ea26b'),
+('means_of_transportation', 539, 2020, '0998135d2c52a091'),
+('means_of_transportation', 540, 2015, '5b3b1cda5a1f28b3'),
+('means_of_transportation', 540, 2020, 'd515ce8e56e75907'),
+('means_of_transportation', 541, 2015, 'b94a367281d26adb'),
+('means_of_transportation', 541, 2020, '77d0856bba373848'),
+('means_of_transportation', 542, 2015, '4e99abf8aca657f1'),
+('means_of_transportation', 542, 2020, '2190a4ee000f5347'),
+('means_of_transportation', 543, 2015, 'c73f771bdade1397'),
+('means_of_transportation', 543, 2020, '7ef215b7bb88d6fa'),
+('means_of_transportation', 544, 2015, 'd0713d4bb99b2907'),
+('means_of_transportation', 544, 2020, '3139176f1838724c'),
+('means_of_transportation', 545, 2015, '74d99033f016053b'),
+('means_of_transportation', 545, 2020, 'bac457fe1f442d57'),
+('means_of_transportation', 546, 2015, 'd493d6f67c267634'),
+('means_of_transportation', 546, 2020, '5c26acc7fb78452f'),
+('means_of_transportation', 547, 2015, 'f3a56d9bb4d83ef5'),
+('means_of_transportation', 547, 2020, 'fa0ba72b2314b4f6'),
+('means_of_transportation', 548, 2015, '93b0f64cafb9159c'),
+('means_of_transportation', 548, 2020, '371216a7bade5bd9'),
+('means_of_transportation', 549, 2015, '2ff9e239e72cd8f1'),
+('means_of_transportation', 549, 2020, '3c0d0d22561cd2ab'),
+('means_of_transportation', 550, 2015, '1b4af7d695284164'),
+('means_of_transportation', 550, 2020, '04f240eaf0f698ac'),
+('means_of_transportation', 551, 2015, '8b3c160da357c898'),
+('means_of_transportation', 551, 2020, 'ad25b6ef3cd97edb'),
+('means_of_transportation', 552, 2015, 'af05f56a7003ffcb'),
+('means_of_transportation', 552, 2020, '38f149d3c098999d'),
+('means_of_transportation', 553, 2015, 'ecd00dd75d573e1d'),
+('means_of_transportation', 553, 2020, '5e375a204d5d95de'),
+('means_of_transportation', 554, 2015, 'b7e7709e5368d834'),
+('means_of_transportation', 554, 2020, 'cac9d4330e9c42b6'),
+('means_of_transportation', 555, 2015, '5cc08e3950f1eb49'),
+('means_of_transportation', 555, 2020, 'f9a59dc85381a9f0'),
+('means_of_transportation', 556, 2015, 'a9d95ba9f22b68e0'),
+('means_of_transportation', 556, 2020, 'fda9a321f4cb68a5'),
+('means_of_transportation', 557, 2015, '441150d43efc7292'),
+('means_of_transportation', 557, 2020, 'd0c5d503bfc25d2f'),
+('means_of_transportation', 558, 2015, 'c0544cb6ee57919d'),
+('means_of_transportation', 558, 2020, '8951efa07662d97f'),
+('means_of_transportation', 559, 2015, '7a16ad958d5ee365'),
+('means_of_transportation', 559, 2020, 'c4b27330f9e5aad8'),
+('means_of_transportation', 560, 2015, '102bb165cb5116c5'),
+('means_of_transportation', 560, 2020, '331c84487b1054d7'),
+('means_of_transportation', 561, 2015, 'dfc3a2387f91e1e9'),
+('means_of_transportation', 561, 2020, '90379ff4fd99f845'),
+('means_of_transportation', 562, 2015, '933ee6ec50e3f92a'),
+('means_of_transportation', 562, 2020, '2f1883b218e3f0dc'),
+('means_of_transportation', 563, 2015, 'a931e0980c56a2d6'),
+('means_of_transportation', 563, 2020, 'c012d0f3c5462582'),
+('means_of_transportation', 564, 2015, '2d49c30351bbbce7'),
+('means_of_transportation', 564, 2020, '8f478deb6e6dfe27'),
+('on_road_vehicle', 0, 2017, '17f46887c242fa99'),
+('on_road_vehicle', 0, 2019, '627e20962f966942'),
+('on_road_vehicle', 1, 2015, '5dccf5bae0c1cee4'),
+('on_road_vehicle', 1, 2020, 'f8e2948d0181e602'),
+('on_road_vehicle', 2, 2017, '5d4517fcea6b1adb'),
+('on_road_vehicle', 2, 2019, 'e121b4ee875e5fd7'),
+('on_road_vehicle', 3, 2017, '50996b3c60f2c6bd'),
+('on_road_vehicle', 3, 2019, 'afc558e4baaca4ce'),
+('on_road_vehicle', 4, 2017, '7a48d0ae04582666'),
+('on_road_vehicle', 4, 2019, 'd782e5460e148a81'),
+('on_road_vehicle', 5, 2017, 'ea7937c4a9b5e5c5'),
+('on_road_vehicle', 5, 2019, '48e70aff781c523b'),
+('on_road_vehicle', 6, 2017, 'cf7ffa2a1fac38de'),
+('on_road_vehicle', 6, 2019, '9046435281aa559d'),
+('on_road_vehicle', 7, 2015, 'ed2a986168bc4c93'),
+('on_road_vehicle', 7, 2020, '46df4e05c7d6efbb'),
+('on_road_vehicle', 8, 2017, 'c556f6e4a1241c35'),
+('on_road_vehicle', 8, 2019, 'f2a5a0693e7a377e'),
+('on_road_vehicle', 9, 2017, 'ab58e8362063ddd6'),
+('on_road_vehicle', 9, 2019, 'fea9caaec7a345ec'),
+('on_road_vehicle', 10, 2017, '85e4396d8b3a4dc6'),
+('on_road_vehicle', 10, 2019, '4d58d684516eb0c2'),
+('on_road_vehicle', 11, 2017, 'e29bf63d683fed01'),
+('on_road_vehicle', 11, 2019, 'bfb5e921bd339868'),
+('on_road_vehicle', 12, 2017, 'be0090eff500aad7'),
+('on_road_vehicle', 12, 2019, '527c3353e02ed35c'),
+('on_road_vehicle', 13, 2015, '389f650c00bcf35f'),
+('on_road_vehicle', 13, 2020, '5d4814b9b8c5b35e'),
+('on_road_vehicle', 14, 2017, 'd18bc3ecd6d5b757'),
+('on_road_vehicle', 14, 2019, 'b9c39d91b0277bad'),
+('on_road_vehicle', 15, 2015, 'fd7ff673676cc416'),
+('on_road_vehicle', 15, 2019, 'c26ca768ad786b5d'),
+('on_road_vehicle', 16, 2015, 'ed41beda68981681'),
+('on_road_vehicle', 16, 2019, '72c2ba9fd72b1d5a'),
+('on_road_vehicle', 17, 2015, '02222d3957276b00'),
+('on_road_vehicle', 17, 2020, 'a9dc248d33c27bd2'),
+('on_road_vehicle', 18, 2017, '34daa94c2451b769'),
+('on_road_vehicle', 18, 2019, '359639549608e202'),
+('on_road_vehicle', 19, 2017, 'ab497951a0328727'),
+('on_road_vehicle', 19, 2019, '39c318c0543bf4cb'),
+('on_road_vehicle', 20, 2017, 'cfb4ba12b97e4547'),
+('on_road_vehicle', 20, 2019, 'c1e8ea69a0833c5b'),
+('on_road_vehicle', 21, 2015, 'ed62e0905690e2be'),
+('on_road_vehicle', 21, 2019, '741b310bff75d2d9'),
+('on_road_vehicle', 22, 2015, 'f4d92c49d6b3912d'),
+('on_road_vehicle', 22, 2019, '117c5ed2742988ca'),
+('on_road_vehicle', 23, 2017, '252047092714df8a'),
+('on_road_vehicle', 23, 2019, 'dde300332eb26363'),
+('on_road_vehicle', 24, 2017, 'b5a7e86aae76af73'),
+('on_road_vehicle', 24, 2019, 'e0910d039a2c362e'),
+('on_road_vehicle', 25, 2017, 'c71ab8a084aaac04'),
+('on_road_vehicle', 25, 2019, '865749d81e36e7dd'),
+('on_road_vehicle', 26, 2017, '7acf6d8f0f9c0444'),
+('on_road_vehicle', 26, 2019, '2a748b3280bab3eb'),
+('on_road_vehicle', 27, 2017, 'f8819220b5b0d55d'),
+('on_road_vehicle', 27, 2019, 'd7aabb68a84f32b6'),
+('on_road_vehicle', 28, 2017, 'fcc6215b19636c71'),
+('on_road_vehicle', 28, 2019, 'b917beacc9e200bb'),
+('on_road_vehicle', 29, 2015, 'd23134147a212232'),
+('on_road_vehicle', 29, 2019, 'a18d33f3ee784963'),
+('on_road_vehicle', 30, 2017, '840ec1aa49639867'),
+('on_road_vehicle', 30, 2019, '595a07f6b76a7812'),
+('on_road_vehicle', 31, 2017, '27facfbce243107c'),
+('on_road_vehicle', 31, 2019, 'fb7cc956c3d33a67'),
+('on_road_vehicle', 32, 2017, '9184aac2ccf34cad'),
+('on_road_vehicle', 32, 2019, 'a5ce39417c6fe734'),
+('on_road_vehicle', 33, 2017, 'f08af53d2e00b894'),
+('on_road_vehicle', 33, 2019, '3a2a366867fdff4b'),
+('on_road_vehicle', 34, 2017, '6113005f86cdd850'),
+('on_road_vehicle', 34, 2019, '4efc891f8e9bec1e'),
+('on_road_vehicle', 35, 2015, 'c22373662898cfb3'),
+('on_road_vehicle', 35, 2019, '69f66c08d781315c'),
+('on_road_vehicle', 36, 2015, '870ab65936be080f'),
+('on_road_vehicle', 36, 2019, 'bc649e636bdcde22'),
+('on_road_vehicle', 37, 2017, '33018af6a758345a'),
+('on_road_vehicle', 37, 2019, '46c0f485813fb04b'),
+('on_road_vehicle', 38, 2017, 'aa02edf7858f21d5'),
+('on_road_vehicle', 38, 2019, '90bdfff43a14eb34'),
+('on_road_vehicle', 39, 2017, '38f535a5ef701331'),
+('on_road_vehicle', 39, 2019, '7a3b8f646bb13ea1'),
+('on_road_vehicle', 40, 2015, '8b56de0b487c7584'),
+('on_road_vehicle', 40, 2019, '86f0be4c870db01c'),
+('on_road_vehicle', 41, 2017, 'c525d04b9ab6e13b'),
+('on_road_vehicle', 41, 2019, '657cf2d57bd35e75'),
+('on_road_vehicle', 42, 2017, '6fcfcf73de4e6855'),
+('on_road_vehicle', 42, 2019, '69744124faea113e'),
+('on_road_vehicle', 43, 2017, '9c24666d3d81e51a'),
+('on_road_vehicle', 43, 2019, '5aa980d0e78e1247'),
+('on_road_vehicle', 44, 2017, '9cd20bb2882cd804'),
+('on_road_vehicle', 44, 2019, '20efc3603ccdcd31'),
+('on_road_vehicle', 45, 2017, '4b05ff07f8638834'),
+('on_road_vehicle', 45, 2019, 'dc83fdc954611e89'),
+('on_road_vehicle', 46, 2017, '4f1a9f626c1dd8af'),
+('on_road_vehicle', 46, 2019, 'bfa4940707519f1e'),
+('on_road_vehicle', 47, 2017, '282fc662e351ec9f'),
+('on_road_vehicle', 47, 2019, 'bebd43f961ac35ce'),
+('on_road_vehicle', 48, 2015, 'b29c3cf6e76982da'),
+('on_road_vehicle', 48, 2019, '758369e1488f1b96'),
+('on_road_vehicle', 49, 2015, 'e1961d57958b656d'),
+('on_road_vehicle', 49, 2019, '851a05929be8a354'),
+('on_road_vehicle', 50, 2017, '8a45a5f3f96fed06'),
+('on_road_vehicle', 50, 2019, 'f2afed60220f0153'),
+('on_road_vehicle', 51, 2017, '615102d1c0923222'),
+('on_road_vehicle', 51, 2019, '79b1969f761fd2e7'),
+('on_road_vehicle', 52, 2017, '35a8572867738484'),
+('on_road_vehicle', 52, 2019, '504e4c3fa8072ffe'),
+('on_road_vehicle', 53, 2017, 'efd9cc492385caa8'),
+('on_road_vehicle', 53, 2019, '0e6acb7ada271149'),
+('on_road_vehicle', 54, 2017, '30835175c6b90237'),
+('on_road_vehicle', 54, 2019, '9f678bcf6642f737'),
+('on_road_vehicle', 55, 2015, 'd880d1228208abcd'),
+('on_road_vehicle', 55, 2020, '7ba1f9bccd29597f'),
+('on_road_vehicle', 56, 2017, '5305a8ce780e63af'),
+('on_road_vehicle', 56, 2019, '01030777994770aa'),
+('on_road_vehicle', 57, 2017, 'bf64b15484eda4cc'),
+('on_road_vehicle', 57, 2019, '9b1c38b86e5ffca1'),
+('on_road_vehicle', 58, 2015, 'ae6d2a5ace0b50ae'),
+('on_road_vehicle', 58, 2020, '69bc01619e748869'),
+('on_road_vehicle', 59, 2015, 'ff31ab391d9eab73'),
+('on_road_vehicle', 59, 2019, '20f133011ced16de'),
+('on_road_vehicle', 60, 2015, 'c55dedcec054b50a'),
+('on_road_vehicle', 60, 2020, '4b36786672e54711'),
+('on_road_vehicle', 61, 2015, 'e4cbc6118ea5ae86'),
+('on_road_vehicle', 61, 2020, '2aac26d3d2adb069'),
+('on_road_vehicle', 62, 2015, '770d4cd8b5a52110'),
+('on_road_vehicle', 62, 2019, 'ccf99667276317b7'),
+('on_road_vehicle', 63, 2015, '2e510015a511a627'),
+('on_road_vehicle', 63, 2019, 'bed1b0666d3bec6c'),
+('on_road_vehicle', 64, 2017, '0a25ed41e4149b5e'),
+('on_road_vehicle', 64, 2019, '43c5001695b738a0'),
+('on_road_vehicle', 65, 2017, '16a3d89761d9f865'),
+('on_road_vehicle', 65, 2019, 'bcf71e05cb09a372'),
+('on_road_vehicle', 66, 2017, '16b954fe8f670528'),
+('on_road_vehicle', 66, 2019, 'c8a3d1510ca17733'),
+('on_road_vehicle', 67, 2017, 'ed289c7b9656f789'),
+('on_road_vehicle', 67, 2019, '6ab30a25705cfdf0'),
+('on_road_vehicle', 68, 2015, '91a8001e3ce0c733'),
+('on_road_vehicle', 68, 2019, 'd417880e07631dae'),
+('on_road_vehicle', 69, 2015, '54ce9c4f9b9616a2'),
+('on_road_vehicle', 69, 2020, '82eebdb50c8f15fd'),
+('on_road_vehicle', 70, 2015, 'de48256e99bae05b'),
+('on_road_vehicle', 70, 2020, '800c65e59e64fe4c'),
+('on_road_vehicle', 71, 2017, '42a095a70ecd2dff'),
+('on_road_vehicle', 71, 2019, '01bb2f4ef51d880f'),
+('on_road_vehicle', 72, 2015, '1abc0d504a51f3e9'),
+('on_road_vehicle', 72, 2020, '82b86b3db1c15ff0'),
+('on_road_vehicle', 73, 2017, '3f672b45d9c5894d'),
+('on_road_vehicle', 73, 2019, '6602f44af22fcd55'),
+('on_road_vehicle', 74, 2017, 'db8cb6e26691592d'),
+('on_road_vehicle', 74, 2019, '819240e9049d2a38'),
+('on_road_vehicle', 75, 2017, '81a14856f8ba43e7'),
+('on_road_vehicle', 75, 2019, '466eb7a9f0a16e3d'),
+('on_road_vehicle', 76, 2017, '2c5aff8622aea67b'),
+('on_road_vehicle', 76, 2019, 'c3bb37fd29588eff'),
+('on_road_vehicle', 77, 2015, '625ee4bff1d47e93'),
+('on_road_vehicle', 77, 2019, '2b065c2166de11f4'),
+('on_road_vehicle', 78, 2015, '8f504983c65c6d67'),
+('on_road_vehicle', 78, 2019, '1beda9f010fd7e68'),
+('on_road_vehicle', 79, 2017, '966b96048bbb1594'),
+('on_road_vehicle', 79, 2019, 'e8b82d9205a74f99'),
+('on_road_vehicle', 80, 2017, '0f0754b0b02a6b7a'),
+('on_road_vehicle', 80, 2019, '1ac5c55fe3813195'),
+('on_road_vehicle', 81, 2015, 'eb698f999aa06c93'),
+('on_road_vehicle', 81, 2019, 'fdb012090d81a053'),
+('on_road_vehicle', 82, 2015, 'daba5d90c182d190'),
+('on_road_vehicle', 82, 2019, 'f55402204aab0ec1'),
+('on_road_vehicle', 83, 2017, 'f3bd025952c8a963'),
+('on_road_vehicle', 83, 2019, 'f34e8ed7f54b30e1'),
+('on_road_vehicle', 84, 2017, 'a913f027a286236b'),
+('on_road_vehicle', 84, 2019, 'd8902b31aa2c35d7'),
+('on_road_vehicle', 85, 2015, 'e9c59468e1f116c0'),
+('on_road_vehicle', 85, 2019, 'acc44395f0d7879f'),
+('on_road_vehicle', 86, 2015, 'a750576095da5de4'),
+('on_road_vehicle', 86, 2019, 'e9788bd6206ddd46'),
+('on_road_vehicle', 87, 2017, '4ae754eadf7930d7'),
+('on_road_vehicle', 87, 2019, 'b98649a1c2cf89bb'),
+('on_road_vehicle', 88, 2017, '3cc994b5bcab63d3'),
+('on_road_vehicle', 88, 2019, 'c318a2ef81e331c5'),
+('on_road_vehicle', 89, 2017, 'b43c6b1b67c3695c'),
+('on_road_vehicle', 89, 2019, '7d422d0d29f66be3'),
+('on_road_vehicle', 90, 2017, '2c190d6200a923e4'),
+('on_road_vehicle', 90, 2019, 'c5dcad4e7afbf908'),
+('on_road_vehicle', 91, 2017, '29f8cc71e7602566'),
+('on_road_vehicle', 91, 2019, '235cbace63102fb3'),
+('on_road_vehicle', 92, 2015, 'a18068504c44e38a'),
+('on_road_vehicle', 92, 2019, 'df4f4388b586af9e'),
+('on_road_vehicle', 93, 2017, 'f5923af728831885'),
+('on_road_vehicle', 93, 2019, '9bee8815752b3501'),
+('on_road_vehicle', 94, 2015, 'a02557ab439e0695'),
+('on_road_vehicle', 94, 2020, '7944264d0c224cfb'),
+('on_road_vehicle', 95, 2015, '170e323e993f796c'),
+('on_road_vehicle', 95, 2020, '32286cdaf972eced'),
+('on_road_vehicle', 96, 2017, '2c4544de93e6c136'),
+('on_road_vehicle', 96, 2019, '8b8991989898ca8c'),
+('on_road_vehicle', 97, 2017, '51783d0a47d0eb47'),
+('on_road_vehicle', 97, 2019, '8f25be00bcf8cd79'),
+('on_road_vehicle', 98, 2017, 'ebed4e9df74d55ea'),
+('on_road_vehicle', 98, 2019, '703695e1c280a824'),
+('on_road_vehicle', 99, 2017, '07bc82bd79c02c06'),
+('on_road_vehicle', 99, 2019, '111190cdf3e58b7f'),
+('on_road_vehicle', 100, 2015, '098ed9dcc28926aa'),
+('on_road_vehicle', 100, 2020, 'ab18121c1151d144'),
+('on_road_vehicle', 101, 2015, '667750ce6e25f95d'),
+('on_road_vehicle', 101, 2019, 'c53d0db48b2facce'),
+('on_road_vehicle', 102, 2017, 'de272399e3719f00'),
+('on_road_vehicle', 102, 2019, '3f475bbb9c1e3fc5'),
+('on_road_vehicle', 103, 2015, 'db3863967619a158'),
+('on_road_vehicle', 103, 2019, '694bb360c9d0786f'),
+('on_road_vehicle', 104, 2017, 'e89b1d65862d43b2'),
+('on_road_vehicle', 104, 2019, 'ac8e33b2592bf934'),
+('on_road_vehicle', 105, 2015, '1a4b34d6558dc27b'),
+('on_road_vehicle', 105, 2020, '67e16c1515f26d35'),
+('on_road_vehicle', 106, 2017, '199e67e46291cef8'),
+('on_road_vehicle', 106, 2019, '9e58e4b0c3e240b4'),
+('on_road_vehicle', 107, 2015, '4c00b6613bfe23bf'),
+('on_road_vehicle', 107, 2019, 'd38a6be51b5bfff7'),
+('on_road_vehicle', 108, 2017, '64b2471f319f3acc'),
+('on_road_vehicle', 108, 2019, '6ea2b3a45158b31b'),
+('on_road_vehicle', 109, 2015, '2aae82182f139334'),
+('on_road_vehicle', 109, 2020, 'b08d85259b0e476b'),
+('on_road_vehicle', 110, 2017, '68422039799e2225'),
+('on_road_vehicle', 110, 2019, '77d3800e2cb9c0bc'),
+('on_road_vehicle', 111, 2017, 'fbd2a6eac4539fc9'),
+('on_road_vehicle', 111, 2019, '4a33433417974546'),
+('on_road_vehicle', 112, 2017, '0d09540c0b1c372d'),
+('on_road_vehicle', 112, 2019, '54723a7f596ed796'),
+('on_road_vehicle', 113, 2017, 'deadac4bb1af6c50'),
+('on_road_vehicle', 113, 2019, 'bc023ba4d9403e3b'),
+('on_road_vehicle', 114, 2017, '0a7ac6df8b6b1109'),
+('on_road_vehicle', 114, 2019, 'fb0dcbed56dd6e97'),
+('on_road_vehicle', 115, 2015, '16e767707625b42b'),
+('on_road_vehicle', 115, 2019, '1b93387a46b49ae2'),
+('on_road_vehicle', 116, 2017, 'fb696d2e706aae9c'),
+('on_road_vehicle', 116, 2019, '6bce87390eeca153'),
+('on_road_vehicle', 117, 2017, 'a4457f46e8117f7e'),
+('on_road_vehicle', 117, 2019, '6b076bdecc2637bc'),
+('on_road_vehicle', 118, 2017, '9d8ebafd0e680536'),
+('on_road_vehicle', 118, 2019, '544761e78b482079'),
+('on_road_vehicle', 119, 2017, '511afc7592ad60cc'),
+('on_road_vehicle', 119, 2019, '5202c91bfae83545'),
+('on_road_vehicle', 120, 2015, 'c7d817b6b4b8be4e'),
+('on_road_vehicle', 120, 2019, '6d20c822b71f6960'),
+('on_road_vehicle', 121, 2015, '2d3bcd56d8c6594b'),
+('on_road_vehicle', 121, 2019, 'e3d835bbd07d5dd2'),
+('on_road_vehicle', 122, 2017, '52a4de8a6caef21e'),
+('on_road_vehicle', 122, 2019, '92689da20c335eef'),
+('on_road_vehicle', 123, 2017, 'e41f966053759d63'),
+('on_road_vehicle', 123, 2019, 'de9cb973e14c3299'),
+('on_road_vehicle', 124, 2015, 'd55a1921aeb950d9'),
+('on_road_vehicle', 124, 2019, '3098faef655f50b9'),
+('on_road_vehicle', 125, 2017, '2f3394779ba2c20b'),
+('on_road_vehicle', 125, 2019, '9bffec9d4aac2abe'),
+('on_road_vehicle', 126, 2015, 'ace3755ff9a6b440'),
+('on_road_vehicle', 126, 2020, '1da1cc5082018a97'),
+('on_road_vehicle', 127, 2015, '61a6740d5a54e07e'),
+('on_road_vehicle', 127, 2020, '3f51bc32ec9aaba3'),
+('on_road_vehicle', 128, 2017, '33381d3ef2a72be8'),
+('on_road_vehicle', 128, 2019, '043b50f87336de31'),
+('on_road_vehicle', 129, 2015, '5c47e9624624006f'),
+('on_road_vehicle', 129, 2019, '762f7860c6cdcf22'),
+('on_road_vehicle', 130, 2015, '5fe78bf66ac8467c'),
+('on_road_vehicle', 130, 2020, 'f13a4f8ea71bca07'),
+('on_road_vehicle', 131, 2017, 'fb22cf334222b02d'),
+('on_road_vehicle', 131, 2019, 'ba8c925d44b53722'),
+('on_road_vehicle', 132, 2015, '9b839523c2c46c1d'),
+('on_road_vehicle', 132, 2020, '8ae78c669b471cec'),
+('on_road_vehicle', 133, 2017, '4a294b9b17143c14'),
+('on_road_vehicle', 133, 2019, '62f99ef086749c13'),
+('on_road_vehicle', 134, 2017, 'd0143eeb257b6153'),
+('on_road_vehicle', 134, 2019, 'af8a5826eec6c9f9'),
+('on_road_vehicle', 135, 2017, 'fb54938489544d1f'),
+('on_road_vehicle', 135, 2019, '56b81b04f6529f9f'),
+('on_road_vehicle', 136, 2017, 'e2c9c2280bcf45f8'),
+('on_road_vehicle', 136, 2019, '8459bc512a359e8d'),
+('on_road_vehicle', 137, 2017, '0bf7196c72d56442'),
+('on_road_vehicle', 137, 2019, 'c0b367a3d68f45a1'),
+('on_road_vehicle', 138, 2015, 'ef4917521b0f45c6'),
+('on_road_vehicle', 138, 2020, 'd2e8a54acc596498'),
+('on_road_vehicle', 139, 2015, '6cac78b8764f6403'),
+('on_road_vehicle', 139, 2019, 'c807405fb4d7588c'),
+('on_road_vehicle', 140, 2015, '10ad5833446106f9'),
+('on_road_vehicle', 140, 2019, '040a523b859f46a1'),
+('on_road_vehicle', 141, 2017, '797723b9c9536d36'),
+('on_road_vehicle', 141, 2019, '738669f8ba5423e9'),
+('on_road_vehicle', 142, 2017, '2366b387dfff19b0'),
+('on_road_vehicle', 142, 2019, 'a724ce7bc32ef22b'),
+('on_road_vehicle', 143, 2015, '1a6568aae7c49f36'),
+('on_road_vehicle', 143, 2020, '6cc578c3523ee178'),
+('on_road_vehicle', 144, 2017, 'ba34e834577e022d'),
+('on_road_vehicle', 144, 2019, 'fd9c174b344bf506'),
+('on_road_vehicle', 145, 2017, 'b72b752071e3bdc1'),
+('on_road_vehicle', 145, 2019, '0cc0ca78ffda37c0'),
+('on_road_vehicle', 146, 2017, '95105bc0a80125c0'),
+('on_road_vehicle', 146, 2019, '00a989e4494a30ec'),
+('on_road_vehicle', 147, 2017, '84069a859387e874'),
+('on_road_vehicle', 147, 2019, '6181e2501e3e2537'),
+('on_road_vehicle', 148, 2017, '54b52ab225c87de9'),
+('on_road_vehicle', 148, 2019, '5aa540fc17684134'),
+('on_road_vehicle', 149, 2015, '68d3c18d51f8abad'),
+('on_road_vehicle', 149, 2019, 'ddffc331c124ab9a'),
+('on_road_vehicle', 150, 2017, 'ab5c5bd47a2f2104'),
+('on_road_vehicle', 150, 2019, '6d2ef27812d42782'),
+('on_road_vehicle', 151, 2015, '7b639af5293ee159'),
+('on_road_vehicle', 151, 2019, '65a3ff257aaaac81'),
+('on_road_vehicle', 152, 2017, '0514d9c0e581f3c1'),
+('on_road_vehicle', 152, 2019, '3a6e1bf465f492a0'),
+('on_road_vehicle', 153, 2015, 'fff9643613c04cd3'),
+('on_road_vehicle', 153, 2020, 'ef8c4708b92010a6'),
+('on_road_vehicle', 154, 2017, '1a117b4188e84922'),
+('on_road_vehicle', 154, 2019, 'b53a78340742fab7'),
+('on_road_vehicle', 155, 2017, '74bc0ce0b46538b9'),
+('on_road_vehicle', 155, 2019, '8a4bdc82cdd6cdc5'),
+('on_road_vehicle', 156, 2017, '37ce01a5856f9524'),
+('on_road_vehicle', 156, 2019, '0c1df3e5cbb58314'),
+('on_road_vehicle', 157, 2017, 'd051bb0ddc3c0f9c'),
+('on_road_vehicle', 157, 2019, '182589d4c39a4828'),
+('on_road_vehicle', 158, 2015, '12c2d3770db78f16'),
+('on_road_vehicle', 158, 2019, '259a41608f9de1ba'),
+('on_road_vehicle', 159, 2017, 'c9be8e862a52a056'),
+('on_road_vehicle', 159, 2019, 'bfab6fa9ea194661'),
+('on_road_vehicle', 160, 2017, '0c75e19c58fe6816'),
+('on_road_vehicle', 160, 2019, 'ccaa0f15ce7acda3'),
+('on_road_vehicle', 161, 2017, 'dfe39f19971be7e0'),
+('on_road_vehicle', 161, 2019, 'c94ea77f4b4ec366'),
+('on_road_vehicle', 162, 2017, '7d2053200fff31b3'),
+('on_road_vehicle', 162, 2019, '185f34af2d759b5b'),
+('on_road_vehicle', 163, 2017, 'eab4164569202010'),
+('on_road_vehicle', 163, 2019, '122417be4d609833'),
+('on_road_vehicle', 164, 2017, 'c5b02a54c468c6be'),
+('on_road_vehicle', 164, 2019, '045789be5172b4b1'),
+('on_road_vehicle', 165, 2017, '6f0189c8e34a1c60'),
+('on_road_vehicle', 165, 2019, 'f9fef53e863b6c45'),
+('on_road_vehicle', 166, 2017, '0aaf94ffc17f00dc'),
+('on_road_vehicle', 166, 2019, '2edce489b763cf49'),
+('on_road_vehicle', 167, 2015, '63167754d7bdc6d1'),
+('on_road_vehicle', 167, 2020, '51a15f85f2f5fa82'),
+('on_road_vehicle', 168, 2017, 'c9f378c1e26695a5'),
+('on_road_vehicle', 168, 2019, '369b073af4d3c2df'),
+('on_road_vehicle', 169, 2017, '195df15540bf2a02'),
+('on_road_vehicle', 169, 2019, '6ed6577fc8232787'),
+('on_road_vehicle', 170, 2015, '8bb7e89674837c43'),
+('on_road_vehicle', 170, 2019, 'fed8716421366797'),
+('on_road_vehicle', 171, 2015, 'aeda13479600017d'),
+('on_road_vehicle', 171, 2019, 'd55d2adb4347f72c'),
+('on_road_vehicle', 172, 2017, '6e5f8de8d35367d8'),
+('on_road_vehicle', 172, 2019, '1a67c3e5aac5cd7c'),
+('on_road_vehicle', 173, 2017, '0ff00d53a1cd29d7'),
+('on_road_vehicle', 173, 2019, '8cd05af48491c3a8'),
+('on_road_vehicle', 174, 2017, '48553f40ca4c648c'),
+('on_road_vehicle', 174, 2019, '053d3ee871ecd9ee'),
+('on_road_vehicle', 175, 2015, '002e8fe7aa37c242'),
+('on_road_vehicle', 175, 2019, '7593e7f4029cccf5'),
+('on_road_vehicle', 176, 2015, '56a79e442c5ef99f'),
+('on_road_vehicle', 176, 2019, 'd932324afbfc5350'),
+('on_road_vehicle', 565, 2017, '723c44542f1352aa'),
+('on_road_vehicle', 565, 2019, 'fa2d946bb7b8dcb0'),
+('on_road_vehicle', 566, 2017, '3016a5dbbb0803c9'),
+('on_road_vehicle', 566, 2019, '2fb5c0a20ccc1e75'),
+('on_road_vehicle', 179, 2015, '848a26d3faedb4b5'),
+('on_road_vehicle', 179, 2020, '4794b1c2cbce13e6'),
+('on_road_vehicle', 180, 2015, '04ca42407457db8b'),
+('on_road_vehicle', 180, 2019, '8a1163912c206900'),
+('on_road_vehicle', 181, 2017, 'c73400bf16da7ce2'),
+('on_road_vehicle', 181, 2019, '1f3941004b4e5c44'),
+('on_road_vehicle', 182, 2017, '0c47f0c87d0f92e3'),
+('on_road_vehicle', 182, 2019, 'd22c7f37ed54eb43'),
+('on_road_vehicle', 183, 2017, '9b40dd5138e4c598'),
+('on_road_vehicle', 183, 2019, '4228e6c79a9f7da3'),
+('on_road_vehicle', 184, 2017, 'b41bdad1d55b512b'),
+('on_road_vehicle', 184, 2019, '6ce330448755c90d'),
+('on_road_vehicle', 185, 2015, '746c8a8f359bcfcc'),
+('on_road_vehicle', 185, 2019, '0eba9b1a0426a639'),
+('on_road_vehicle', 186, 2015, '08ec2eb4becfe86c'),
+('on_road_vehicle', 186, 2019, '4c33222d8094e6b7'),
+('on_road_vehicle', 187, 2015, '40090c7e2cb1fba7'),
+('on_road_vehicle', 187, 2019, '6f7996da9c2f18cd'),
+('on_road_vehicle', 188, 2015, '80a918b531e4772e'),
+('on_road_vehicle', 188, 2019, 'ca1b4629f3b82bd0'),
+('on_road_vehicle', 189, 2017, '31f7fcc74137fc14'),
+('on_road_vehicle', 189, 2019, '1556be093be94c01'),
+('on_road_vehicle', 190, 2017, '793dd1ccdc76aea4'),
+('on_road_vehicle', 190, 2019, '0cbf4ce9d21e503f'),
+('on_road_vehicle', 191, 2015, 'baec6bb8840a525d'),
+('on_road_vehicle', 191, 2020, '9cd434e71ea40492'),
+('on_road_vehicle', 192, 2015, 'b57d32a55716a991'),
+('on_road_vehicle', 192, 2019, '27273b3b592e9796'),
+('on_road_vehicle', 193, 2015, '2620d1b92006f087'),
+('on_road_vehicle', 193, 2020, 'e16170dd865a4a74'),
+('on_road_vehicle', 194, 2017, '83dff523e3b59412'),
+('on_road_vehicle', 194, 2019, '138b987809abd165'),
+('on_road_vehicle', 195, 2017, '29f2a71adc936a7f'),
+('on_road_vehicle', 195, 2019, 'e9de8d23c7d1fd86'),
+('on_road_vehicle', 196, 2017, '9dc57305541fcbcc'),
+('on_road_vehicle', 196, 2019, 'fa107b9dcbafa778'),
+('on_road_vehicle', 197, 2017, 'fda54c8973712add'),
+('on_road_vehicle', 197, 2019, '72a2c821a3abd83e'),
+('on_road_vehicle', 198, 2017, 'd1a4c7e500947f01'),
+('on_road_vehicle', 198, 2019, 'b7a8bece0d3f4565'),
+('on_road_vehicle', 199, 2017, 'e8905a55208ddd2c'),
+('on_road_vehicle', 199, 2019, 'baed01166fea61e2'),
+('on_road_vehicle', 200, 2017, '9b98b11c17bcd70a'),
+('on_road_vehicle', 200, 2019, '478325e426353a74'),
+('on_road_vehicle', 201, 2017, 'ae2277aaddd1b851'),
+('on_road_vehicle', 201, 2019, '35f86d2070d9e510'),
+('on_road_vehicle', 202, 2017, 'fad92d2daf1ccd21'),
+('on_road_vehicle', 202, 2019, '877fe3678bc797a8'),
+('on_road_vehicle', 203, 2015, 'eb528dda25f0891c'),
+('on_road_vehicle', 203, 2019, '008aec4cb534212c'),
+('on_road_vehicle', 204, 2017, 'a20f0f5f8809c3d2'),
+('on_road_vehicle', 204, 2019, '6de85bdb1803e04b'),
+('on_road_vehicle', 205, 2017, '9942f3ae6eadecfc'),
+('on_road_vehicle', 205, 2019, '05ccb7971687c494'),
+('on_road_vehicle', 206, 2017, 'b9e6549500d46577'),
+('on_road_vehicle', 206, 2019, '33333bc889431395'),
+('on_road_vehicle', 207, 2017, 'c67a91440b31605a'),
+('on_road_vehicle', 207, 2019, '42aec7c61c6d9b5d'),
+('on_road_vehicle', 208, 2017, '10b3fe6bda1c40fe'),
+('on_road_vehicle', 208, 2019, '95880302ea8264f6'),
+('on_road_vehicle', 209, 2017, '6739a084abfee4a9'),
+('on_road_vehicle', 209, 2019, 'e268345f63a9df14'),
+('on_road_vehicle', 210, 2017, 'b851be37e935c922'),
+('on_road_vehicle', 210, 2019, '3a9b76f0c2da9839'),
+('on_road_vehicle', 211, 2017, '38e0efab840e2f59'),
+('on_road_vehicle', 211, 2019, '4136455004d5c624'),
+('on_road_vehicle', 212, 2017, 'f49a1654c2688e19'),
+('on_road_vehicle', 212, 2019, '12936094f3ffa57a'),
+('on_road_vehicle', 213, 2015, '309cb9eb1e122b12'),
+('on_road_vehicle', 213, 2019, '5719c86311d0b9a9'),
+('on_road_vehicle', 214, 2017, 'c2669288cce78dcc'),
+('on_road_vehicle', 214, 2019, '1e3ac8e2965ded04'),
+('on_road_vehicle', 215, 2017, 'bf545175a1f16fb4'),
+('on_road_vehicle', 215, 2019, '9fc6fc14b7664324'),
+('on_road_vehicle', 216, 2017, 'fbc26a5a6d8dea2f'),
+('on_road_vehicle', 216, 2019, '15bc04a53f6b0405'),
+('on_road_vehicle', 217, 2015, '39806f4cfa9f5e24'),
+('on_road_vehicle', 217, 2019, 'f436c28a8caad843'),
+('on_road_vehicle', 218, 2017, 'd7385a6d00cb0e99'),
+('on_road_vehicle', 218, 2019, '64bcd504eec3ba49'),
+('on_road_vehicle', 219, 2017, '55c1e5897c5d79a6'),
+('on_road_vehicle', 219, 2019, '959349b3cf5e07ac'),
+('on_road_vehicle', 220, 2017, '9eaaa59be04f59ad'),
+('on_road_vehicle', 220, 2019, '0e4d9c2e40d05c69'),
+('on_road_vehicle', 221, 2017, '24106c034ba2e2fb'),
+('on_road_vehicle', 221, 2019, '5d5b371b5e9668ba'),
+('on_road_vehicle', 222, 2017, '0301dda7c54f8d96'),
+('on_road_vehicle', 222, 2019, '5c5085065c7509a4'),
+('on_road_vehicle', 223, 2017, '7c6bccf6b7b6dc8a'),
+('on_road_vehicle', 223, 2019, '6a44e5a4b6457caa'),
+('on_road_vehicle', 224, 2015, '16cc9af34594349c'),
+('on_road_vehicle', 224, 2019, 'b1088a205527848b'),
+('on_road_vehicle', 225, 2015, '2db006fd0bfa990a'),
+('on_road_vehicle', 225, 2020, '0e8f09735aa1f649'),
+('on_road_vehicle', 226, 2015, 'f13c59da0c33c0bd'),
+('on_road_vehicle', 226, 2019, '48f93f779009b571'),
+('on_road_vehicle', 227, 2017, '2bfa1694d7dcd68b'),
+('on_road_vehicle', 227, 2019, '2abaf7e4e6dae672'),
+('on_road_vehicle', 228, 2017, '6292cd91f7e9a864'),
+('on_road_vehicle', 228, 2019, '4c2ce11353fb1e79'),
+('on_road_vehicle', 229, 2017, '4c6b14105c92c3f2'),
+('on_road_vehicle', 229, 2019, 'bc5cb50cfb46a307'),
+('on_road_vehicle', 230, 2017, '364e1e6c8126a749'),
+('on_road_vehicle', 230, 2019, '93ac8ccf7d4c2d62'),
+('on_road_vehicle', 231, 2017, 'f3cb4665f599e7e7'),
+('on_road_vehicle', 231, 2019, 'ed7e5f672c2cf74c'),
+('on_road_vehicle', 232, 2017, '0544f675f325922f'),
+('on_road_vehicle', 232, 2019, 'd4c65f144c04f7ae'),
+('on_road_vehicle', 233, 2017, '6e7eebf5c6318452'),
+('on_road_vehicle', 233, 2019, 'e3c9775e4ba3fb2a'),
+('on_road_vehicle', 234, 2017, '2fb9c3027759d7e5'),
+('on_road_vehicle', 234, 2019, 'd037c49d0148848b'),
+('on_road_vehicle', 235, 2017, '107609cf63204816'),
+('on_road_vehicle', 235, 2019, 'f254f4fd71c45f18'),
+('on_road_vehicle', 236, 2017, 'dfb9a02071201cc1'),
+('on_road_vehicle', 236, 2019, '416f485d6474b59a'),
+('on_road_vehicle', 237, 2017, 'e078a8e01690ac1d'),
+('on_road_vehicle', 237, 2019, 'a1904bd1dc16ab43'),
+('on_road_vehicle', 238, 2017, '49a747c71cebff36'),
+('on_road_vehicle', 238, 2019, 'c7788183f668add4'),
+('on_road_vehicle', 239, 2017, '276fcd5a08f78cf5'),
+('on_road_vehicle', 239, 2019, '1ba1b63af0607f65'),
+('on_road_vehicle', 240, 2017, 'a862ac03b42902c5'),
+('on_road_vehicle', 240, 2019, '2e5a74f7fbe9daf7'),
+('on_road_vehicle', 241, 2017, '81c278b657ae317d'),
+('on_road_vehicle', 241, 2019, 'bcdd7da434ad52f2'),
+('on_road_vehicle', 242, 2017, 'b9b1839d818549d8'),
+('on_road_vehicle', 242, 2019, '6f65c56c28ed75e8'),
+('on_road_vehicle', 243, 2017, 'b60cda8df9c7bf07'),
+('on_road_vehicle', 243, 2019, 'e39b28f3562a437b'),
+('on_road_vehicle', 244, 2017, '26b0601dac7f8720'),
+('on_road_vehicle', 244, 2019, 'aafc6d9fdf14e124'),
+('on_road_vehicle', 245, 2017, '8fff339006f54856'),
+('on_road_vehicle', 245, 2019, '86775a79416fe771'),
+('on_road_vehicle', 246, 2017, '9f6b1fa166aa7c56'),
+('on_road_vehicle', 246, 2019, '9efc62fa0dd82e38'),
+('on_road_vehicle', 247, 2017, 'a2ebafd5d44a61a7'),
+('on_road_vehicle', 247, 2019, '79719ac374864f92'),
+('on_road_vehicle', 248, 2017, '17383b8be16e368f'),
+('on_road_vehicle', 248, 2019, '9aa98d0f856a3b76'),
+('on_road_vehicle', 249, 2015, 'b973f2fbc3f97a46'),
+('on_road_vehicle', 249, 2019, '03305ac2109ac46c'),
+('on_road_vehicle', 250, 2017, '0fc953acf5eff3d1'),
+('on_road_vehicle', 250, 2019, '09981fc0dbc63191'),
+('on_road_vehicle', 251, 2015, '4cfb26834c5e3389'),
+('on_road_vehicle', 251, 2019, '2c14817a18f98ba8'),
+('on_road_vehicle', 252, 2015, 'eda1a74401916726'),
+('on_road_vehicle', 252, 2020, '5d0daa9af6fb6729'),
+('on_road_vehicle', 253, 2015, 'cac4dc5670312076'),
+('on_road_vehicle', 253, 2019, '05f1c9e8578e4244'),
+('on_road_vehicle', 254, 2017, 'ffd724be0ff23562'),
+('on_road_vehicle', 254, 2019, '031ca1446ff2fcf5'),
+('on_road_vehicle', 255, 2017, 'd67a492051b3e496'),
+('on_road_vehicle', 255, 2019, '4a4ee2740ccb17bd'),
+('on_road_vehicle', 256, 2017, '8377eb880962d35b'),
+('on_road_vehicle', 256, 2019, '32f2e6f31dc8875b'),
+('on_road_vehicle', 257, 2017, '43572195217e0e9e'),
+('on_road_vehicle', 257, 2019, 'd3e52a1f9b00104c'),
+('on_road_vehicle', 258, 2017, '78099a71ed4e06db'),
+('on_road_vehicle', 258, 2019, 'df055da059e29514'),
+('on_road_vehicle', 259, 2017, 'ce5a40a118016f44'),
+('on_road_vehicle', 259, 2019, 'fc138febfb55541b'),
+('on_road_vehicle', 260, 2015, '31c33b0aef931175'),
+('on_road_vehicle', 260, 2019, 'd403e1c703b0dedb'),
+('on_road_vehicle', 261, 2015, '9af57362643ea7c7'),
+('on_road_vehicle', 261, 2020, 'fba79fcaa8c0aa6e'),
+('on_road_vehicle', 262, 2017, '84b34014618dcdd9'),
+('on_road_vehicle', 262, 2019, '18979cbeea23c6e9'),
+('on_road_vehicle', 263, 2017, '9cf8d1fe6bae739c'),
+('on_road_vehicle', 263, 2019, '8a0b303ec3834813'),
+('on_road_vehicle', 264, 2017, '1c340b9227124bde'),
+('on_road_vehicle', 264, 2019, '0d504de0b5b8e6fc'),
+('on_road_vehicle', 265, 2017, '5052b595dd6af4a7'),
+('on_road_vehicle', 265, 2019, 'd8478e39f2620322'),
+('on_road_vehicle', 266, 2017, 'c31ab3eb79a26051'),
+('on_road_vehicle', 266, 2019, 'b4b21c3aa679ab52'),
+('on_road_vehicle', 267, 2017, '9e5c8a01937b1dc0'),
+('on_road_vehicle', 267, 2019, '4967451f14b2a83b'),
+('on_road_vehicle', 268, 2017, 'ed47c66cc445d1d5'),
+('on_road_vehicle', 268, 2019, '2efc4f2f7588de71'),
+('on_road_vehicle', 269, 2015, '9d489dc8a9f0a083'),
+('on_road_vehicle', 269, 2019, '4a39effba902fe28'),
+('on_road_vehicle', 270, 2017, '57eeb722ac9f3894'),
+('on_road_vehicle', 270, 2019, 'fdc4e29f7f8ad079'),
+('on_road_vehicle', 271, 2017, '56ff83782cfae7fe'),
+('on_road_vehicle', 271, 2019, '2b477c797d2acae0'),
+('on_road_vehicle', 272, 2017, '52fef460b21d35a3'),
+('on_road_vehicle', 272, 2019, 'e153a8f4388217d3'),
+('on_road_vehicle', 273, 2015, '3b354bed82383b09'),
+('on_road_vehicle', 273, 2020, '28a33e8280205965'),
+('on_road_vehicle', 274, 2017, 'c3883dc53391a0ee'),
+('on_road_vehicle', 274, 2019, '8564bf2607cb551e'),
+('on_road_vehicle', 275, 2015, 'f02c67865ade8a97'),
+('on_road_vehicle', 275, 2020, 'f57e7aadb5355709'),
+('on_road_vehicle', 276, 2015, 'f5f0784fba325816'),
+('on_road_vehicle', 276, 2020, 'a12373e31c79f8aa'),
+('on_road_vehicle', 277, 2015, '4ac17e156e9675b9'),
+('on_road_vehicle', 277, 2019, 'f3f7bbfa381c0d60'),
+('on_road_vehicle', 278, 2017, '53f87364374907fe'),
+('on_road_vehicle', 278, 2019, 'bdac9dac153b226e'),
+('on_road_vehicle', 279, 2017, 'b171cd7e9a7ab188'),
+('on_road_vehicle', 279, 2019, '0298b42b16a29e46'),
+('on_road_vehicle', 280, 2015, '89dd604d7283e23f'),
+('on_road_vehicle', 280, 2019, '648556c112ae655f'),
+('on_road_vehicle', 281, 2017, '0a71ebccc837fd88'),
+('on_road_vehicle', 281, 2019, '2fe52b89639f973d'),
+('on_road_vehicle', 282, 2017, 'e00bae778a3eb3cc'),
+('on_road_vehicle', 282, 2019, 'e0319b8059a8c998'),
+('on_road_vehicle', 283, 2017, 'b7ba20cca534dbf3'),
+('on_road_vehicle', 283, 2019, '06837b599259598f'),
+('on_road_vehicle', 284, 2017, '6e95695db2202ad7'),
+('on_road_vehicle', 284, 2019, 'bc0eea563a70b62a'),
+('on_road_vehicle', 285, 2015, '4f712891a57b6b72'),
+('on_road_vehicle', 285, 2020, '36b263f6e21eb2c0'),
+('on_road_vehicle', 286, 2015, 'c46bef8aa73c42cc'),
+('on_road_vehicle', 286, 2019, '1d16ee67183abc65'),
+('on_road_vehicle', 287, 2017, 'f04a5a3e0eb76022'),
+('on_road_vehicle', 287, 2019, '92af625a0e42c5bc'),
+('on_road_vehicle', 288, 2017, '4aef559b2aa8a58d'),
+('on_road_vehicle', 288, 2019, '01d48eb37a8ff9e0'),
+('on_road_vehicle', 289, 2015, 'a8e05ddc54cbbb6b'),
+('on_road_vehicle', 289, 2019, '690ccaac283a0229'),
+('on_road_vehicle', 290, 2017, '9f50992bafa195a5'),
+('on_road_vehicle', 290, 2019, 'eb6dca7b30b6ddd3'),
+('on_road_vehicle', 291, 2015, '453f57981784220c'),
+('on_road_vehicle', 291, 2019, '8acab3fdf9b93fd7'),
+('on_road_vehicle', 292, 2017, '96e3aca46f53f69d'),
+('on_road_vehicle', 292, 2019, 'b7ef8c2a12675efe'),
+('on_road_vehicle', 293, 2015, 'cfb63e089926c88a'),
+('on_road_vehicle', 293, 2020, 'd0df6f1f7ef6dfbb'),
+('on_road_vehicle', 294, 2017, 'e6d9ff1d83ee7e03'),
+('on_road_vehicle', 294, 2019, '63c6ad42661db06e'),
+('on_road_vehicle', 295, 2017, '8b51fc41fdd33a20'),
+('on_road_vehicle', 295, 2019, '5ae9c7ea314cde73'),
+('on_road_vehicle', 296, 2015, '382d7b679213a623'),
+('on_road_vehicle', 296, 2020, 'aad556ffec770c61'),
+('on_road_vehicle', 297, 2017, '3edf67d0cc4e39f0'),
+('on_road_vehicle', 297, 2019, '3720b34cdb966ad6'),
+('on_road_vehicle', 298, 2015, '01376021228ef39b'),
+('on_road_vehicle', 298, 2019, '12b96f925b332fa8'),
+('on_road_vehicle', 299, 2015, '3148058663cb18df'),
+('on_road_vehicle', 299, 2019, '09aa185da212530b'),
+('on_road_vehicle', 300, 2017, 'bf1e655a185d22bd'),
+('on_road_vehicle', 300, 2019, '3ae700a49dce6d04'),
+('on_road_vehicle', 301, 2017, '39e5734d4c3fc9d4'),
+('on_road_vehicle', 301, 2019, '62d02139425b74bd'),
+('on_road_vehicle', 302, 2015, '3fb05d027e693565'),
+('on_road_vehicle', 302, 2019, 'c8a64572e118baf2'),
+('on_road_vehicle', 303, 2017, 'a01cdfd546c55183'),
+('on_road_vehicle', 303, 2019, '868f4c9c1e07c91d'),
+('on_road_vehicle', 304, 2015, '6b4b195f95cd6742'),
+('on_road_vehicle', 304, 2020, '39609da2216e8c51'),
+('on_road_vehicle', 305, 2017, '636ce404e77fae89'),
+('on_road_vehicle', 305, 2019, 'bb21cf4a647a922a'),
+('on_road_vehicle', 306, 2017, '270ee3f013619389'),
+('on_road_vehicle', 306, 2019, '90d5a682a61ec75c'),
+('on_road_vehicle', 307, 2017, '2c1e5398c1633f60'),
+('on_road_vehicle', 307, 2019, '15356defaa7013d3'),
+('on_road_vehicle', 308, 2017, '7f3b3a210554c36b'),
+('on_road_vehicle', 308, 2019, '9a5601c17221fa50'),
+('on_road_vehicle', 309, 2017, 'da3aaa54f6bf5c6e'),
+('on_road_vehicle', 309, 2019, '707f6c8a28b0d7bf'),
+('on_road_vehicle', 310, 2017, '3bb73713186910d2'),
+('on_road_vehicle', 310, 2019, '0d93bd7d0c858905'),
+('on_road_vehicle', 311, 2017, 'b0b5581965c0346e'),
+('on_road_vehicle', 311, 2019, 'ee8c5a62e276ba87'),
+('on_road_vehicle', 312, 2017, '2b74d43f9e024284'),
+('on_road_vehicle', 312, 2019, '3e14e0cf2194fc7f'),
+('on_road_vehicle', 313, 2015, 'a387805fb2c6a44b'),
+('on_road_vehicle', 313, 2020, 'dc18b587d111d69e'),
+('on_road_vehicle', 314, 2017, '5bd445f553bbbf1f'),
+('on_road_vehicle', 314, 2019, '4c57a9957dd0280e'),
+('on_road_vehicle', 315, 2017, 'fe198ed055be1178'),
+('on_road_vehicle', 315, 2019, 'f577d22510569f43'),
+('on_road_vehicle', 316, 2015, '0512489026a9c46e'),
+('on_road_vehicle', 316, 2019, '5ee14c29cec5483c'),
+('on_road_vehicle', 317, 2017, 'b979bf0ecb76226d'),
+('on_road_vehicle', 317, 2019, '8ab182120f375453'),
+('on_road_vehicle', 318, 2017, 'c5fe2abe414f500c'),
+('on_road_vehicle', 318, 2019, 'f2b8592f99cea532'),
+('on_road_vehicle', 319, 2017, 'eb11da19b89427c3'),
+('on_road_vehicle', 319, 2019, '4456704f03f8f099'),
+('on_road_vehicle', 320, 2017, '58792b8a481e43ca'),
+('on_road_vehicle', 320, 2019, '440d0b453bc7ffa5'),
+('on_road_vehicle', 321, 2017, 'f4d4f678e294081a'),
+('on_road_vehicle', 321, 2019, 'a326079127698401'),
+('on_road_vehicle', 322, 2017, '8198fa576a7cc10b'),
+('on_road_vehicle', 322, 2019, '2d6b056f16b1f828'),
+('on_road_vehicle', 323, 2017, '99a9206ce79fd94b'),
+('on_road_vehicle', 323, 2019, '1809a87a4981b7af'),
+('on_road_vehicle', 324, 2015, '73e70711338ab3da'),
+('on_road_vehicle', 324, 2019, '85d8b35912d6f09d'),
+('on_road_vehicle', 325, 2017, '5b4e5588b88afc67'),
+('on_road_vehicle', 325, 2019, 'd6927b57ee7c4d95'),
+('on_road_vehicle', 326, 2017, '80991fc8b69c860a'),
+('on_road_vehicle', 326, 2019, 'cd83a0f57c716ca6'),
+('on_road_vehicle', 327, 2017, '07a681f18fa94aa0'),
+('on_road_vehicle', 327, 2019, '91827d40ebf93508'),
+('on_road_vehicle', 328, 2017, 'a9905ffe71bc3c9d'),
+('on_road_vehicle', 328, 2019, 'f8982623174666d5'),
+('on_road_vehicle', 329, 2015, '8fa5a7d84b926628'),
+('on_road_vehicle', 329, 2019, '1ef9b0d2b9e36a6f'),
+('on_road_vehicle', 330, 2015, '0344855d5fb1b551'),
+('on_road_vehicle', 330, 2019, 'c166336d0643a0eb'),
+('on_road_vehicle', 331, 2015, '96eeeb3d013c74b1'),
+('on_road_vehicle', 331, 2019, '5b30466c281be34f'),
+('on_road_vehicle', 332, 2017, 'cf0723f468f086b8'),
+('on_road_vehicle', 332, 2019, 'c091414635d8af06'),
+('on_road_vehicle', 333, 2017, '7873ba2bc5ff80e1'),
+('on_road_vehicle', 333, 2019, '933f8d7cc8f7b6e5'),
+('on_road_vehicle', 334, 2017, '3b3a52f27cd119d2'),
+('on_road_vehicle', 334, 2019, '68a22a83708fc053'),
+('on_road_vehicle', 335, 2015, '97058d7484c4c9de'),
+('on_road_vehicle', 335, 2020, '29c6a4ff61c90e2a'),
+('on_road_vehicle', 336, 2015, 'db9ae08a17b311d8'),
+('on_road_vehicle', 336, 2019, '7b3f8c8ac9264a6c'),
+('on_road_vehicle', 337, 2017, '710d48c095092ae4'),
+('on_road_vehicle', 337, 2019, '07b2c8cb3a5b832c'),
+('on_road_vehicle', 338, 2017, '0c85e040705b0da6'),
+('on_road_vehicle', 338, 2019, '060e32977e99aef6'),
+('on_road_vehicle', 339, 2017, '86a4ec8276809c5b'),
+('on_road_vehicle', 339, 2019, 'c5af9130fd23b7ba'),
+('on_road_vehicle', 340, 2017, '29488f740a746acd'),
+('on_road_vehicle', 340, 2019, '05bfd03053d3e882'),
+('on_road_vehicle', 341, 2015, '0c64a0fd4d56abdd'),
+('on_road_vehicle', 341, 2019, '31307bd35cb4eaae'),
+('on_road_vehicle', 342, 2017, '314c51f65c80debe'),
+('on_road_vehicle', 342, 2019, '86d6a7b1f4531b10'),
+('on_road_vehicle', 343, 2017, '1f9a2213726482fb'),
+('on_road_vehicle', 343, 2019, '873c73ea5f505b71'),
+('on_road_vehicle', 344, 2017, 'b8c26294054435cc'),
+('on_road_vehicle', 344, 2019, '31b553a9694807a5'),
+('on_road_vehicle', 345, 2015, 'c492d7a056859ff9'),
+('on_road_vehicle', 345, 2019, '3f1788586e634649'),
+('on_road_vehicle', 346, 2017, 'aac2d3c4105f4cc8'),
+('on_road_vehicle', 346, 2019, '0d376d1575c0690f'),
+('on_road_vehicle', 347, 2017, 'dc9f9faa1d75301f'),
+('on_road_vehicle', 347, 2019, 'c3ee0f0ff0cdb373'),
+('on_road_vehicle', 348, 2017, 'f8c578c45399e7e2'),
+('on_road_vehicle', 348, 2019, 'af672a63bce577ba'),
+('on_road_vehicle', 349, 2017, '8a353821c7957389'),
+('on_road_vehicle', 349, 2019, 'c5151876cae5bf2c'),
+('on_road_vehicle', 350, 2017, '36dacd6649080cac'),
+('on_road_vehicle', 350, 2019, '3deed4b9a3a738b7'),
+('on_road_vehicle', 351, 2017, '304ec066231cb69c'),
+('on_road_vehicle', 351, 2019, 'ec07b9cf7146945a'),
+('on_road_vehicle', 352, 2015, '617b30f242e40bc5'),
+('on_road_vehicle', 352, 2019, '627308814b1dc473'),
+('on_road_vehicle', 353, 2017, '0c85dc54f62b2b17'),
+('on_road_vehicle', 353, 2019, 'bbd76812dc4b8b45'),
+('on_road_vehicle', 354, 2015, '0eb1d7fff579f0ad'),
+('on_road_vehicle', 354, 2020, 'ddc894b3a94647a2'),
+('on_road_vehicle', 355, 2015, 'ab1d3663c3f9fab0'),
+('on_road_vehicle', 355, 2020, 'd62b48827343a933'),
+('on_road_vehicle', 356, 2017, 'e831c3e265946e8c'),
+('on_road_vehicle', 356, 2019, '12924c4f534d6707'),
+('on_road_vehicle', 357, 2017, '2794d75d0eee8a82'),
+('on_road_vehicle', 357, 2019, 'e4c1f3bc91b4cc6b'),
+('on_road_vehicle', 358, 2017, '9902676b0f6d5129'),
+('on_road_vehicle', 358, 2019, '1c1a188f620dfa11'),
+('on_road_vehicle', 359, 2017, '5bf76a9ec1da0d7d'),
+('on_road_vehicle', 359, 2019, 'effab5da57696fb6'),
+('on_road_vehicle', 360, 2015, '8d2e5528053a6552'),
+('on_road_vehicle', 360, 2019, '0e5a1d1388050fa4'),
+('on_road_vehicle', 361, 2015, '0b779878bf61567c'),
+('on_road_vehicle', 361, 2020, '1efa79afbcce6eae'),
+('on_road_vehicle', 362, 2017, 'f6d58ef17c78a5d0'),
+('on_road_vehicle', 362, 2019, '53b4fae70007d8fb'),
+('on_road_vehicle', 363, 2017, '6fe328c7f58d949b'),
+('on_road_vehicle', 363, 2019, '1451bd2adec911f4'),
+('on_road_vehicle', 364, 2017, '96e6c8a41ac6d3e2'),
+('on_road_vehicle', 364, 2019, '719d23fa7f37579e'),
+('on_road_vehicle', 365, 2017, '159d5ff36df23a12'),
+('on_road_vehicle', 365, 2019, 'e057321652e24a66'),
+('on_road_vehicle', 366, 2017, '2cfcf5b64410c186'),
+('on_road_vehicle', 366, 2019, '26c5c6c8dcf637f4'),
+('on_road_vehicle', 367, 2017, 'f4b125b40a6f4303'),
+('on_road_vehicle', 367, 2019, 'cb4fe1d950b62995'),
+('on_road_vehicle', 368, 2017, 'c5a97b297d2cc124'),
+('on_road_vehicle', 368, 2019, '8b95c7574d4b0d94'),
+('on_road_vehicle', 369, 2015, '8ef00b1197406bc7'),
+('on_road_vehicle', 369, 2020, 'ec80ec9c6a44badc'),
+('on_road_vehicle', 370, 2017, 'ece670bc005c6b16'),
+('on_road_vehicle', 370, 2019, '837ceb951183152b'),
+('on_road_vehicle', 371, 2017, '35c1673a73de948f'),
+('on_road_vehicle', 371, 2019, '1fff65b979b9b576'),
+('on_road_vehicle', 372, 2017, 'f6211265424ff40b'),
+('on_road_vehicle', 372, 2019, '18826186a9d73941'),
+('on_road_vehicle', 373, 2015, 'ee4cb1cbef78c6ee'),
+('on_road_vehicle', 373, 2019, 'dc113a13ba1c179b'),
+('on_road_vehicle', 374, 2017, 'afc4d64ff6e6cd00'),
+('on_road_vehicle', 374, 2019, '69bae1d1014be33f'),
+('on_road_vehicle', 375, 2017, '6da1f5c849d49d4d'),
+('on_road_vehicle', 375, 2019, '3478253aa31d7182'),
+('on_road_vehicle', 376, 2017, '8c31cb5aee10d6c7'),
+('on_road_vehicle', 376, 2019, '40efb3e4137944e5'),
+('on_road_vehicle', 377, 2017, '31bf70d1435ad80a'),
+('on_road_vehicle', 377, 2019, 'dbe1c28142d7df77'),
+('on_road_vehicle', 378, 2017, '34d0f338f9ef1445'),
+('on_road_vehicle', 378, 2019, '88a35b103f029f26'),
+('on_road_vehicle', 379, 2015, '076f455155bdb823'),
+('on_road_vehicle', 379, 2019, 'a84cbf6f708a875d'),
+('on_road_vehicle', 380, 2017, '07198af3332bcb9d'),
+('on_road_vehicle', 380, 2019, 'fca8aac6a8bb41a8'),
+('on_road_vehicle', 381, 2015, '6bc5b002fd7cf8d8'),
+('on_road_vehicle', 381, 2019, '0606cbb97e814dcc'),
+('on_road_vehicle', 382, 2015, 'bd33a71f0ddef126'),
+('on_road_vehicle', 382, 2019, 'cdff19e1787c155c'),
+('on_road_vehicle', 383, 2015, '897d8ffcea68d9a5'),
+('on_road_vehicle', 383, 2019, '677a967f3eedf8e5'),
+('on_road_vehicle', 384, 2015, 'fbd58c94a30d3a04'),
+('on_road_vehicle', 384, 2020, '878c341ff9aa55b9'),
+('on_road_vehicle', 385, 2015, 'ff62ea8478a5d594'),
+('on_road_vehicle', 385, 2019, 'e053d57c3ec9009c'),
+('on_road_vehicle', 386, 2015, '86b55a13db8b5b56'),
+('on_road_vehicle', 386, 2020, 'cfd0d96c7ffa7e3c'),
+('on_road_vehicle', 387, 2017, 'f9da401e28469ac1'),
+('on_road_vehicle', 387, 2019, '07a08e03b3a064ed'),
+('on_road_vehicle', 388, 2017, 'd822dfe23c6a9e67'),
+('on_road_vehicle', 388, 2019, '008b3b3ef46e410d'),
+('on_road_vehicle', 389, 2017, '4dc4ea92a0de830e'),
+('on_road_vehicle', 389, 2019, '4c68a7ba87cc2c24'),
+('on_road_vehicle', 390, 2015, '30514125287480dd'),
+('on_road_vehicle', 390, 2020, '78f8287873e08a7b'),
+('on_road_vehicle', 391, 2017, '97bafb09a2975000'),
+('on_road_vehicle', 391, 2019, 'd49927ab8c1e45ca'),
+('on_road_vehicle', 392, 2015, 'fad0a360b6584f40'),
+('on_road_vehicle', 392, 2019, 'c2461f81165b05f6'),
+('on_road_vehicle', 393, 2015, '3a011a102ebcb624'),
+('on_road_vehicle', 393, 2019, 'dc591aa7c0041b8a'),
+('on_road_vehicle', 394, 2017, '7414a4211a1420de'),
+('on_road_vehicle', 394, 2019, '87cf3d06bea1022b'),
+('on_road_vehicle', 395, 2015, 'c33521e8d91b2729'),
+('on_road_vehicle', 395, 2019, 'f64e1bfd687bbe7a'),
+('on_road_vehicle', 396, 2015, 'd3928c00890323e9'),
+('on_road_vehicle', 396, 2020, '55589a1039b3d114'),
+('on_road_vehicle', 397, 2017, '2ea27675aba47f55'),
+('on_road_vehicle', 397, 2019, 'c8ff518a4fe90d6a'),
+('on_road_vehicle', 398, 2017, '985009fc083b036e'),
+('on_road_vehicle', 398, 2019, 'a644908c71e27c54'),
+('on_road_vehicle', 399, 2015, 'bbcd8302f773e2f5'),
+('on_road_vehicle', 399, 2020, '1ab71dd13da702fc'),
+('on_road_vehicle', 400, 2017, '3a722de229625d0c'),
+('on_road_vehicle', 400, 2019, '5c8094507bfbf9ae'),
+('on_road_vehicle', 401, 2017, '81bf1f3c5aa1de3a'),
+('on_road_vehicle', 401, 2019, '90c4b403709488ba'),
+('on_road_vehicle', 402, 2017, '79b63be93d3986e5'),
+('on_road_vehicle', 402, 2019, '8b8d52d90b0d9a35'),
+('on_road_vehicle', 403, 2017, '54297d19189e0769'),
+('on_road_vehicle', 403, 2019, '4af44d71d72c7fb6'),
+('on_road_vehicle', 404, 2017, 'd9f37fbeb5a1bbcf'),
+('on_road_vehicle', 404, 2019, 'dd804a42676800ec'),
+('on_road_vehicle', 405, 2015, '1e72a8ddc567780d'),
+('on_road_vehicle', 405, 2020, '165ce1865bb0b6d4'),
+('on_road_vehicle', 406, 2015, 'a4a5c6515c3ba952'),
+('on_road_vehicle', 406, 2019, 'a725b30d63f07e24'),
+('on_road_vehicle', 407, 2017, 'c5bf3d041ae5baec'),
+('on_road_vehicle', 407, 2019, 'b54abd935c0bd5c3'),
+('on_road_vehicle', 408, 2015, '1ac826dee7cfd2c0'),
+('on_road_vehicle', 408, 2020, '45d5cbc8c7d746c9'),
+('on_road_vehicle', 409, 2017, '53239397dad9df84'),
+('on_road_vehicle', 409, 2019, '509e7fbd1e71f2bb'),
+('on_road_vehicle', 410, 2017, 'a2fc15b82b69dd74'),
+('on_road_vehicle', 410, 2019, '39e88edfe4eb92f9'),
+('on_road_vehicle', 411, 2017, '73c13393239436e8'),
+('on_road_vehicle', 411, 2019, '90af952761c33470'),
+('on_road_vehicle', 567, 2017, '66c1bd4e8c5b91d1'),
+('on_road_vehicle', 567, 2019, '5400ddb9b0e81560'),
+('on_road_vehicle', 568, 2017, '1eea91c0b78d136e'),
+('on_road_vehicle', 568, 2019, '99529f82cfadb939'),
+('on_road_vehicle', 414, 2017, 'a48abc61340b160e'),
+('on_road_vehicle', 414, 2019, '9c2c55dff67d22a7'),
+('on_road_vehicle', 415, 2017, 'c29a68edc51d2588'),
+('on_road_vehicle', 415, 2019, 'f3b1dce1b2bc23a2'),
+('on_road_vehicle', 416, 2017, '8fba2c74b4f0c071'),
+('on_road_vehicle', 416, 2019, '624f65a154b1d91d'),
+('on_road_vehicle', 417, 2017, '116ecf5f1657db7e'),
+('on_road_vehicle', 417, 2019, 'd2fdf87c60b32922'),
+('on_road_vehicle', 418, 2017, '242696a4cd84e6e8'),
+('on_road_vehicle', 418, 2019, '09ea00e35643db1e'),
+('on_road_vehicle', 419, 2017, 'adb03aacd68806eb'),
+('on_road_vehicle', 419, 2019, 'a6df69b2504fe3d5'),
+('on_road_vehicle', 420, 2017, '18a6f3a1a1e365ca'),
+('on_road_vehicle', 420, 2019, '718bab331981a51b'),
+('on_road_vehicle', 421, 2017, '2151c871557f2b18'),
+('on_road_vehicle', 421, 2019, '7ebbad0e2d5460c9'),
+('on_road_vehicle', 422, 2017, '9150c71a59f1f769'),
+('on_road_vehicle', 422, 2019, '4ec8fbfd5afe3575'),
+('on_road_vehicle', 423, 2015, '37b9d44ec6bd4474'),
+('on_road_vehicle', 423, 2019, 'e9d247c289eec680'),
+('on_road_vehicle', 424, 2015, '294fa4edaba6f31e'),
+('on_road_vehicle', 424, 2019, '291a3053f79a1e34'),
+('on_road_vehicle', 425, 2015, '5990ee938ca50dde'),
+('on_road_vehicle', 425, 2019, '05b5f377437c1487'),
+('on_road_vehicle', 426, 2017, '4abf204f7d09718b'),
+('on_road_vehicle', 426, 2019, '4c6934aca72250b4'),
+('on_road_vehicle', 427, 2017, 'c553c42187823471'),
+('on_road_vehicle', 427, 2019, '01e7251316d368df'),
+('on_road_vehicle', 428, 2017, 'faa20fe7f574d07a'),
+('on_road_vehicle', 428, 2019, 'ee45032c30aa60bc'),
+('on_road_vehicle', 429, 2017, 'e0655775c6a546f9'),
+('on_road_vehicle', 429, 2019, 'e72971bdf41775d6'),
+('on_road_vehicle', 430, 2017, '4e02b4793203fe71'),
+('on_road_vehicle', 430, 2019, '8d111c433a198714'),
+('on_road_vehicle', 431, 2017, '82e58943220ea632'),
+('on_road_vehicle', 431, 2019, '8d9c24901a909ec3'),
+('on_road_vehicle', 432, 2017, '2b549aaea9a42bad'),
+('on_road_vehicle', 432, 2019, 'aa85dc821011c7e8'),
+('on_road_vehicle', 433, 2017, 'e4c985ba3cb99915'),
+('on_road_vehicle', 433, 2019, 'b0d85aa390814191'),
+('on_road_vehicle', 434, 2017, 'a4f034f886a1646f'),
+('on_road_vehicle', 434, 2019, 'd9032bade727619f'),
+('on_road_vehicle', 435, 2017, 'e5488ff0ef55172c'),
+('on_road_vehicle', 435, 2019, 'ac72e6e41f7658f8'),
+('on_road_vehicle', 436, 2017, 'e0970be2523b4d27'),
+('on_road_vehicle', 436, 2019, '7d03f77af84cd7aa'),
+('on_road_vehicle', 437, 2015, '89172ef8e148ea0b'),
+('on_road_vehicle', 437, 2019, 'd46235afd4efe7b1'),
+('on_road_vehicle', 438, 2017, 'e61cb3cc784a5dac'),
+('on_road_vehicle', 438, 2019, '3ad84a29fc570820'),
+('on_road_vehicle', 439, 2017, '36fb53e8d4aade82'),
+('on_road_vehicle', 439, 2019, '30f9c4ef21b27a8f'),
+('on_road_vehicle', 440, 2017, 'add76bf5bc268cb4'),
+('on_road_vehicle', 440, 2019, '278e89a8569ad3cc'),
+('on_road_vehicle', 441, 2015, 'ccbdfd6aaa716c25'),
+('on_road_vehicle', 441, 2020, 'cd5c6a810f43c8ca'),
+('on_road_vehicle', 442, 2017, '585e6b3bcd416185'),
+('on_road_vehicle', 442, 2019, 'dc846ad98858ad60'),
+('on_road_vehicle', 443, 2017, '5560fe2a50c88c4a'),
+('on_road_vehicle', 443, 2019, 'aa16311f830d3c7a'),
+('on_road_vehicle', 444, 2017, 'ad51653f04dc67ce'),
+('on_road_vehicle', 444, 2019, '6ce8b47508127c41'),
+('on_road_vehicle', 445, 2017, '5267ce4426caf08d'),
+('on_road_vehicle', 445, 2019, 'b2788d5dc3a397f9'),
+('on_road_vehicle', 446, 2017, '31dce634cae2c30f'),
+('on_road_vehicle', 446, 2019, '25e053839d91abd2'),
+('on_road_vehicle', 447, 2015, '647723853fc2bd6e'),
+('on_road_vehicle', 447, 2020, '4eeb1cfe8bcc96bf'),
+('on_road_vehicle', 449, 2017, '7835f26687e8d36d'),
+('on_road_vehicle', 449, 2019, 'cb69af06d92ee49e'),
+('on_road_vehicle', 450, 2017, '8ad649b9c0bd1362'),
+('on_road_vehicle', 450, 2019, '0da1369f66a15b9b'),
+('on_road_vehicle', 451, 2015, '18d3d2f3a103db0a'),
+('on_road_vehicle', 451, 2019, 'c61dac8cb260ed32'),
+('on_road_vehicle', 452, 2015, '9f1d4d0b505a0c0d'),
+('on_road_vehicle', 452, 2020, '1e1b002c52fa0ea2'),
+('on_road_vehicle', 453, 2017, '0a6e2f12764c711d'),
+('on_road_vehicle', 453, 2019, 'bde103e81ca0c8c9'),
+('on_road_vehicle', 454, 2017, '74ea720876581111'),
+('on_road_vehicle', 454, 2019, '08607885d0495c11'),
+('on_road_vehicle', 455, 2017, '2944635bba9d23f0'),
+('on_road_vehicle', 455, 2019, '4d3a6384a7b9a91a'),
+('on_road_vehicle', 456, 2015, '9e7d248da0ae9799'),
+('on_road_vehicle', 456, 2019, 'c2fb9aaae7e0206f'),
+('on_road_vehicle', 457, 2015, 'fa5d729de3e27ea7'),
+('on_road_vehicle', 457, 2020, '068806b495443b1d'),
+('on_road_vehicle', 458, 2017, '7109391632d06659'),
+('on_road_vehicle', 458, 2019, '2e33b73633476b00'),
+('on_road_vehicle', 459, 2017, 'd0ec9a5136005177'),
+('on_road_vehicle', 459, 2019, '887627df94d0b60f'),
+('on_road_vehicle', 460, 2017, '1a5ac2216e090716'),
+('on_road_vehicle', 460, 2019, '3706f4e460812ec1'),
+('on_road_vehicle', 461, 2017, 'c39e1fda93fa3b2d'),
+('on_road_vehicle', 461, 2019, '251bb37c0f5fd04d'),
+('on_road_vehicle', 462, 2017, '381127fa46fa1d89'),
+('on_road_vehicle', 463, 2015, '99d863ee00d205fb'),
+('on_road_vehicle', 463, 2019, '67d5613d80a09a50'),
+('on_road_vehicle', 464, 2017, '81c1fee4b0945cc8'),
+('on_road_vehicle', 464, 2019, 'efa7563ee6421fdb'),
+('on_road_vehicle', 465, 2017, 'f3dcc3a08fc9db3a'),
+('on_road_vehicle', 465, 2019, '7250eddaa41a7d71'),
+('on_road_vehicle', 466, 2017, '2c1bb39e718162dc'),
+('on_road_vehicle', 466, 2019, 'f535a0a9753ec414'),
+('on_road_vehicle', 467, 2017, '3b4855f9ef3b6f66'),
+('on_road_vehicle', 467, 2019, '037d286399204b2c'),
+('on_road_vehicle', 468, 2015, '14b5c367dd82458a'),
+('on_road_vehicle', 468, 2019, 'abf9e89516a57388'),
+('on_road_vehicle', 469, 2017, 'f83a92a2f3270a89'),
+('on_road_vehicle', 469, 2019, '2565039991e0790b'),
+('on_road_vehicle', 470, 2017, 'c60ab74d97681bfa'),
+('on_road_vehicle', 470, 2019, '8625aef5d281f690'),
+('on_road_vehicle', 471, 2017, 'de72fb3251f91d05'),
+('on_road_vehicle', 471, 2019, '7214d0df021410e1'),
+('on_road_vehicle', 472, 2017, 'f3103bbd71613525'),
+('on_road_vehicle', 472, 2019, '661208fe7f5d9a41'),
+('on_road_vehicle', 473, 2015, '827ab491aecb43ba'),
+('on_road_vehicle', 473, 2019, 'de69fdb164a93d7a'),
+('on_road_vehicle', 474, 2017, '52d26a84092e59a5'),
+('on_road_vehicle', 474, 2019, '848a68a14a868ed3'),
+('on_road_vehicle', 475, 2017, '7880a085e04d99be'),
+('on_road_vehicle', 475, 2019, 'e84e920271e1f090'),
+('on_road_vehicle', 476, 2017, '11b54776e72a9ffe'),
+('on_road_vehicle', 476, 2019, '0f4cf1cf7c8223b5'),
+('on_road_vehicle', 477, 2017, '87f8f3ba1f2ec652'),
+('on_road_vehicle', 477, 2019, '7fa13fd615690bbe'),
+('on_road_vehicle', 478, 2017, '8928d6aa41b93207'),
+('on_road_vehicle', 478, 2019, '86da820ff49104fb'),
+('on_road_vehicle', 479, 2015, 'ac0bc65751db71ef'),
+('on_road_vehicle', 479, 2020, '48104e4906b973c9'),
+('on_road_vehicle', 480, 2015, '81e8a0707ac44369'),
+('on_road_vehicle', 480, 2020, '20d691dc79e07010'),
+('on_road_vehicle', 481, 2015, '9d0be0e040d3336c'),
+('on_road_vehicle', 481, 2019, '2cc0fd47bfd42def'),
+('on_road_vehicle', 482, 2017, '56bff3e1129a7725'),
+('on_road_vehicle', 482, 2019, '4aa9aa04be79f207'),
+('on_road_vehicle', 483, 2017, 'c219d4260ed23c8e'),
+('on_road_vehicle', 484, 2017, 'af17edb0b1371865'),
+('on_road_vehicle', 484, 2019, '6dcf505f03cb132d'),
+('on_road_vehicle', 485, 2015, 'eba3934bdb33ecbd'),
+('on_road_vehicle', 485, 2019, '38a21d975158d77d'),
+('on_road_vehicle', 486, 2015, '350f145dc71be8a9'),
+('on_road_vehicle', 486, 2019, 'c847a215978fbbf7'),
+('on_road_vehicle', 487, 2015, 'b883687801017e05'),
+('on_road_vehicle', 487, 2019, '7a80d2b3565f4723'),
+('on_road_vehicle', 488, 2017, '5259afa403cadfdd'),
+('on_road_vehicle', 488, 2019, 'abd54ed0ca7a6828'),
+('on_road_vehicle', 489, 2017, '80e33dfe63c484b6'),
+('on_road_vehicle', 489, 2019, '344e40741a90aa70'),
+('on_road_vehicle', 490, 2017, '48548f8ac9f78ada'),
+('on_road_vehicle', 490, 2019, '3dbd4c04dd4236f4'),
+('on_road_vehicle', 491, 2017, '85cbdc5bcdfd25dd'),
+('on_road_vehicle', 491, 2019, 'a54d7b080c5a12d1'),
+('on_road_vehicle', 492, 2017, '8445dee23d9baf37'),
+('on_road_vehicle', 492, 2019, '70b1eea2dc4ce6cf'),
+('on_road_vehicle', 493, 2017, 'a7f23ea26252fcaa'),
+('on_road_vehicle', 493, 2019, '8e13b77cb45db303'),
+('on_road_vehicle', 494, 2017, '5e760a2cc9c2c202'),
+('on_road_vehicle', 494, 2019, '266e6064f60b9391'),
+('on_road_vehicle', 495, 2015, '13a45e25ec74d7c0'),
+('on_road_vehicle', 495, 2019, '048133e4ab802402'),
+('on_road_vehicle', 496, 2017, '464bc9fc99c5265a'),
+('on_road_vehicle', 496, 2019, 'c1d5fb945a2372d6'),
+('on_road_vehicle', 497, 2017, '5cfe4703a26b5e89'),
+('on_road_vehicle', 497, 2019, 'd8919c370501a463'),
+('on_road_vehicle', 498, 2017, '4a1a7c2a1be35c9a'),
+('on_road_vehicle', 498, 2019, '590912617c370bff'),
+('on_road_vehicle', 499, 2017, '8b798b44a8a7ad20'),
+('on_road_vehicle', 499, 2019, 'c23d9e6ef2ba7483'),
+('on_road_vehicle', 500, 2017, '68ae2c1c02d41eab'),
+('on_road_vehicle', 500, 2019, 'f7c509214bfa65eb'),
+('on_road_vehicle', 501, 2015, '117a5b525603ca32'),
+('on_road_vehicle', 501, 2020, '38095ee95fa54680'),
+('on_road_vehicle', 502, 2017, 'bc780980d7f1f0b2'),
+('on_road_vehicle', 502, 2019, 'eced2049c9de62ef'),
+('on_road_vehicle', 503, 2015, '479d571e4f8ef14b'),
+('on_road_vehicle', 503, 2020, 'b68e0d0478063b8e'),
+('on_road_vehicle', 504, 2017, '7921ac5a7be39417'),
+('on_road_vehicle', 504, 2019, '7dca2d06fb5a5376'),
+('on_road_vehicle', 505, 2015, 'a4515b1b8ed1ecd7'),
+('on_road_vehicle', 505, 2020, 'a52a4d943fffa70f'),
+('on_road_vehicle', 506, 2015, '408da011f7c80f42'),
+('on_road_vehicle', 506, 2020, '2e0e01d1a71803d2'),
+('on_road_vehicle', 507, 2017, '8972029869341a47'),
+('on_road_vehicle', 507, 2019, '62a60ee21a23b3f6'),
+('on_road_vehicle', 508, 2017, '8a1de71bafd597e3'),
+('on_road_vehicle', 508, 2019, 'e25f060189e7b913'),
+('on_road_vehicle', 509, 2017, '7755ce55a92629c6'),
+('on_road_vehicle', 509, 2019, 'a9dde528dc49fe1b'),
+('on_road_vehicle', 510, 2015, '5d3b8cf2f826239c'),
+('on_road_vehicle', 510, 2020, 'dd46128a03783682'),
+('on_road_vehicle', 511, 2015, '19f103f52fa47f6b'),
+('on_road_vehicle', 511, 2019, 'fcd85a92281e784d'),
+('on_road_vehicle', 512, 2017, 'd772b4e162445e01'),
+('on_road_vehicle', 512, 2019, '9a5c877c67bd2a25'),
+('on_road_vehicle', 513, 2017, 'a33679ff681ea4cb'),
+('on_road_vehicle', 513, 2019, '25b30906c2fbd0b2'),
+('on_road_vehicle', 514, 2017, '8f15364622677b00'),
+('on_road_vehicle', 514, 2019, 'f3f4d245187038d6'),
+('on_road_vehicle', 515, 2017, '743b97335f47fa2e'),
+('on_road_vehicle', 515, 2019, 'c73520621e9ef442'),
+('on_road_vehicle', 516, 2017, '57931dd6542c6036'),
+('on_road_vehicle', 516, 2019, '6939cd6cada30840'),
+('on_road_vehicle', 517, 2017, 'd90580016f9929e0'),
+('on_road_vehicle', 517, 2019, 'd6fcecfdc9fad9d4'),
+('on_road_vehicle', 518, 2017, '663678b7712893e8'),
+('on_road_vehicle', 518, 2019, '08d736a1f86d066b'),
+('on_road_vehicle', 519, 2017, '088237c1cf23a32d'),
+('on_road_vehicle', 519, 2019, 'b2f80f0817b4c56d'),
+('on_road_vehicle', 520, 2017, '804fcaedb461e784'),
+('on_road_vehicle', 520, 2019, '3b549d11d49f7dc8'),
+('on_road_vehicle', 521, 2015, '6996ae6122bc1833'),
+('on_road_vehicle', 521, 2019, 'f5ecf6f7ef8ecc1d'),
+('on_road_vehicle', 522, 2015, 'f1ac50a5ef3aee38'),
+('on_road_vehicle', 522, 2019, 'a5029b45df980545'),
+('on_road_vehicle', 523, 2017, 'dcabd00d36314331'),
+('on_road_vehicle', 523, 2019, '4e599ea78b795685'),
+('on_road_vehicle', 524, 2017, '86e4b9726b3dbb99'),
+('on_road_vehicle', 524, 2019, '65afda78daf02649'),
+('on_road_vehicle', 525, 2017, '4ee589e64b5cb961'),
+('on_road_vehicle', 525, 2019, '157cd55c708fa578'),
+('on_road_vehicle', 526, 2015, '4d7dd22b7a7691c4'),
+('on_road_vehicle', 526, 2019, '2ca2917dc6c06d17'),
+('on_road_vehicle', 527, 2017, '21828262658f59a9'),
+('on_road_vehicle', 527, 2019, '93780540fabf675e'),
+('on_road_vehicle', 528, 2017, '324542254ac4b50d'),
+('on_road_vehicle', 528, 2019, 'ff0e141b9cdf8412'),
+('on_road_vehicle', 529, 2015, 'f88b890c872cdb8c'),
+('on_road_vehicle', 529, 2019, '95bf60c72c40059b'),
+('on_road_vehicle', 530, 2017, '267823184986759d'),
+('on_road_vehicle', 530, 2019, '7610070f7601ef8a'),
+('on_road_vehicle', 531, 2017, '31a72bedb23bbf5c'),
+('on_road_vehicle', 531, 2019, '58437dc5cce673cb'),
+('on_road_vehicle', 532, 2015, '4cd2840bb607a116'),
+('on_road_vehicle', 532, 2020, '5363d5369967748c'),
+('on_road_vehicle', 533, 2015, '2a42e04265cfeab0'),
+('on_road_vehicle', 533, 2019, '268f89be2340a828'),
+('on_road_vehicle', 534, 2017, 'f24f44c3112cc1e6'),
+('on_road_vehicle', 534, 2019, '04893113cfb8b514'),
+('on_road_vehicle', 535, 2017, 'b76e517fea1f8574'),
+('on_road_vehicle', 535, 2019, 'bf1712f0002d62e1'),
+('on_road_vehicle', 536, 2017, 'd86f1ddc544cf403'),
+('on_road_vehicle', 536, 2019, '20ed3934f8b13984'),
+('on_road_vehicle', 537, 2017, 'e52c8cb9850e4ede'),
+('on_road_vehicle', 537, 2019, 'a013a1133c9c10fa'),
+('on_road_vehicle', 538, 2015, '582a656120dbd392'),
+('on_road_vehicle', 538, 2020, 'ca96e06d238d7122'),
+('on_road_vehicle', 539, 2015, '3f4849bf9cf96ab1'),
+('on_road_vehicle', 539, 2019, '6fe9141e77bf6795'),
+('on_road_vehicle', 540, 2015, 'c09930ac60b1ef4c'),
+('on_road_vehicle', 540, 2019, '99077dc4a5303b13'),
+('on_road_vehicle', 541, 2017, '8f389f5aa311743c'),
+('on_road_vehicle', 541, 2019, 'b3b5eb2aaa116869'),
+('on_road_vehicle', 542, 2015, 'edfae58901c17792'),
+('on_road_vehicle', 542, 2019, '5337f2f62668a955'),
+('on_road_vehicle', 543, 2017, 'c9f924ab81baaeee'),
+('on_road_vehicle', 543, 2019, '0fe576787aab7908'),
+('on_road_vehicle', 544, 2015, 'acb1969e0b195df0'),
+('on_road_vehicle', 544, 2020, '091e33fc9847d071'),
+('on_road_vehicle', 545, 2017, 'f4a4eccfa39d296d'),
+('on_road_vehicle', 545, 2019, '9821cccbd7464a72'),
+('on_road_vehicle', 546, 2017, 'e6dece5a8926e7d0'),
+('on_road_vehicle', 546, 2019, 'd7980be9994822a5'),
+('on_road_vehicle', 547, 2015, '02ffd30281bab392'),
+('on_road_vehicle', 547, 2020, 'f99c1d4c10f3437f'),
+('on_road_vehicle', 548, 2015, '79b207e1d2b43eec'),
+('on_road_vehicle', 548, 2020, 'a2900f99b742a33c'),
+('on_road_vehicle', 549, 2015, '5a9f4d47f98ecd7e'),
+('on_road_vehicle', 549, 2019, '1225a3e866426fe4'),
+('on_road_vehicle', 550, 2017, '4fe4965f0a20f9d0'),
+('on_road_vehicle', 550, 2019, 'bdd62730d09b98a3'),
+('on_road_vehicle', 551, 2015, '657ceb8a4f1b8bb5'),
+('on_road_vehicle', 551, 2019, '320213dec5993c11'),
+('on_road_vehicle', 552, 2015, '13a1884e98e2f38a'),
+('on_road_vehicle', 552, 2020, 'd49c1818b751e90b'),
+('on_road_vehicle', 553, 2017, '7ac5362889d879f3'),
+('on_road_vehicle', 553, 2019, 'a8fb14e13ae15f3c'),
+('on_road_vehicle', 554, 2015, 'f46de452ee52ddfb'),
+('on_road_vehicle', 554, 2019, '68126a47067fb838'),
+('on_road_vehicle', 555, 2015, '1a7d5c61d9275dd7'),
+('on_road_vehicle', 555, 2019, 'c96a3bfa2b4855b4'),
+('on_road_vehicle', 556, 2017, 'ebb00c662a49ab5b'),
+('on_road_vehicle', 556, 2019, 'e607c8a78d480793'),
+('on_road_vehicle', 557, 2017, '2c5564e5598273ea'),
+('on_road_vehicle', 557, 2019, '718476381ae88f88'),
+('on_road_vehicle', 558, 2015, 'fd3711a52276be0d'),
+('on_road_vehicle', 558, 2019, '0b78a17894a8dacd'),
+('on_road_vehicle', 559, 2015, '116ee07afe578d7d'),
+('on_road_vehicle', 559, 2019, 'eab438f565c90abb'),
+('on_road_vehicle', 560, 2017, '01b84ab101a11b71'),
+('on_road_vehicle', 560, 2019, 'd0ddbd20137649ea'),
+('on_road_vehicle', 561, 2015, '32e0a101b3b01755'),
+('on_road_vehicle', 561, 2020, '6cd9f91948369363'),
+('on_road_vehicle', 562, 2015, '9fe7a1dfd2d5b57a'),
+('on_road_vehicle', 562, 2019, 'b9fe34b1fb8d622c'),
+('on_road_vehicle', 563, 2015, 'ffd810db83b41c47'),
+('on_road_vehicle', 563, 2019, 'd674a18f97e51b93'),
+('on_road_vehicle', 564, 2017, '12e1594ceb962f5c'),
+('on_road_vehicle', 564, 2019, 'a77b1e249d1e3ab0');
+CREATE INDEX IF NOT EXISTS population_year ON population (Year, MNo) INCLUDE (Pop, CO2, EVs, PersonalVehicles);
+CREATE INDEX IF NOT EXISTS means_of_transportation_year ON means_of_transportation (Year, Type, MNo) INCLUDE (Percentage);
+CREATE INDEX IF NOT EXISTS on_road_vehicle_year ON on_road_vehicle (Year, Type, MNo) INCLUDE (CO2, Miles);
+REFRESH MATERIALIZED VIEW ranking;
+REFRESH MATERIALIZED VIEW totals;
+VACUUM ANALYZE;
@@ -73,3 +73,29 @@ SELECT Name, County, Percentage
     FROM municipality
     NATURAL JOIN means_of_transportation
     WHERE Type = 'car, truck, or van' AND Percentage < 30.0 AND Year = 2020;
+
+-- The same questions can be answered from the ranking and totals
+-- materialized views, which the loader refreshes after every load.
+
+-- Which municipalities lost the most people from 2015 to 2020?
+SELECT Name, County, Value AS Pop2020, Delta
+    FROM ranking
+    NATURAL JOIN municipality
+    WHERE Metric = 'population' AND Year = 2020
+    ORDER BY Delta
+    LIMIT 5;
+
+-- In towns with more than 10,000 people in 2020, which had the greatest
+-- percentage of people taking a bicycle to work?
+SELECT Name, County, Value AS Percentage
+    FROM ranking
+    NATURAL JOIN municipality
+    WHERE Metric = 'transportation:bicycle' AND Year = 2020 AND Pop > 10000
+    ORDER BY Rank
+    LIMIT 1;
+
+-- What share of personal vehicles were EVs in each county in 2020?
+SELECT County, Value AS EVShare
+    FROM totals
+    WHERE Metric = 'ev_share' AND Year = 2020
+    ORDER BY Value DESC;
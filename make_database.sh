@@ -9,6 +9,9 @@ createdb $database
 psql -d $database -c "\i initialize_db.sql"
 cd -
 
+# rebuild the map geometry and its compressed copies
+(cd web && python3 convert_geojson.py)
+
 echo
 echo successfully created database called njdata
 echo creating web gui...
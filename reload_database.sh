@@ -0,0 +1,9 @@
+#!/bin/bash
+# Reloads the data into the existing njdata database while the site stays up.
+set -e
+cd db_scripts
+python3 convert.py --incremental --dsn "dbname=njdata"
+cd -
+
+echo
+echo successfully reloaded database called njdata
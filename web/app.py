@@ -51,264 +51,564 @@ https://scoutapm.com/blog/python-flask-tutorial-getting-started-with-flask
 https://www.geeksforgeeks.org/python-using-for-loop-in-flask/
 """
 
+import batch
+import cache
+import comparison
+import db
+import geometry
+import hashlib
 import json
-import psycopg2
-import matplotlib
-import matplotlib.pyplot as plt
-import multiprocessing as mp
-import numpy as np
-from base64 import b64encode
+import math
+import multiprocessing
+import metrics
+import prerender
+import queries
+import rankings
+import render
+import snapshot
+import tables
+import threading
 from collections import namedtuple
-from config import config
-from flask import Flask, render_template, request, Response
-from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from config import boolean, config
+from flask import Flask, render_template, request, Response, url_for
 from flask import redirect
 import os
 
-matplotlib.use('agg')
-
-# Connect to the PostgreSQL database server
-def connect(query):
-    conn = None
-    try:
-        # read connection parameters
-        params = config()
- 
-        # connect to the PostgreSQL server
-        print('Connecting to the %s database...' % (params['database']))
-        conn = psycopg2.connect(**params)
-        print('Connected.')
-      
-        # create a cursor
-        cur = conn.cursor()
-        
-        # execute a query using fetchall()
-        cur.execute(query)
-        rows = cur.fetchall()
-
-        # close the communication with the PostgreSQL
-        cur.close()
-    except (Exception, psycopg2.DatabaseError) as error:
-        print(error)
-    finally:
-        if conn is not None:
-            conn.close()
-            print('Database connection closed.')
-    # return the query result from fetchall()
-    return rows
- 
 # app.py
 app = Flask(__name__)
+db.init_app(app)
+metrics.init_app(app)
 
-def name_and_county(mno):
-    # sanitize inputs!
-    mno = int(mno)
-    # make query
-    return tuple(connect(f'SELECT name, county FROM municipality WHERE mno = {mno};')[0])
+@app.before_request
+def prerendered():
+    # send what prerender.py built for the loaded data, if it was run
+    if prerender.DIRECTORY and request.method == 'GET':
+        return prerender.response(cache.data_version().version)
 
-def render_plot():
-    fig = plt.gcf()
-    f = BytesIO()
-    fig.savefig(f, format='png')
-    f.seek(0)
-    return b64encode(f.getbuffer()).decode()
-
-def get_sql_enum(name):
-    return [row[0] for row in connect(f'SELECT UNNEST(ENUM_RANGE(NULL::{name}));')]
+def name_and_county(mno):
+    snap = snapshot.get()
+    i = snap.index[mno]
+    return snap.name[i], snap.county[i]
 
-MOT_ENUM = get_sql_enum('means_of_transportation_type')
+def mot_enum():
+    # read on first use rather than on import, so the app can start before the database
+    return queries.enum_values('means_of_transportation_type')
 
 class YearTable:
     def __init__(self, columns, table, mno):
-        self.header = ['Year'] + list(columns)
-        self.rows = connect(f'SELECT year, {", ".join(columns)} FROM {table} WHERE mno = {mno};')
-
-    def bar_chart(self, title, id, calculation, queue):
-        # run in separate process because matplotlib leaks memory with repeated use
-        years = [row[0] for row in self.rows]
-        rows = [calculation(row[1:]) for row in self.rows]
-        def worker():
-            plt.cla()
-            plt.clf()
-            bar_chart(title, years, [''], rows)
-            queue.put((id, render_plot()))
-        proc = mp.Process(target=worker)
-        proc.start()
-        return proc
+        with metrics.span('year_table', table):
+            snapshot_table = snapshot.table(table)
+            if snapshot_table is not None:
+                self.matrix = snapshot_table.matrix(columns, mno)
+            else:
+                self.matrix = tables.YearMatrix.from_rows(queries.BY_MNO[table, tuple(columns)](mno), columns)
+        self.header = self.matrix.header
+
+    @property
+    def rows(self):
+        return self.matrix.table_rows()
+
+    def chart_spec(self, title, calculation):
+        rows = [calculation(row) for row in self.matrix.values.tolist()]
+        return title, self.matrix.years, [''], [None if math.isnan(value) else value for value in rows]
+
+    def bar_chart(self, title, calculation):
+        # rendered by the worker pool unless cached, keeping the drawing off the request threads
+        return cache.chart(*self.chart_spec(title, calculation))
 
 class TypedYearTable(YearTable):
     def __init__(self, column, table, mno):
-        super().__init__(['Type', column], table, mno)
-        self.types = get_sql_enum(table + '_type')
-        self.header = ['Year'] + self.types
-        year_rows = {}
-        for year, type, value in self.rows:
-            if year not in year_rows:
-                year_rows[year] = [year] + [None for _ in range(len(self.types))]
-            year_rows[year][self.types.index(type) + 1] = value
-        self.rows = sorted(year_rows.values())
-
-    def bar_chart(self, title, id, queue):
-        # run in separate process because matplotlib leaks memory with repeated use
-        years = [row[0] for row in self.rows]
-        types = self.types
-        rows = [row[1:] for row in self.rows]
-        def worker():
-            plt.cla()
-            plt.clf()
-            bar_chart(title, years, types, rows)
-            queue.put((id, render_plot()))
-        proc = mp.Process(target=worker)
-        proc.start()
-        return proc
-
-def bar_chart(title, years, types, rows):
-    plt.figure(figsize=(8, 8))
-    plt.subplots_adjust(bottom=0.3)
-    indices = np.arange(len(types))
-
-    width = 1.0 / len(years)
-    offset = -0.5 + 0.5 * width
-    for year, row in zip(years, rows):
-        plt.bar(indices + offset, row, width, label=year)
-        offset += width
-
-    plt.title(title)
-    plt.xticks(indices, types, rotation=90)
-
-    plt.gca().ticklabel_format(style='plain', axis='y')
-
-    plt.legend(years)
+        with metrics.span('year_table', table):
+            snapshot_table = snapshot.table(table)
+            if snapshot_table is not None:
+                self.matrix = snapshot_table.matrix([column], mno)
+            else:
+                rows = queries.BY_MNO[table, ('Type', column)](mno)
+                self.matrix = tables.YearMatrix.from_typed_rows(rows, queries.enum_values(table + '_type'))
+        self.header = self.matrix.header
+        self.types = self.matrix.columns
+
+    def chart_spec(self, title):
+        return title, self.matrix.years, self.types, self.matrix.chart_rows()
+
+    def bar_chart(self, title):
+        # rendered by the worker pool unless cached, keeping the drawing off the request threads
+        return cache.chart(*self.chart_spec(title))
+
+EV_COLUMNS = ["EVs", "PersonalVehicles", "Pop", "CO2"]
+
+# charts served by /chart, by dataset and metric
+CHARTS = {
+    ('mot', 'percentage'): lambda mno: TypedYearTable('Percentage', 'means_of_transportation', mno).chart_spec('Percentage of Total Means of Transportation'),
+    ('vmt', 'miles'): lambda mno: TypedYearTable('Miles', 'on_road_vehicle', mno).chart_spec('Miles Traveled by On-road Vehicles'),
+    ('vmt', 'co2'): lambda mno: TypedYearTable('CO2', 'on_road_vehicle', mno).chart_spec('CO2 Emissions in Tons by On-road Vehicles'),
+    ('ev', 'ev_percentage'): lambda mno: YearTable(EV_COLUMNS, 'population', mno).chart_spec('Percentage of EVs out of Personal Vehicles', lambda row: 100 * (row[0] / row[1])),
+    ('ev', 'per_person'): lambda mno: YearTable(EV_COLUMNS, 'population', mno).chart_spec('Number of Vehicles per Person', lambda row: (row[1] / row[2])),
+}
+
+CHART_MODE = config(section='charts', defaults={'mode': 'server'})['mode']
+# drawn by static/charts.js from /chart/....json, with the PNG kept for download
+app.jinja_env.globals['client_charts'] = CHART_MODE == 'client'
+
+PAGES = config(section='pages', defaults={'threads': '0'})
+PAGE_THREADS = int(PAGES['threads'])
+# work for the detail pages runs here, on pooled connections of its own
+page_executor = ThreadPoolExecutor(PAGE_THREADS, thread_name_prefix='page') if PAGE_THREADS > 0 else None
+
+def gather(*calls):
+    # make each call, all at once if pages have threads, and return their results in order
+    if page_executor is None:
+        return [call() for call in calls]
+    # give back any connection this thread holds, since the page threads need their own
+    # and would otherwise wait for it whenever every connection is held like this
+    db.release_request_connection()
+    futures = [page_executor.submit(metrics.propagate(call)) for call in calls]
+    return [future.result() for future in futures]
+
+def warm_charts(mno, *charts):
+    # start rendering a page's charts, so they're ready or nearly when the browser asks for them
+    if page_executor is None or CHART_MODE == 'client':
+        return
+    def start(chart):
+        spec = CHARTS[chart](mno)
+        if spec[1]:
+            cache.chart(*spec)
+    for chart in charts:
+        page_executor.submit(start, chart)
+
+def render_page(template, **context):
+    with metrics.span('template', template):
+        return render_template(template, **context)
+
+def have_vehicles(mno):
+    # check which years are supported for on_road_vehicle
+    vehicles = snapshot.table('on_road_vehicle')
+    if vehicles is not None:
+        return mno in vehicles.rows_of
+    return len(queries.VEHICLE_YEARS(mno)) > 0
+
+def warm_up():
+    """Load what the first requests would otherwise wait for."""
+    for name in queries.ENUMS:
+        queries.enum_values(name)
+    snapshot.get()
+    geometry.get_geometry()
+    cache.data_version()
+    if CHART_MODE != 'client' and render.PROCESSES > 0:
+        render.get_pool()
+
+def warm_up_in_background():
+    try:
+        warm_up()
+    except Exception:
+        # everything is loaded on first use instead, such as once the database is up
+        app.logger.exception('warming up failed')
+
+STARTUP = config(section='startup', defaults={'warm_up': 'false'})
+# not in the chart workers, which import this module again when it's run as a script
+if boolean(STARTUP['warm_up']) and multiprocessing.current_process().name == 'MainProcess':
+    threading.Thread(target=warm_up_in_background, name='warm-up', daemon=True).start()
 
 @app.route('/municipality', methods=['POST'])
-def municipality():
-    mno = int(request.form['mno'])
+@app.route('/municipality/<int:mno>/', methods=['GET'])
+def municipality(mno=None):
+    if mno is None:
+        mno = request.form.get('mno', type=int)
+    if mno is None:
+        return Response(status=400)
+    if mno not in snapshot.get().index:
+        return Response(status=404)
     name, county = name_and_county(mno)
-    # check which years are supported for on_road_vehicle
-    have_vmt = len(connect(f'SELECT DISTINCT year FROM on_road_vehicle WHERE mno = {mno};')) > 0
-    return render_template('municipality.html', mno=mno, name=name, county=county, have_vmt=have_vmt)
+    return render_page('municipality.html', mno=mno, name=name, county=county, have_vmt=have_vehicles(mno))
 
 Municipality = namedtuple('Municipality', ('mno', 'name', 'county'))
 
 @app.route('/')
 def home():
-    municipalities = [Municipality(*row) for row in connect('SELECT mno, name, county FROM municipality;')]
-    types = [{'index': i, 'name': v } for i, v in enumerate(MOT_ENUM)]
-    return render_template('index.html', municipalities=municipalities, types=types)
+    snap = snapshot.get()
+    municipalities = [Municipality(*row) for row in zip(snap.mno, snap.name, snap.county)]
+    types = [{'index': i, 'name': v } for i, v in enumerate(mot_enum())]
+    return render_page('index.html', municipalities=municipalities, types=types)
 
 @app.route('/mot', methods=['POST'])
-def mot():
-    mno = int(request.form['mno'])
-    name, county = name_and_county(mno)
-    year_table = TypedYearTable('Percentage', 'means_of_transportation', mno)
-    queue = mp.Queue()
-    proc = year_table.bar_chart('Percentage of Total Means of Transportation', '', queue)
-    _, chart = queue.get()
-    proc.join()
-    return render_template('mot.html', mno=mno, name=name, county=county, chart=chart, year_table=year_table)
+@app.route('/mot/<int:mno>/', methods=['GET'])
+def mot(mno=None):
+    if mno is None:
+        mno = request.form.get('mno', type=int)
+    if mno is None:
+        return Response(status=400)
+    if mno not in snapshot.get().index:
+        return Response(status=404)
+    warm_charts(mno, ('mot', 'percentage'))
+    (name, county), year_table = gather(
+        lambda: name_and_county(mno),
+        lambda: TypedYearTable('Percentage', 'means_of_transportation', mno),
+    )
+    return render_page('mot.html', mno=mno, name=name, county=county, year_table=year_table, version=cache.data_version().version)
 
 @app.route('/vmt', methods=['POST'])
-def vmt():
-    mno = int(request.form['mno'])
-    name, county = name_and_county(mno)
-    miles_year_table = TypedYearTable('Miles', 'on_road_vehicle', mno)
-    if len(miles_year_table.rows) == 0:
+@app.route('/vmt/<int:mno>/', methods=['GET'])
+def vmt(mno=None):
+    if mno is None:
+        mno = request.form.get('mno', type=int)
+    if mno is None:
         return Response(status=400)
-    co2_year_table = TypedYearTable('CO2', 'on_road_vehicle', mno)
-    queue = mp.Queue()
-    miles_proc = miles_year_table.bar_chart('Miles Traveled by On-road Vehicles', 'miles', queue)
-    co2_proc = co2_year_table.bar_chart('CO2 Emissions in Tons by On-road Vehicles', 'co2', queue)
-    id1, chart1 = queue.get()
-    id2, chart2 = queue.get()
-    miles_chart = chart1 if id1 == 'miles' else chart2
-    co2_chart = chart2 if id2 == 'co2' else chart1
-    miles_proc.join()
-    co2_proc.join()
-    return render_template('vmt.html', mno=mno, name=name, county=county, miles_year_table=miles_year_table, miles_chart=miles_chart, co2_year_table=co2_year_table,co2_chart=co2_chart)
+    if mno not in snapshot.get().index:
+        return Response(status=404)
+    warm_charts(mno, ('vmt', 'miles'), ('vmt', 'co2'))
+    (name, county), miles_year_table, co2_year_table = gather(
+        lambda: name_and_county(mno),
+        lambda: TypedYearTable('Miles', 'on_road_vehicle', mno),
+        lambda: TypedYearTable('CO2', 'on_road_vehicle', mno),
+    )
+    if not miles_year_table.matrix.years:
+        return Response(status=400)
+    return render_page('vmt.html', mno=mno, name=name, county=county, miles_year_table=miles_year_table, co2_year_table=co2_year_table, version=cache.data_version().version)
 
 @app.route('/ev', methods=['POST'])
-def ev():
-    mno = int(request.form['mno'])
-    name, county = name_and_county(mno)
-    year_table = YearTable(["EVs", "PersonalVehicles", "Pop", "CO2"], "population", mno)
-    queue = mp.Queue()
-    ev_percentage_proc = year_table.bar_chart('Percentage of EVs out of Personal Vehicles', 'ev_percentage', lambda row: 100 * (row[0] / row[1]), queue)
-    id1, chart1 = queue.get()
-    per_person_proc = year_table.bar_chart('Number of Vehicles per Person', 'per_person', lambda row: (row[1] / row[2]), queue)
-    id2, chart2 = queue.get()
-    ev_percentage_chart = chart1 if id1 == 'ev_percentage' else chart2
-    per_person_chart = chart2 if id2 == 'per_person' else chart1
-    ev_percentage_proc.join()
-    per_person_proc.join()
-    return render_template('ev.html', mno=mno, name=name, county=county, year_table=year_table, ev_percentage_chart=ev_percentage_chart, per_person_chart=per_person_chart)
+@app.route('/ev/<int:mno>/', methods=['GET'])
+def ev(mno=None):
+    if mno is None:
+        mno = request.form.get('mno', type=int)
+    if mno is None:
+        return Response(status=400)
+    if mno not in snapshot.get().index:
+        return Response(status=404)
+    warm_charts(mno, ('ev', 'ev_percentage'), ('ev', 'per_person'))
+    (name, county), year_table = gather(
+        lambda: name_and_county(mno),
+        lambda: YearTable(EV_COLUMNS, "population", mno),
+    )
+    return render_page('ev.html', mno=mno, name=name, county=county, year_table=year_table, version=cache.data_version().version)
+
+def chart_response(dataset, metric, mno, mimetype, suffix=''):
+    # the chart's spec and a response with its caching headers, or a finished response if there's nothing to send
+    if (dataset, metric) not in CHARTS:
+        return None, Response(status=404)
+    spec = CHARTS[dataset, metric](mno)
+    # no years of data for this municipality
+    if not spec[1]:
+        return None, Response(status=404)
+    version = cache.data_version()
+    response = versioned_response(cache.chart_key(version.version, *spec) + suffix, mimetype)
+    if response.status_code == 304:
+        return None, response
+    return spec, response
+
+def versioned_response(etag, mimetype):
+    # a response with caching headers for the loaded data, finished as a 304 if the client's copy is current
+    version = cache.data_version()
+    response = Response(mimetype=mimetype)
+    response.set_etag(etag)
+    if version.loaded is not None:
+        response.last_modified = version.loaded
+    cache.version_headers(response, request.args.get('v') == version.version)
+    # answer revalidation without rendering anything
+    if request.if_none_match.contains(etag):
+        response.status_code = 304
+    return response
+
+def wait_for_chart(spec, name):
+    # the chart's PNG, or None if it wasn't drawn in time
+    with metrics.span('chart.wait', name):
+        try:
+            return cache.chart(*spec).result(timeout=render.TIMEOUT)
+        except TimeoutError:
+            return None
+
+@app.route('/chart/<dataset>/<metric>/<int:mno>.png', methods=['GET'])
+def chart(dataset, metric, mno):
+    spec, response = chart_response(dataset, metric, mno, 'image/png')
+    if spec is None:
+        return response
+    png = wait_for_chart(spec, f'{dataset}/{metric}')
+    if png is None:
+        return Response(status=503)
+    response.set_data(png)
+    return response.make_conditional(request)
+
+@app.route('/chart/<dataset>/<metric>/<int:mno>.json', methods=['GET'])
+def chart_data(dataset, metric, mno):
+    # what the PNG is drawn from, for drawing it in the browser instead
+    spec, response = chart_response(dataset, metric, mno, 'application/json', '-json')
+    if spec is None:
+        return response
+    title, years, types, rows = spec
+    # untyped charts have one value a year rather than a row
+    rows = [row if isinstance(row, (list, tuple)) else [row] for row in rows]
+    response.set_data(json.dumps({
+        'title': title,
+        'years': years,
+        'types': types,
+        'rows': [[None if value is None else float(value) for value in row] for row in rows],
+    }, separators=(',', ':')))
+    return response.make_conditional(request)
+
+def compared_mnos():
+    # ?mnos=1,2,3 or ?county=Bergen, or None if neither names any municipality
+    if 'county' in request.args:
+        return batch.county_mnos(request.args['county'])
+    return batch.parse_mnos(request.args.get('mnos'))
+
+@app.route('/compare.json', methods=['GET'])
+def compare_json():
+    # like /compare.json?county=Bergen&datasets=population,vmt_miles, for many municipalities in one request
+    mnos = compared_mnos()
+    datasets = request.args.get('datasets')
+    datasets = list(dict.fromkeys(datasets.split(','))) if datasets else list(batch.DATASETS)
+    if mnos is None or any(dataset not in batch.DATASETS for dataset in datasets):
+        return Response(status=400)
+    version = cache.data_version().version
+    etag = hashlib.sha256(f'{version}\0{mnos}\0{datasets}'.encode()).hexdigest()
+    response = versioned_response(etag, 'application/json')
+    if response.status_code == 304:
+        return response
+    response.set_data(json.dumps(batch.to_json(mnos, datasets), separators=(',', ':')))
+    return response.make_conditional(request)
+
+@app.route('/compare.png', methods=['GET'])
+def compare_chart():
+    # like /compare.png?county=Bergen&metric=vmt_miles, or &metric=mot&type=2 for one type
+    mnos = compared_mnos()
+    metric = request.args.get('metric')
+    type = request.args.get('type', type=int)
+    if mnos is None or metric not in batch.METRICS or ('type' in request.args and type is None) or len(mnos) > batch.CHART_LIMIT:
+        return Response(status=400)
+    spec = batch.chart_spec(metric, mnos, type)
+    if spec is None:
+        return Response(status=400)
+    if not spec[1]:
+        return Response(status=404)
+    version = cache.data_version()
+    response = versioned_response(cache.chart_key(version.version, *spec), 'image/png')
+    if response.status_code == 304:
+        return response
+    png = wait_for_chart(spec, f'compare/{metric}')
+    if png is None:
+        return Response(status=503)
+    response.set_data(png)
+    return response.make_conditional(request)
+
+def map_geometry():
+    # where the map gets its shapes: tiles if they were built, else the whole geometry
+    index = geometry.tile_index()
+    return {
+        'geometry_path': url_for('geometry_handler', v=geometry.version()),
+        'tile_path': '' if index is None else '/tiles/{z}/{x}/{y}?v=' + index['version'],
+        'tile_min_zoom': 0 if index is None else index['min_zoom'],
+        'tile_max_zoom': 0 if index is None else index['max_zoom'],
+    }
 
 @app.route('/ghg', methods=['POST'])
-def ghg():
-    year = int(request.form['year'])
-    return render_template('map.html', query_path=f'/ghg.json?year={year}', color_map='heatmap', display_type='co2', title=f'CO₂ emissions in {year}')
+@app.route('/ghg/<int:year>/', methods=['GET'])
+def ghg(year=None):
+    if year is None:
+        year = request.form.get('year', type=int)
+    if year is None:
+        return Response(status=400)
+    return render_page('map.html', **map_geometry(), query_path=f'/choropleth/ghg/{year}.json', color_map='heatmap', display_type='co2', title=f'CO₂ emissions in {year}')
 
 @app.route('/mot2', methods=['POST'])
-def mot2():
-    year = int(request.form['year'])
-    t1 = int(request.form['t1'])
-    t2 = int(request.form['t2'])
+@app.route('/mot2/<int:year>/<int:t1>/<int:t2>/', methods=['GET'])
+def mot2(year=None, t1=None, t2=None):
+    if year is None:
+        year = request.form.get('year', type=int)
+        t1 = request.form.get('t1', type=int)
+        t2 = request.form.get('t2', type=int)
     # validate range
-    if t1 >= len(MOT_ENUM) or t1 < 0 or t2 >= len(MOT_ENUM) or t2 < 0:
+    if year is None or t1 is None or t2 is None or t1 >= len(mot_enum()) or t1 < 0 or t2 >= len(mot_enum()) or t2 < 0:
         return Response(status=400)
-    return render_template(
+    return render_page(
         'map.html',
-        query_path=f'/mot.json?year={year}&t1={t1}&t2={t2}',
+        **map_geometry(),
+        query_path=f'/choropleth/mot/{year}/{t1}/{t2}.json',
         color_map='diverging',
         display_type='mot',
-        t1=MOT_ENUM[t1],
-        t2=MOT_ENUM[t2],
-        title=f'Compare {MOT_ENUM[t1]} to {MOT_ENUM[t2]} in {year}',
+        t1=mot_enum()[t1],
+        t2=mot_enum()[t2],
+        title=f'Compare {mot_enum()[t1]} to {mot_enum()[t2]} in {year}',
     )
 
 @app.route('/population.json', methods=['GET'])
-def population_handler():
-    # cast year to int to avoid injection
-    year = int(request.args.get('year'))
-    return json.dumps({i[0]: i[1] for i in connect(f'SELECT mno, pop FROM population WHERE year = {year};')})
+@app.route('/population/<int:year>.json', methods=['GET'])
+def population_handler(year=None):
+    if year is None:
+        year = request.args.get('year', type=int)
+    if year is None:
+        return Response(status=400)
+    population = snapshot.table('population')
+    if population is not None:
+        return json.dumps(population.values('pop', year))
+    return json.dumps({i[0]: i[1] for i in queries.POPULATION(year)})
+
+def ghg_values(year):
+    population = snapshot.table('population')
+    if population is not None:
+        return population.values('co2', year)
+    return {i[0]: i[1] for i in queries.GHG(year)}
+
+def mot_types(value):
+    # a comma-separated list of type indices, or None if any is out of range
+    try:
+        types = [int(t) for t in value.split(',')]
+    except (AttributeError, ValueError):
+        return None
+    if not types or any(t >= len(mot_enum()) or t < 0 for t in types):
+        return None
+    return types
+
+def legend_range(values, color_map):
+    high = max(values, default=0)
+    low = min(values, default=0)
+    if color_map == 'heatmap':
+        # if heatmap, minimum will be set to 0 so the legend doesn't start above 0
+        low = 0
+        # adjust max to nearest 10,000 above
+        if high % 10000 != 0:
+            high += 10000 - high % 10000
+    else:
+        # balance both ends of range if it's a diverging, so that 0.5 stays centered
+        length = max(abs(high - 0.5), abs(low - 0.5))
+        # adjust to nearest 10% above
+        length = 0.5 - math.copysign(1, 0.5 - length) * math.floor(20 * abs(0.5 - length)) * 0.05
+        high = 0.5 + length
+        low = 0.5 - length
+    return low, high
+
+# number of steps drawn in the map legend
+LEGEND_STEPS = 20
+
+def choropleth_payload(values, color_map):
+    # everything the map needs besides geometry, as columns indexed alike
+    snap = snapshot.get()
+    mnos = sorted(values)
+    column = [values[mno] for mno in mnos]
+    low, high = legend_range(column, color_map)
+    return {
+        'mno': mnos,
+        'value': column,
+        'name': [snap.name[snap.index[mno]] for mno in mnos],
+        'county': [snap.county[snap.index[mno]] for mno in mnos],
+        'min': low,
+        'max': high,
+        # legend values from top to bottom
+        'breaks': [high - (high - low) * i / LEGEND_STEPS for i in range(LEGEND_STEPS + 1)],
+    }
 
 @app.route('/ghg.json', methods=['GET'])
-def ghg_json():
-    # cast year to int to avoid injection
-    year = int(request.args.get('year'))
-    return json.dumps({i[0]: i[1] for i in connect(f'SELECT mno, co2 FROM population WHERE year = {year};')})
+@app.route('/ghg/<int:year>.json', methods=['GET'])
+def ghg_json(year=None):
+    if year is None:
+        year = request.args.get('year', type=int)
+    if year is None:
+        return Response(status=400)
+    return json.dumps(ghg_values(year))
 
 @app.route('/mot.json', methods=['GET'])
-def mot_json():
-    # cast year to int to avoid injection
-    year = int(request.args.get('year'))
-    t1 = int(request.args.get('t1'))
-    t2 = int(request.args.get('t2'))
-    # validate range
-    if t1 >= len(MOT_ENUM) or t1 < 0 or t2 >= len(MOT_ENUM) or t2 < 0:
+@app.route('/mot/<int:year>/<t1>/<t2>.json', methods=['GET'])
+def mot_json(year=None, t1=None, t2=None):
+    if year is None:
+        year = request.args.get('year', type=int)
+        t1 = request.args.get('t1')
+        t2 = request.args.get('t2')
+    if year is None:
         return Response(status=400)
-    # comparison algorithm: 0 for all t1, 1 for all t2
-    t1_values = connect(f"SELECT mno, percentage FROM means_of_transportation WHERE year = {year} AND type = '{MOT_ENUM[t1]}' ORDER BY mno;")
-    t2_values = connect(f"SELECT mno, percentage FROM means_of_transportation WHERE year = {year} AND type = '{MOT_ENUM[t2]}' ORDER BY mno;")
-    result = {}
-    for t1_row, t2_row in zip(t1_values, t2_values):
-        t1_mno, t1_percentage = t1_row
-        t2_mno, t2_percentage = t2_row
-        # should be guaranteed by ORDER BY
-        assert t1_mno == t2_mno
-        result[t1_mno] = ((float(t1_percentage) - float(t2_percentage)) + 100.0) / 200.0
-    return json.dumps(result)
+    # each of t1 and t2 may be a group of types, like t1=0,2
+    t1 = mot_types(t1)
+    t2 = mot_types(t2)
+    if t1 is None or t2 is None:
+        return Response(status=400)
+    return json.dumps(comparison.scores(year, t1, t2))
+
+@app.route('/choropleth.json', methods=['GET'])
+@app.route('/choropleth/<dataset>/<int:year>.json', methods=['GET'])
+@app.route('/choropleth/<dataset>/<int:year>/<t1>/<t2>.json', methods=['GET'])
+def choropleth_json(dataset=None, year=None, t1=None, t2=None):
+    if year is None:
+        dataset = request.args.get('dataset')
+        year = request.args.get('year', type=int)
+        t1 = request.args.get('t1')
+        t2 = request.args.get('t2')
+    if year is None:
+        return Response(status=400)
+    if dataset == 'ghg':
+        return json.dumps(choropleth_payload(ghg_values(year), 'heatmap'))
+    elif dataset == 'mot':
+        t1 = mot_types(t1)
+        t2 = mot_types(t2)
+        if t1 is None or t2 is None:
+            return Response(status=400)
+        return json.dumps(choropleth_payload(comparison.scores(year, t1, t2), 'diverging'))
+    return Response(status=400)
 
 @app.route('/transportation.json', methods=['GET'])
-def transportation_handler():
-    # cast year to int to avoid injection
-    year = int(request.args.get('year'))
+@app.route('/transportation/<int:year>.json', methods=['GET'])
+def transportation_handler(year=None):
+    if year is None:
+        year = request.args.get('year', type=int)
+    if year is None:
+        return Response(status=400)
     # for now, this one is hardcoded for working from home percentage
-    return json.dumps({i[0]: float(i[1]) for i in connect(f"SELECT mno, percentage FROM means_of_transportation WHERE year = {year} and type = 'worked at home';")})
+    transportation = snapshot.table('means_of_transportation')
+    if transportation is not None:
+        return json.dumps(transportation.values('percentage', year, 'worked at home'))
+    return json.dumps({i[0]: float(i[1]) for i in queries.TRANSPORTATION(year, 'worked at home')})
+
+@app.route('/rankings.json', methods=['GET'])
+def rankings_handler():
+    # the metrics that can be ranked, and their years
+    return json.dumps(rankings.metrics())
+
+@app.route('/top.json', methods=['GET'])
+def top_handler():
+    # like /top.json?metric=transportation:bicycle&year=2020&n=5&min_pop=10000
+    metric = request.args.get('metric')
+    year = request.args.get('year', type=int)
+    n = request.args.get('n', 10, type=int)
+    by = request.args.get('by', 'value')
+    order = request.args.get('order', 'desc')
+    min_pop = request.args.get('min_pop', 0, type=int)
+    if not rankings.exists(metric, year) or n is None or n < 0 or by not in ('value', 'delta') or order not in ('asc', 'desc') or min_pop is None:
+        return Response(status=400)
+    return json.dumps(rankings.top(metric, year, n, by, order == 'asc', min_pop))
+
+@app.route('/rank.json', methods=['GET'])
+def rank_handler():
+    metric = request.args.get('metric')
+    year = request.args.get('year', type=int)
+    mno = request.args.get('mno', type=int)
+    if not rankings.exists(metric, year) or mno is None:
+        return Response(status=400)
+    result = rankings.rank(metric, year, mno)
+    if result is None:
+        return Response(status=404)
+    return json.dumps(result)
+
+@app.route('/totals.json', methods=['GET'])
+def totals_handler():
+    # only sums and ratios of them have totals, so other metrics have none
+    metric = request.args.get('metric')
+    year = request.args.get('year', type=int)
+    if not rankings.exists(metric, year):
+        return Response(status=400)
+    return json.dumps(rankings.totals(metric, year))
+
+@app.route('/geometry.json', methods=['GET'])
+def geometry_handler():
+    # precompressed, so much smaller than static/geometry.json
+    return geometry.response()
+
+@app.route('/tiles/<int:z>/<int:x>/<int:y>', methods=['GET'])
+def tile_handler(z, x, y):
+    # geometry simplified for one zoom level, built by convert_geojson.py
+    return geometry.tile_response(z, x, y)
 
 @app.route('/names.json', methods=['GET'])
 def names_handler():
-    # get data from database
-    return json.dumps({i[0]: { 'name': i[1], 'county': i[2] } for i in connect(f'SELECT * FROM municipality;')})
+    # names only change when the database is reloaded
+    snap = snapshot.get()
+    return json.dumps({mno: { 'name': name, 'county': county } for mno, name, county in zip(snap.mno, snap.name, snap.county)})
 
 
 @app.route("/redirectURL", methods=["GET"])
@@ -316,6 +616,6 @@ def redirectURL():
     return redirect("https://www.sustainablejersey.com/resources/data-center/sustainable-jersey-data-resources/", code=302)
 
 if __name__ == '__main__':
-    port = int(os.environment.get('PORT', 5000))
+    port = int(os.environ.get('PORT', 5000))
     app.run(debug = True, host='0.0.0.0', port=port)
 
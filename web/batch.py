@@ -0,0 +1,156 @@
+"""
+The series of many municipalities at once, for comparing them.
+
+A list of mnos, or a county, is answered with one query per table for all of
+them (mno = ANY($1), in order of mno and year) instead of a query per table
+for each municipality, or sliced out of the snapshot if it's loaded. Each
+municipality's years of each dataset come back as a YearMatrix, the same as
+for its own pages.
+"""
+
+import itertools
+import math
+
+import metrics
+import queries
+import snapshot
+import tables
+
+# the columns BY_MNOS reads of each table, after mno, year and any type
+COLUMNS = {
+    'population': ('EVs', 'PersonalVehicles', 'Pop', 'CO2'),
+    'on_road_vehicle': ('Miles', 'CO2'),
+    'means_of_transportation': ('Percentage',),
+}
+# dataset -> its table and columns, with a column per type of the one column of a typed table
+DATASETS = {
+    'population': ('population', COLUMNS['population']),
+    'mot': ('means_of_transportation', ('Percentage',)),
+    'vmt_miles': ('on_road_vehicle', ('Miles',)),
+    'vmt_co2': ('on_road_vehicle', ('CO2',)),
+}
+
+def total(values):
+    # of each year's types, missing only if every type is
+    import numpy as np
+    missing = np.isnan(values).all(axis=1)
+    return np.where(missing, np.nan, np.nansum(values, axis=1))
+
+# metrics charted for each municipality: (title, dataset, each year's value from its matrix values),
+# with None for typed datasets that can only be charted one type at a time
+METRICS = {
+    'population': ('Population', 'population', lambda values: values[:, 2]),
+    'co2': ('CO2 Emissions in Tons', 'population', lambda values: values[:, 3]),
+    'evs': ('Number of EVs', 'population', lambda values: values[:, 0]),
+    'ev_percentage': ('Percentage of EVs out of Personal Vehicles', 'population', lambda values: 100 * (values[:, 0] / values[:, 1])),
+    'per_person': ('Number of Vehicles per Person', 'population', lambda values: values[:, 1] / values[:, 2]),
+    'vmt_miles': ('Miles Traveled by On-road Vehicles', 'vmt_miles', total),
+    'vmt_co2': ('CO2 Emissions in Tons by On-road Vehicles', 'vmt_co2', total),
+    'mot': ('Percentage of Total Means of Transportation', 'mot', None),
+}
+# municipalities one chart can tell apart
+CHART_LIMIT = 100
+
+def county_mnos(county):
+    """The mnos of a county, in order, or None if there's no such county."""
+    snap = snapshot.get()
+    county = county.strip().lower()
+    mnos = [mno for mno, c in zip(snap.mno, snap.county) if c.lower() == county]
+    return mnos or None
+
+def parse_mnos(value):
+    # a comma-separated list of known mnos without repeats, or None
+    try:
+        mnos = list(dict.fromkeys(int(mno) for mno in value.split(',')))
+    except (AttributeError, ValueError):
+        return None
+    index = snapshot.get().index
+    if not mnos or any(mno not in index for mno in mnos):
+        return None
+    return mnos
+
+def typed(table):
+    return table in snapshot.TYPED_TABLES
+
+def from_database(table, mnos, datasets):
+    # one query for every municipality, whose rows are contiguous since they're ordered by mno
+    rows = {mno: list(group) for mno, group in itertools.groupby(queries.BY_MNOS[table](mnos), key=lambda row: row[0])}
+    types = queries.enum_values(snapshot.TYPED_TABLES[table]) if typed(table) else None
+    result = {mno: {} for mno in mnos}
+    for dataset in datasets:
+        columns = DATASETS[dataset][1]
+        for mno in mnos:
+            mine = rows.get(mno, [])
+            if types is None:
+                result[mno][dataset] = tables.YearMatrix.from_rows([row[1:] for row in mine], columns)
+            else:
+                i = 3 + COLUMNS[table].index(columns[0])
+                result[mno][dataset] = tables.YearMatrix.from_typed_rows([(row[1], row[2], row[i]) for row in mine], types)
+    return result
+
+def series(mnos, datasets=tuple(DATASETS)):
+    """Each municipality's YearMatrix of each dataset, by mno and then dataset."""
+    result = {mno: {} for mno in mnos}
+    by_table = {}
+    for dataset in datasets:
+        by_table.setdefault(DATASETS[dataset][0], []).append(dataset)
+    for table, table_datasets in by_table.items():
+        with metrics.span('batch', table):
+            snapshot_table = snapshot.table(table)
+            if snapshot_table is None:
+                for mno, matrices in from_database(table, mnos, table_datasets).items():
+                    result[mno].update(matrices)
+                continue
+            for dataset in table_datasets:
+                columns = DATASETS[dataset][1]
+                for mno in mnos:
+                    result[mno][dataset] = snapshot_table.matrix(columns, mno)
+    return result
+
+def to_json(mnos, datasets=tuple(DATASETS)):
+    """The series of each municipality with its name and county, in the order given."""
+    snap = snapshot.get()
+    matrices = series(mnos, datasets)
+    municipalities = []
+    for mno in mnos:
+        i = snap.index[mno]
+        municipality = {'mno': mno, 'name': snap.name[i], 'county': snap.county[i]}
+        for dataset in datasets:
+            matrix = matrices[mno][dataset]
+            municipality[dataset] = {'years': matrix.years, 'columns': matrix.columns, 'values': matrix.json_rows()}
+        municipalities.append(municipality)
+    return {'municipalities': municipalities}
+
+def chart_spec(metric, mnos, type=None):
+    """
+    A chart of one metric with a group of bars per municipality and a bar per
+    year, or None if the metric needs a type and wasn't given a valid one.
+    """
+    import numpy as np
+    title, dataset, calculation = METRICS[metric]
+    if type is not None:
+        if not typed(DATASETS[dataset][0]):
+            return None
+        types = queries.enum_values(snapshot.TYPED_TABLES[DATASETS[dataset][0]])
+        if not 0 <= type < len(types):
+            return None
+        title = f'{title}: {types[type]}'
+        calculation = lambda values: values[:, type]
+    elif calculation is None:
+        return None
+    snap = snapshot.get()
+    matrices = series(mnos, (dataset,))
+    # each municipality's value by year
+    by_year = {}
+    for position, mno in enumerate(mnos):
+        matrix = matrices[mno][dataset]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            values = calculation(matrix.values)
+        for year, value in zip(matrix.years, values.tolist()):
+            by_year.setdefault(year, [None] * len(mnos))[position] = value if math.isfinite(value) else None
+    years = sorted(by_year)
+    names = [snap.name[snap.index[mno]] for mno in mnos]
+    # the same name can be in more than one county
+    if len({snap.county[snap.index[mno]] for mno in mnos}) > 1:
+        names = [f'{name} ({snap.county[snap.index[mno]]})' for name, mno in zip(names, mnos)]
+    return title, years, names, [by_year[year] for year in years]
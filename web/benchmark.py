@@ -0,0 +1,318 @@
+# Load test for the web app.
+# Starts the server as run_server.sh does, unless --url points at one already
+# running, waits until it answers, and then replays a mix of page, chart and data
+# requests at each concurrency level for a while. For each level it reports
+# throughput, latency percentiles overall and per endpoint, the peak memory of
+# each server process and the peak number of database connections, as JSON.
+# The database server must be running and loaded.
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+
+import psycopg2
+import requests
+from config import config
+
+WEB = os.path.dirname(os.path.abspath(__file__))
+
+# endpoint -> relative share of the traffic
+DEFAULT_MIX = {
+    'home': 1,
+    'municipality': 4,
+    'mot': 3,
+    'vmt': 2,
+    'ev': 2,
+    'ghg.json': 2,
+    'mot.json': 2,
+    'names.json': 1,
+    # what the pages and map ask for next, which covers chart rendering and its cache
+    'chart.png': 6,
+    'chart.json': 1,
+    'choropleth.json': 2,
+    'geometry.json': 1,
+}
+# the charts each municipality has, by dataset and metric, as in app.CHARTS
+CHARTS = (
+    ('mot', 'percentage'),
+    ('vmt', 'miles'),
+    ('vmt', 'co2'),
+    ('ev', 'ev_percentage'),
+    ('ev', 'per_person'),
+)
+
+def parse_mix(value):
+    # like home=1,mot=3
+    mix = {}
+    for item in value.split(','):
+        name, _, weight = item.partition('=')
+        if name not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(f'unknown endpoint {name!r}')
+        mix[name] = float(weight or 1)
+    return mix
+
+def parse_levels(value):
+    return [int(level) for level in value.split(',')]
+
+class Data:
+    """What requests can ask for, read from the database."""
+    def __init__(self, cur):
+        cur.execute('SELECT mno FROM municipality')
+        self.mnos = [row[0] for row in cur.fetchall()]
+        cur.execute('SELECT DISTINCT mno FROM on_road_vehicle')
+        self.vehicle_mnos = [row[0] for row in cur.fetchall()]
+        cur.execute('SELECT DISTINCT year FROM population')
+        self.years = [row[0] for row in cur.fetchall()]
+        cur.execute('SELECT COUNT(*) FROM UNNEST(ENUM_RANGE(NULL::means_of_transportation_type))')
+        self.mot_types = cur.fetchone()[0]
+
+    def request(self, endpoint):
+        """A random request to an endpoint, as (method, path, form)."""
+        if endpoint == 'home':
+            return 'GET', '/', None
+        if endpoint in ('municipality', 'mot', 'ev'):
+            return 'POST', '/' + endpoint, {'mno': random.choice(self.mnos)}
+        if endpoint == 'vmt':
+            return 'POST', '/vmt', {'mno': random.choice(self.vehicle_mnos)}
+        if endpoint in ('chart.png', 'chart.json'):
+            dataset, metric = random.choice(CHARTS)
+            mno = random.choice(self.vehicle_mnos if dataset == 'vmt' else self.mnos)
+            return 'GET', f'/chart/{dataset}/{metric}/{mno}.{endpoint.split(".")[1]}', None
+        if endpoint == 'geometry.json':
+            return 'GET', '/geometry.json', None
+        year = random.choice(self.years)
+        if endpoint == 'ghg.json':
+            return 'GET', f'/ghg.json?year={year}', None
+        if endpoint == 'mot.json':
+            t1, t2 = random.sample(range(self.mot_types), 2)
+            return 'GET', f'/mot.json?year={year}&t1={t1}&t2={t2}', None
+        if endpoint == 'choropleth.json':
+            if random.random() < 0.5:
+                return 'GET', f'/choropleth/ghg/{year}.json', None
+            t1, t2 = random.sample(range(self.mot_types), 2)
+            return 'GET', f'/choropleth/mot/{year}/{t1}/{t2}.json', None
+        return 'GET', '/names.json', None
+
+def percentile(values, p):
+    # nearest rank, of sorted values
+    if not values:
+        return None
+    return values[min(len(values) - 1, max(0, round(p / 100 * len(values)) - 1))]
+
+def latency_summary(latencies):
+    latencies = sorted(latencies)
+    return {
+        'p50': percentile(latencies, 50),
+        'p95': percentile(latencies, 95),
+        'p99': percentile(latencies, 99),
+        'max': latencies[-1] if latencies else None,
+    }
+
+def process_tree(pid):
+    """pid and every process descended from it."""
+    parents = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as file:
+                stat = file.read()
+        except OSError:
+            continue
+        # the command name is in parentheses and may contain spaces
+        parents.setdefault(int(stat.rsplit(')', 1)[1].split()[1]), []).append(int(entry))
+    tree = [pid]
+    for parent in tree:
+        tree.extend(parents.get(parent, ()))
+    return tree
+
+def rss_mb(pid):
+    """A process's command and resident memory in megabytes, or None if it's gone."""
+    try:
+        with open(f'/proc/{pid}/cmdline', 'rb') as file:
+            command = file.read().replace(b'\0', b' ').decode(errors='replace').strip()
+        with open(f'/proc/{pid}/status') as file:
+            for line in file:
+                if line.startswith('VmRSS:'):
+                    return command, int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+def connection_counts(cur):
+    cur.execute('''
+        SELECT COALESCE(state, 'unknown'), COUNT(*) FROM pg_stat_activity
+        WHERE datname = current_database() AND pid <> pg_backend_pid()
+        GROUP BY 1
+    ''')
+    return dict(cur.fetchall())
+
+class Sampler(threading.Thread):
+    """Keeps the peak memory of the server's processes and its database connections."""
+    def __init__(self, pid, cur, interval):
+        super().__init__(daemon=True)
+        self.pid = pid
+        self.cur = cur
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.rss = {}
+        self.connections = 0
+        self.connection_states = {}
+
+    def sample(self):
+        if self.pid is not None:
+            for pid in process_tree(self.pid):
+                usage = rss_mb(pid)
+                if usage is not None:
+                    command, mb = usage
+                    peak = self.rss.get(pid, {'command': command, 'peak_mb': 0})
+                    peak['peak_mb'] = max(peak['peak_mb'], mb)
+                    self.rss[pid] = peak
+        counts = connection_counts(self.cur)
+        if sum(counts.values()) > self.connections:
+            self.connections = sum(counts.values())
+            self.connection_states = counts
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.sample()
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+        self.sample()
+
+def run_level(url, data, mix, concurrency, duration, pid, cur, interval):
+    endpoints = list(mix)
+    weights = [mix[endpoint] for endpoint in endpoints]
+    results = []
+    results_lock = threading.Lock()
+    deadline = time.monotonic() + duration
+
+    def client():
+        session = requests.Session()
+        mine = []
+        while time.monotonic() < deadline:
+            endpoint = random.choices(endpoints, weights)[0]
+            method, path, form = data.request(endpoint)
+            start = time.perf_counter()
+            try:
+                ok = session.request(method, url + path, data=form).status_code == 200
+            except requests.RequestException:
+                ok = False
+            mine.append((endpoint, (time.perf_counter() - start) * 1000, ok))
+        with results_lock:
+            results.extend(mine)
+
+    sampler = Sampler(pid, cur, interval)
+    sampler.start()
+    start = time.perf_counter()
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    sampler.stop()
+
+    return {
+        'concurrency': concurrency,
+        'seconds': elapsed,
+        'requests': len(results),
+        'errors': sum(not ok for _, _, ok in results),
+        'throughput': len(results) / elapsed,
+        'latency_ms': latency_summary([ms for _, ms, _ in results]),
+        'endpoints': {
+            endpoint: dict(
+                requests=sum(e == endpoint for e, _, _ in results),
+                latency_ms=latency_summary([ms for e, ms, _ in results if e == endpoint]),
+            )
+            for endpoint in endpoints
+        },
+        'rss_mb': {str(pid): usage for pid, usage in sampler.rss.items()},
+        # an upper bound, since processes peak at different times
+        'rss_total_mb': sum(usage['peak_mb'] for usage in sampler.rss.values()),
+        'db_connections': {'peak': sampler.connections, 'by_state': sampler.connection_states},
+    }
+
+def wait_until_up(url, server, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server is not None and server.poll() is not None:
+            raise RuntimeError('the server exited while starting')
+        try:
+            if requests.get(url + '/names.json', timeout=1).status_code == 200:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError(f'the server did not answer within {timeout} seconds')
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Load test the web app and report throughput, latency, memory and database connections as JSON.')
+    parser.add_argument('--url', help='benchmark a server already running here instead of starting one')
+    parser.add_argument('--pid', type=int, help='process id of the server given by --url, to report its memory')
+    parser.add_argument('--port', type=int, default=5050, help='port to start the server on (default: 5050)')
+    parser.add_argument('--concurrency', type=parse_levels, default=[1, 4, 16], help='comma-separated numbers of clients at once (default: 1,4,16)')
+    parser.add_argument('--duration', type=float, default=10, help='seconds to run each level (default: 10)')
+    parser.add_argument('--warmup', type=float, default=2, help='seconds of traffic before measuring, not reported (default: 2)')
+    parser.add_argument('--mix', type=parse_mix, default=DEFAULT_MIX, help='comma-separated endpoint=weight (default: ' + ','.join(f'{k}={v}' for k, v in DEFAULT_MIX.items()) + ')')
+    parser.add_argument('--sample-interval', type=float, default=0.5, help='seconds between memory and connection samples (default: 0.5)')
+    parser.add_argument('--output', help='write the report here instead of to standard output')
+    args = parser.parse_args()
+
+    os.chdir(WEB)
+    server = None
+    url = args.url
+    pid = args.pid
+    if url is None:
+        url = f'http://127.0.0.1:{args.port}'
+        server = subprocess.Popen(
+            [sys.executable, '-m', 'flask', 'run', '--port', str(args.port)],
+            env=dict(os.environ, FLASK_APP='app.py'),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        pid = server.pid
+    url = url.rstrip('/')
+    try:
+        started = time.perf_counter()
+        wait_until_up(url, server, 60)
+        startup = time.perf_counter() - started
+        conn = psycopg2.connect(**config())
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            data = Data(cur)
+            if args.warmup > 0:
+                run_level(url, data, args.mix, max(args.concurrency), args.warmup, None, cur, args.sample_interval)
+            levels = []
+            for concurrency in args.concurrency:
+                levels.append(run_level(url, data, args.mix, concurrency, args.duration, pid, cur, args.sample_interval))
+                print(f"{concurrency:4} clients: {levels[-1]['throughput']:8.1f} requests/s, "
+                      f"p50 {levels[-1]['latency_ms']['p50']:.1f} ms, p99 {levels[-1]['latency_ms']['p99']:.1f} ms, "
+                      f"{levels[-1]['errors']} errors", file=sys.stderr)
+        conn.close()
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    report = {
+        'url': url,
+        'startup_seconds': startup if server is not None else None,
+        'duration': args.duration,
+        'mix': args.mix,
+        'levels': levels,
+    }
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    sys.exit(1 if any(level['errors'] for level in levels) else 0)
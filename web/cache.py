@@ -0,0 +1,190 @@
+"""
+Caching of rendered charts.
+
+A chart only depends on its title, years, types and rows, and those only
+change when the database is reloaded. Rendered PNGs are kept in a
+size-bounded LRU cache in memory, with an optional second tier on disk, keyed
+by a hash of the chart inputs and the data version stamp that the loader in
+db_scripts/convert.py writes. Reloading the database changes the stamp, which
+drops everything cached for the old data.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from concurrent.futures import Future
+
+import psycopg2
+
+import queries
+import render
+from config import config
+
+CACHE = config(section='cache', defaults={
+    'max_bytes': str(64 * 1024 * 1024),
+    'directory': '',
+    'version_check_interval': '10',
+})
+MAX_BYTES = int(CACHE['max_bytes'])
+# leave empty to keep charts in memory only
+DIRECTORY = CACHE['directory']
+# seconds between checks for a reloaded database
+VERSION_CHECK_INTERVAL = float(CACHE['version_check_interval'])
+
+# a year, for URLs carrying a version, which never change
+MAX_AGE = 365 * 24 * 60 * 60
+
+DataVersion = namedtuple('DataVersion', ('version', 'loaded'))
+
+_version = DataVersion('', None)
+_version_checked = None
+
+def data_version():
+    """Get the version stamp of the loaded data, re-read every few seconds."""
+    global _version, _version_checked
+    now = time.monotonic()
+    if _version_checked is None or now - _version_checked >= VERSION_CHECK_INTERVAL:
+        try:
+            rows = queries.DATA_VERSION()
+        except psycopg2.errors.UndefinedTable:
+            # database loaded before versions were stamped
+            rows = []
+        _version = DataVersion(*rows[0]) if rows else DataVersion('', None)
+        _version_checked = now
+    return _version
+
+def version_headers(response, versioned):
+    """
+    Let a response be kept for good if its URL carries the version of what it
+    holds, and otherwise make clients revalidate it against its ETag.
+    """
+    response.cache_control.public = True
+    if versioned:
+        response.cache_control.max_age = MAX_AGE
+        response.cache_control.immutable = True
+    else:
+        response.cache_control.no_cache = True
+
+def chart_key(version, title, years, types, rows):
+    """Hash the inputs of a chart into its cache key."""
+    inputs = json.dumps([version, title, list(years), list(types), rows], default=str)
+    return hashlib.sha256(inputs.encode()).hexdigest()
+
+class ChartCache:
+    def __init__(self, max_bytes=MAX_BYTES, directory=DIRECTORY):
+        self.max_bytes = max_bytes
+        self.directory = directory or None
+        self.entries = OrderedDict()
+        self.size = 0
+        self.version = None
+        self.lock = threading.Lock()
+
+    def set_version(self, version):
+        """
+        Switch to the loaded data's version, returning whether version is it.
+        Called with the lock held.
+        """
+        if version == self.version:
+            return True
+        # a request that read the stamp just before a reload mustn't switch back to it
+        if version != data_version().version:
+            return False
+        self.version = version
+        self.entries.clear()
+        self.size = 0
+        if self.directory is not None:
+            self.prune_directory()
+        return True
+
+    def prune_directory(self):
+        # only remove directories that look like version stamps
+        if not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name != self.version and re.fullmatch(r'[0-9a-f]{16}', name) and os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+
+    def path(self, key):
+        return os.path.join(self.directory, self.version, key + '.png')
+
+    def get(self, version, key):
+        """Look up a chart, returning None if it isn't cached."""
+        with self.lock:
+            if not self.set_version(version):
+                return None
+            png = self.entries.get(key)
+            if png is not None:
+                self.entries.move_to_end(key)
+                return png
+            if self.directory is None:
+                return None
+            path = self.path(key)
+        try:
+            with open(path, 'rb') as file:
+                png = file.read()
+        except FileNotFoundError:
+            return None
+        self.put(version, key, png, write=False)
+        return png
+
+    def put(self, version, key, png, write=True):
+        """Store a chart, evicting the least recently used ones to make room."""
+        with self.lock:
+            if not self.set_version(version) or len(png) > self.max_bytes:
+                return
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                return
+            self.entries[key] = png
+            self.size += len(png)
+            while self.size > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= len(evicted)
+            if self.directory is None or not write:
+                return
+            path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # write then rename, so readers never see a partial file
+        temp = f'{path}.{os.getpid()}.{threading.get_ident()}'
+        with open(temp, 'wb') as file:
+            file.write(png)
+        os.replace(temp, path)
+
+charts = ChartCache()
+
+# charts being rendered and when to stop waiting for them, by key
+_rendering = {}
+_rendering_lock = threading.Lock()
+
+def chart(title, years, types, rows):
+    """Get a bar chart as a Future of PNG bytes, rendering it only on a cache miss."""
+    version = data_version().version
+    key = chart_key(version, title, years, types, rows)
+    png = charts.get(version, key)
+    if png is not None:
+        future = Future()
+        future.set_result(png)
+        return future
+    with _rendering_lock:
+        # already being rendered, say for the page that shows it,
+        # unless it has taken so long that it may never finish
+        rendering = _rendering.get(key)
+        if rendering is not None and time.monotonic() < rendering[1]:
+            return rendering[0]
+        future = render.submit(title, years, types, rows)
+        _rendering[key] = future, time.monotonic() + render.TIMEOUT
+    def store(future):
+        if future.exception() is None:
+            charts.put(version, key, future.result())
+        with _rendering_lock:
+            # a newer render may have taken the key over
+            if _rendering.get(key, (None,))[0] is future:
+                del _rendering[key]
+    future.add_done_callback(store)
+    return future
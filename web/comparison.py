@@ -0,0 +1,83 @@
+"""
+Comparisons between means of transportation.
+
+All of a year's percentages are pivoted into one types × municipalities
+matrix, read from the snapshot or fetched with a single query, and kept until
+the data is reloaded. Scores for every pair of types are worked out from it
+in one go, and comparisons between groups of types sum the groups' rows.
+NumPy is imported with the first comparison rather than with this module.
+"""
+
+import threading
+
+import queries
+import snapshot
+
+_version = None
+# year -> (mnos, types × mnos matrix, types × types × mnos pair scores)
+_years = {}
+_lock = threading.Lock()
+
+def pivot(mno, type, percentage, type_count):
+    """Arrange (mno, type, percentage) columns into a types × mnos matrix."""
+    import numpy as np
+    mnos, positions = np.unique(mno, return_inverse=True)
+    # NaN wherever a municipality is missing a type
+    matrix = np.full((type_count, len(mnos)), np.nan)
+    matrix[type, positions] = percentage
+    return mnos, matrix
+
+def load(year):
+    transportation = snapshot.table('means_of_transportation')
+    if transportation is not None:
+        mask = transportation.year == year
+        return pivot(
+            transportation.mno[mask],
+            transportation.type[mask],
+            transportation.columns['percentage'][mask],
+            len(transportation.types),
+        )
+    import numpy as np
+    types = queries.enum_values('means_of_transportation_type')
+    codes = {t: i for i, t in enumerate(types)}
+    rows = queries.MOT(year)
+    return pivot(
+        np.array([row[0] for row in rows], dtype=np.int32),
+        np.array([codes[row[1]] for row in rows], dtype=np.intp),
+        np.array([float(row[2]) for row in rows]),
+        len(types),
+    )
+
+def get_year(year):
+    global _version
+    version = snapshot.get().version
+    with _lock:
+        if version != _version:
+            _years.clear()
+            _version = version
+        if year in _years:
+            return _years[year]
+        mnos, matrix = load(year)
+        # 1 where everyone uses the first type, 0 where everyone uses the second
+        pairs = ((matrix[:, None, :] - matrix[None, :, :]) + 100.0) / 200.0
+        # only years with data are kept, so asking for any other year costs no memory
+        if len(mnos):
+            _years[year] = (mnos, matrix, pairs)
+        return mnos, matrix, pairs
+
+def scores(year, first, second):
+    """
+    Compare two groups of types for every municipality in a year.
+
+    A score is 1 where everyone uses the first group, 0 where everyone uses
+    the second, and 0.5 where both are used equally. Municipalities missing
+    any of the types are left out.
+    """
+    import numpy as np
+    mnos, matrix, pairs = get_year(year)
+    if len(first) == 1 and len(second) == 1:
+        result = pairs[first[0], second[0]]
+    else:
+        result = ((matrix[list(first)].sum(axis=0) - matrix[list(second)].sum(axis=0)) + 100.0) / 200.0
+    valid = ~np.isnan(result)
+    return dict(zip(mnos[valid].tolist(), result[valid].tolist()))
@@ -12,19 +12,26 @@ https://www.postgresqltutorial.com/postgresql-python/
 from configparser import ConfigParser
  
  
-def config(filename='database.ini', section='postgresql'):
+def config(filename='database.ini', section='postgresql', defaults=None):
     # create a parser
     parser = ConfigParser()
     # read config file
     parser.read(filename)
  
     # get section, default to postgresql
-    db = {}
+    # optional sections fall back to the given defaults
+    db = dict(defaults or {})
     if parser.has_section(section):
         params = parser.items(section)
         for param in params:
             db[param[0]] = param[1]
-    else:
+    elif defaults is None:
         raise Exception('Section {0} not found in the {1} file'.format(section, filename))
  
     return db
+
+def boolean(value):
+    # an option read by config() as true or false, accepting what ConfigParser.getboolean does
+    if value.lower() not in ConfigParser.BOOLEAN_STATES:
+        raise ValueError('Not a boolean: {0}'.format(value))
+    return ConfigParser.BOOLEAN_STATES[value.lower()]
@@ -1,11 +1,35 @@
-# Converts the official geojson into a format more suited for our database.
-# The database server must be running.
+# Converts the official geojson into a format more suited for our database,
+# then writes a compact copy of it along with gzip and brotli compressed
+# versions for the web server to send as-is, and cuts it into tiles of
+# simplified geometry for each zoom level of the map.
+# The database server must be running, unless --compress-only is given, in
+# which case the existing static/geometry.json is used.
 
+import argparse
+import gzip
+import hashlib
 import json
+import math
+import os
+import shutil
 
 import psycopg2
 from config import config
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+GEOMETRY = 'static/geometry.json'
+COMPACT_GEOMETRY = 'static/geometry.min.json'
+# decimal places kept in coordinates, about a meter at our latitude
+PRECISION = 5
+TILES = 'tiles'
+# the map can't zoom out past 7, and past 12 the full geometry is detailed enough
+MIN_ZOOM = 7
+MAX_ZOOM = 12
+
 def connect(query):
     params = config()
     with psycopg2.connect(**params) as conn:
@@ -13,39 +37,190 @@ def connect(query):
             cur.execute(query)
             return cur.fetchall()
 
-with open('municipalities.json') as file:
-    original = json.load(file)
+def convert():
+    with open('municipalities.json') as file:
+        original = json.load(file)
 
-features = []
+    features = []
 
-# get our own municipality table
-municipalities = {(name.lower(), county.lower()): mno for (mno, name, county) in connect('select * from municipality;')}
-used_mno = set()
+    # get our own municipality table
+    municipalities = {(name.lower(), county.lower()): mno for (mno, name, county) in connect('select * from municipality;')}
+    used_mno = set()
 
-for feature in original['features']:
-    properties = feature['properties']
-    try:
-        mno = municipalities[properties['NAME'].lower(), properties['COUNTY'].lower()]
-    except KeyError:
+    for feature in original['features']:
+        properties = feature['properties']
         try:
-            mno = municipalities[properties['NAME'].lower() + ' ' + properties['MUN_TYPE'].lower(), properties['COUNTY'].lower()]
+            mno = municipalities[properties['NAME'].lower(), properties['COUNTY'].lower()]
         except KeyError:
-            # only one we fail to match is peapack-gladstone
-            assert properties['NAME'] == 'Peapack-Gladstone Borough'
-            mno = municipalities['peapack and gladstone borough', 'somerset']
-    assert mno not in used_mno
-    used_mno.add(mno)
-    features.append({
-        'type': 'Feature',
-        'properties': { 'mno': mno },
-        'geometry': feature['geometry'],
-    })
-
-result = {
-    'type': 'FeatureCollection',
-    'name': 'Municipalities',
-    'features': features,
-}
-
-with open('templates/geometry.json', 'w') as file:
-    json.dump(result, file)
+            try:
+                mno = municipalities[properties['NAME'].lower() + ' ' + properties['MUN_TYPE'].lower(), properties['COUNTY'].lower()]
+            except KeyError:
+                # only one we fail to match is peapack-gladstone
+                assert properties['NAME'] == 'Peapack-Gladstone Borough'
+                mno = municipalities['peapack and gladstone borough', 'somerset']
+        assert mno not in used_mno
+        used_mno.add(mno)
+        features.append({
+            'type': 'Feature',
+            'properties': { 'mno': mno },
+            'geometry': feature['geometry'],
+        })
+
+    result = {
+        'type': 'FeatureCollection',
+        'name': 'Municipalities',
+        'features': features,
+    }
+
+    with open(GEOMETRY, 'w') as file:
+        json.dump(result, file)
+    return result
+
+def quantize_ring(ring):
+    """Round a ring's coordinates, dropping points that become duplicates."""
+    result = []
+    for x, y in ring:
+        point = [round(x, PRECISION), round(y, PRECISION)]
+        if not result or result[-1] != point:
+            result.append(point)
+    return result
+
+def quantize(geometry):
+    if geometry['type'] == 'Polygon':
+        coordinates = [quantize_ring(ring) for ring in geometry['coordinates']]
+    else:
+        coordinates = [[quantize_ring(ring) for ring in polygon] for polygon in geometry['coordinates']]
+    return {'type': geometry['type'], 'coordinates': coordinates}
+
+def write_compressed(path, data):
+    """Write data along with gzip and, if available, brotli copies of it."""
+    with open(path, 'wb') as file:
+        file.write(data)
+    # mtime=0 keeps the output, and so its ETag, identical between builds
+    with open(path + '.gz', 'wb') as file:
+        file.write(gzip.compress(data, compresslevel=9, mtime=0))
+    if brotli is not None:
+        with open(path + '.br', 'wb') as file:
+            file.write(brotli.compress(data, quality=11))
+
+def compress(result):
+    compact = {
+        'type': 'FeatureCollection',
+        'features': [
+            {'type': 'Feature', 'properties': feature['properties'], 'geometry': quantize(feature['geometry'])}
+            for feature in result['features']
+        ],
+    }
+    data = json.dumps(compact, separators=(',', ':')).encode()
+    write_compressed(COMPACT_GEOMETRY, data)
+    if brotli is None:
+        print('brotli is not installed, skipping brotli compression')
+    return compact
+
+def simplify_ring(ring, tolerance):
+    """Simplify a closed ring with the Douglas-Peucker algorithm."""
+    if len(ring) <= 4:
+        return ring
+    keep = [False] * len(ring)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(ring) - 1)]
+    while stack:
+        start, end = stack.pop()
+        (x1, y1), (x2, y2) = ring[start], ring[end]
+        dx, dy = x2 - x1, y2 - y1
+        length = math.hypot(dx, dy)
+        farthest, distance = None, tolerance
+        for i in range(start + 1, end):
+            x, y = ring[i]
+            if length == 0:
+                d = math.hypot(x - x1, y - y1)
+            else:
+                d = abs(dy * x - dx * y + x2 * y1 - y2 * x1) / length
+            if d > distance:
+                farthest, distance = i, d
+        if farthest is not None:
+            keep[farthest] = True
+            stack.append((start, farthest))
+            stack.append((farthest, end))
+    return [point for point, kept in zip(ring, keep) if kept]
+
+def simplify_polygon(polygon, tolerance, decimals):
+    rings = []
+    for i, ring in enumerate(polygon):
+        simplified = simplify_ring(ring, tolerance)
+        if len(simplified) < 4:
+            # holes this small vanish, outer rings shrink to a triangle
+            if i > 0:
+                continue
+            third = len(ring) // 3
+            simplified = [ring[0], ring[third], ring[2 * third], ring[0]]
+        rings.append([[round(x, decimals), round(y, decimals)] for x, y in simplified])
+    return rings
+
+def simplify(geometry, tolerance, decimals):
+    if geometry['type'] == 'Polygon':
+        return {'type': 'Polygon', 'coordinates': simplify_polygon(geometry['coordinates'], tolerance, decimals)}
+    polygons = [simplify_polygon(polygon, tolerance, decimals) for polygon in geometry['coordinates']]
+    return {'type': 'MultiPolygon', 'coordinates': polygons}
+
+def bounding_box(geometry):
+    polygons = [geometry['coordinates']] if geometry['type'] == 'Polygon' else geometry['coordinates']
+    xs = [x for polygon in polygons for x, _ in polygon[0]]
+    ys = [y for polygon in polygons for _, y in polygon[0]]
+    return min(xs), min(ys), max(xs), max(ys)
+
+def tile_x(lon, z):
+    return int((lon + 180) / 360 * 2 ** z)
+
+def tile_y(lat, z):
+    lat = math.radians(lat)
+    return int((1 - math.asinh(math.tan(lat)) / math.pi) / 2 * 2 ** z)
+
+def build_tiles(compact):
+    """
+    Cut the geometry into web mercator tiles for each zoom level.
+
+    Each tile holds every municipality whose bounds overlap it, simplified to
+    about a pixel at that zoom. Municipalities are kept whole rather than cut
+    at tile edges so the map can outline and highlight each one as a single
+    shape. The map adds each municipality once per zoom level.
+    """
+    shutil.rmtree(TILES, ignore_errors=True)
+    boxes = [bounding_box(feature['geometry']) for feature in compact['features']]
+    for z in range(MIN_ZOOM, MAX_ZOOM + 1):
+        # degrees per pixel of a 256 pixel tile
+        tolerance = 360 / (256 * 2 ** z)
+        decimals = math.ceil(-math.log10(tolerance)) + 1
+        tiles = {}
+        for feature, (west, south, east, north) in zip(compact['features'], boxes):
+            simplified = {
+                'type': 'Feature',
+                'properties': feature['properties'],
+                'geometry': simplify(feature['geometry'], tolerance, decimals),
+            }
+            for x in range(tile_x(west, z), tile_x(east, z) + 1):
+                for y in range(tile_y(north, z), tile_y(south, z) + 1):
+                    tiles.setdefault((x, y), []).append(simplified)
+        for (x, y), features in tiles.items():
+            os.makedirs(os.path.join(TILES, str(z), str(x)), exist_ok=True)
+            data = json.dumps({'type': 'FeatureCollection', 'features': features}, separators=(',', ':')).encode()
+            write_compressed(os.path.join(TILES, str(z), str(x), f'{y}.json'), data)
+    index = {
+        'min_zoom': MIN_ZOOM,
+        'max_zoom': MAX_ZOOM,
+        # tiles only change along with the geometry
+        'version': hashlib.sha256(json.dumps(compact).encode()).hexdigest()[:16],
+    }
+    with open(os.path.join(TILES, 'index.json'), 'w') as file:
+        json.dump(index, file)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build the geometry served to the map.')
+    parser.add_argument('--compress-only', action='store_true', help=f'only rebuild the compact copies and tiles of {GEOMETRY}')
+    args = parser.parse_args()
+    if args.compress_only:
+        with open(GEOMETRY) as file:
+            result = json.load(file)
+    else:
+        result = convert()
+    build_tiles(compress(result))
@@ -0,0 +1,177 @@
+"""
+Pooled PostgreSQL connections for the web application.
+
+Connection parameters are read from database.ini once, when this module is
+imported. Connections are kept open in a pool and handed out on demand.
+Inside a Flask request, the first query checks out a connection which is then
+reused by every other query made while handling that request, and returned to
+the pool when the request ends. Queries declared in queries.py are prepared on
+each connection the first time they are used on it.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+import psycopg2
+import metrics
+from flask import g, has_app_context
+from psycopg2.pool import PoolError, ThreadedConnectionPool
+
+from config import config
+
+# read connection parameters once at startup
+PARAMS = config()
+POOL = config(section='pool', defaults={
+    'minconn': '1',
+    'maxconn': '10',
+    'health_check_interval': '30',
+    'checkout_timeout': '10',
+})
+MIN_CONNECTIONS = int(POOL['minconn'])
+MAX_CONNECTIONS = int(POOL['maxconn'])
+HEALTH_CHECK_INTERVAL = float(POOL['health_check_interval'])
+CHECKOUT_TIMEOUT = float(POOL['checkout_timeout'])
+
+class Connection(psycopg2.extensions.connection):
+    """A connection that remembers which statements have been prepared on it."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared = set()
+
+class Pool(ThreadedConnectionPool):
+    """A pool that keeps every healthy connection handed back, up to maxconn."""
+
+    def _putconn(self, conn, key=None, close=False):
+        # psycopg2 only keeps minconn idle connections and closes the rest,
+        # which would reconnect and re-prepare for every concurrent request
+        minconn = self.minconn
+        self.minconn = self.maxconn
+        try:
+            super()._putconn(conn, key, close)
+        finally:
+            self.minconn = minconn
+
+_pool = None
+_pool_lock = threading.Lock()
+# psycopg2's pool raises instead of blocking when it runs dry, so gate it
+_available = threading.BoundedSemaphore(MAX_CONNECTIONS)
+# when each pooled connection was last returned, keyed by id()
+_last_used = {}
+
+def get_pool():
+    """Get the connection pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = Pool(MIN_CONNECTIONS, MAX_CONNECTIONS, connection_factory=Connection, **PARAMS)
+    return _pool
+
+def is_healthy(conn):
+    """Check that a pooled connection can still be used."""
+    if conn.closed:
+        return False
+    # connections used recently are trusted without a round trip
+    last_used = _last_used.get(id(conn))
+    if last_used is not None and time.monotonic() - last_used < HEALTH_CHECK_INTERVAL:
+        return True
+    try:
+        with conn.cursor() as cur:
+            cur.execute('SELECT 1;')
+        return True
+    except psycopg2.Error:
+        return False
+
+def checkout():
+    """Take a healthy connection out of the pool."""
+    with metrics.span('db.connect'):
+        return take_healthy()
+
+def take_healthy():
+    if not _available.acquire(timeout=CHECKOUT_TIMEOUT):
+        raise PoolError('timed out waiting for a database connection')
+    try:
+        pool = get_pool()
+        # every connection in the pool may have gone stale, plus one fresh one
+        for _ in range(MAX_CONNECTIONS + 1):
+            conn = pool.getconn()
+            if not conn.closed and not conn.autocommit:
+                # the app only reads, so never leave a transaction open in the pool
+                conn.autocommit = True
+            if is_healthy(conn):
+                return conn
+            _last_used.pop(id(conn), None)
+            pool.putconn(conn, close=True)
+        raise psycopg2.OperationalError('could not get a healthy database connection')
+    except BaseException:
+        _available.release()
+        raise
+
+def checkin(conn):
+    """Return a connection taken with checkout() to the pool."""
+    try:
+        if conn.closed:
+            _last_used.pop(id(conn), None)
+        else:
+            _last_used[id(conn)] = time.monotonic()
+        get_pool().putconn(conn, close=bool(conn.closed))
+    finally:
+        _available.release()
+
+@contextmanager
+def connection():
+    """
+    Use a pooled connection for the duration of a with block.
+
+    Inside an application context the connection belongs to the current
+    request and is only returned when the request ends.
+    """
+    if has_app_context():
+        if 'db' not in g:
+            g.db = checkout()
+        yield g.db
+    else:
+        conn = checkout()
+        try:
+            yield conn
+        finally:
+            checkin(conn)
+
+def release_request_connection(exception=None):
+    """Return the current request's connection, if it took one."""
+    conn = g.pop('db', None)
+    if conn is not None:
+        checkin(conn)
+
+def init_app(app):
+    """Return request connections to the pool when each request ends."""
+    app.teardown_appcontext(release_request_connection)
+
+def query(sql, args=None):
+    """Run a query on a pooled connection and fetch all rows."""
+    with connection() as conn, metrics.span('db.query', 'sql'):
+        with conn.cursor() as cur:
+            cur.execute(sql, args)
+            return cur.fetchall()
+
+def prepare(cur, name, sql):
+    cur.execute(f'PREPARE {name} AS {sql}')
+    cur.connection.prepared.add(name)
+
+def execute(name, sql, args=()):
+    """Run a prepared statement on a pooled connection, preparing it first if needed, and fetch all rows."""
+    placeholders = f' ({", ".join(["%s"] * len(args))})' if args else ''
+    with connection() as conn, metrics.span('db.query', name):
+        with conn.cursor() as cur:
+            if name not in conn.prepared:
+                prepare(cur, name, sql)
+            try:
+                cur.execute(f'EXECUTE {name}{placeholders}', args)
+            except (psycopg2.errors.FeatureNotSupported, psycopg2.InternalError):
+                # the tables or types were replaced since the statement was prepared
+                cur.execute(f'DEALLOCATE {name}')
+                prepare(cur, name, sql)
+                cur.execute(f'EXECUTE {name}{placeholders}', args)
+            return cur.fetchall()
@@ -0,0 +1,69 @@
+# Checks that the queries behind the map's year-scoped endpoints can be
+# answered from the covering indexes alone, with EXPLAIN ANALYZE.
+# At today's size a sequential scan of a year can cost about as much as the
+# index, so each query is planned twice: once as the planner likes, which is
+# only reported, and once with the alternatives turned off, which must be an
+# index-only scan that never visits the table. Exits with 1 if any isn't.
+# The database server must be running and loaded.
+
+import argparse
+import json
+import sys
+
+import psycopg2
+import queries
+from config import config
+
+# the prepared statements each endpoint runs when it can't use the snapshot,
+# and their parameters besides the year
+QUERIES = (
+    ('/population.json', queries.POPULATION, ()),
+    ('/ghg.json', queries.GHG, ()),
+    ('/transportation.json', queries.TRANSPORTATION, ('worked at home',)),
+    ('/mot.json', queries.MOT, ()),
+)
+
+def explain(cur, query, args):
+    placeholders = ', '.join(['%s'] * len(args))
+    cur.execute(f'EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) EXECUTE {query.name} ({placeholders})', args)
+    result = cur.fetchone()[0]
+    # older servers hand back the JSON as text
+    if isinstance(result, str):
+        result = json.loads(result)
+    return result[0]
+
+def nodes(plan):
+    yield plan
+    for child in plan.get('Plans', ()):
+        yield from nodes(child)
+
+def check(cur, endpoint, query, args):
+    """Explain one query, returning whether it passed."""
+    cur.execute(f'PREPARE {query.name} AS {query.sql}')
+    chosen = explain(cur, query, args)
+    cur.execute('SET enable_seqscan = off; SET enable_bitmapscan = off;')
+    try:
+        forced = explain(cur, query, args)
+    finally:
+        cur.execute('RESET enable_seqscan; RESET enable_bitmapscan;')
+    scans = [node for node in nodes(forced['Plan']) if 'Relation Name' in node]
+    heap_fetches = sum(node.get('Heap Fetches', 0) for node in scans)
+    passed = bool(scans) and all(node['Node Type'] == 'Index Only Scan' for node in scans) and heap_fetches == 0
+    print(f"{'ok' if passed else 'FAIL':4} {endpoint}")
+    print(f"     chosen: {chosen['Plan']['Node Type']}, {chosen['Execution Time']:.3f} ms")
+    print(f"     index:  {', '.join(node['Node Type'] + ' using ' + node.get('Index Name', '?') for node in scans)}, "
+          f"{forced['Execution Time']:.3f} ms, {heap_fetches} heap fetches")
+    return passed
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Check that the map endpoints are answered by index-only scans.')
+    parser.add_argument('--year', type=int, help='year to query (default: the latest loaded)')
+    args = parser.parse_args()
+    with psycopg2.connect(**config()) as conn:
+        with conn.cursor() as cur:
+            year = args.year
+            if year is None:
+                cur.execute('SELECT MAX(year) FROM population;')
+                year = cur.fetchone()[0]
+            results = [check(cur, endpoint, query, (year,) + extra) for endpoint, query, extra in QUERIES]
+    sys.exit(0 if all(results) else 1)
@@ -0,0 +1,104 @@
+"""
+Delivery of the municipality geometry used by the map.
+
+convert_geojson.py writes a compact copy of static/geometry.json and tiles of
+simplified geometry for each zoom level, each along with gzip and brotli
+compressed versions. These are read into memory on first use and sent as-is,
+picking the smallest one the client accepts, with a strong ETag per version.
+The URLs handed to the map carry a hash of the geometry, so browsers may
+cache them forever.
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+import cache
+from flask import Response, request
+
+WEB = os.path.dirname(os.path.abspath(__file__))
+GEOMETRY = os.path.join(WEB, 'static', 'geometry.json')
+COMPACT_GEOMETRY = os.path.join(WEB, 'static', 'geometry.min.json')
+TILES = os.path.join(WEB, 'tiles')
+# smallest first
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+EMPTY_TILE = b'{"type":"FeatureCollection","features":[]}'
+EMPTY_TILE_VARIANTS = {None: (EMPTY_TILE, hashlib.sha256(EMPTY_TILE).hexdigest()[:32])}
+
+_geometry = None
+_tile_index = None
+_tiles = {}
+_lock = threading.Lock()
+
+def load_variants(path):
+    """Read a file and whichever precompressed copies of it were built, keyed by encoding."""
+    variants = {}
+    for encoding, suffix in ENCODINGS + ((None, ''),):
+        if not os.path.exists(path + suffix):
+            continue
+        with open(path + suffix, 'rb') as file:
+            data = file.read()
+        variants[encoding] = (data, hashlib.sha256(data).hexdigest()[:32])
+    return variants
+
+def send_variants(variants, version):
+    """Send the best encoding the client accepts."""
+    encoding = None
+    for candidate, _ in ENCODINGS:
+        if candidate in variants and request.accept_encodings[candidate] > 0:
+            encoding = candidate
+            break
+    data, etag = variants[encoding]
+    result = Response(data, mimetype='application/json')
+    if encoding is not None:
+        result.content_encoding = encoding
+    result.vary.add('Accept-Encoding')
+    result.set_etag(etag)
+    cache.version_headers(result, request.args.get('v') == version)
+    return result.make_conditional(request)
+
+def get_geometry():
+    global _geometry
+    if _geometry is None:
+        with _lock:
+            if _geometry is None:
+                # fall back to the original file if nothing was built
+                path = COMPACT_GEOMETRY if os.path.exists(COMPACT_GEOMETRY) else GEOMETRY
+                _geometry = load_variants(path)
+    return _geometry
+
+def version():
+    """A hash of the uncompressed geometry, for cache-busting its URL."""
+    return get_geometry()[None][1][:16]
+
+def response():
+    """Send the whole geometry."""
+    return send_variants(get_geometry(), version())
+
+def tile_index():
+    """Get the zoom levels and version of the built tiles, or None if there are none."""
+    global _tile_index
+    if _tile_index is None:
+        path = os.path.join(TILES, 'index.json')
+        if not os.path.exists(path):
+            return None
+        with open(path) as file:
+            _tile_index = json.load(file)
+    return _tile_index
+
+def tile_response(z, x, y):
+    """Send one tile, or an empty one where there are no municipalities."""
+    index = tile_index()
+    if index is None or not index['min_zoom'] <= z <= index['max_zoom']:
+        return Response(status=404)
+    key = (z, x, y)
+    variants = _tiles.get(key)
+    if variants is None:
+        variants = load_variants(os.path.join(TILES, str(z), str(x), f'{y}.json'))
+        if not variants:
+            # not remembered, so probing arbitrary tiles can't grow the cache
+            return send_variants(EMPTY_TILE_VARIANTS, index['version'])
+        with _lock:
+            _tiles[key] = variants
+    return send_variants(variants, index['version'])
@@ -0,0 +1,166 @@
+"""
+Timing of requests and the parts of them that take time.
+
+With [metrics] enabled in database.ini, each request and each span inside it
+(checking out a database connection, running a query, waiting for and drawing
+a chart, building a table, rendering a template) is added to a histogram, and
+the histograms are served at /metrics in Prometheus's text format. With
+slow_request_ms set, a request taking longer than that is logged along with
+every span it was made of.
+
+When disabled, span() hands back one shared context manager that does
+nothing, and the app gets no hooks or routes.
+"""
+
+import contextvars
+import json
+import threading
+import time
+from contextlib import nullcontext
+
+from config import boolean, config
+
+METRICS = config(section='metrics', defaults={
+    'enabled': 'false',
+    'slow_request_ms': '0',
+})
+ENABLED = boolean(METRICS['enabled'])
+SLOW_REQUEST_MS = float(METRICS['slow_request_ms'])
+# upper bounds of the histogram buckets, in seconds
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_NOOP = nullcontext()
+# (metric, labels) -> [count in each bucket, sum, count]
+_histograms = {}
+_lock = threading.Lock()
+# spans of the current request, when it is being traced
+_trace = contextvars.ContextVar('trace', default=None)
+
+def observe(metric, seconds, labels):
+    with _lock:
+        histogram = _histograms.get((metric, labels))
+        if histogram is None:
+            histogram = _histograms[metric, labels] = [[0] * len(BUCKETS), 0.0, 0]
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                histogram[0][i] += 1
+                break
+        histogram[1] += seconds
+        histogram[2] += 1
+
+def record(span, seconds, name=''):
+    """Count a span that was timed elsewhere."""
+    if not ENABLED:
+        return
+    observe('span', seconds, (('span', span), ('name', name)))
+    trace = _trace.get()
+    if trace is not None:
+        trace.append((span, name, time.perf_counter() - seconds, seconds))
+
+class Span:
+    __slots__ = ('span', 'name', 'start')
+
+    def __init__(self, span, name):
+        self.span = span
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record(self.span, time.perf_counter() - self.start, self.name)
+
+def span(span, name=''):
+    """Time a with block as part of the current request."""
+    if not ENABLED:
+        return _NOOP
+    return Span(span, name)
+
+def propagate(call):
+    """Make a call's spans count toward the current request when it runs on another thread."""
+    if not ENABLED:
+        return call
+    trace = _trace.get()
+    def traced():
+        _trace.set(trace)
+        return call()
+    # only the trace is carried over, since a copy of the whole context would
+    # share the request's Flask context, and with it its database connection
+    return lambda: contextvars.Context().run(traced)
+
+def escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def exposition():
+    """Every histogram, in Prometheus's text format."""
+    with _lock:
+        histograms = sorted((key, (list(buckets), total, count)) for key, (buckets, total, count) in _histograms.items())
+    lines = []
+    for metric, description in (
+        ('request', 'Time taken to answer requests, by endpoint and status.'),
+        ('span', 'Time taken by parts of requests, by span and name.'),
+    ):
+        name = f'cab_{metric}_duration_seconds'
+        lines.append(f'# HELP {name} {description}')
+        lines.append(f'# TYPE {name} histogram')
+        for (key_metric, labels), (buckets, total, count) in histograms:
+            if key_metric != metric:
+                continue
+            label_text = ','.join(f'{key}="{escape(value)}"' for key, value in labels)
+            cumulative = 0
+            for bound, bucket in zip(BUCKETS, buckets):
+                cumulative += bucket
+                lines.append(f'{name}_bucket{{{label_text},le="{bound}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{{label_text},le="+Inf"}} {count}')
+            lines.append(f'{name}_sum{{{label_text}}} {total}')
+            lines.append(f'{name}_count{{{label_text}}} {count}')
+    return '\n'.join(lines) + '\n'
+
+def init_app(app):
+    """Time every request and serve the histograms at /metrics, if enabled."""
+    if not ENABLED:
+        return
+    # imported here, since the chart workers use this module without Flask
+    from flask import Response, g, request
+
+    @app.before_request
+    def start_request():
+        g.metrics_start = time.perf_counter()
+        if SLOW_REQUEST_MS > 0:
+            g.metrics_trace = _trace.set([])
+
+    @app.after_request
+    def keep_status(response):
+        g.metrics_status = response.status_code
+        return response
+
+    @app.teardown_request
+    def finish_request(exception=None):
+        start = g.pop('metrics_start', None)
+        if start is None:
+            return
+        elapsed = time.perf_counter() - start
+        status = g.pop('metrics_status', 500)
+        observe('request', elapsed, (('endpoint', request.endpoint or ''), ('status', str(status))))
+        token = g.pop('metrics_trace', None)
+        if token is None:
+            return
+        trace = _trace.get()
+        _trace.reset(token)
+        if elapsed * 1000 >= SLOW_REQUEST_MS:
+            app.logger.warning('slow request %s', json.dumps({
+                'method': request.method,
+                'path': request.full_path.rstrip('?'),
+                'status': status,
+                'ms': round(elapsed * 1000, 3),
+                # in the order they finished, each from the start of the request
+                'spans': [
+                    {'span': span, 'name': name, 'at_ms': round((started - start) * 1000, 3), 'ms': round(seconds * 1000, 3)}
+                    for span, name, started, seconds in trace
+                ],
+            }))
+
+    @app.route('/metrics', methods=['GET'])
+    def metrics_handler():
+        return Response(exposition(), mimetype='text/plain; version=0.0.4')
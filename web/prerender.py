@@ -0,0 +1,167 @@
+"""
+A static copy of the site, built ahead of time.
+
+There are only a few hundred municipalities, a couple of years and a handful
+of means of transportation, so every page, chart and map payload the site
+links to can be rendered once per load of the data. Running this file writes
+them all to a directory laid out for any file server: the page at /mot/5/ is
+written to mot/5/index.html and the data at /mot/2020/0/1.json to
+mot/2020/0/1.json. The pages only link to such paths, with nothing in their
+query strings but versions for cache-busting.
+
+With [prerender] directory set in database.ini, the app sends these files
+itself while they are of the loaded data version, and renders live whatever
+isn't among them.
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import cache
+from config import config
+from flask import request, send_from_directory
+from werkzeug.security import safe_join
+
+PRERENDER = config(section='prerender', defaults={'directory': ''})
+DIRECTORY = PRERENDER['directory']
+# holds the data version the files were rendered from, and is written last
+VERSION_FILE = '.version'
+
+def file_path(path):
+    """The file a URL path is written to, relative to the output directory."""
+    if path.endswith('/'):
+        path += 'index.html'
+    return path.lstrip('/')
+
+def built_version(directory):
+    try:
+        with open(os.path.join(directory, VERSION_FILE)) as file:
+            return file.read().strip()
+    except FileNotFoundError:
+        return None
+
+_built = None
+_built_checked = None
+
+def current_build():
+    """The data version DIRECTORY was built from, re-read as often as the loaded data's."""
+    global _built, _built_checked
+    now = time.monotonic()
+    if _built_checked is None or now - _built_checked >= cache.VERSION_CHECK_INTERVAL:
+        _built = built_version(DIRECTORY)
+        _built_checked = now
+    return _built
+
+def response(version):
+    """Send the prerendered file for this request, or None to render it live."""
+    # other query strings, and versions of anything but the data, ask for what wasn't built
+    versioned = request.args.get('v') == version
+    if len(request.args) > (1 if versioned else 0):
+        return None
+    # such as .version itself
+    if any(part.startswith('.') for part in request.path.split('/')):
+        return None
+    if current_build() != version:
+        return None
+    path = safe_join(DIRECTORY, file_path(request.path))
+    if path is None or not os.path.isfile(path):
+        return None
+    result = send_from_directory(DIRECTORY, file_path(request.path))
+    cache.version_headers(result, versioned)
+    return result
+
+def paths(site):
+    """Every path the site links to."""
+    import geometry
+    import queries
+    import snapshot
+    yield '/'
+    yield '/names.json'
+    yield '/rankings.json'
+    yield '/geometry.json'
+    for mno in snapshot.get().mno:
+        yield f'/municipality/{mno}/'
+        pages = ('mot', 'vmt', 'ev') if site.have_vehicles(mno) else ('mot', 'ev')
+        for page in pages:
+            yield f'/{page}/{mno}/'
+        for dataset, metric in site.CHARTS:
+            if dataset in pages:
+                yield f'/chart/{dataset}/{metric}/{mno}.png'
+                yield f'/chart/{dataset}/{metric}/{mno}.json'
+    types = range(len(site.mot_enum()))
+    for (year,) in queries.MAP_YEARS():
+        yield f'/ghg/{year}/'
+        yield f'/population/{year}.json'
+        yield f'/ghg/{year}.json'
+        yield f'/transportation/{year}.json'
+        yield f'/choropleth/ghg/{year}.json'
+        for t1 in types:
+            for t2 in types:
+                yield f'/mot2/{year}/{t1}/{t2}/'
+                yield f'/mot/{year}/{t1}/{t2}.json'
+                yield f'/choropleth/mot/{year}/{t1}/{t2}.json'
+    # the map asks for tiles without a file extension
+    if geometry.tile_index() is not None:
+        for root, _, files in os.walk(geometry.TILES):
+            for name in files:
+                if name.endswith('.json') and name != 'index.json':
+                    tile = os.path.relpath(os.path.join(root, name[:-len('.json')]), geometry.TILES)
+                    yield '/tiles/' + tile.replace(os.sep, '/')
+
+def build(directory, threads, processes):
+    """Render every path into directory, returning the paths that couldn't be."""
+    import app as site
+    import render
+    # charts are most of the work, so draw them in as many processes as asked
+    render.PROCESSES = processes
+    # render everything afresh rather than sending what was built before,
+    # through the module the app imported, which isn't __main__
+    site.prerender.DIRECTORY = ''
+    version = cache.data_version().version
+    # built to one side and swapped in whole, so nothing sees half of it
+    staging = directory + '.new'
+    shutil.rmtree(staging, ignore_errors=True)
+    shutil.copytree(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static'), os.path.join(staging, 'static'))
+
+    def render(path):
+        result = site.app.test_client().get(path)
+        if result.status_code != 200:
+            return path, result.status_code
+        target = os.path.join(staging, file_path(path))
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, 'wb') as file:
+            file.write(result.data)
+        return path, 200
+
+    with ThreadPoolExecutor(threads) as executor:
+        results = list(executor.map(render, paths(site)))
+    if cache.data_version().version != version:
+        shutil.rmtree(staging)
+        raise RuntimeError('the database was reloaded while prerendering')
+    with open(os.path.join(staging, VERSION_FILE), 'w') as file:
+        file.write(version)
+    old = directory + '.old'
+    shutil.rmtree(old, ignore_errors=True)
+    if os.path.exists(directory):
+        os.replace(directory, old)
+    os.replace(staging, directory)
+    shutil.rmtree(old, ignore_errors=True)
+    print(f'wrote {sum(status == 200 for _, status in results)} files to {directory}')
+    return [(path, status) for path, status in results if status != 200]
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Render every page, chart and map payload of the site to static files.')
+    parser.add_argument('--out', default=DIRECTORY or 'prerendered', help='output directory (default: [prerender] directory, or prerendered)')
+    parser.add_argument('--threads', type=int, default=8, help='requests rendered at once (default: 8)')
+    parser.add_argument('--processes', type=int, default=os.cpu_count(), help='chart rendering processes (default: one per CPU)')
+    args = parser.parse_args()
+    start = time.perf_counter()
+    failed = build(args.out, args.threads, args.processes)
+    for path, status in failed:
+        print(f'{status} {path}', file=sys.stderr)
+    print(f'took {time.perf_counter() - start:.1f}s')
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,70 @@
+"""
+Every query the web app sends to the database, declared once.
+
+Each query has a name and SQL with $1, $2, ... placeholders. It is prepared
+on a pooled connection the first time it's run there and executed by name
+from then on, so the server parses and plans it once per connection instead
+of on every request, and values are only ever passed as parameters. Years
+and mnos are compared as int parameters rather than the columns' smallint,
+so a value out of smallint's range matches nothing instead of failing.
+"""
+
+import db
+
+class Query:
+    def __init__(self, name, sql):
+        self.name = name
+        self.sql = sql
+
+    def __call__(self, *args):
+        """Run the query with the given parameters and fetch all rows."""
+        return db.execute(self.name, self.sql, args)
+
+DATA_VERSION = Query('data_version', 'SELECT version, loaded FROM data_version')
+MUNICIPALITIES = Query('municipalities', 'SELECT mno, name, county FROM municipality ORDER BY mno')
+
+# values of each enum, in order
+ENUMS = {
+    'means_of_transportation_type': Query('means_of_transportation_types', 'SELECT UNNEST(ENUM_RANGE(NULL::means_of_transportation_type))'),
+    'on_road_vehicle_type': Query('on_road_vehicle_types', 'SELECT UNNEST(ENUM_RANGE(NULL::on_road_vehicle_type))'),
+}
+
+# name -> (data version, values)
+_enum_values = {}
+
+def enum_values(name):
+    """The values of an enum in order, read once per load of the data, since a reload can change them."""
+    # imported here, since cache reads the data version through this module
+    import cache
+    version = cache.data_version().version
+    cached = _enum_values.get(name)
+    if cached is None or cached[0] != version:
+        cached = _enum_values[name] = version, [row[0] for row in ENUMS[name]()]
+    return cached[1]
+
+# a municipality's years of a table in order, by table and columns
+BY_MNO = {
+    ('means_of_transportation', ('Type', 'Percentage')): Query('mot_by_mno', 'SELECT year, Type, Percentage FROM means_of_transportation WHERE mno = $1::int ORDER BY year'),
+    ('on_road_vehicle', ('Type', 'Miles')): Query('vehicle_miles_by_mno', 'SELECT year, Type, Miles FROM on_road_vehicle WHERE mno = $1::int ORDER BY year'),
+    ('on_road_vehicle', ('Type', 'CO2')): Query('vehicle_co2_by_mno', 'SELECT year, Type, CO2 FROM on_road_vehicle WHERE mno = $1::int ORDER BY year'),
+    ('population', ('EVs', 'PersonalVehicles', 'Pop', 'CO2')): Query('ev_by_mno', 'SELECT year, EVs, PersonalVehicles, Pop, CO2 FROM population WHERE mno = $1::int ORDER BY year'),
+}
+# the years of a table of every municipality in a list, in order of mno and year, by table
+BY_MNOS = {
+    'means_of_transportation': Query('mot_by_mnos', 'SELECT mno, year, Type, Percentage FROM means_of_transportation WHERE mno = ANY($1) ORDER BY mno, year'),
+    'on_road_vehicle': Query('vehicles_by_mnos', 'SELECT mno, year, Type, Miles, CO2 FROM on_road_vehicle WHERE mno = ANY($1) ORDER BY mno, year'),
+    'population': Query('population_by_mnos', 'SELECT mno, year, EVs, PersonalVehicles, Pop, CO2 FROM population WHERE mno = ANY($1) ORDER BY mno, year'),
+}
+VEHICLE_YEARS = Query('vehicle_years', 'SELECT DISTINCT year FROM on_road_vehicle WHERE mno = $1::int')
+
+# the years the map has data for
+MAP_YEARS = Query('map_years', 'SELECT year FROM population UNION SELECT year FROM means_of_transportation ORDER BY year')
+# a year of values for the map, keyed by mno
+POPULATION = Query('population_by_year', 'SELECT mno, pop FROM population WHERE year = $1::int')
+GHG = Query('ghg_by_year', 'SELECT mno, co2 FROM population WHERE year = $1::int')
+TRANSPORTATION = Query('transportation_by_year', 'SELECT mno, percentage FROM means_of_transportation WHERE year = $1::int AND type = $2')
+MOT = Query('mot_by_year', 'SELECT mno, type, percentage FROM means_of_transportation WHERE year = $1::int')
+
+RANKED_METRICS = Query('ranked_metrics', 'SELECT DISTINCT metric, year FROM ranking ORDER BY metric, year')
+RANKING = Query('ranking', 'SELECT mno, value, delta, rank, percentile, pop FROM ranking WHERE metric = $1 AND year = $2 ORDER BY rank, mno')
+TOTALS = Query('totals', 'SELECT county, value, delta FROM totals WHERE metric = $1 AND year = $2 ORDER BY county NULLS FIRST')
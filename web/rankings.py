@@ -0,0 +1,107 @@
+"""
+Rankings of municipalities, and totals by county and statewide.
+
+The loader refreshes the ranking and totals materialized views with every
+load. Each metric's rows for a year are read from them once per data
+version and kept in order, so a top-N list is a slice and looking up one
+municipality's rank is a dictionary lookup.
+"""
+
+import threading
+
+import queries
+import snapshot
+
+_version = None
+# metric -> years it has
+_metrics = {}
+# (metric, year) -> (rows by value, rows by change, rows by mno)
+_rankings = {}
+# (metric, year) -> rows of each county, statewide first
+_totals = {}
+_lock = threading.Lock()
+
+def current():
+    """Forget everything if the data was reloaded."""
+    global _version
+    version = snapshot.get().version
+    with _lock:
+        if version != _version:
+            _metrics.clear()
+            _rankings.clear()
+            _totals.clear()
+            _version = version
+            for metric, year in queries.RANKED_METRICS():
+                _metrics.setdefault(metric, []).append(year)
+
+def metrics():
+    """Every metric, with the years it has."""
+    current()
+    return _metrics
+
+def exists(metric, year):
+    return year in metrics().get(metric, ())
+
+def load(metric, year):
+    snap = snapshot.get()
+    rows = []
+    for mno, value, delta, rank, percentile, pop in queries.RANKING(metric, year):
+        i = snap.index[mno]
+        rows.append({
+            'mno': mno,
+            'name': snap.name[i],
+            'county': snap.county[i],
+            'value': value,
+            'delta': delta,
+            'rank': rank,
+            'percentile': percentile,
+            'pop': pop,
+        })
+    by_delta = sorted((row for row in rows if row['delta'] is not None), key=lambda row: -row['delta'])
+    return rows, by_delta, {row['mno']: row for row in rows}
+
+def get_ranking(metric, year):
+    key = (metric, year)
+    ranking = _rankings.get(key)
+    if ranking is None:
+        ranking = load(metric, year)
+        with _lock:
+            _rankings[key] = ranking
+    return ranking
+
+def top(metric, year, n, by='value', ascending=False, min_pop=0):
+    """
+    The first n municipalities for a metric in a year, highest first unless
+    ascending, by its value or its change since the year before. With
+    min_pop, municipalities with fewer people, or no count of them that
+    year, are skipped.
+    """
+    by_value, by_delta, _ = get_ranking(metric, year)
+    rows = by_value if by == 'value' else by_delta
+    if ascending:
+        rows = reversed(rows)
+    result = []
+    for row in rows:
+        if len(result) >= n:
+            break
+        if min_pop and (row['pop'] is None or row['pop'] < min_pop):
+            continue
+        result.append(row)
+    return result
+
+def rank(metric, year, mno):
+    """Where a municipality stands for a metric in a year, or None if it isn't ranked."""
+    return get_ranking(metric, year)[2].get(mno)
+
+def totals(metric, year):
+    """A metric summed over each county, with the statewide total first and its county as None."""
+    key = (metric, year)
+    rows = _totals.get(key)
+    if rows is None:
+        rows = [
+            {'county': county, 'value': value, 'delta': delta}
+            for county, value, delta in queries.TOTALS(metric, year)
+        ]
+        with _lock:
+            _totals[key] = rows
+    return rows
@@ -0,0 +1,232 @@
+"""
+A pool of long-lived chart rendering processes.
+
+Drawing a chart holds the GIL for as long as it takes, so by default charts
+are not drawn in the web server process. Rather than forking a process per
+chart, a few worker processes are started once, and each idle one is sent
+the next queued chart spec down a pipe of its own and sends back PNG bytes.
+A worker retires itself after a number of renders or once its memory use
+passes a ceiling, and the pool starts a fresh one in its place. If a worker
+dies instead, the chart it was drawing fails rather than never finishing.
+
+With processes set to 0, charts are drawn in the server process instead, one
+at a time, since they share one figure.
+"""
+
+import atexit
+import itertools
+import multiprocessing as mp
+import resource
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from multiprocessing.connection import wait
+
+import metrics
+from config import config
+
+RENDER = config(section='render', defaults={
+    'processes': '2',
+    'max_renders': '200',
+    'max_rss_mb': '400',
+    'timeout': '30',
+})
+PROCESSES = int(RENDER['processes'])
+MAX_RENDERS = int(RENDER['max_renders'])
+MAX_RSS_MB = float(RENDER['max_rss_mb'])
+# seconds to wait for a chart before giving up on it
+TIMEOUT = float(RENDER['timeout'])
+
+def peak_rss_mb():
+    """Peak resident memory of this process in megabytes."""
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def worker_main(conn, max_renders, max_rss_mb):
+    """Render the charts sent down conn until it is time to retire."""
+    import charts
+    for i in range(max_renders):
+        try:
+            task = conn.recv()
+        except EOFError:
+            break
+        if task is None:
+            break
+        task_id, spec = task
+        start = time.perf_counter()
+        try:
+            png, error = charts.render_chart(*spec), None
+        except Exception as exception:
+            png, error = None, repr(exception)
+        retiring = i + 1 == max_renders or peak_rss_mb() > max_rss_mb
+        # how long drawing took, so the pool can tell it from time spent queued,
+        # and whether to send this worker anything else
+        conn.send((task_id, png, error, time.perf_counter() - start, retiring))
+        if retiring:
+            break
+
+class Worker:
+    """A rendering process, with a pipe of its own so it can't wedge the others by dying."""
+
+    def __init__(self, context, max_renders, max_rss_mb):
+        self.conn, child = context.Pipe()
+        self.process = context.Process(target=worker_main, args=(child, max_renders, max_rss_mb), daemon=True)
+        self.process.start()
+        child.close()
+        # the task id being drawn, failed if the process dies with it
+        self.task = None
+        self.retiring = False
+
+    @property
+    def idle(self):
+        return self.task is None and not self.retiring
+
+class RenderPool:
+    def __init__(self, processes=PROCESSES, max_renders=MAX_RENDERS, max_rss_mb=MAX_RSS_MB):
+        # spawn, so workers don't inherit the server's memory or database sockets
+        self.context = mp.get_context('spawn')
+        self.processes = processes
+        self.max_renders = max_renders
+        self.max_rss_mb = max_rss_mb
+        self.task_ids = itertools.count()
+        # charts waiting for an idle worker, in order
+        self.queue = deque()
+        self.pending = {}
+        self.workers = []
+        self.lock = threading.Lock()
+        self.closed = False
+        for _ in range(processes):
+            self.start_worker()
+        self.collector = threading.Thread(target=self.collect, daemon=True)
+        self.collector.start()
+
+    def start_worker(self):
+        self.workers.append(Worker(self.context, self.max_renders, self.max_rss_mb))
+
+    def submit(self, title, years, types, rows):
+        """Queue a bar chart for rendering, returning a Future of its PNG bytes."""
+        future = Future()
+        with self.lock:
+            if self.closed:
+                raise RuntimeError('render pool is closed')
+            task_id = next(self.task_ids)
+            self.pending[task_id] = future, time.perf_counter()
+            self.queue.append((task_id, (title, years, types, rows)))
+            self.dispatch()
+        return future
+
+    def dispatch(self):
+        # hand queued charts to idle workers, with the lock held
+        for worker in self.workers:
+            if not self.queue:
+                return
+            if worker.idle and not self.closed:
+                task = self.queue.popleft()
+                try:
+                    worker.conn.send(task)
+                except OSError:
+                    # it died, which the collector will notice
+                    self.queue.appendleft(task)
+                    worker.retiring = True
+                    continue
+                worker.task = task[0]
+
+    def collect(self):
+        """Hand results to their futures and replace workers that exit."""
+        while True:
+            with self.lock:
+                if self.closed and not self.workers:
+                    return
+                waiting = [worker.conn for worker in self.workers] + [worker.process.sentinel for worker in self.workers]
+            wait(waiting, timeout=1.0)
+            # futures are resolved without the lock, since their callbacks may submit charts
+            done = []
+            with self.lock:
+                for worker in list(self.workers):
+                    self.receive(worker, done)
+                    if worker.process.is_alive():
+                        continue
+                    self.workers.remove(worker)
+                    worker.process.join()
+                    worker.conn.close()
+                    if worker.task is not None:
+                        future, _ = self.pending.pop(worker.task)
+                        done.append((future, None, RuntimeError(f'chart worker exited with code {worker.process.exitcode}')))
+                    if not self.closed:
+                        self.start_worker()
+                self.dispatch()
+            for future, png, error in done:
+                if error is None:
+                    future.set_result(png)
+                else:
+                    future.set_exception(error)
+
+    def receive(self, worker, done):
+        # every result the worker has sent, with the lock held
+        while True:
+            try:
+                if not worker.conn.poll():
+                    return
+                task_id, png, error, seconds, retiring = worker.conn.recv()
+            except (EOFError, OSError):
+                return
+            worker.task = None
+            worker.retiring = retiring
+            future, submitted = self.pending.pop(task_id)
+            metrics.record('render.queue', time.perf_counter() - submitted - seconds)
+            metrics.record('render.chart', seconds)
+            done.append((future, png, None if error is None else RuntimeError(error)))
+
+    def close(self):
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+            queued = [self.pending.pop(task_id)[0] for task_id, _ in self.queue]
+            self.queue.clear()
+            for worker in self.workers:
+                try:
+                    # read once the worker has finished what it's drawing
+                    worker.conn.send(None)
+                except OSError:
+                    pass
+        for future in queued:
+            future.set_exception(RuntimeError('render pool is closed'))
+        self.collector.join(timeout=TIMEOUT)
+
+_pool = None
+_pool_lock = threading.Lock()
+# held while drawing a chart in this process
+_render_lock = threading.Lock()
+
+def get_pool():
+    """Get the render pool, starting its workers on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = RenderPool(PROCESSES)
+                atexit.register(_pool.close)
+    return _pool
+
+def submit(title, years, types, rows):
+    """Render a bar chart in the worker pool, returning a Future of PNG bytes."""
+    if PROCESSES == 0:
+        return render_here(title, years, types, rows)
+    return get_pool().submit(title, years, types, rows)
+
+def render_here(title, years, types, rows):
+    import charts
+    future = Future()
+    try:
+        with metrics.span('render.queue'):
+            _render_lock.acquire()
+        try:
+            with metrics.span('render.chart'):
+                future.set_result(charts.render_chart(title, years, types, rows))
+        finally:
+            _render_lock.release()
+    except Exception as error:
+        future.set_exception(RuntimeError(repr(error)))
+    return future
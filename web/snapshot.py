@@ -0,0 +1,135 @@
+"""
+An in-process snapshot of data that only changes when the database is reloaded.
+
+The snapshot is loaded on first use and again whenever the data version
+stamp written by the loader changes, so requests can read it instead of
+querying the database every time. It always holds the municipality names.
+With [snapshot] enabled in database.ini it also holds every data table as
+NumPy columns sorted by (mno, year, type), which the app reads through,
+falling back to the database if the snapshot couldn't be loaded. NumPy is
+only imported once the tables are, not along with this module.
+"""
+
+import threading
+import traceback
+
+import cache
+import db
+import queries
+import tables
+from config import boolean, config
+
+SNAPSHOT = config(section='snapshot', defaults={'enabled': 'false'})
+ENABLED = boolean(SNAPSHOT['enabled'])
+
+# data tables and their value columns
+TABLES = {
+    'population': ('pop', 'co2', 'evs', 'personalvehicles'),
+    'on_road_vehicle': ('co2', 'miles'),
+    'means_of_transportation': ('percentage',),
+}
+# tables with a type column, and the enum it uses
+TYPED_TABLES = {
+    'on_road_vehicle': 'on_road_vehicle_type',
+    'means_of_transportation': 'means_of_transportation_type',
+}
+
+def to_array(values):
+    # integer columns stay integers, anything else becomes float with NaN for NULL
+    import numpy as np
+    if all(isinstance(value, int) for value in values):
+        return np.array(values, dtype=np.int64)
+    return np.array([np.nan if value is None else float(value) for value in values], dtype=np.float64)
+
+class Table:
+    """One table as columns of equal length, sorted by (mno, year, type)."""
+
+    def __init__(self, name, columns):
+        import numpy as np
+        self.name = name
+        enum = TYPED_TABLES.get(name)
+        keys = 'mno, year, type' if enum else 'mno, year'
+        rows = db.query(f'SELECT {keys}, {", ".join(columns)} FROM {name} ORDER BY {keys};')
+        self.mno = np.array([row[0] for row in rows], dtype=np.int32)
+        self.year = np.array([row[1] for row in rows], dtype=np.int32)
+        if enum:
+            self.types = queries.enum_values(enum)
+            codes = {t: i for i, t in enumerate(self.types)}
+            self.type = np.array([codes[row[2]] for row in rows], dtype=np.int8)
+        else:
+            self.types = None
+            self.type = None
+        offset = 3 if enum else 2
+        self.columns = {}
+        # so rows read back from the snapshot look just like rows from the database
+        self.decimal_places = {}
+        for i, column in enumerate(columns):
+            values = [row[offset + i] for row in rows]
+            self.columns[column] = to_array(values)
+            self.decimal_places[column] = tables.decimal_places(values)
+        # rows of each municipality, which are contiguous since rows are sorted by mno
+        starts = np.flatnonzero(np.diff(self.mno, prepend=-1))
+        stops = np.append(starts[1:], len(self.mno))
+        self.rows_of = {int(self.mno[start]): slice(int(start), int(stop)) for start, stop in zip(starts, stops)}
+
+    def matrix(self, columns, mno):
+        """
+        One municipality's years of the given columns as a YearMatrix, or of
+        one column with a column per type if the table has types.
+        """
+        import numpy as np
+        rows = self.rows_of.get(mno, slice(0, 0))
+        if self.types is None:
+            names = [column.lower() for column in columns]
+            return tables.YearMatrix(
+                self.year[rows].tolist(),
+                list(columns),
+                np.column_stack([self.columns[name][rows] for name in names]).astype(np.float64),
+                [self.decimal_places[name] for name in names],
+            )
+        name = columns[0].lower()
+        years, positions = np.unique(self.year[rows], return_inverse=True)
+        values = np.full((len(years), len(self.types)), np.nan)
+        values[positions, self.type[rows]] = self.columns[name][rows]
+        return tables.YearMatrix(years.tolist(), list(self.types), values, [self.decimal_places[name]] * len(self.types))
+
+    def values(self, column, year, type=None):
+        """A column for one year, and type if the table has them, keyed by mno."""
+        mask = self.year == year
+        if type is not None:
+            mask &= self.type == self.types.index(type)
+        return dict(zip(self.mno[mask].tolist(), self.columns[column][mask].tolist()))
+
+class Snapshot:
+    def __init__(self, version):
+        self.version = version
+        rows = queries.MUNICIPALITIES()
+        self.mno = [row[0] for row in rows]
+        self.name = [row[1] for row in rows]
+        self.county = [row[2] for row in rows]
+        # position of each municipality in the columns above
+        self.index = {mno: i for i, mno in enumerate(self.mno)}
+        self.tables = {}
+        if ENABLED:
+            try:
+                self.tables = {name: Table(name, columns) for name, columns in TABLES.items()}
+            except Exception:
+                # keep serving from the database
+                traceback.print_exc()
+
+_snapshot = None
+_lock = threading.Lock()
+
+def get():
+    """Get the snapshot of the currently loaded data."""
+    global _snapshot
+    version = cache.data_version().version
+    if _snapshot is None or _snapshot.version != version:
+        with _lock:
+            if _snapshot is None or _snapshot.version != version:
+                _snapshot = Snapshot(version)
+    return _snapshot
+
+def table(name):
+    """Get a table from the snapshot, or None if it should be read from the database."""
+    return get().tables.get(name)
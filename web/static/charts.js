@@ -0,0 +1,110 @@
+// draws each figure.chart on the page as an SVG bar chart from the JSON at its data-src,
+// laid out like the PNG charts: a group of bars per type, one bar per year
+
+// matplotlib's default colors, so the charts match their PNG downloads
+var barColors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22', '#17becf'];
+
+var svgNamespace = 'http://www.w3.org/2000/svg';
+
+function svgElement(name, attributes, text) {
+    var element = document.createElementNS(svgNamespace, name);
+    for (var key in attributes) {
+        element.setAttribute(key, attributes[key]);
+    }
+    if (text !== undefined) {
+        element.textContent = text;
+    }
+    return element;
+}
+
+// a round distance between ticks giving about count of them up to high
+function tickStep(high, count) {
+    var rough = high / count;
+    var magnitude = Math.pow(10, Math.floor(Math.log10(rough)));
+    var steps = [1, 2, 2.5, 5, 10];
+    for (var i = 0; i < steps.length; i++) {
+        if (steps[i] * magnitude >= rough) {
+            return steps[i] * magnitude;
+        }
+    }
+    return 10 * magnitude;
+}
+
+function drawChart(figure, chart) {
+    var labeled = chart.types.some(function (type) { return type != ''; });
+    var longest = Math.max.apply(null, chart.types.map(function (type) { return type.length; }));
+    var width = 640;
+    var height = 480;
+    var margin = { top: 40, right: 16, bottom: labeled ? 16 + 7 * longest : 16, left: 96 };
+    var plotWidth = width - margin.left - margin.right;
+    var plotHeight = height - margin.top - margin.bottom;
+
+    var values = [].concat.apply([], chart.rows).filter(function (value) { return value !== null; });
+    var high = Math.max.apply(null, values.concat([0]));
+    var step = tickStep(high || 1, 6);
+    var top = Math.ceil(high / step) * step || step;
+    function y(value) {
+        return margin.top + plotHeight * (1 - value / top);
+    }
+
+    var svg = svgElement('svg', { viewBox: '0 0 ' + width + ' ' + (height + 24 * chart.years.length), width: width, role: 'img', 'aria-label': chart.title });
+    svg.appendChild(svgElement('text', { x: width / 2, y: 24, 'text-anchor': 'middle', 'font-size': 16 }, chart.title));
+
+    // y axis, with grid lines at each tick
+    for (var tick = 0; tick <= top + step / 2; tick += step) {
+        svg.appendChild(svgElement('line', { x1: margin.left, x2: width - margin.right, y1: y(tick), y2: y(tick), stroke: 'currentColor', 'stroke-opacity': 0.2 }));
+        svg.appendChild(svgElement('text', { x: margin.left - 6, y: y(tick) + 4, 'text-anchor': 'end', 'font-size': 12 }, tick.toLocaleString()));
+    }
+    svg.appendChild(svgElement('line', { x1: margin.left, x2: margin.left, y1: margin.top, y2: y(0), stroke: 'currentColor' }));
+    svg.appendChild(svgElement('line', { x1: margin.left, x2: width - margin.right, y1: y(0), y2: y(0), stroke: 'currentColor' }));
+
+    // bars, grouped by type
+    var groupWidth = plotWidth / chart.types.length;
+    var barWidth = groupWidth / chart.years.length;
+    chart.types.forEach(function (type, t) {
+        var left = margin.left + t * groupWidth;
+        chart.rows.forEach(function (row, r) {
+            var value = row[t];
+            if (value === null) {
+                return;
+            }
+            var bar = svgElement('rect', {
+                x: left + r * barWidth,
+                y: y(Math.max(value, 0)),
+                width: barWidth,
+                height: Math.abs(y(value) - y(0)),
+                fill: barColors[r % barColors.length],
+            });
+            bar.appendChild(svgElement('title', {}, chart.years[r] + (labeled ? ', ' + type : '') + ': ' + value.toLocaleString()));
+            svg.appendChild(bar);
+        });
+        if (labeled) {
+            var x = left + groupWidth / 2;
+            svg.appendChild(svgElement('text', {
+                x: x,
+                y: y(0) + 8,
+                transform: 'rotate(-90 ' + x + ' ' + (y(0) + 8) + ')',
+                'text-anchor': 'end',
+                'dominant-baseline': 'middle',
+                'font-size': 12,
+            }, type));
+        }
+    });
+
+    // legend of years, below the chart
+    chart.years.forEach(function (year, r) {
+        var legendY = height + 24 * r;
+        svg.appendChild(svgElement('rect', { x: width / 2 - 30, y: legendY, width: 16, height: 16, fill: barColors[r % barColors.length] }));
+        svg.appendChild(svgElement('text', { x: width / 2 - 8, y: legendY + 13, 'font-size': 14 }, year));
+    });
+
+    figure.insertBefore(svg, figure.firstChild);
+}
+
+document.querySelectorAll('figure.chart').forEach(function (figure) {
+    fetch(figure.dataset.src).then(function (response) {
+        return response.json();
+    }).then(function (chart) {
+        drawChart(figure, chart);
+    });
+});
@@ -1,4 +1,4 @@
-// expect queryPath, colorMap to be defined globally
+// expect geometryPath, tilePath, tileMinZoom, tileMaxZoom, queryPath, colorMap to be defined globally
 
 if (t1 != '' && t2 != '' && t1 == t2) {
     alert("Can't compare the same types!");
@@ -65,38 +65,23 @@ L.tileLayer('https://tile.openstreetmap.org/{z}/{x}/{y}.png', {
     attribution: '&copy; <a href="http://www.openstreetmap.org/copyright">OpenStreetMap</a>',
 }).addTo(leafletMap);
 // fetch necessary files and then display information
+// when tiles were built, geometry is fetched per tile once the map is drawn
 Promise.all([
-    fetchJson('/static/geometry.json'),
+    tilePath ? null : fetchJson(geometryPath),
     fetchJson(queryPath),
-    fetchJson('/names.json')
 ]).then(function (values) {
     var geo = values[0];
-    var pop = values[1];
-    var names = values[2];
-    // find max population for calculating range
-    var max = -Infinity;
-    var min = Infinity;
-    var properties = Object.getOwnPropertyNames(pop);
-    for (var i = 0; i < properties.length; i++) {
-        var p = properties[i];
-        if (pop[p] > max) max = pop[p];
-        if (pop[p] < min) min = pop[p];
-    }
-    if (colorMap == 'heatmap') {
-        // if heatmap, minimum will be set to 0 so the legend doesn't start above 0
-        min = 0;
-        // adjust max to nearest 10,000 above
-        if ((max % 10000) != 0) {
-            max += 10000 - (max % 10000);
-        }
-    } else {
-        // balance both ends of range if it's a diverging, so that 0.5 stays centered
-        var length = Math.max(Math.abs(max - 0.5), Math.abs(min - 0.5));
-        // adjust to nearest 10% above
-        length = 0.5 - Math.sign(0.5 - length) * Math.floor(20 * Math.abs(0.5 - length)) * 0.05;
-        max = 0.5 + length;
-        min = 0.5 - length;
+    var payload = values[1];
+    // values, names and counties come as columns, indexed alike
+    var pop = {};
+    var names = {};
+    for (var i = 0; i < payload.mno.length; i++) {
+        pop[payload.mno[i]] = payload.value[i];
+        names[payload.mno[i]] = { name: payload.name[i], county: payload.county[i] };
     }
+    // the server works out the legend range
+    var max = payload.max;
+    var min = payload.min;
     var range = max - min;
     // geojson object
     var info = L.control();
@@ -174,31 +159,63 @@ Promise.all([
                     info.update(null);
                 },
                 click: function (e) {
-                    var form = document.createElement('form');
-                    form.style.visibility = 'hidden';
-                    form.method = 'POST';
-                    form.action = '/municipality';
-                    var input = document.createElement('input');
-                    input.name = 'mno';
-                    input.value = feature.properties.mno;
-                    form.appendChild(input);
-                    document.body.appendChild(form);
-                    form.submit();
+                    location.href = '/municipality/' + feature.properties.mno + '/';
                 },
             });
         }
     }).addTo(leafletMap);
+    if (tilePath) {
+        // only fetch the tiles in view, simplified for the zoom level
+        var tileZoom = null;
+        var shown = {};
+        var tileRequests = {};
+        function addTile(z, tile) {
+            // a tile may arrive after zooming to another level
+            if (z != tileZoom) return;
+            // municipalities are whole in every tile they overlap, so add each once
+            var features = tile.features.filter(function (feature) {
+                return !shown[feature.properties.mno];
+            });
+            features.forEach(function (feature) {
+                shown[feature.properties.mno] = true;
+            });
+            gj.addData(features);
+        }
+        function loadTiles() {
+            var z = Math.min(Math.max(leafletMap.getZoom(), tileMinZoom), tileMaxZoom);
+            if (z != tileZoom) {
+                gj.clearLayers();
+                shown = {};
+                tileZoom = z;
+            }
+            var bounds = leafletMap.getBounds();
+            var nw = leafletMap.project(bounds.getNorthWest(), z).divideBy(256).floor();
+            var se = leafletMap.project(bounds.getSouthEast(), z).divideBy(256).floor();
+            for (var x = nw.x; x <= se.x; x++) {
+                for (var y = nw.y; y <= se.y; y++) {
+                    var url = tilePath.replace('{z}', z).replace('{x}', x).replace('{y}', y);
+                    if (!(url in tileRequests)) {
+                        tileRequests[url] = fetchJson(url);
+                    }
+                    tileRequests[url].then(addTile.bind(null, z));
+                }
+            }
+        }
+        leafletMap.on('moveend', loadTiles);
+        loadTiles();
+    }
     var legend = L.control({ position: 'bottomright' });
     legend.onAdd = function (map) {
         var div = L.DomUtil.create('div', 'info legend');
         var gradient = 'width:5dvw;margin:auto;height:30dvh;background:linear-gradient(';
         var gradients = [];
-        for (var i = 0; i <= 20; i++) {
-            var scaledValue = (20 - i) / 20;
-            gradients.push(getColor(scaledValue) + ' ' + (i * 5) + '%');
+        var steps = payload.breaks.length - 1;
+        for (var i = 0; i <= steps; i++) {
+            var scaledValue = (steps - i) / steps;
+            gradients.push(getColor(scaledValue) + ' ' + (i * 100 / steps) + '%');
         }
         gradient += gradients.join(',') + ')';
-        div.innerHTML += '<h4>Legend</h4>' + display(max) + '<div style="'+gradient+'"></div>' + display(min);
+        div.innerHTML += '<h4>Legend</h4>' + display(payload.breaks[0]) + '<div style="'+gradient+'"></div>' + display(payload.breaks[steps]);
         return div;
     };
     legend.addTo(leafletMap);
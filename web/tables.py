@@ -0,0 +1,86 @@
+"""
+A municipality's values by year, as one years × columns matrix.
+
+Tables with a type column get a column per type, and the others a column per
+value. The detail pages' tables, the charts, the charts' JSON and the
+comparison API are all read from the same float array, with NaN wherever a
+value is missing. Each column keeps the number of decimal places the database
+gave it, so the tables show values as they were stored.
+"""
+
+import math
+from decimal import Decimal
+
+def decimal_places(values):
+    # DECIMAL columns come back as Decimal, all with the scale of the column
+    for value in values:
+        if isinstance(value, Decimal):
+            return -value.as_tuple().exponent
+    return None
+
+def to_float(value):
+    return math.nan if value is None else float(value)
+
+class YearMatrix:
+    def __init__(self, years, columns, values, places):
+        # years in order, and a row of values for each
+        self.years = years
+        self.columns = columns
+        self.column_of = {column: i for i, column in enumerate(columns)}
+        self.values = values
+        # of each column, or None for integers
+        self.places = places
+
+    @classmethod
+    def from_rows(cls, rows, columns):
+        """Arrange (year, value, ...) rows ordered by year."""
+        import numpy as np
+        values = np.array([[to_float(value) for value in row[1:]] for row in rows], dtype=np.float64)
+        return cls(
+            [row[0] for row in rows],
+            list(columns),
+            values.reshape(len(rows), len(columns)),
+            [decimal_places([row[1 + i] for row in rows]) for i in range(len(columns))],
+        )
+
+    @classmethod
+    def from_typed_rows(cls, rows, types):
+        """Pivot (year, type, value) rows ordered by year into a column per type."""
+        import numpy as np
+        column_of = {t: i for i, t in enumerate(types)}
+        row_of = {}
+        positions = [(row_of.setdefault(year, len(row_of)), column_of[type]) for year, type, _ in rows]
+        values = np.full((len(row_of), len(types)), np.nan)
+        if positions:
+            values[tuple(zip(*positions))] = [to_float(value) for _, _, value in rows]
+        places = decimal_places(value for _, _, value in rows)
+        return cls(list(row_of), list(types), values, [places] * len(types))
+
+    @property
+    def header(self):
+        return ['Year'] + self.columns
+
+    def format(self, value, places):
+        if math.isnan(value):
+            return None
+        if places is None:
+            return int(value)
+        return f'{value:.{places}f}'
+
+    def table_rows(self):
+        """Each year and its values, as the database would show them."""
+        return [
+            [year] + [self.format(value, places) for value, places in zip(row, self.places)]
+            for year, row in zip(self.years, self.values.tolist())
+        ]
+
+    def chart_rows(self):
+        """Each year's values, with None where one is missing."""
+        return [[None if math.isnan(value) else value for value in row] for row in self.values.tolist()]
+
+    def json_rows(self):
+        """Each year's values as numbers for JSON, with null where one is missing."""
+        return [
+            [None if math.isnan(value) else int(value) if places is None else value for value, places in zip(row, self.places)]
+            for row in self.values.tolist()
+        ]
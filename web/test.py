@@ -4,6 +4,7 @@ from config import config
 from time import sleep
 from subprocess import Popen, PIPE, DEVNULL
 from os import chdir, kill
+from re import findall
 from signal import SIGINT
 from tqdm import tqdm
 
@@ -21,10 +22,13 @@ try:
                 return cur.fetchall()
 
         all_mno = [row[0] for row in connect('SELECT mno FROM municipality;')]
+        all_county = [row[0] for row in connect('SELECT DISTINCT county FROM municipality;')]
 
         def test_get(path):
-            if requests.get('http://localhost:5000/' + path).status_code != 200:
+            response = requests.get('http://localhost:5000/' + path)
+            if response.status_code != 200:
                 raise RuntimeError('error on path "' + path + '"')
+            return response.text
 
         def test_post(path, data):
             if requests.post('http://localhost:5000/' + path, data).status_code != 200:
@@ -40,10 +44,22 @@ try:
             # test mot endpoint
             test_post('mot', {'mno': mno})
             # if vmt endpoint valid, test vmt endpoint
-            if connect(f'SELECT * FROM on_road_vehicle WHERE mno = {mno}'):
+            have_vmt = bool(connect(f'SELECT * FROM on_road_vehicle WHERE mno = {mno}'))
+            if have_vmt:
                 test_post('vmt', {'mno': mno})
             # test ev endpoints
             test_post('ev', {'mno': mno})
+            # test the same pages at their own URLs, and the charts they show
+            pages = ['municipality', 'mot', 'ev'] + (['vmt'] if have_vmt else [])
+            for page in pages:
+                for chart in set(findall(r'/chart/\w+/\w+/\d+', test_get(f'{page}/{mno}/'))):
+                    # the chart, and the data it's drawn from
+                    test_get(chart[1:] + '.png')
+                    test_get(chart[1:] + '.json')
+
+        # test comparing every municipality of each county
+        for county in all_county:
+            test_get(f'compare.json?county={county}')
 finally:
     kill(server.pid, SIGINT)
     server.wait()